@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# ADRV9009 JESD204B Streaming Benchmark.
+#
+# Host-side benchmark for the ADI ADRV2CRR-FMC with --with-jesd: streams RX/TX samples of each
+# ADRV9009 through its LitePCIe DMA (/dev/litepcieX, one per device), and reports per device the
+# sustained RX/TX bandwidth, the RX overruns/TX underruns and the JESD204B link status and error
+# counters (SYSREF, resynchronizations, ILAS configuration, 8b10b and unexpected characters).
+#
+# By default the internal pattern is used (RX 16-bit counter, checked on the host, TX sink at the
+# link rate) to benchmark the DMA path without the links, --source=jesd uses the JESD204B links
+# (the ADRV9009s and HMC7044s have to be configured first).
+#
+# Build/Load the target and the driver (see adi_adrv2crr_fmc.py), then:
+# ./bench/adrv9009_jesd_stream.py --csr-csv=csr.csv --devices=0,1
+
+import os
+import csv
+import time
+import fcntl
+import struct
+import argparse
+
+# LitePCIe Driver Interface ------------------------------------------------------------------------
+
+def _IOC(direction, nr, size):
+    return (direction << 30) | (size << 16) | (ord("S") << 8) | nr
+
+def _IOW(nr, size):  return _IOC(1, nr, size)
+def _IOWR(nr, size): return _IOC(3, nr, size)
+
+# Ioctls from litepcie/software/kernel/litepcie.h.
+LITEPCIE_IOCTL_REG        = _IOWR( 0, 12)
+LITEPCIE_IOCTL_DMA        = _IOW( 20,  1)
+LITEPCIE_IOCTL_DMA_WRITER = _IOWR(21, 24)
+LITEPCIE_IOCTL_DMA_READER = _IOWR(22, 24)
+LITEPCIE_IOCTL_LOCK       = _IOWR(25,  6)
+
+DMA_BUFFER_SIZE = 8192
+
+class LitePCIe:
+    def __init__(self, device, csr_csv):
+        self.fd   = os.open(device, os.O_RDWR | os.O_NONBLOCK)
+        self.regs = {}
+        with open(csr_csv) as f:
+            for row in csv.reader(f):
+                if row and row[0] == "csr_register":
+                    self.regs[row[1]] = (int(row[2], 0), int(row[3]))
+
+    def close(self):
+        os.close(self.fd)
+
+    # CSRs.
+    def _reg(self, addr, val=0, is_write=0):
+        buf = bytearray(struct.pack("IIB3x", addr, val, is_write))
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_REG, buf)
+        return struct.unpack("IIB3x", buf)[1]
+
+    def read(self, name):
+        addr, size = self.regs[name]
+        value = 0
+        for n in range(size):
+            value = (value << 32) | self._reg(addr + 4*n)
+        return value
+
+    def write(self, name, value):
+        addr, size = self.regs[name]
+        for n in range(size):
+            self._reg(addr + 4*n, (value >> (32*(size - 1 - n))) & 0xffffffff, is_write=1)
+
+    # DMAs.
+    def dma_lock(self):
+        buf = bytearray(struct.pack("6B", 1, 1, 0, 0, 0, 0))
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_LOCK, buf)
+        if not all(struct.unpack("6B", buf)[4:]):
+            raise RuntimeError("DMA channel already in use.")
+
+    def dma_unlock(self):
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_LOCK, bytearray(struct.pack("6B", 0, 0, 1, 1, 0, 0)))
+
+    def dma_enable(self, writer, reader):
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_DMA,        bytearray(struct.pack("B", 0))) # No loopback.
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_DMA_WRITER, bytearray(struct.pack("B7xqq", writer, 0, 0)))
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_DMA_READER, bytearray(struct.pack("B7xqq", reader, 0, 0)))
+
+    def dma_read(self, size):
+        try:
+            return os.read(self.fd, size)
+        except BlockingIOError:
+            return b""
+
+    def dma_write(self, data):
+        try:
+            return os.write(self.fd, data)
+        except BlockingIOError:
+            return 0
+
+# JESD204B Device ----------------------------------------------------------------------------------
+
+LINK_COUNTERS = ["sysref_errors", "tx_resyncs", "tx_error_reports", "rx_resyncs", "rx_config_errors"]
+LANES         = 4
+
+class ADRV9009Stream:
+    def __init__(self, n, device, csr_csv):
+        self.n    = n
+        self.name = f"jesd{n}"
+        self.pcie = LitePCIe(device, csr_csv)
+        self.pcie.dma_lock()
+
+    def close(self):
+        self.pcie.dma_unlock()
+        self.pcie.close()
+
+    def counters(self):
+        counters = {name: self.pcie.read(f"{self.name}_core_{name}") for name in LINK_COUNTERS}
+        for lane in range(LANES):
+            counters[f"lane{lane}_errors"]     = self.pcie.read(f"{self.name}_core_rx_lane{lane}_errors")
+            counters[f"lane{lane}_unexpected"] = self.pcie.read(f"{self.name}_core_rx_lane{lane}_unexpected")
+        return counters
+
+    def status(self):
+        status = self.pcie.read(f"{self.name}_core_status")
+        return {
+            "lmfc"     : (status >> 0) & 0b1,
+            "tx_jsync" : (status >> 1) & 0b1,
+            "tx_ready" : (status >> 2) & 0b1,
+            "rx_jsync" : (status >> 3) & 0b1,
+            "rx_ready" : (status >> 4) & 0b1,
+            "rx_lanes" : (status >> 8) & (2**LANES - 1),
+        }
+
+    def start(self, pattern, with_tx):
+        self.pcie.write(f"{self.name}_stream_control", 0)
+        self.counters_start = self.counters()
+        self.pcie.dma_enable(writer=1, reader=int(with_tx))
+        self.pcie.write(f"{self.name}_stream_control", (pattern << 8) | (int(with_tx) << 1) | 1)
+        self.rx_bytes  = 0
+        self.rx_lost   = 0
+        self.tx_bytes  = 0
+        self.last      = None
+
+    def stop(self):
+        self.pcie.write(f"{self.name}_stream_control", 0)
+        self.pcie.dma_enable(writer=0, reader=0)
+        self.rx_overruns  = self.pcie.read(f"{self.name}_stream_rx_overruns")
+        self.tx_underruns = self.pcie.read(f"{self.name}_stream_tx_underruns")
+        counters = self.counters()
+        self.counters_delta = {k: (counters[k] - self.counters_start[k]) % 2**32 for k in counters}
+
+    def service(self, chunk, pattern, tx_data):
+        # RX (with pattern: 16-bit counter, checked on the first sample of each DMA buffer).
+        data = self.pcie.dma_read(chunk*DMA_BUFFER_SIZE)
+        if pattern:
+            for offset in range(0, len(data), DMA_BUFFER_SIZE):
+                sample = struct.unpack_from("<H", data, offset)[0]
+                if self.last is not None and sample != (self.last + DMA_BUFFER_SIZE//2) % 2**16:
+                    self.rx_lost += 1
+                self.last = sample
+        self.rx_bytes += len(data)
+        # TX.
+        if tx_data is not None:
+            self.tx_bytes += self.pcie.dma_write(tx_data)
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def bench(streams, duration, pattern, with_tx, chunk):
+    tx_data = bytes(chunk*DMA_BUFFER_SIZE) if with_tx else None
+    for s in streams:
+        s.start(pattern, with_tx)
+    start = time.time()
+    while time.time() - start < duration:
+        for s in streams:
+            s.service(chunk, pattern, tx_data)
+    elapsed = time.time() - start
+    for s in streams:
+        s.stop()
+
+    total_rx, total_tx = 0, 0
+    for s in streams:
+        rx_mbps   = s.rx_bytes/elapsed/1e6
+        tx_mbps   = s.tx_bytes/elapsed/1e6
+        total_rx += rx_mbps
+        total_tx += tx_mbps
+        print(f"ADRV9009 {s.n}: "
+            f"RX {rx_mbps:9.2f} MB/s ({s.rx_overruns} overruns, {s.rx_lost} lost), "
+            f"TX {tx_mbps:9.2f} MB/s ({s.tx_underruns} underruns)")
+        if not pattern:
+            status = s.status()
+            print("  Status  : " + ", ".join(f"{k}: {v:x}" for k, v in status.items()))
+            print("  Errors  : " + ", ".join(f"{k}: {v}" for k, v in s.counters_delta.items()))
+    print(f"Total     : RX {total_rx:9.2f} MB/s, TX {total_tx:9.2f} MB/s")
+
+def main():
+    parser = argparse.ArgumentParser(description="ADRV9009 JESD204B streaming benchmark.")
+    parser.add_argument("--device",   default="/dev/litepcie", help="LitePCIe device prefix (one DMA/device per ADRV9009).")
+    parser.add_argument("--csr-csv",  default="csr.csv",       help="SoC CSV file.")
+    parser.add_argument("--devices",  default="0,1",           help="ADRV9009s to stream.")
+    parser.add_argument("--source",   default="pattern", choices=["pattern", "jesd"], help="Samples source/sink.")
+    parser.add_argument("--duration", default=10.0, type=float, help="Test duration (s).")
+    parser.add_argument("--chunk",    default=32,   type=int,   help="DMA buffers per read/write call.")
+    parser.add_argument("--no-tx",    action="store_true",      help="Disable TX streaming.")
+    args = parser.parse_args()
+
+    streams = []
+    try:
+        for n in [int(n) for n in args.devices.split(",")]:
+            streams.append(ADRV9009Stream(n, f"{args.device}{n}", args.csr_csv))
+        bench(streams,
+            duration = args.duration,
+            pattern  = int(args.source == "pattern"),
+            with_tx  = not args.no_tx,
+            chunk    = args.chunk)
+    finally:
+        for s in streams:
+            s.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Camera Capture Statistics.
+#
+# Host-side monitor for targets with MIPI CSI-2 camera capture to HyperRAM ring buffers (ex Lattice
+# CrossLink-NX VIP with --with-cameras): Reports per sensor the measured resolution, the captured
+# frames/s, the received throughput and the dropped frames/link errors, and optionally dumps the
+# last captured frame of each sensor (the slot is locked while read).
+#
+# Build/Load the target (see lattice_crosslink_nx_vip.py) and configure the sensors (over I2C), then
+# start a litex_server and:
+# ./bench/camera_capture_stats.py --csr-csv=csr.csv --cameras=0,1,2,3 --auto-frame-size
+
+import time
+import argparse
+
+from litex import RemoteClient
+
+# Camera -------------------------------------------------------------------------------------------
+
+class Camera:
+    def __init__(self, bus, n):
+        self.n    = n
+        self.bus  = bus
+        self.regs = {}
+        for reg in ["control", "resolution", "ecc_errors", "line_errors", "overflows"]:
+            self.regs[reg] = getattr(bus.regs, f"camera{n}_csi2_{reg}")
+        for reg in ["frame_size", "lock", "latest", "frames", "drops", "frame_rate", "throughput"]:
+            self.regs[reg] = getattr(bus.regs, f"camera{n}_ringbuffer_{reg}")
+        self.base      = bus.mems.d[f"hyperram{n//2}"].base + bus.constants.d[f"camera{n}_ringbuffer_offset"]
+        self.slot_size = bus.constants.d[f"camera{n}_ringbuffer_slot_size"]
+
+    def read(self, reg):
+        return self.regs[reg].read()
+
+    def get_resolution(self):
+        resolution = self.read("resolution")
+        return (resolution >> 0) & 0xffff, (resolution >> 16) & 0xffff
+
+    def get_errors(self):
+        return self.read("drops"), self.read("ecc_errors"), self.read("line_errors"), self.read("overflows")
+
+    def dump(self, filename):
+        latest = self.read("latest")
+        if not (latest & 0x1):
+            return False
+        slot = (latest >> 8) & 0xff
+        self.regs["lock"].write((slot << 8) | 1)
+        try:
+            length = self.read("frame_size")//4
+            data   = bytearray()
+            for offset in range(0, length, 64):
+                for word in self.bus.read(self.base + slot*self.slot_size + 4*offset, min(64, length - offset)):
+                    data += word.to_bytes(4, "little")
+        finally:
+            self.regs["lock"].write(0)
+        with open(filename, "wb") as f:
+            f.write(data)
+        return True
+
+# Statistics ---------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Camera Capture statistics.")
+    parser.add_argument("--csr-csv",         default="csr.csv",   help="SoC CSV file.")
+    parser.add_argument("--host",            default="localhost", help="litex_server host.")
+    parser.add_argument("--port",            default=1234, type=int, help="litex_server port.")
+    parser.add_argument("--cameras",         default="0,1,2,3",   help="Cameras to monitor.")
+    parser.add_argument("--interval",        default=1.0, type=float, help="Reporting interval (s).")
+    parser.add_argument("--duration",        default=0,   type=float, help="Monitoring duration (s, 0: infinite).")
+    parser.add_argument("--auto-frame-size", action="store_true",  help="Set frame size from the measured resolution.")
+    parser.add_argument("--dump",            default=None,         help="Dump the last frame of each camera to {dump}{n}.raw and exit.")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+
+    cameras = [Camera(bus, int(n)) for n in args.cameras.split(",")]
+
+    # Resolutions / Frame sizes.
+    for camera in cameras:
+        h_active, v_active = camera.get_resolution()
+        if args.auto_frame_size and h_active and v_active:
+            camera.regs["frame_size"].write(min(h_active*v_active*4, camera.slot_size))
+        frame_size = camera.read("frame_size")
+        print(f"Camera{camera.n}: {h_active*4} bytes/line x {v_active} lines, frame size: {frame_size} bytes.")
+
+    # Frame Dumps.
+    if args.dump is not None:
+        for camera in cameras:
+            filename = f"{args.dump}{camera.n}.raw"
+            if camera.dump(filename):
+                print(f"Camera{camera.n}: frame dumped to {filename}.")
+            else:
+                print(f"Camera{camera.n}: no frame captured.")
+        bus.close()
+        return
+
+    # Frames/s / Throughput / Drops/Errors.
+    start  = time.time()
+    errors = {camera.n: camera.get_errors() for camera in cameras}
+    try:
+        while (args.duration == 0) or (time.time() - start < args.duration):
+            time.sleep(args.interval)
+            line = []
+            for camera in cameras:
+                fps        = camera.read("frame_rate")
+                throughput = camera.read("throughput")/1e6
+                drops, ecc, lines, overflows = [(e - e0) % 2**32 for e, e0 in zip(camera.get_errors(), errors[camera.n])]
+                line.append(f"Camera{camera.n}: {fps:3d} fps, {throughput:6.2f} MB/s, {drops:5d} dropped "
+                    f"(ECC: {ecc}, lines: {lines}, overflows: {overflows})")
+            print(" | ".join(line))
+    except KeyboardInterrupt:
+        pass
+
+    bus.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Etherbone Burst Client / Benchmark.
+#
+# Host-side Etherbone client that coalesces sequential accesses into burst records (up to the
+# --etherbone-buffer-depth the target was built with) and keeps a window of packets in flight.
+#
+# Build/Load a target with Etherbone and a large buffer depth, ex:
+# ./digilent_arty.py --with-etherbone --etherbone-buffer-depth=255 --csr-csv=csr.csv --build --load
+#
+# Then compare single accesses vs bursts on the main RAM:
+# ./bench/etherbone_burst.py --ip=192.168.1.50 --buffer-depth=255 --window=8 --length=4MB
+#
+# The same measurement on builds with --eth-data-width=8 and --eth-data-width=32 shows the gain of
+# running the MAC/UDP-IP stack on the 32-bit sys clock datapath.
+
+import time
+import socket
+import argparse
+
+from litex.tools.remote.etherbone import EtherbonePacket, EtherboneRecord
+from litex.tools.remote.etherbone import EtherboneReads, EtherboneWrites
+from litex.tools.remote.comm_udp  import CommUDP
+
+# Etherbone Burst Client ---------------------------------------------------------------------------
+
+class EtherboneBurstClient:
+    def __init__(self, server="192.168.1.50", port=1234, buffer_depth=16, window=8, timeout=0.5, retries=10, addr_width=32):
+        assert 1 <= buffer_depth <= 255 # Record's wcount/rcount are 8-bit.
+        assert window >= 1
+        self.server       = server
+        self.port         = port
+        self.buffer_depth = buffer_depth
+        self.window       = window
+        self.timeout      = timeout
+        self.retries      = retries
+        self.addr_width   = addr_width
+        self.addr_size    = addr_width//8
+        self.tag          = 0
+
+    def open(self):
+        if hasattr(self, "socket"):
+            return
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("", self.port))
+        self.socket.settimeout(self.timeout)
+
+    def close(self):
+        if not hasattr(self, "socket"):
+            return
+        self.socket.close()
+        del self.socket
+
+    # Packets --------------------------------------------------------------------------------------
+
+    def _send(self, record):
+        packet = EtherbonePacket(self.addr_width)
+        packet.records = [record]
+        packet.encode()
+        self.socket.sendto(packet.bytes, (self.server, self.port))
+
+    def _send_reads(self, tag, addr, length):
+        record = EtherboneRecord(addr_size=self.addr_size)
+        record.reads  = EtherboneReads(addr_size=self.addr_size, base_ret_addr=tag, addrs=[addr + 4*i for i in range(length)])
+        record.rcount = length
+        self._send(record)
+
+    def _send_writes(self, tag, addr, datas):
+        # Writes followed by a read of the last written word in the same record: Etherbone handles
+        # the writes before the reads, so the read response acknowledges the writes.
+        record = EtherboneRecord(addr_size=self.addr_size)
+        record.writes = EtherboneWrites(addr_size=self.addr_size, base_addr=addr, datas=iter(datas))
+        record.wcount = len(datas)
+        record.reads  = EtherboneReads(addr_size=self.addr_size, base_ret_addr=tag, addrs=[addr + 4*(len(datas) - 1)])
+        record.rcount = 1
+        self._send(record)
+
+    def _recv(self):
+        datas, _ = self.socket.recvfrom(8192)
+        packet = EtherbonePacket(self.addr_width, datas)
+        packet.decode()
+        record = packet.records.pop()
+        return record.writes.base_addr, record.writes.get_datas()
+
+    def _new_tag(self):
+        self.tag = (self.tag + 4) % 2**32
+        return self.tag
+
+    def _chunks(self, addr, length, depth):
+        for offset in range(0, length, depth):
+            yield addr + 4*offset, min(depth, length - offset)
+
+    def _transfer(self, n, send):
+        # Keep up to window requests in flight, each acknowledged by a tagged response. On timeout,
+        # outstanding requests are re-issued with new tags (late responses are dropped).
+        pending = {}   # tag -> index.
+        results = [None]*n
+        index   = 0
+        retries = 0
+        while (index < n) or pending:
+            # Fill window.
+            while (index < n) and (len(pending) < self.window):
+                tag = self._new_tag()
+                pending[tag] = index
+                send(tag, index)
+                index += 1
+            # Collect responses.
+            try:
+                tag, datas = self._recv()
+            except socket.timeout:
+                retries += 1
+                if retries > self.retries:
+                    raise
+                for old_tag, i in list(pending.items()):
+                    del pending[old_tag]
+                    tag = self._new_tag()
+                    pending[tag] = i
+                    send(tag, i)
+                continue
+            if tag in pending:
+                results[pending.pop(tag)] = datas
+                retries = 0 # Max consecutive timeouts.
+        return results
+
+    # Accesses -------------------------------------------------------------------------------------
+
+    def read(self, addr, length=None):
+        length_int = 1 if length is None else length
+        chunks = list(self._chunks(addr, length_int, self.buffer_depth))
+        def send(tag, i):
+            self._send_reads(tag, *chunks[i])
+        results = self._transfer(len(chunks), send)
+        datas = [data for chunk in results for data in chunk]
+        return datas[0] if length is None else datas
+
+    def write(self, addr, datas):
+        # Acknowledged writes: The record FIFO of the target holds buffer_depth + 1 words (header
+        # excluded), the acknowledge read (return address + address) takes 2 of them.
+        if self.buffer_depth < 3:
+            raise ValueError("Acknowledged writes require a buffer depth of at least 3.")
+        datas  = datas if isinstance(datas, list) else [datas]
+        chunks = list(self._chunks(addr, len(datas), self.buffer_depth - 2))
+        def send(tag, i):
+            chunk_addr, chunk_length = chunks[i]
+            offset = (chunk_addr - addr)//4
+            self._send_writes(tag, chunk_addr, datas[offset:offset + chunk_length])
+        self._transfer(len(chunks), send)
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def parse_size(size):
+    units = {"KB": 2**10, "MB": 2**20, "GB": 2**30}
+    for unit, value in units.items():
+        if size.upper().endswith(unit):
+            return int(float(size[:-len(unit)])*value)
+    return int(size, 0)
+
+def bench(name, func, nbytes):
+    start = time.time()
+    func()
+    duration = time.time() - start
+    speed    = nbytes/duration/1e6
+    print(f"{name:>8s}: {nbytes:10d} bytes in {duration:8.3f}s: {speed:8.3f} MB/s")
+    return speed
+
+def main():
+    parser = argparse.ArgumentParser(description="Etherbone burst client benchmark.")
+    parser.add_argument("--ip",            default="192.168.1.50", help="Target IP address.")
+    parser.add_argument("--port",          default=1234, type=int, help="Target Etherbone UDP port.")
+    parser.add_argument("--addr",          default="0x40000000",   help="Base address of the tested region (ex main_ram).")
+    parser.add_argument("--length",        default="1MB",          help="Length of the burst accesses.")
+    parser.add_argument("--single-length", default="16KB",         help="Length of the single accesses (reference).")
+    parser.add_argument("--buffer-depth",  default=16, type=int,   help="Target's Etherbone buffer depth (--etherbone-buffer-depth, 1-255).")
+    parser.add_argument("--window",        default=8,  type=int,   help="Number of burst packets in flight.")
+    parser.add_argument("--no-single",     action="store_true",    help="Skip single accesses reference.")
+    args = parser.parse_args()
+
+    addr          = int(args.addr, 0)
+    length        = parse_size(args.length)//4
+    single_length = parse_size(args.single_length)//4
+    datas         = [(0x5a5a0000 + i) & 0xffffffff for i in range(length)]
+    client        = EtherboneBurstClient(server=args.ip, port=args.port,
+        buffer_depth = args.buffer_depth,
+        window       = args.window)
+
+    # Single accesses (1 word per packet, lock-step) through LiteX's CommUDP.
+    if not args.no_single:
+        print("Single accesses (CommUDP):")
+        comm = CommUDP(server=args.ip, port=args.port)
+        comm.open()
+        def single_write():
+            for i in range(single_length):
+                comm.write(addr + 4*i, datas[i])
+        def single_read():
+            for i in range(single_length):
+                comm.read(addr + 4*i)
+        single_wr = bench("write", single_write, 4*single_length)
+        single_rd = bench("read",  single_read,  4*single_length)
+        comm.close()
+
+    # Burst accesses.
+    print(f"Burst accesses (buffer_depth={client.buffer_depth}, window={client.window}):")
+    client.open()
+    burst_wr = bench("write", lambda: client.write(addr, datas), 4*length)
+    readback = []
+    burst_rd = bench("read",  lambda: readback.extend(client.read(addr, length)), 4*length)
+    client.close()
+
+    # Check.
+    errors = sum(r != d for r, d in zip(readback, datas))
+    print(f"Errors: {errors}/{length}")
+
+    if not args.no_single:
+        print(f"Speedup: write x{burst_wr/single_wr:.1f}, read x{burst_rd/single_rd:.1f}")
+
+if __name__ == "__main__":
+    main()
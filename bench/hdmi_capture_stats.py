@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# HDMI Capture Statistics.
+#
+# Host-side monitor for targets with HDMI Capture to DRAM ring buffers/PCIe DMA (ex Decklink Quad
+# HDMI Recorder with --with-hdmi-capture): Reports per input the measured resolution, the sustained
+# captured/DMAed frames/s and the dropped frames.
+#
+# Build/Load the target:
+# ./decklink_quad_hdmi_recorder.py --with-pcie --with-hdmi-capture --driver --csr-csv=csr.csv --build --load
+#
+# Start a litex_server (over PCIe or JTAG) and the DMAs (ex with litepcie_util from the driver), then:
+# ./bench/hdmi_capture_stats.py --csr-csv=csr.csv --auto-frame-size
+
+import time
+import argparse
+
+from litex import RemoteClient
+
+# HDMI Capture Channel -----------------------------------------------------------------------------
+
+class HDMICaptureChannel:
+    def __init__(self, bus, n):
+        self.n    = n
+        self.regs = {}
+        for reg in ["status", "v_active", "ringbuffer_frame_size", "ringbuffer_frames", "ringbuffer_drops", "ringbuffer_dma_frames"]:
+            self.regs[reg] = getattr(bus.regs, f"hdmi{n}_capture_{reg}")
+
+    def read(self, reg):
+        return self.regs[reg].read()
+
+    def get_resolution(self):
+        status = self.read("status")
+        return (status >> 0) & 0x1, (status >> 16) & 0xffff, self.read("v_active")
+
+    def get_counters(self):
+        return self.read("ringbuffer_frames"), self.read("ringbuffer_dma_frames"), self.read("ringbuffer_drops")
+
+# Statistics ---------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="HDMI Capture statistics.")
+    parser.add_argument("--csr-csv",         default="csr.csv",   help="SoC CSV file.")
+    parser.add_argument("--host",            default="localhost", help="litex_server host.")
+    parser.add_argument("--port",            default=1234, type=int, help="litex_server port.")
+    parser.add_argument("--channels",        default="0,1,2,3",   help="HDMI inputs to monitor.")
+    parser.add_argument("--interval",        default=1.0, type=float, help="Reporting interval (s).")
+    parser.add_argument("--duration",        default=0,   type=float, help="Monitoring duration (s, 0: infinite).")
+    parser.add_argument("--auto-frame-size", action="store_true",  help="Set frame size from the measured resolution (RGB32).")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+
+    channels = [HDMICaptureChannel(bus, int(n)) for n in args.channels.split(",")]
+
+    # Resolutions / Frame sizes.
+    for channel in channels:
+        aligned, h_active, v_active = channel.get_resolution()
+        if args.auto_frame_size and aligned and h_active and v_active:
+            channel.regs["ringbuffer_frame_size"].write(h_active*v_active*4)
+        frame_size = channel.read("ringbuffer_frame_size")
+        print(f"HDMI{channel.n}: aligned={aligned} {h_active}x{v_active}, frame size: {frame_size} bytes.")
+
+    # Frames/s / Drops.
+    start    = time.time()
+    last     = {channel.n: channel.get_counters() for channel in channels}
+    last_t   = start
+    drops_t0 = {channel.n: last[channel.n][2] for channel in channels}
+    try:
+        while (args.duration == 0) or (time.time() - start < args.duration):
+            time.sleep(args.interval)
+            now      = time.time()
+            duration = now - last_t
+            line     = []
+            for channel in channels:
+                frames, dma_frames, drops = channel.get_counters()
+                l_frames, l_dma_frames, l_drops = last[channel.n]
+                fps     = ((frames     - l_frames)     % 2**32)/duration
+                dma_fps = ((dma_frames - l_dma_frames) % 2**32)/duration
+                dropped = (drops - drops_t0[channel.n]) % 2**32
+                line.append(f"HDMI{channel.n}: {fps:6.2f} fps (DMA {dma_fps:6.2f} fps), {dropped:6d} dropped")
+                last[channel.n] = (frames, dma_frames, drops)
+            last_t = now
+            print(" | ".join(line))
+    except KeyboardInterrupt:
+        pass
+
+    bus.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LMS7002M IQ Streaming Benchmark.
+#
+# Host-side benchmark for targets with LMS7002M IQ streaming over PCIe DMA (ex Fairwaves XTRX with
+# --with-lms7002m): streams RX/TX packets through the LitePCIe kernel driver (/dev/litepcieX) and
+# reports per sample rate the sustained RX/TX MS/s, the RX overruns (packets dropped by the FPGA
+# FIFO or lost by the driver) and the TX underruns.
+#
+# By default the internal pattern is used (RX counter/TX sink at the requested sample rate) to
+# benchmark the DMA path without RF configuration, --source=lms uses the LMS7002M samples (the
+# sample rate is then the one configured on the LMS7002M).
+#
+# Build/Load the target and the driver (see fairwaves_xtrx.py), then:
+# ./bench/lms7002m_stream.py --csr-csv=csr.csv --rates=1e6,10e6,30.72e6,61.44e6
+
+import os
+import csv
+import time
+import fcntl
+import struct
+import argparse
+
+# LitePCIe Driver Interface ------------------------------------------------------------------------
+
+def _IOC(direction, nr, size):
+    return (direction << 30) | (size << 16) | (ord("S") << 8) | nr
+
+def _IOW(nr, size):  return _IOC(1, nr, size)
+def _IOWR(nr, size): return _IOC(3, nr, size)
+
+# Ioctls from litepcie/software/kernel/litepcie.h.
+LITEPCIE_IOCTL_REG        = _IOWR( 0, 12)
+LITEPCIE_IOCTL_DMA        = _IOW( 20,  1)
+LITEPCIE_IOCTL_DMA_WRITER = _IOWR(21, 24)
+LITEPCIE_IOCTL_DMA_READER = _IOWR(22, 24)
+LITEPCIE_IOCTL_LOCK       = _IOWR(25,  6)
+
+DMA_BUFFER_SIZE = 8192
+
+class LitePCIe:
+    def __init__(self, device, csr_csv):
+        self.fd   = os.open(device, os.O_RDWR | os.O_NONBLOCK)
+        self.regs = {}
+        with open(csr_csv) as f:
+            for row in csv.reader(f):
+                if row and row[0] == "csr_register":
+                    self.regs[row[1]] = (int(row[2], 0), int(row[3]))
+
+    def close(self):
+        os.close(self.fd)
+
+    # CSRs.
+    def _reg(self, addr, val=0, is_write=0):
+        buf = bytearray(struct.pack("IIB3x", addr, val, is_write))
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_REG, buf)
+        return struct.unpack("IIB3x", buf)[1]
+
+    def read(self, name):
+        addr, size = self.regs[name]
+        value = 0
+        for n in range(size):
+            value = (value << 32) | self._reg(addr + 4*n)
+        return value
+
+    def write(self, name, value):
+        addr, size = self.regs[name]
+        for n in range(size):
+            self._reg(addr + 4*n, (value >> (32*(size - 1 - n))) & 0xffffffff, is_write=1)
+
+    # DMAs.
+    def dma_lock(self):
+        buf = bytearray(struct.pack("6B", 1, 1, 0, 0, 0, 0))
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_LOCK, buf)
+        if not all(struct.unpack("6B", buf)[4:]):
+            raise RuntimeError("DMA channel already in use.")
+
+    def dma_unlock(self):
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_LOCK, bytearray(struct.pack("6B", 0, 0, 1, 1, 0, 0)))
+
+    def dma_enable(self, writer, reader):
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_DMA,        bytearray(struct.pack("B", 0))) # No loopback.
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_DMA_WRITER, bytearray(struct.pack("B7xqq", writer, 0, 0)))
+        fcntl.ioctl(self.fd, LITEPCIE_IOCTL_DMA_READER, bytearray(struct.pack("B7xqq", reader, 0, 0)))
+
+    def dma_read(self, size):
+        try:
+            return os.read(self.fd, size)
+        except BlockingIOError:
+            return b""
+
+    def dma_write(self, data):
+        try:
+            return os.write(self.fd, data)
+        except BlockingIOError:
+            return 0
+
+# Packets ------------------------------------------------------------------------------------------
+
+LMS7002M_SYNC  = 0x5aa55aa5
+PACKET_WORDS   = DMA_BUFFER_SIZE//8
+PACKET_SAMPLES = PACKET_WORDS - 2
+
+def decode_packet(data):
+    header, timestamp = struct.unpack_from("<QQ", data)
+    if (header >> 32) != LMS7002M_SYNC:
+        return None
+    return header & 0xffffffff, timestamp
+
+def encode_packet(timestamp=0):
+    return struct.pack("<QQ", LMS7002M_SYNC << 32, timestamp) + bytes(8*PACKET_SAMPLES)
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def bench(pcie, rate, duration, sys_clk_freq, pattern, with_tx, chunk):
+    pcie.write("lms7002m_stream", 0)
+    pcie.write("lms7002m_pattern_rate", min(int(rate/sys_clk_freq*2**32), 2**32 - 1))
+    rx_overruns_start  = pcie.read("lms7002m_rx_overruns")
+    tx_underruns_start = pcie.read("lms7002m_tx_underruns")
+
+    pcie.dma_enable(writer=1, reader=int(with_tx))
+    pcie.write("lms7002m_stream", (pattern << 8) | (int(with_tx) << 1) | 1)
+
+    tx_packets = encode_packet()*chunk
+    rx_packets = 0
+    rx_lost    = 0
+    rx_errors  = 0
+    tx_samples = 0
+    last_ts    = None
+    start      = time.time()
+    while time.time() - start < duration:
+        # RX.
+        data = pcie.dma_read(chunk*DMA_BUFFER_SIZE)
+        for offset in range(0, len(data), DMA_BUFFER_SIZE):
+            packet = decode_packet(data[offset:offset + DMA_BUFFER_SIZE])
+            if packet is None:
+                rx_errors += 1
+                continue
+            _, timestamp = packet
+            if last_ts is not None and timestamp != last_ts + PACKET_SAMPLES:
+                rx_lost += max(0, (timestamp - last_ts)//PACKET_SAMPLES - 1)
+            last_ts     = timestamp
+            rx_packets += 1
+        # TX.
+        if with_tx:
+            tx_samples += (pcie.dma_write(tx_packets)//DMA_BUFFER_SIZE)*PACKET_SAMPLES
+    elapsed = time.time() - start
+
+    pcie.write("lms7002m_stream", 0)
+    pcie.dma_enable(writer=0, reader=0)
+
+    rx_overruns  = (pcie.read("lms7002m_rx_overruns")  - rx_overruns_start)  % 2**32
+    tx_underruns = (pcie.read("lms7002m_tx_underruns") - tx_underruns_start) % 2**32
+    rx_msps      = rx_packets*PACKET_SAMPLES/elapsed/1e6
+    tx_msps      = tx_samples/elapsed/1e6
+    name = f"{rate/1e6:8.3f} MS/s" if pattern else "LMS7002M"
+    print(f"{name}: "
+        f"RX {rx_msps:8.3f} MS/s ({rx_overruns} overruns, {rx_lost} lost, {rx_errors} errors), "
+        f"TX {tx_msps:8.3f} MS/s ({tx_underruns} underruns)")
+
+def main():
+    parser = argparse.ArgumentParser(description="LMS7002M IQ streaming benchmark.")
+    parser.add_argument("--device",       default="/dev/litepcie0",  help="LitePCIe device.")
+    parser.add_argument("--csr-csv",      default="csr.csv",         help="SoC CSV file.")
+    parser.add_argument("--sys-clk-freq", default=125e6, type=float, help="Target's system clock frequency.")
+    parser.add_argument("--source",       default="pattern", choices=["pattern", "lms"], help="Samples source/sink.")
+    parser.add_argument("--rates",        default="1e6,10e6,30.72e6,61.44e6", help="Sample rates to test (pattern).")
+    parser.add_argument("--duration",     default=5.0, type=float,   help="Test duration per sample rate (s).")
+    parser.add_argument("--chunk",        default=16,  type=int,     help="DMA buffers per read/write call.")
+    parser.add_argument("--no-tx",        action="store_true",       help="Disable TX streaming.")
+    args = parser.parse_args()
+
+    pcie = LitePCIe(args.device, args.csr_csv)
+    pcie.dma_lock()
+    try:
+        rates = [float(rate) for rate in args.rates.split(",")] if args.source == "pattern" else [0]
+        for rate in rates:
+            bench(pcie, rate,
+                duration     = args.duration,
+                sys_clk_freq = args.sys_clk_freq,
+                pattern      = int(args.source == "pattern"),
+                with_tx      = not args.no_tx,
+                chunk        = args.chunk)
+    finally:
+        pcie.dma_unlock()
+        pcie.close()
+
+if __name__ == "__main__":
+    main()
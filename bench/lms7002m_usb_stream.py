@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LMS7002M IQ Streaming over USB-FIFO (FT601) Benchmark.
+#
+# Host-side benchmark for targets with LMS7002M IQ streaming over a FT601 USB-FIFO (ex LimeSDR Mini
+# V2 with --with-lms7002m): streams RX/TX packets (see litex_boards/lib/lms7002m.py) through the
+# FT601 pipes and reports per sample rate the sustained USB throughput, the RX/TX MS/s and the
+# sample drops (RX overruns/lost packets, TX underruns), then the highest sustainable sample rate.
+#
+# The internal pattern (RX counter/TX sink at the requested sample rate) is used so that no RF
+# configuration is needed. CSRs are accessed through litex_server (ex over JTAG) and the samples
+# through FTDI's D3XX Python wrapper (ftd3xx).
+#
+# Build/Load the target, start litex_server, then:
+# ./bench/lms7002m_usb_stream.py --csr-csv=csr.csv --rates=1e6,5e6,10e6,20e6,30e6,40e6
+# ./bench/lms7002m_usb_stream.py --csr-csv=csr.csv --search --min-rate=1e6 --max-rate=40e6
+
+import time
+import struct
+import argparse
+import threading
+
+from litex import RemoteClient
+
+# FT601 --------------------------------------------------------------------------------------------
+
+FT601_PIPE_OUT = 0x02 # Host -> FPGA.
+FT601_PIPE_IN  = 0x82 # FPGA -> Host.
+
+class FT601:
+    def __init__(self, index=0, timeout=100):
+        try:
+            import ftd3xx
+            import ftd3xx._ftd3xx_linux as _ftd3xx
+        except ImportError:
+            raise ImportError("FTDI D3XX Python wrapper (ftd3xx) is required.")
+        self.dev = ftd3xx.create(index, _ftd3xx.FT_OPEN_BY_INDEX)
+        if self.dev is None:
+            raise RuntimeError("No FT601 device found.")
+        self.dev.setPipeTimeout(FT601_PIPE_IN,  timeout)
+        self.dev.setPipeTimeout(FT601_PIPE_OUT, timeout)
+
+    def close(self):
+        self.dev.close()
+
+    def read(self, size):
+        return self.dev.readPipeEx(FT601_PIPE_IN, size)["bytes"]
+
+    def write(self, data):
+        return self.dev.writePipe(FT601_PIPE_OUT, data, len(data))
+
+# Packets ------------------------------------------------------------------------------------------
+
+LMS7002M_SYNC = 0x5aa55aa5
+
+class Packets:
+    def __init__(self, packet_words=512):
+        self.packet_size    = 8*packet_words
+        self.packet_samples = packet_words - 2
+        self.buffer         = b""
+
+    def decode(self, data):
+        # Returns the timestamps of the complete packets (None for invalid packets).
+        self.buffer += data
+        timestamps   = []
+        while len(self.buffer) >= self.packet_size:
+            header, timestamp = struct.unpack_from("<QQ", self.buffer)
+            if (header >> 32) != LMS7002M_SYNC:
+                # Resynchronize on next 64-bit word.
+                self.buffer = self.buffer[8:]
+                timestamps.append(None)
+                continue
+            timestamps.append(timestamp)
+            self.buffer = self.buffer[self.packet_size:]
+        return timestamps
+
+    def encode(self, timestamp=0):
+        return struct.pack("<QQ", LMS7002M_SYNC << 32, timestamp) + bytes(8*self.packet_samples)
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def bench(bus, usb, rate, duration, sys_clk_freq, packet_words, chunk, with_tx):
+    packets = Packets(packet_words)
+    bus.regs.lms7002m_stream.write(0)
+    bus.regs.lms7002m_pattern_rate.write(min(int(rate/sys_clk_freq*2**32), 2**32 - 1))
+    # Flush pending RX data.
+    while len(usb.read(chunk*packets.packet_size)):
+        pass
+    rx_overruns_start  = bus.regs.lms7002m_rx_overruns.read()
+    tx_underruns_start = bus.regs.lms7002m_tx_underruns.read()
+
+    stats = {"rx_bytes": 0, "rx_packets": 0, "rx_lost": 0, "rx_errors": 0, "tx_bytes": 0}
+    done  = threading.Event()
+
+    def rx_thread():
+        last_ts = None
+        while not done.is_set():
+            data = usb.read(chunk*packets.packet_size)
+            stats["rx_bytes"] += len(data)
+            for timestamp in packets.decode(data):
+                if timestamp is None:
+                    stats["rx_errors"] += 1
+                    continue
+                if last_ts is not None and timestamp != last_ts + packets.packet_samples:
+                    stats["rx_lost"] += max(0, (timestamp - last_ts)//packets.packet_samples - 1)
+                last_ts = timestamp
+                stats["rx_packets"] += 1
+
+    def tx_thread():
+        tx_data = packets.encode()*chunk
+        while not done.is_set():
+            stats["tx_bytes"] += usb.write(tx_data)
+
+    threads = [threading.Thread(target=rx_thread)]
+    if with_tx:
+        threads.append(threading.Thread(target=tx_thread))
+    bus.regs.lms7002m_stream.write((1 << 8) | (int(with_tx) << 1) | 1)
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    done.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+    bus.regs.lms7002m_stream.write(0)
+
+    rx_overruns  = (bus.regs.lms7002m_rx_overruns.read()  - rx_overruns_start)  % 2**32
+    tx_underruns = (bus.regs.lms7002m_tx_underruns.read() - tx_underruns_start) % 2**32
+    usb_mbps     = (stats["rx_bytes"] + stats["tx_bytes"])/elapsed/1e6
+    rx_msps      = stats["rx_packets"]*packets.packet_samples/elapsed/1e6
+    tx_msps      = (stats["tx_bytes"]//packets.packet_size)*packets.packet_samples/elapsed/1e6
+    drops        = rx_overruns + stats["rx_lost"] + stats["rx_errors"] + (tx_underruns if with_tx else 0)
+    print(f"{rate/1e6:8.3f} MS/s: USB {usb_mbps:7.2f} MB/s, "
+        f"RX {rx_msps:8.3f} MS/s ({rx_overruns} overruns, {stats['rx_lost']} lost, {stats['rx_errors']} errors), "
+        f"TX {tx_msps:8.3f} MS/s ({tx_underruns} underruns)")
+    return drops == 0
+
+def main():
+    parser = argparse.ArgumentParser(description="LMS7002M IQ streaming over USB-FIFO benchmark.")
+    parser.add_argument("--csr-csv",      default="csr.csv",         help="SoC CSV file.")
+    parser.add_argument("--host",         default="localhost",       help="litex_server host.")
+    parser.add_argument("--port",         default=1234, type=int,    help="litex_server port.")
+    parser.add_argument("--sys-clk-freq", default=80e6, type=float,  help="Target's system clock frequency.")
+    parser.add_argument("--packet-words", default=512, type=int,     help="Target's packet size (in 64-bit words).")
+    parser.add_argument("--rates",        default="1e6,5e6,10e6,20e6,30e6,40e6", help="Sample rates to test.")
+    parser.add_argument("--search",       action="store_true",       help="Search the highest sustainable sample rate.")
+    parser.add_argument("--min-rate",     default=1e6,  type=float,  help="Search min sample rate.")
+    parser.add_argument("--max-rate",     default=40e6, type=float,  help="Search max sample rate.")
+    parser.add_argument("--duration",     default=5.0,  type=float,  help="Test duration per sample rate (s).")
+    parser.add_argument("--chunk",        default=32,   type=int,    help="Packets per USB transfer.")
+    parser.add_argument("--read-time",    default=None, type=int,    help="Set USB-FIFO max read time slice.")
+    parser.add_argument("--write-time",   default=None, type=int,    help="Set USB-FIFO max write time slice.")
+    parser.add_argument("--no-adaptive",  action="store_true",       help="Disable adaptive USB-FIFO time slices.")
+    parser.add_argument("--no-tx",        action="store_true",       help="Disable TX streaming.")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    usb = FT601()
+
+    # USB-FIFO time slices.
+    timing = bus.regs.usb_phy_timing.read()
+    if args.read_time is not None:
+        timing = (timing & 0xffff0000) | (args.read_time  <<  0)
+    if args.write_time is not None:
+        timing = (timing & 0x0000ffff) | (args.write_time << 16)
+    bus.regs.usb_phy_timing.write(timing)
+    adaptive = bus.regs.usb_phy_adaptive.read()
+    bus.regs.usb_phy_adaptive.write((adaptive & ~0x1) | int(not args.no_adaptive))
+    print(f"USB-FIFO: read time: {timing & 0xffff}, write time: {timing >> 16}, adaptive: {not args.no_adaptive}.")
+
+    def run(rate):
+        return bench(bus, usb, rate,
+            duration     = args.duration,
+            sys_clk_freq = args.sys_clk_freq,
+            packet_words = args.packet_words,
+            chunk        = args.chunk,
+            with_tx      = not args.no_tx)
+
+    highest = None
+    try:
+        if args.search:
+            low, high = args.min_rate, args.max_rate
+            while (high - low) > 0.01*high:
+                rate = (low + high)/2
+                if run(rate):
+                    highest, low = rate, rate
+                else:
+                    high = rate
+        else:
+            for rate in [float(rate) for rate in args.rates.split(",")]:
+                if run(rate):
+                    highest = rate
+    finally:
+        usb.close()
+        bus.close()
+
+    if highest is None:
+        print("No sustainable sample rate found.")
+    else:
+        print(f"Highest sustainable sample rate: {highest/1e6:.3f} MS/s.")
+
+if __name__ == "__main__":
+    main()
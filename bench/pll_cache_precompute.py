@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# PLL/MMCM Configuration Cache Precompute.
+#
+# Elaborates the targets using the PLL configuration cache (use_pll_cache or BoardCRG) at their
+# default and common sys_clk_freqs (without CPU, nothing is built) and stores the solved PLL/MMCM
+# configurations in the cache table (litex_boards/lib/pll_cache.json by default). The number of configurations
+# solved/found in the table and the search time are reported for each target/frequency.
+#
+# ./bench/pll_cache_precompute.py
+# ./bench/pll_cache_precompute.py --targets=digilent_arty,sqrl_xcu1525 --freqs=50e6,100e6,125e6
+
+import os
+import inspect
+import logging
+import argparse
+import importlib
+
+import litex_boards.targets
+
+from litex_boards.lib import pll_cache
+
+# Targets arguments (required BaseSoC parameters, uart_name: read from kwargs by some targets).
+default_kwargs = {"cpu_type": None, "uart_name": "serial"}
+target_kwargs  = {
+    "colorlight_5a_75x" : {"board": "5a-75b", "revision": "8.0", "uart_name": "serial", "with_uartbone": False},
+}
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def get_cached_targets():
+    path = os.path.dirname(litex_boards.targets.__file__)
+    targets = []
+    for f in sorted(os.listdir(path)):
+        if not f.endswith(".py"):
+            continue
+        content = open(os.path.join(path, f)).read()
+        if "use_pll_cache(" in content or "BoardCRG" in content:
+            targets.append(f[:-3])
+    return targets
+
+def elaborate(target, sys_clk_freq):
+    module = importlib.import_module(f"litex_boards.targets.{target}")
+    kwargs = {**default_kwargs, **target_kwargs.get(target, {})}
+    if sys_clk_freq is not None:
+        kwargs["sys_clk_freq"] = sys_clk_freq
+    soc = module.BaseSoC(**kwargs)
+    soc.finalize()
+    return soc
+
+def get_default_sys_clk_freq(target):
+    module = importlib.import_module(f"litex_boards.targets.{target}")
+    return inspect.signature(module.BaseSoC.__init__).parameters["sys_clk_freq"].default
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="PLL/MMCM configuration cache precompute.")
+    parser.add_argument("--targets", default=None,                      help="Targets (default: all targets using the cache).")
+    parser.add_argument("--freqs",   default="50e6,75e6,100e6,125e6",   help="Common sys_clk_freqs (in addition to the default).")
+    parser.add_argument("--output",  default=None,                      help="Cache file (default: litex_boards/lib/pll_cache.json).")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    cache   = pll_cache.get_pll_cache()
+    output  = cache.filename if args.output is None else args.output
+    targets = get_cached_targets() if args.targets is None else args.targets.split(",")
+    freqs   = [float(f) for f in args.freqs.split(",")]
+
+    for target in targets:
+        default = get_default_sys_clk_freq(target)
+        for freq in sorted(set([float(default)] + freqs)):
+            hits, misses, search_time = cache.hits, cache.misses, cache.search_time
+            status = "default" if freq == default else "       "
+            try:
+                elaborate(target, freq)
+            except Exception as e:
+                error = str(e).splitlines()[0] if str(e) else type(e).__name__
+                print(f"{target:<32} {freq/1e6:8.3f}MHz {status}: skipped ({error}).")
+                continue
+            print(f"{target:<32} {freq/1e6:8.3f}MHz {status}: {cache.misses - misses} PLL(s) solved "
+                  f"in {(cache.search_time - search_time)*1e3:7.2f}ms, {cache.hits - hits} from table.")
+
+    cache.save(output)
+    print(f"{len(cache.configs)} PLL configurations saved to {output}.")
+
+if __name__ == "__main__":
+    main()
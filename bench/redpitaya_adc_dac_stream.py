@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Red Pitaya ADC/DAC Streaming Benchmark.
+#
+# Runs on the Red Pitaya's Linux (Zynq PS) with the target built with --cpu-type=zynq7000
+# --with-adc-dac-dma: streams the ADC samples to PS DDR and plays DAC samples from PS DDR through
+# the AXI HP ring-buffers (see litex_boards/lib/axi_dma.py) and reports, per buffer size and ADC
+# decimation, the sustained ADC/DAC sample rates and the ADC drops/DAC underruns.
+#
+# CSRs and ring-buffers are accessed through /dev/mem, the ring-buffers region must be reserved
+# from Linux (ex with mem=496M on the kernel command line for the default --region-base/size).
+#
+# ./redpitaya_adc_dac_stream.py --csr-csv=csr.csv --sizes=4096,16384,65536,262144 --decimations=0,1,3
+
+import os
+import csv
+import mmap
+import time
+import struct
+import argparse
+
+# Memory Access ------------------------------------------------------------------------------------
+
+PAGE_SIZE = mmap.PAGESIZE
+
+class DevMem:
+    def __init__(self, base, size):
+        self.base   = base & ~(PAGE_SIZE - 1)
+        self.offset = base - self.base
+        self.fd     = os.open("/dev/mem", os.O_RDWR | os.O_SYNC)
+        self.mem    = mmap.mmap(self.fd, self.offset + size, offset=self.base)
+
+    def close(self):
+        self.mem.close()
+        os.close(self.fd)
+
+    def read32(self, addr):
+        return struct.unpack_from("<I", self.mem, self.offset + addr)[0]
+
+    def write32(self, addr, value):
+        struct.pack_into("<I", self.mem, self.offset + addr, value & 0xffffffff)
+
+    def read(self, addr, size):
+        return self.mem[self.offset + addr:self.offset + addr + size]
+
+    def write(self, addr, data):
+        self.mem[self.offset + addr:self.offset + addr + len(data)] = data
+
+class CSRs:
+    def __init__(self, csr_csv):
+        self.regs = {}
+        with open(csr_csv) as f:
+            for row in csv.reader(f):
+                if row and row[0] == "csr_register":
+                    self.regs[row[1]] = int(row[2], 0)
+        base      = min(self.regs.values())
+        self.mem  = DevMem(base, max(self.regs.values()) - base + 4)
+        self.base = base
+
+    def close(self):
+        self.mem.close()
+
+    def read(self, name):
+        return self.mem.read32(self.regs[name] - self.base)
+
+    def write(self, name, value):
+        self.mem.write32(self.regs[name] - self.base, value)
+
+# Ring-Buffer --------------------------------------------------------------------------------------
+
+class RingBuffer:
+    def __init__(self, csrs, name, base, offset, size, buffers):
+        self.csrs    = csrs
+        self.name    = name
+        self.base    = base
+        self.offset  = offset # In the reserved region.
+        self.size    = size
+        self.buffers = buffers
+        self.sw      = 0
+
+    def start(self, control=0b1):
+        self.csrs.write(f"{self.name}_control",  0)
+        self.csrs.write(f"{self.name}_base",     self.base)
+        self.csrs.write(f"{self.name}_size",     self.size)
+        self.csrs.write(f"{self.name}_buffers",  self.buffers)
+        self.csrs.write(f"{self.name}_sw_count", 0)
+        self.sw = 0
+        self.csrs.write(f"{self.name}_control",  control)
+
+    def stop(self):
+        self.csrs.write(f"{self.name}_control", 0)
+
+    def hw_count(self):
+        return self.csrs.read(f"{self.name}_hw_count")
+
+    def release(self, n=1):
+        self.sw = (self.sw + n) % 2**32
+        self.csrs.write(f"{self.name}_sw_count", self.sw)
+
+    def buffer_offset(self, n):
+        return self.offset + (n % self.buffers)*self.size
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def bench(csrs, mem, region_base, region_size, size, decimation, duration, adc_clk_freq, with_dac):
+    buffers = min((region_size//2)//size, 2**16 - 1)
+    adc     = RingBuffer(csrs, "adc_dma", region_base,                  0,               size, buffers)
+    dac     = RingBuffer(csrs, "dac_dma", region_base + region_size//2, region_size//2, size, buffers)
+    csrs.write("adc_decimation", decimation)
+
+    # Prime the DAC ring-buffer (full scale/8 square wave).
+    dac_data = struct.pack("<hh", 4096, 4096)*(size//8) + struct.pack("<hh", -4096, -4096)*(size//8)
+    if with_dac:
+        for n in range(buffers):
+            mem.write(dac.buffer_offset(n), dac_data)
+        dac.start()
+        dac.release(buffers)
+    underruns_start = csrs.read("dac_underruns")
+
+    adc.start()
+    adc_buffers = 0
+    dac_buffers = 0
+    start = time.time()
+    while time.time() - start < duration:
+        # ADC: consume the completed buffers.
+        pending = (adc.hw_count() - adc.sw) % 2**32
+        for n in range(pending):
+            mem.read(adc.buffer_offset(adc.sw + n), size)
+        if pending:
+            adc.release(pending)
+            adc_buffers += pending
+        # DAC: refill the played buffers.
+        if with_dac:
+            played = (dac.hw_count() + buffers - dac.sw) % 2**32
+            for n in range(played):
+                mem.write(dac.buffer_offset(dac.sw + n), dac_data)
+            if played:
+                dac.release(played)
+                dac_buffers += played
+    elapsed = time.time() - start
+
+    drops     = csrs.read("adc_dma_drops")
+    underruns = (csrs.read("dac_underruns") - underruns_start) % 2**32
+    adc.stop()
+    dac.stop()
+
+    adc_msps = adc_buffers*size/4/elapsed/1e6
+    dac_msps = dac_buffers*size/4/elapsed/1e6
+    target   = adc_clk_freq/(decimation + 1)/1e6
+    print(f"{size:8d} bytes x {buffers:5d}, {target:8.3f} MS/s: "
+        f"ADC {adc_msps:8.3f} MS/s ({drops} drops), "
+        f"DAC {dac_msps:8.3f} MS/s ({underruns} underruns)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Red Pitaya ADC/DAC streaming benchmark.")
+    parser.add_argument("--csr-csv",      default="csr.csv",            help="SoC CSV file.")
+    parser.add_argument("--region-base",  default="0x1f000000",         help="Reserved DDR region base.")
+    parser.add_argument("--region-size",  default="0x01000000",         help="Reserved DDR region size.")
+    parser.add_argument("--sizes",        default="4096,16384,65536,262144,1048576", help="Buffer sizes to test (bytes).")
+    parser.add_argument("--decimations",  default="0,1,3,7",            help="ADC decimations to test.")
+    parser.add_argument("--adc-clk-freq", default=125e6, type=float,    help="ADC clock frequency.")
+    parser.add_argument("--duration",     default=5.0,   type=float,    help="Test duration per configuration (s).")
+    parser.add_argument("--no-dac",       action="store_true",          help="Disable DAC streaming.")
+    args = parser.parse_args()
+
+    region_base = int(args.region_base, 0)
+    region_size = int(args.region_size, 0)
+
+    csrs = CSRs(args.csr_csv)
+    mem  = DevMem(region_base, region_size)
+    try:
+        for decimation in [int(d) for d in args.decimations.split(",")]:
+            for size in [int(s) for s in args.sizes.split(",")]:
+                bench(csrs, mem, region_base, region_size, size,
+                    decimation   = decimation,
+                    duration     = args.duration,
+                    adc_clk_freq = args.adc_clk_freq,
+                    with_dac     = not args.no_dac)
+    finally:
+        mem.close()
+        csrs.close()
+
+if __name__ == "__main__":
+    main()
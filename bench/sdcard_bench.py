@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SDCard Throughput Benchmark.
+#
+# Measures the native SDCard read/write throughputs of targets built with --with-sdcard, driven from
+# the BIOS console only: the card is initialized with sdcard_freq/sdcard_init, single block accesses
+# use the BIOS sdcard_read/sdcard_write commands and multiple blocks transfers (CMD18/CMD25 + DMA
+# to/from main RAM) are programmed with mem_write on the LiteSDCard CSRs. Throughputs come from the
+# sdcard_stats hardware counters (first to last byte), so they don't depend on the console latency.
+#
+# Writes are destructive: they are only done with --write, on blocks starting at --block.
+#
+# Build/Load the target with --with-sdcard and (with the BIOS console idle):
+# ./bench/sdcard_bench.py --port=/dev/ttyUSB1 --csr-csv=csr.csv --freqs=12.5e6,25e6,50e6
+
+import csv
+import time
+import argparse
+
+from spi_flash_xip_bench import BIOSConsole
+
+# SDCard Constants ---------------------------------------------------------------------------------
+
+SDCARD_CTRL_DATA_TRANSFER_READ  = 1
+SDCARD_CTRL_DATA_TRANSFER_WRITE = 2
+SDCARD_CTRL_RESPONSE_SHORT      = 1
+SDCARD_CTRL_RESPONSE_SHORT_BUSY = 3
+
+# SDCard -------------------------------------------------------------------------------------------
+
+class SDCard:
+    def __init__(self, console, csr_csv):
+        self.console   = console
+        self.regs      = {}
+        self.regions   = {}
+        self.constants = {}
+        with open(csr_csv) as f:
+            for row in csv.reader(f):
+                if not row or row[0].startswith("#"):
+                    continue
+                if row[0] == "csr_register":
+                    self.regs[row[1]] = (int(row[2], 0), int(row[3]))
+                elif row[0] == "memory_region":
+                    self.regions[row[1]] = (int(row[2], 0), int(row[3], 0))
+                elif row[0] == "constant":
+                    self.constants[row[1]] = row[2]
+        if "sdcard_stats_control" not in self.regs:
+            raise ValueError("SoC built without SDCard statistics (--with-sdcard).")
+        self.clk_freq = int(self.constants["config_clock_frequency"])
+
+    def write(self, name, value):
+        # Multi-words CSRs: Most significant word first.
+        addr, size = self.regs[name]
+        for n in range(size):
+            self.console.write32(addr + 4*n, (value >> (32*(size - 1 - n))) & 0xffffffff)
+
+    def read(self, name):
+        addr, size = self.regs[name]
+        value = 0
+        for n in range(size):
+            value = (value << 32) | self.console.read32(addr + 4*n)
+        return value
+
+    def init(self, freq):
+        self.console.command(f"sdcard_freq {int(freq)}")
+        r, _ = self.console.command("sdcard_init")
+        if "error" in r.lower() or "failed" in r.lower():
+            raise RuntimeError(f"SDCard initialization failed at {freq/1e6:.2f}MHz.")
+
+    def command(self, cmd, arg, transfer, response):
+        self.write("sdcard_core_cmd_argument", arg)
+        self.write("sdcard_core_cmd_command", (cmd << 8) | (transfer << 5) | response)
+        self.write("sdcard_core_cmd_send", 1)
+
+    def wait(self, name, timeout=10.0):
+        start = time.time()
+        while not (self.read(name) & 0x1):
+            if time.time() - start > timeout:
+                raise RuntimeError(f"Timeout on {name}.")
+
+    def stats(self, direction):
+        nbytes = self.read(f"sdcard_stats_{direction}_bytes")
+        cycles = self.read(f"sdcard_stats_{direction}_time")
+        return nbytes, nbytes*self.clk_freq/max(cycles, 1)
+
+    def single(self, direction, block, nblocks):
+        # BIOS commands: One command/DMA per block (console latency between blocks excluded).
+        rates = []
+        for n in range(nblocks):
+            self.write("sdcard_stats_control", 1)
+            if direction == "read":
+                self.console.command(f"sdcard_read {block + n}")
+            else:
+                self.console.command(f"sdcard_write {block + n} litex")
+            rates.append(self.stats(direction)[1])
+        return sum(rates)/len(rates)
+
+    def multiple(self, direction, block, nblocks, buf=None):
+        buf = self.regions["main_ram"][0] if buf is None else buf
+        dma = {"read": "sdcard_block2mem", "write": "sdcard_mem2block"}[direction]
+        self.write("sdcard_stats_control", 1)
+        self.write(f"{dma}_dma_enable", 0)
+        self.write(f"{dma}_dma_base",   buf)
+        self.write(f"{dma}_dma_length", 512*nblocks)
+        self.write(f"{dma}_dma_enable", 1)
+        self.write("sdcard_core_block_length", 512)
+        self.write("sdcard_core_block_count",  nblocks)
+        if direction == "read":
+            self.command(18, block, SDCARD_CTRL_DATA_TRANSFER_READ,  SDCARD_CTRL_RESPONSE_SHORT)
+        else:
+            self.command(25, block, SDCARD_CTRL_DATA_TRANSFER_WRITE, SDCARD_CTRL_RESPONSE_SHORT)
+        self.wait(f"{dma}_dma_done")
+        self.wait("sdcard_core_data_event")
+        self.command(12, 0, 0, SDCARD_CTRL_RESPONSE_SHORT_BUSY)
+        self.wait("sdcard_core_cmd_event")
+        return self.stats(direction)
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="SDCard throughput benchmark.")
+    parser.add_argument("--port",     required=True,               help="BIOS console serial port.")
+    parser.add_argument("--baudrate", default=115200,  type=int,   help="BIOS console baudrate.")
+    parser.add_argument("--csr-csv",  default="csr.csv",           help="SoC CSV file.")
+    parser.add_argument("--freqs",    default="25e6,50e6",         help="SDCard clock frequencies to test.")
+    parser.add_argument("--block",    default=0x10000, type=int,   help="First SDCard block used by the benchmark.")
+    parser.add_argument("--blocks",   default=2048,    type=int,   help="Blocks per multiple blocks transfer.")
+    parser.add_argument("--write",    action="store_true",         help="Also run the (destructive) write tests.")
+    args = parser.parse_args()
+
+    console = BIOSConsole(args.port, args.baudrate)
+    sdcard  = SDCard(console, args.csr_csv)
+
+    directions = ["read"] + (["write"] if args.write else [])
+    for freq in [float(f) for f in args.freqs.split(",")]:
+        sdcard.init(freq)
+        for direction in directions:
+            single = sdcard.single(direction, args.block, 4)
+            nbytes, multiple = sdcard.multiple(direction, args.block, args.blocks)
+            print(f"{freq/1e6:6.2f}MHz {direction:<5}: single block: {single/2**20:6.2f} MiB/s, "
+                  f"{args.blocks} blocks: {multiple/2**20:6.2f} MiB/s ({nbytes} bytes).")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SPI Flash XIP Cache Benchmark.
+#
+# Compares cached vs uncached (Cache bypassed) execution from the SPI Flash on targets built with
+# --with-xip-cache (ex iCEBreaker/Fomu). The BIOS runs in place from the SPI Flash, so its memory
+# kernels are used as a small CoreMark-style workload (integer loops, pseudo-random accesses, CRC)
+# driven from the BIOS console:
+# - sram_write/sram_read: mem_speed loops on the SRAM (code fetched from the Flash).
+# - flash_seq/flash_rand: mem_speed read loops on the BIOS image in Flash (code + data from Flash).
+# - memtest:              memtest on the SRAM (host timed).
+# - crc:                  crc of the BIOS image in Flash (host timed).
+# For each kernel the speed, Cache hit rate and Flash wait cycles are reported and a score is
+# computed as the geometric mean of the cached/uncached speedups.
+#
+# Build/Load the target with --with-xip-cache and (with the BIOS console idle):
+# ./bench/spi_flash_xip_bench.py --port=/dev/ttyUSB1 --csr-csv=csr.csv
+
+import re
+import csv
+import time
+import math
+import argparse
+
+import serial
+
+# BIOS Console -------------------------------------------------------------------------------------
+
+class BIOSConsole:
+    prompt = b"litex> "
+
+    def __init__(self, port, baudrate=115200, timeout=60):
+        self.port    = serial.Serial(port, baudrate, timeout=0.1)
+        self.timeout = timeout
+        self.command("")
+
+    def command(self, cmd):
+        self.port.reset_input_buffer()
+        self.port.write(cmd.encode() + b"\n")
+        start = time.time()
+        data  = b""
+        while not data.endswith(self.prompt):
+            data += self.port.read(256)
+            if time.time() - start > self.timeout:
+                raise RuntimeError(f"No BIOS prompt after \"{cmd}\".")
+        duration = time.time() - start
+        return data.decode(errors="ignore"), duration
+
+    def read32(self, addr):
+        r, _ = self.command(f"mem_read 0x{addr:08x} 4")
+        m = re.search(r"0x[0-9a-f]{8}\s+((?:[0-9a-f]{2} ){4})", r)
+        return int.from_bytes(bytes.fromhex(m.group(1).replace(" ", "")), "little")
+
+    def write32(self, addr, value):
+        self.command(f"mem_write 0x{addr:08x} 0x{value:08x}")
+
+# CSR/Constants ------------------------------------------------------------------------------------
+
+def load_csr_csv(filename):
+    regs, regions, constants = {}, {}, {}
+    with open(filename) as f:
+        for row in csv.reader(f):
+            if not row or row[0].startswith("#"):
+                continue
+            if row[0] == "csr_register":
+                regs[row[1]] = int(row[2], 0)
+            elif row[0] == "memory_region":
+                regions[row[1]] = (int(row[2], 0), int(row[3], 0))
+            elif row[0] == "constant":
+                constants[row[1]] = row[2]
+    return regs, regions, constants
+
+def parse_speed(s):
+    units = {"B": 1, "KiB": 2**10, "MiB": 2**20, "GiB": 2**30}
+    m = re.search(r"Read speed: ([0-9.]+)(B|KiB|MiB|GiB)/s", s)
+    w = re.search(r"Write speed: ([0-9.]+)(B|KiB|MiB|GiB)/s", s)
+    r = float(m.group(1))*units[m.group(2)] if m else None
+    w = float(w.group(1))*units[w.group(2)] if w else None
+    return r, w
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="SPI Flash XIP Cache benchmark.")
+    parser.add_argument("--port",     required=True,            help="BIOS console serial port.")
+    parser.add_argument("--baudrate", default=115200, type=int, help="BIOS console baudrate.")
+    parser.add_argument("--csr-csv",  default="csr.csv",        help="SoC CSV file.")
+    parser.add_argument("--size",     default=4096,   type=int, help="Kernels size (in bytes).")
+    args = parser.parse_args()
+
+    regs, regions, constants = load_csr_csv(args.csr_csv)
+    if "spiflash_cache_control" not in regs:
+        raise ValueError("SoC built without SPI Flash XIP Cache (--with-xip-cache).")
+    sram = regions["sram"][0]
+    rom  = regions.get("rom", regions["spiflash"])[0]
+    size = args.size
+    # Keep SRAM kernels away from the BIOS stack/data (at the start of the SRAM).
+    sram_test = sram + regions["sram"][1]//2
+
+    console = BIOSConsole(args.port, args.baudrate)
+    print(f"SPI Flash XIP Cache: {constants.get('spiflash_cache_size')} bytes, "
+          f"{constants.get('spiflash_cache_line_size')} bytes/line, "
+          f"SPI Flash @ {int(constants.get('spiflash_phy_frequency', 0))/1e6:.1f}MHz.")
+
+    kernels = {
+        "sram_write" : (f"mem_speed 0x{sram_test:08x} {size}",     lambda r, d: parse_speed(r)[1]),
+        "sram_read"  : (f"mem_speed 0x{sram_test:08x} {size}",     lambda r, d: parse_speed(r)[0]),
+        "flash_seq"  : (f"mem_speed 0x{rom:08x} {size} 1",         lambda r, d: parse_speed(r)[0]),
+        "flash_rand" : (f"mem_speed 0x{rom:08x} {size} 1 1",       lambda r, d: parse_speed(r)[0]),
+        "memtest"    : (f"mem_test 0x{sram_test:08x} {size}",      lambda r, d: size/d),
+        "crc"        : (f"crc 0x{rom:08x} {8*size}",               lambda r, d: 8*size/d),
+    }
+
+    results = {}
+    for mode, bypass in [("uncached", 1), ("cached", 0)]:
+        results[mode] = {}
+        for name, (cmd, speed) in kernels.items():
+            console.write32(regs["spiflash_cache_control"], bypass | 0b10)
+            r, duration = console.command(cmd)
+            accesses = console.read32(regs["spiflash_cache_accesses"])
+            misses   = console.read32(regs["spiflash_cache_misses"])
+            waits    = console.read32(regs["spiflash_cache_wait_cycles"])
+            results[mode][name] = speed(r, duration)
+            hit_rate = 0 if (bypass or accesses == 0) else 100*(1 - misses/accesses)
+            print(f"{mode:<8} {name:<10}: {results[mode][name]/2**10:10.2f} KiB/s, "
+                  f"hit rate: {hit_rate:6.2f}%, Flash wait cycles: {waits}")
+    console.write32(regs["spiflash_cache_control"], 0)
+
+    speedups = [results["cached"][k]/results["uncached"][k] for k in kernels]
+    for name, speedup in zip(kernels, speedups):
+        print(f"Speedup {name:<10}: x{speedup:.2f}")
+    print(f"Score (geometric mean speedup): x{math.prod(speedups)**(1/len(speedups)):.2f}")
+
+if __name__ == "__main__":
+    main()
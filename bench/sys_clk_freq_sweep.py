@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# sys_clk_freq Sweep.
+#
+# Finds the maximum passing sys_clk_freq of a target built with the open-source toolchains
+# (yosys+nextpnr: ECP5/Trellis, iCE40/IceStorm, Gowin/Apicula, NX/Oxide): builds are run in
+# parallel on --jobs frequencies between --min and --max, the NextPNR timing reports are parsed and
+# the range is refined between the highest passing and lowest failing frequencies until it is
+# below --resolution. The result is recorded (with --update) in litex_boards/lib/fmax.json for the
+# configuration (target arguments after --), with the LiteX/toolchain versions, for the target
+# parsers to suggest it.
+#
+# ./bench/sys_clk_freq_sweep.py --target=icebreaker --min=20e6 --max=60e6 --jobs=4 --update
+# ./bench/sys_clk_freq_sweep.py --target=colorlight_5a_75x --min=40e6 --max=120e6 --update -- --board=5a-75b --revision=8.0
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+import importlib.metadata
+
+from concurrent.futures import ThreadPoolExecutor
+
+from litex_boards.lib.nextpnr import parse_nextpnr_fmax, get_nextpnr_timing_pass, get_toolchain_versions
+from litex_boards.lib.fmax import FmaxDatabase
+
+# Build --------------------------------------------------------------------------------------------
+
+def build(target, sys_clk_freq, args, output_dir, seed):
+    build_dir = os.path.join(output_dir, f"{target}_{int(sys_clk_freq)}")
+    cmd = [sys.executable, "-m", f"litex_boards.targets.{target}",
+        "--build",
+        f"--sys-clk-freq={sys_clk_freq}",
+        f"--output-dir={build_dir}",
+        f"--nextpnr-seed={seed}",
+        *args,
+    ]
+    start = time.time()
+    r = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    os.makedirs(build_dir, exist_ok=True)
+    with open(os.path.join(build_dir, "build.log"), "w") as f:
+        f.write(r.stdout)
+    return {
+        "sys_clk_freq" : sys_clk_freq,
+        "passed"       : (r.returncode == 0) and get_nextpnr_timing_pass(r.stdout),
+        "fmax"         : parse_nextpnr_fmax(r.stdout),
+        "duration"     : time.time() - start,
+        "returncode"   : r.returncode,
+    }
+
+# Sweep --------------------------------------------------------------------------------------------
+
+def sweep(target, fmin, fmax, jobs, resolution, args, output_dir, seed):
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # First round on [fmin, fmax], then inside ]passing, failing[.
+        freqs = [fmin + n*(fmax - fmin)/max(jobs - 1, 1) for n in range(jobs)]
+        while True:
+            freqs = sorted(set(round(f, -3) for f in freqs))
+            for r in executor.map(lambda f: build(target, f, args, output_dir, seed), freqs):
+                results.append(r)
+                clocks = ", ".join(f"{c}: {f/1e6:.2f}MHz" for c, (f, _, _) in r["fmax"].items())
+                print(f"{r['sys_clk_freq']/1e6:8.3f}MHz: {'PASS' if r['passed'] else 'FAIL'} "
+                      f"({r['duration']:.0f}s) {clocks}")
+            passed  = [r["sys_clk_freq"] for r in results if r["passed"]]
+            failed  = [r["sys_clk_freq"] for r in results if not r["passed"]]
+            passing = max(passed) if passed else None
+            failing = min([f for f in failed if passing is None or f > passing], default=None)
+            if passing is None or failing is None:
+                break
+            if (failing - passing) <= resolution:
+                break
+            step  = (failing - passing)/(jobs + 1)
+            freqs = [passing + n*max(step, resolution/2) for n in range(1, jobs + 1)]
+            freqs = [f for f in freqs if f < failing]
+    return passing, failing, results
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    argv = sys.argv[1:]
+    target_args = []
+    if "--" in argv:
+        target_args = argv[argv.index("--") + 1:]
+        argv        = argv[:argv.index("--")]
+
+    parser = argparse.ArgumentParser(description="sys_clk_freq sweep (open-source toolchains).")
+    parser.add_argument("--target",     required=True,                help="Target name (ex icebreaker).")
+    parser.add_argument("--min",        default=25e6,   type=float,   help="Minimum sys_clk_freq.")
+    parser.add_argument("--max",        default=150e6,  type=float,   help="Maximum sys_clk_freq.")
+    parser.add_argument("--jobs",       default=4,      type=int,     help="Parallel builds.")
+    parser.add_argument("--resolution", default=1e6,    type=float,   help="Frequency resolution.")
+    parser.add_argument("--seed",       default=1,      type=int,     help="NextPNR seed.")
+    parser.add_argument("--config",     default=None,                 help="Configuration name (default: target arguments or default).")
+    parser.add_argument("--output-dir", default="build/sys_clk_freq_sweep", help="Builds directory.")
+    parser.add_argument("--update",     action="store_true",          help="Record the result in the results database.")
+    args = parser.parse_args(argv)
+
+    config = args.config or (" ".join(target_args) if target_args else "default")
+    print(f"Sweeping {args.target} ({config}) from {args.min/1e6:.2f}MHz to {args.max/1e6:.2f}MHz...")
+    passing, failing, results = sweep(
+        target     = args.target,
+        fmin       = args.min,
+        fmax       = args.max,
+        jobs       = args.jobs,
+        resolution = args.resolution,
+        args       = target_args,
+        output_dir = args.output_dir,
+        seed       = args.seed,
+    )
+    if passing is None:
+        print(f"No passing sys_clk_freq for {args.target} ({config}).")
+        sys.exit(1)
+    print(f"Max passing sys_clk_freq: {passing/1e6:.2f}MHz" +
+        (f" (failing at {failing/1e6:.2f}MHz)." if failing is not None else " (upper bound of the range)."))
+
+    if args.update:
+        best = [r for r in results if r["sys_clk_freq"] == passing][0]
+        db   = FmaxDatabase()
+        db.set(args.target, config, {
+            "sys_clk_freq" : passing,
+            "failing"      : failing,
+            "fmax"         : {c: f for c, (f, _, _) in best["fmax"].items()},
+            "seed"         : args.seed,
+            "litex"        : importlib.metadata.version("litex"),
+            "toolchain"    : get_toolchain_versions(),
+            "date"         : time.strftime("%Y-%m-%d"),
+        })
+        db.save()
+        print(f"Result recorded in {db.filename}.")
+
+if __name__ == "__main__":
+    main()
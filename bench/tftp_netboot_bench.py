@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# TFTP Netboot Benchmark.
+#
+# Loads the netboot images listed in a boot.json (same format than the BIOS netboot: filename/load
+# address pairs with optional "bootargs" r1/r2/r3 and "addr" entries) with the Hardware TFTP
+# Receiver of targets built with --with-tftp-dma (large blocks + windowed transfers, written to
+# memory and ACKed in hardware) and reports the throughputs from the hardware cycles counter.
+#
+# A small TFTP server (RFC 2347/2348/7440 options: blksize/windowsize) can be started with --serve
+# to serve the boot.json directory, for both the Hardware TFTP Receiver and the BIOS netboot (that
+# uses lock-step transfers). With --console, the BIOS netboot is then measured on the same images
+# (from the "netboot" command to the "Executing booted program" message) for comparison, or, with
+# --boot, the images loaded by the Hardware TFTP Receiver are directly booted from the BIOS console.
+#
+# Build/Load the target, ex:
+# ./digilent_arty.py --with-etherbone --with-ethernet --with-tftp-dma --csr-csv=csr.csv --build --load
+# Start a litex_server (--udp) and:
+# sudo ./bench/tftp_netboot_bench.py --csr-csv=csr.csv --root=images --serve --server-ip=192.168.1.100 --console=/dev/ttyUSB1
+
+import os
+import json
+import time
+import socket
+import struct
+import argparse
+import threading
+
+from litex import RemoteClient
+
+from litex_boards.lib.tftp import TFTP_RRQ, TFTP_DATA, TFTP_ACK, TFTP_ERROR, TFTP_OACK, tftp_request
+
+# TFTP Server --------------------------------------------------------------------------------------
+
+class TFTPServer(threading.Thread):
+    def __init__(self, root, port=69, timeout=0.05, retries=100):
+        threading.Thread.__init__(self, daemon=True)
+        self.root    = root
+        self.timeout = timeout
+        self.retries = retries
+        self.socket  = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("", port))
+        self.retransmits = 0
+
+    def run(self):
+        while True:
+            request, client = self.socket.recvfrom(1024)
+            if struct.unpack(">H", request[:2])[0] != TFTP_RRQ:
+                continue
+            fields   = request[2:].split(b"\x00")
+            filename = fields[0].decode()
+            options  = {fields[n].decode().lower(): fields[n + 1].decode() for n in range(2, len(fields) - 2, 2)}
+            self.transfer(client, filename, options)
+
+    def transfer(self, client, filename, options):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(("", 0))
+        sock.settimeout(self.timeout)
+        try:
+            data = open(os.path.join(self.root, os.path.basename(filename)), "rb").read()
+        except OSError:
+            sock.sendto(struct.pack(">HH", TFTP_ERROR, 1) + b"File not found\x00", client)
+            sock.close()
+            return
+
+        # Options (only acknowledged when requested).
+        oack = {}
+        if "blksize" in options:
+            oack["blksize"] = str(min(max(int(options["blksize"]), 8), 65464))
+        if "windowsize" in options:
+            oack["windowsize"] = str(min(max(int(options["windowsize"]), 1), 65535))
+        if "tsize" in options:
+            oack["tsize"] = str(len(data))
+        blksize    = int(oack.get("blksize", 512))
+        windowsize = int(oack.get("windowsize", 1))
+        nblocks    = len(data)//blksize + 1
+
+        def wait_ack(acked, window):
+            # Returns the new (unwrapped) acked block number, None on timeout.
+            try:
+                while True:
+                    packet, _ = sock.recvfrom(1024)
+                    opcode, block = struct.unpack(">HH", packet[:4])
+                    if opcode == TFTP_ERROR:
+                        return -1
+                    if opcode == TFTP_ACK:
+                        block = acked + ((block - acked) & 0xffff)
+                        if block <= acked + window:
+                            return block
+            except socket.timeout:
+                return None
+
+        # OACK.
+        if oack:
+            payload = b"".join(k.encode() + b"\x00" + v.encode() + b"\x00" for k, v in oack.items())
+            for _ in range(self.retries):
+                sock.sendto(struct.pack(">H", TFTP_OACK) + payload, client)
+                if wait_ack(0, 0) == 0:
+                    break
+                self.retransmits += 1
+
+        # DATA (windowed).
+        acked   = 0
+        retries = 0
+        while (acked < nblocks) and (retries < self.retries):
+            last = min(acked + windowsize, nblocks)
+            for block in range(acked + 1, last + 1):
+                payload = data[(block - 1)*blksize:block*blksize]
+                sock.sendto(struct.pack(">HH", TFTP_DATA, block & 0xffff) + payload, client)
+            ack = wait_ack(acked, windowsize)
+            if ack == -1:
+                break
+            if ack is None or ack < last:
+                self.retransmits += 1
+                retries += 1
+            else:
+                retries = 0
+            if ack is not None:
+                acked = max(acked, ack)
+        sock.close()
+
+# Hardware TFTP Receiver ---------------------------------------------------------------------------
+
+TFTP_CAUSES = ["ERROR packet", "timeouts", "options mismatch", "block too large", "max length", "", "", ""]
+
+class TFTPReceiver:
+    def __init__(self, bus, server_ip, server_port=69, blksize=1468, windowsize=16):
+        if not hasattr(bus.regs, "tftp_control"):
+            raise ValueError("SoC built without Hardware TFTP Receiver (--with-tftp-dma).")
+        self.bus        = bus
+        self.clk_freq   = bus.constants.d["config_clock_frequency"]
+        self.blksize    = blksize
+        self.windowsize = windowsize
+        ip = [int(b) for b in server_ip.split(".")]
+        bus.regs.tftp_server_ip.write((ip[0] << 24) | (ip[1] << 16) | (ip[2] << 8) | ip[3])
+        bus.regs.tftp_server_port.write(server_port)
+
+    def load(self, filename, addr, max_length=0, timeout=60.0):
+        regs = self.bus.regs
+        assert self.blksize % 4 == 0
+        assert addr % 4 == 0
+        request = tftp_request(filename, self.blksize, self.windowsize)
+        regs.tftp_control.write(0b100)
+        for n in range(0, len(request), 4):
+            regs.tftp_request_data.write(int.from_bytes(request[n:n + 4].ljust(4, b"\x00"), "little"))
+        regs.tftp_request_length.write(len(request))
+        regs.tftp_base.write(addr)
+        regs.tftp_blksize.write(self.blksize)
+        regs.tftp_windowsize.write(self.windowsize)
+        regs.tftp_max_length.write(max_length)
+        regs.tftp_control.write(0b001)
+        start = time.time()
+        while True:
+            status = regs.tftp_status.read()
+            if status & 0b010:
+                break
+            if status & 0b100:
+                cause = TFTP_CAUSES[(status >> 4) & 0b111]
+                raise RuntimeError(f"TFTP error on {filename} ({cause}, {regs.tftp_timeouts.read()} timeouts).")
+            if time.time() - start > timeout:
+                regs.tftp_control.write(0b010)
+                raise RuntimeError(f"TFTP timeout on {filename}.")
+        return {
+            "bytes"    : regs.tftp_bytes.read(),
+            "duration" : regs.tftp_cycles.read()/self.clk_freq,
+            "acks"     : regs.tftp_acks.read(),
+            "timeouts" : regs.tftp_timeouts.read(),
+        }
+
+# Boot JSON ----------------------------------------------------------------------------------------
+
+def load_boot_json(filename):
+    with open(filename) as f:
+        boot = json.load(f)
+    images   = {k: int(v, 0) for k, v in boot.items() if k not in ["bootargs", "addr"]}
+    bootargs = boot.get("bootargs", {})
+    r = [int(bootargs.get(f"r{n}", "0"), 0) for n in range(1, 4)]
+    addr = int(boot["addr"], 0) if "addr" in boot else list(images.values())[0]
+    return images, addr, r
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="TFTP Netboot benchmark.")
+    parser.add_argument("--csr-csv",     default="csr.csv",            help="SoC CSV file.")
+    parser.add_argument("--host",        default="localhost",          help="litex_server host.")
+    parser.add_argument("--root",        default=".",                  help="Directory of the boot.json and images.")
+    parser.add_argument("--serve",       action="store_true",          help="Serve --root with the built-in TFTP server.")
+    parser.add_argument("--server-ip",   default="192.168.1.100",      help="TFTP server IP address (as seen from the target).")
+    parser.add_argument("--server-port", default=69,     type=int,     help="TFTP server port.")
+    parser.add_argument("--blksize",     default=1468,   type=int,     help="TFTP block size (multiple of 4, 1468 for 1500 MTU).")
+    parser.add_argument("--windowsize",  default=16,     type=int,     help="TFTP window size (in blocks).")
+    parser.add_argument("--verify",      action="store_true",          help="Read back and check the loaded images.")
+    parser.add_argument("--console",     default=None,                 help="BIOS console serial port (BIOS netboot comparison).")
+    parser.add_argument("--baudrate",    default=115200, type=int,     help="BIOS console baudrate.")
+    parser.add_argument("--boot",        action="store_true",          help="Boot the loaded images from the BIOS console (instead of BIOS netboot).")
+    args = parser.parse_args()
+
+    images, addr, r = load_boot_json(os.path.join(args.root, "boot.json"))
+
+    if args.serve:
+        server = TFTPServer(args.root, port=args.server_port)
+        server.start()
+
+    # Hardware TFTP Receiver.
+    bus = RemoteClient(host=args.host, csr_csv=args.csr_csv)
+    bus.open()
+    tftp = TFTPReceiver(bus, args.server_ip, args.server_port, args.blksize, args.windowsize)
+    hw_bytes    = 0
+    hw_duration = 0
+    bases = sorted(images.values())
+    for filename, base in images.items():
+        # Max length: Up to the next image (unlimited for the last one).
+        max_length = min([b - base for b in bases if b > base], default=0)
+        r_ = tftp.load(filename, base, max_length)
+        hw_bytes    += r_["bytes"]
+        hw_duration += r_["duration"]
+        print(f"HW   {filename:<24} @ 0x{base:08x}: {r_['bytes']:10d} bytes, {r_['duration']*1e3:8.2f}ms, "
+              f"{r_['bytes']/r_['duration']/2**20:7.2f} MiB/s ({r_['acks']} ACKs, {r_['timeouts']} timeouts).")
+        if args.verify:
+            data = open(os.path.join(args.root, filename), "rb").read()
+            data = data.ljust((len(data) + 3)//4*4, b"\x00")
+            words = bus.read(base, len(data)//4)
+            if b"".join(struct.pack("<I", w) for w in words)[:len(data)] != data:
+                print(f"HW   {filename}: verify failed!")
+    bus.close()
+    print(f"HW   total: {hw_bytes} bytes, {hw_duration*1e3:.2f}ms, {hw_bytes/hw_duration/2**20:.2f} MiB/s.")
+
+    # BIOS Console.
+    if args.console:
+        import serial
+        port = serial.Serial(args.console, args.baudrate, timeout=0.1)
+        if args.boot:
+            port.write(f"boot 0x{addr:08x} 0x{r[0]:x} 0x{r[1]:x} 0x{r[2]:x}\n".encode())
+            print(f"Booting 0x{addr:08x}...")
+            return
+        port.reset_input_buffer()
+        port.write(b"netboot\n")
+        start = time.time()
+        data  = b""
+        while b"Executing booted program" not in data:
+            data += port.read(256)
+            if time.time() - start > 600:
+                raise RuntimeError("BIOS netboot timeout.")
+        duration = time.time() - start
+        print(f"BIOS netboot: {hw_bytes} bytes, {duration*1e3:.2f}ms, {hw_bytes/duration/2**20:.2f} MiB/s "
+              f"(x{duration/hw_duration:.1f} vs HW).")
+
+if __name__ == "__main__":
+    main()
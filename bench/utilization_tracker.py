@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Resource Utilization Tracker.
+#
+# Builds the targets supported by the open-source toolchains (yosys+nextpnr) at their default
+# configuration (in parallel), extracts the LUT/FF/BRAM/DSP utilization and per-clock Fmax from the
+# Yosys/NextPNR reports and compares them to the last results recorded in the history
+# (litex_boards/lib/utilization.json): resources increases above --resource-threshold, Fmax
+# decreases above --fmax-threshold and builds failing (ex no longer fitting) are flagged as
+# regressions (non-zero exit code, ex for a CI job). With --update, results are appended to the
+# history.
+#
+# ./bench/utilization_tracker.py --jobs=4
+# ./bench/utilization_tracker.py --targets=icebreaker,kosagi_fomu --update
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+import importlib.metadata
+
+from concurrent.futures import ThreadPoolExecutor
+
+from litex_boards.lib.nextpnr import parse_nextpnr_fmax, parse_nextpnr_utilization, get_nextpnr_resources
+from litex_boards.lib.nextpnr import parse_yosys_cells, get_yosys_ff_count, get_toolchain_versions
+from litex_boards.lib.utilization import UtilizationHistory, check_utilization
+
+# Targets (default configuration with the open-source toolchains) ----------------------------------
+
+targets = {
+    "icebreaker"               : [],
+    "kosagi_fomu"              : [],
+    "tinyfpga_bx"              : [],
+    "sipeed_tang_nano"         : ["--toolchain=apicula"],
+    "sipeed_tang_nano_9k"      : ["--toolchain=apicula"],
+    "colorlight_5a_75x"        : ["--board=5a-75b", "--revision=8.0"],
+    "radiona_ulx3s"            : [],
+    "gsd_orangecrab"           : [],
+    "lambdaconcept_ecpix5"     : [],
+    "lattice_crosslink_nx_evn" : ["--toolchain=oxide"],
+}
+
+# Build --------------------------------------------------------------------------------------------
+
+def build(target, args, output_dir):
+    build_dir = os.path.join(output_dir, target)
+    cmd = [sys.executable, "-m", f"litex_boards.targets.{target}", "--build", f"--output-dir={build_dir}", *args]
+    start = time.time()
+    r = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    os.makedirs(build_dir, exist_ok=True)
+    with open(os.path.join(build_dir, "build.log"), "w") as f:
+        f.write(r.stdout)
+    resources = get_nextpnr_resources(parse_nextpnr_utilization(r.stdout))
+    if "ff" not in resources:
+        # FFs packed with the LUTs (ex iCE40 LCs): From Yosys cells.
+        resources["ff"] = (get_yosys_ff_count(parse_yosys_cells(r.stdout)), None)
+    return {
+        "passed"    : (r.returncode == 0) and ("lut" in resources),
+        "resources" : resources,
+        "fmax"      : {c: f for c, (f, _, _) in parse_nextpnr_fmax(r.stdout).items()},
+        "duration"  : time.time() - start,
+    }
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Resource utilization tracker (open-source toolchains).")
+    parser.add_argument("--targets",            default=None,                    help="Targets (default: all tracked targets).")
+    parser.add_argument("--jobs",               default=4,     type=int,         help="Parallel builds.")
+    parser.add_argument("--resource-threshold", default=0.02,  type=float,       help="Resources increase flagged as regression.")
+    parser.add_argument("--fmax-threshold",     default=0.05,  type=float,       help="Fmax decrease flagged as regression.")
+    parser.add_argument("--output-dir",         default="build/utilization",     help="Builds directory.")
+    parser.add_argument("--history",            default=None,                    help="History file (default: litex_boards/lib/utilization.json).")
+    parser.add_argument("--update",             action="store_true",             help="Append the results to the history.")
+    args = parser.parse_args()
+
+    names   = list(targets.keys()) if args.targets is None else args.targets.split(",")
+    history = UtilizationHistory(args.history)
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        results = dict(zip(names, executor.map(lambda t: build(t, targets.get(t, []), args.output_dir), names)))
+
+    versions    = {"litex": importlib.metadata.version("litex"), "toolchain": get_toolchain_versions()}
+    regressions = 0
+    for target, result in results.items():
+        previous = history.last(target)
+        if not result["passed"]:
+            regressions += 1
+            print(f"{target:<26}: FAIL (build failed or does not fit, see {args.output_dir}/{target}/build.log).")
+            continue
+        resources = ", ".join(f"{k.upper()}: {u}" + (f"/{a}" if a else "") for k, (u, a) in result["resources"].items())
+        clocks    = ", ".join(f"{c}: {f/1e6:.2f}MHz" for c, f in result["fmax"].items())
+        print(f"{target:<26}: {resources}, {clocks} ({result['duration']:.0f}s).")
+        _regressions, _warnings = check_utilization(previous, result,
+            resource_threshold = args.resource_threshold,
+            fmax_threshold     = args.fmax_threshold,
+        )
+        for warning in _warnings:
+            print(f"{'':<26}  WARNING: {warning}")
+        for regression in _regressions:
+            print(f"{'':<26}  REGRESSION: {regression}")
+        regressions += len(_regressions)
+        if args.update:
+            history.append(target, {
+                "resources" : result["resources"],
+                "fmax"      : result["fmax"],
+                "args"      : " ".join(targets.get(target, [])),
+                "date"      : time.strftime("%Y-%m-%d"),
+                **versions,
+            })
+
+    if args.update:
+        history.save()
+        print(f"Results appended to {history.filename}.")
+    if regressions:
+        print(f"{regressions} regression(s) found.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Video Blitter Benchmark.
+#
+# Host-side benchmark for targets with a page-flipped Video FrameBuffer and Video Blitter (ex Nexys
+# Video/ECPIX-5 with --with-video-framebuffer --video-buffers=2 --with-video-blitter): Runs full
+# page fills/copies and rectangle blits on the Blitter and reports the operations/s and throughput
+# (from the Blitter's cycles counter), then checks the VSync page flips (flip latency, frames/s).
+#
+# The CPU fill/copy throughputs are estimated from the BIOS mem_speed results (mem_speed command
+# on the FrameBuffer region) given with --cpu-write/--cpu-read (in MiB/s): a fill is bounded by
+# the write speed and a copy by 1/(1/read + 1/write).
+#
+# Build/Load the target, start a litex_server and:
+# ./bench/video_blitter_bench.py --csr-csv=csr.csv --cpu-read=80 --cpu-write=120
+
+import time
+import argparse
+
+from litex import RemoteClient
+
+# Video Blitter ------------------------------------------------------------------------------------
+
+BLITTER_FILL = 0
+BLITTER_COPY = 1
+
+class VideoBlitter:
+    def __init__(self, bus):
+        self.bus      = bus
+        self.base     = bus.constants.d["video_framebuffer_base"]
+        self.hres     = bus.constants.d["video_framebuffer_hres"]
+        self.vres     = bus.constants.d["video_framebuffer_vres"]
+        self.depth    = bus.constants.d["video_framebuffer_depth"]
+        self.stride   = bus.constants.d["video_framebuffer_stride"]
+        self.nbuffers = bus.constants.d["video_framebuffer_nbuffers"]
+        self.line     = self.hres*self.depth//8
+        self.clk_freq = bus.constants.d["config_clock_frequency"]
+
+    def page(self, n):
+        return self.base + n*self.stride
+
+    def run(self, mode, dst, width, height, src=0, color=0, src_stride=None, dst_stride=None):
+        regs = self.bus.regs
+        regs.video_blitter_src.write(src)
+        regs.video_blitter_dst.write(dst)
+        regs.video_blitter_width.write(width)
+        regs.video_blitter_height.write(height)
+        regs.video_blitter_src_stride.write(self.line if src_stride is None else src_stride)
+        regs.video_blitter_dst_stride.write(self.line if dst_stride is None else dst_stride)
+        regs.video_blitter_color.write(color)
+        regs.video_blitter_control.write((mode << 1) | 1)
+        while regs.video_blitter_status.read() & 0x1:
+            pass
+        return regs.video_blitter_cycles.read()/self.clk_freq
+
+    def flip(self, page, timeout=1.0):
+        regs   = self.bus.regs
+        frames = regs.video_framebuffer_flipper_frames.read()
+        start  = time.time()
+        regs.video_framebuffer_flipper_flip.write(page)
+        while regs.video_framebuffer_flipper_status.read() & (1 << 8):
+            if time.time() - start > timeout:
+                raise RuntimeError("Page flip not applied (FrameBuffer disabled?).")
+        return time.time() - start, (regs.video_framebuffer_flipper_frames.read() - frames) % 2**32
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def report(name, duration, nbytes, cpu_rate=None):
+    rate = nbytes/duration/2**20
+    line = f"{name:<24}: {1/duration:10.2f} ops/s, {rate:8.2f} MiB/s"
+    if cpu_rate:
+        line += f" (CPU: {cpu_rate*2**20/nbytes:10.2f} ops/s, x{rate/cpu_rate:5.2f})"
+    print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Video Blitter benchmark.")
+    parser.add_argument("--csr-csv",    default="csr.csv",   help="SoC CSV file.")
+    parser.add_argument("--host",       default="localhost", help="litex_server host.")
+    parser.add_argument("--port",       default=1234, type=int,   help="litex_server port.")
+    parser.add_argument("--loops",      default=16,   type=int,   help="Operations per measurement.")
+    parser.add_argument("--rect",       default="256x256",        help="Rectangle blit size (in pixels).")
+    parser.add_argument("--cpu-read",   default=None, type=float, help="CPU read speed from BIOS mem_speed (MiB/s).")
+    parser.add_argument("--cpu-write",  default=None, type=float, help="CPU write speed from BIOS mem_speed (MiB/s).")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+
+    blitter = VideoBlitter(bus)
+    print(f"FrameBuffer: {blitter.hres}x{blitter.vres}, {blitter.depth}-bit, {blitter.nbuffers} pages.")
+
+    cpu_fill = args.cpu_write
+    cpu_copy = None
+    if args.cpu_read and args.cpu_write:
+        cpu_copy = 1/(1/args.cpu_read + 1/args.cpu_write)
+
+    # Page Fill/Copy.
+    page_size = blitter.line*blitter.vres
+    fill = sum(blitter.run(BLITTER_FILL, blitter.page(1), blitter.line, blitter.vres, color=n)
+        for n in range(args.loops))/args.loops
+    report("Page Fill", fill, page_size, cpu_fill)
+    copy = sum(blitter.run(BLITTER_COPY, blitter.page(0), blitter.line, blitter.vres, src=blitter.page(1))
+        for n in range(args.loops))/args.loops
+    report("Page Copy", copy, page_size, cpu_copy)
+
+    # Rectangle Blit.
+    rect_w, rect_h = (int(v) for v in args.rect.split("x"))
+    rect_w = min(rect_w, blitter.hres//2)*blitter.depth//8
+    rect_h = min(rect_h, blitter.vres//2)
+    blit = sum(blitter.run(BLITTER_COPY, blitter.page(0) + blitter.line*rect_h + rect_w, rect_w, rect_h,
+        src=blitter.page(1)) for n in range(args.loops))/args.loops
+    report(f"Blit {args.rect}", blit, rect_w*rect_h, cpu_copy)
+
+    # Page Flips.
+    latencies = []
+    for n in range(args.loops):
+        latency, frames = blitter.flip(n % blitter.nbuffers)
+        latencies.append(latency)
+    blitter.flip(0)
+    frames = bus.regs.video_framebuffer_flipper_frames.read()
+    time.sleep(1.0)
+    fps = (bus.regs.video_framebuffer_flipper_frames.read() - frames) % 2**32
+    print(f"Page Flip               : {fps} frames/s, latency: {1e3*min(latencies):.2f}-{1e3*max(latencies):.2f} ms (incl. host accesses).")
+
+    bus.close()
+
+if __name__ == "__main__":
+    main()
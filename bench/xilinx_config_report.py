@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Xilinx Configuration Time Report.
+#
+# Lists the Xilinx platforms declaring their configuration SPI Flash (config_flash_part) with their
+# current configuration settings vs the --fast-config ones and the estimated power-on configuration
+# times (uncompressed bitstream, nominal and worst-case/slowest CCLK). Compression gains are design
+# dependent and can be given with --compress-ratio (compressed/uncompressed size ratio).
+#
+# ./bench/xilinx_config_report.py [--compress-ratio=0.5] [--csv=report.csv]
+
+import csv
+import pkgutil
+import argparse
+import importlib
+
+from litex_boards import platforms
+from litex_boards.lib.xilinx_config import config_families, get_config_family
+from litex_boards.lib.xilinx_config import get_fast_config, get_platform_config, get_config_time
+
+# Report -------------------------------------------------------------------------------------------
+
+def get_platforms():
+    for module in pkgutil.iter_modules(platforms.__path__):
+        try:
+            platform = importlib.import_module(f"litex_boards.platforms.{module.name}")
+        except Exception:
+            continue
+        if getattr(getattr(platform, "Platform", None), "config_flash_part", None) is None:
+            continue
+        yield module.name, platform.Platform
+
+def get_report(compress_ratio=1.0):
+    for name, platform_cls in get_platforms():
+        platform = platform_cls()
+        family   = get_config_family(platform.device)
+        tol      = config_families[family]["tolerance"]
+        current  = get_platform_config(platform)
+        fast     = get_fast_config(platform.device, platform.config_flash_part, platform.config_flash_buswidth)
+        current_ratio = compress_ratio if current["compress"] else 1.0
+        yield {
+            "platform"          : name,
+            "device"            : platform.device,
+            "flash"             : platform.config_flash_part,
+            "current_rate"      : current["rate"],
+            "current_buswidth"  : current["buswidth"],
+            "current_compress"  : current["compress"],
+            "current_time"      : get_config_time(platform.device, current["rate"], current["buswidth"], current_ratio),
+            "current_time_max"  : get_config_time(platform.device, current["rate"], current["buswidth"], current_ratio, tol),
+            "fast_rate"         : fast["rate"],
+            "fast_buswidth"     : fast["buswidth"],
+            "fast_time"         : get_config_time(platform.device, fast["rate"], fast["buswidth"], compress_ratio),
+            "fast_time_max"     : get_config_time(platform.device, fast["rate"], fast["buswidth"], compress_ratio, tol),
+        }
+
+def fmt_time(t):
+    return "     -" if t is None else f"{1e3*t:6.0f}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Xilinx configuration time report.")
+    parser.add_argument("--compress-ratio", default=1.0, type=float, help="Compressed/Uncompressed bitstream size ratio.")
+    parser.add_argument("--csv",            default=None,            help="Also write the report to a CSV file.")
+    args = parser.parse_args()
+
+    report = list(get_report(args.compress_ratio))
+
+    print(f"{'Platform':<28} {'Device':<22} {'Flash':<12} {'Current':>12} {'ms':>6} {'max':>6} {'Fast':>12} {'ms':>6} {'max':>6}")
+    for r in report:
+        current = "{:g}MHz x{}{}".format(r["current_rate"], r["current_buswidth"], "c" if r["current_compress"] else "")
+        fast    = "{:g}MHz x{}c".format(r["fast_rate"], r["fast_buswidth"])
+        print(f"{r['platform']:<28} {r['device']:<22} {r['flash']:<12} {current:>12} "
+              f"{fmt_time(r['current_time'])} {fmt_time(r['current_time_max'])} "
+              f"{fast:>12} {fmt_time(r['fast_time'])} {fmt_time(r['fast_time_max'])}")
+
+    if args.csv is not None:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(report[0].keys()))
+            writer.writeheader()
+            writer.writerows(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Zynq7000/ZynqMP PL-to-PS DMA Bandwidth Test.
+#
+# Runs on the target's Linux (Zynq PS) with the target built with --with-ps-dma (see
+# litex_boards/lib/zynq_dma.py): uses the PS DMA pattern generator/checker to measure the write,
+# read and concurrent write/read bandwidth to PS DDR through the selected HP/HPC/ACP port, and
+# checks the data read back.
+#
+# CSRs and ring-buffers are accessed through /dev/mem, the ring-buffers region must be reserved
+# from Linux (ex with mem=496M on the kernel command line for the default --region-base/size).
+#
+# ./zynq_ps_dma_bandwidth.py --csr-csv=csr.csv --sizes=4096,65536,1048576
+
+import os
+import csv
+import mmap
+import time
+import struct
+import argparse
+
+# CSRs ---------------------------------------------------------------------------------------------
+
+class CSRs:
+    def __init__(self, csr_csv, prefix="ps_dma"):
+        self.regs      = {}
+        self.constants = {}
+        with open(csr_csv) as f:
+            for row in csv.reader(f):
+                if row and row[0] == "csr_register" and row[1].startswith(prefix):
+                    self.regs[row[1][len(prefix) + 1:]] = (int(row[2], 0), int(row[3]))
+                if row and row[0] == "constant":
+                    self.constants[row[1]] = row[2]
+        if not len(self.regs):
+            raise ValueError(f"No {prefix} CSRs in {csr_csv}.")
+        self.base = min(addr for addr, _ in self.regs.values()) & ~(mmap.PAGESIZE - 1)
+        size      = max(addr + 4*n for addr, n in self.regs.values()) - self.base
+        self.fd   = os.open("/dev/mem", os.O_RDWR | os.O_SYNC)
+        self.mem  = mmap.mmap(self.fd, size, offset=self.base)
+
+    def close(self):
+        self.mem.close()
+        os.close(self.fd)
+
+    def read(self, name):
+        addr, size = self.regs[name]
+        value = 0
+        for n in range(size):
+            value = (value << 32) | struct.unpack_from("<I", self.mem, addr - self.base + 4*n)[0]
+        return value
+
+    def write(self, name, value):
+        addr, size = self.regs[name]
+        for n in range(size):
+            struct.pack_into("<I", self.mem, addr - self.base + 4*n, (value >> (32*(size - 1 - n))) & 0xffffffff)
+
+# Bandwidth Test -----------------------------------------------------------------------------------
+
+DMA_ENABLE = (1 << 0)
+DMA_LOOP   = (1 << 1)
+
+def configure(csrs, dma, base, size, buffers):
+    csrs.write(f"{dma}_control",  0)
+    csrs.write(f"{dma}_base",     base)
+    csrs.write(f"{dma}_size",     size)
+    csrs.write(f"{dma}_buffers",  buffers)
+    csrs.write(f"{dma}_sw_count", 0)
+
+def measure(csrs, duration, data_width):
+    csrs.write("test", 0)
+    csrs.write("test", 1)
+    start = time.time()
+    time.sleep(duration)
+    wbeats  = csrs.read("test_write_beats")
+    rbeats  = csrs.read("test_read_beats")
+    elapsed = time.time() - start
+    errors  = csrs.read("test_errors")
+    to_mbps = lambda beats: beats*data_width/8/elapsed/1e6
+    return to_mbps(wbeats), to_mbps(rbeats), errors
+
+def bench(csrs, region_base, region_size, size, duration, data_width):
+    buffers = min(region_size//size, 2**16 - 1)
+    configure(csrs, "writer", region_base, size, buffers)
+    configure(csrs, "reader", region_base, size, buffers)
+    csrs.write("test_words", buffers*size//(data_width//8))
+
+    # Write (also fills the ring with the pattern for the read checks).
+    csrs.write("test", 1)
+    csrs.write("writer_control", DMA_ENABLE | DMA_LOOP)
+    while csrs.read("writer_hw_count") < buffers:
+        time.sleep(0.01)
+    write, _, _ = measure(csrs, duration, data_width)
+
+    # Write + Read.
+    csrs.write("reader_control", DMA_ENABLE | DMA_LOOP)
+    both_w, both_r, both_errors = measure(csrs, duration, data_width)
+
+    # Read.
+    csrs.write("writer_control", 0)
+    _, read, read_errors = measure(csrs, duration, data_width)
+    csrs.write("reader_control", 0)
+    csrs.write("test", 0)
+
+    print(f"{size:8d} bytes x {buffers:5d}: "
+        f"Write {write:8.2f} MB/s, Read {read:8.2f} MB/s ({read_errors} errors), "
+        f"Write+Read {both_w:8.2f} + {both_r:8.2f} MB/s ({both_errors} errors)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Zynq7000/ZynqMP PL-to-PS DMA bandwidth test.")
+    parser.add_argument("--csr-csv",     default="csr.csv",     help="SoC CSV file.")
+    parser.add_argument("--region-base", default="0x1f000000",  help="Reserved DDR region base.")
+    parser.add_argument("--region-size", default="0x01000000",  help="Reserved DDR region size.")
+    parser.add_argument("--sizes",       default="4096,65536,1048576", help="Buffer sizes to test (bytes).")
+    parser.add_argument("--data-width",  default=None, type=int,   help="PS port data width (64: Zynq7000, 128: ZynqMP).")
+    parser.add_argument("--duration",    default=2.0,  type=float, help="Test duration per measure (s).")
+    args = parser.parse_args()
+
+    csrs       = CSRs(args.csr_csv)
+    data_width = args.data_width or {"zynqmp": 128}.get(csrs.constants.get("config_cpu_name"), 64)
+    try:
+        for size in [int(s) for s in args.sizes.split(",")]:
+            bench(csrs,
+                region_base  = int(args.region_base, 0),
+                region_size  = int(args.region_size, 0),
+                size         = size,
+                duration     = args.duration,
+                data_width   = data_width)
+    finally:
+        csrs.close()
+
+if __name__ == "__main__":
+    main()
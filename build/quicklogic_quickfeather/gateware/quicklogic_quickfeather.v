@@ -0,0 +1,944 @@
+// -----------------------------------------------------------------------------
+// Auto-Generated by:        __   _ __      _  __
+//                          / /  (_) /____ | |/_/
+//                         / /__/ / __/ -_)>  <
+//                        /____/_/\__/\__/_/|_|
+//                     Build your hardware, easily!
+//                   https://github.com/enjoy-digital/litex
+//
+// Filename   : quicklogic_quickfeather.v
+// Device     : ql-eos-s3
+// LiteX sha1 : 519ce9d
+// Date       : 2026-10-19 11:59:39
+//------------------------------------------------------------------------------
+
+`timescale 1ns / 1ps
+
+//------------------------------------------------------------------------------
+// Module
+//------------------------------------------------------------------------------
+
+module quicklogic_quickfeather (
+    input  wire          user_btn_n0,
+    output wire          user_led0,
+    output wire          user_led1,
+    output wire          user_led2
+);
+
+
+//------------------------------------------------------------------------------
+// Hierarchy
+//------------------------------------------------------------------------------
+
+/*
+BaseSoC
+└─── crg (_CRG)
+│    └─── [qlal4s3b_cell_macro]
+└─── bus (SoCBusHandler)
+└─── csr (SoCCSRHandler)
+└─── irq (SoCIRQHandler)
+└─── ctrl (SoCController)
+└─── cpu (CPUNone)
+└─── sram (SRAM)
+└─── identifier (Identifier)
+└─── timer0 (Timer)
+│    └─── ev (EventManager)
+│    │    └─── eventsourceprocess_0* (EventSourceProcess)
+└─── leds (LedChaser)
+│    └─── waittimer_0* (WaitTimer)
+└─── gpio (GPIOIn)
+│    └─── ev (EventManager)
+│    │    └─── eventsourceprocess_0* (EventSourceProcess)
+└─── csr_bridge (Wishbone2CSR)
+│    └─── fsm (FSM)
+└─── csr_bankarray (CSRBankArray)
+│    └─── csrbank_0* (CSRBank)
+│    │    └─── csrstorage_0* (CSRStorage)
+│    │    └─── csrstorage_1* (CSRStorage)
+│    │    └─── csrstatus_0* (CSRStatus)
+│    └─── csrbank_1* (CSRBank)
+│    │    └─── csrstatus_0* (CSRStatus)
+│    │    └─── csrstorage_0* (CSRStorage)
+│    │    └─── csrstorage_1* (CSRStorage)
+│    │    └─── csrstatus_1* (CSRStatus)
+│    │    └─── csrstatus_2* (CSRStatus)
+│    │    └─── csrstorage_2* (CSRStorage)
+│    └─── sram_0* (SRAM)
+│    └─── csrbank_2* (CSRBank)
+│    │    └─── csrstorage_0* (CSRStorage)
+│    └─── csrbank_3* (CSRBank)
+│    │    └─── csrstorage_0* (CSRStorage)
+│    │    └─── csrstorage_1* (CSRStorage)
+│    │    └─── csrstorage_2* (CSRStorage)
+│    │    └─── csrstorage_3* (CSRStorage)
+│    │    └─── csrstatus_0* (CSRStatus)
+│    │    └─── csrstatus_1* (CSRStatus)
+│    │    └─── csrstatus_2* (CSRStatus)
+│    │    └─── csrstorage_4* (CSRStorage)
+└─── csr_interconnect (InterconnectShared)
+* : Generated name.
+[]: BlackBox.
+*/
+
+//------------------------------------------------------------------------------
+// Signals
+//------------------------------------------------------------------------------
+
+wire   [10:0] adr;
+reg           adr_burst = 1'd0;
+reg           bus_error = 1'd0;
+reg    [31:0] bus_errors = 32'd0;
+reg           bus_errors_re = 1'd0;
+wire   [31:0] bus_errors_status;
+wire          bus_errors_we;
+reg     [2:0] chaser = 3'd0;
+reg    [20:0] count = 21'd1666666;
+wire          cpu_rst;
+wire          crg0;
+wire          crg1;
+reg           crg_rst0 = 1'd0;
+wire    [5:0] csr_bankarray_adr;
+wire   [31:0] csr_bankarray_csrbank0_bus_errors_r;
+reg           csr_bankarray_csrbank0_bus_errors_re = 1'd0;
+wire   [31:0] csr_bankarray_csrbank0_bus_errors_w;
+reg           csr_bankarray_csrbank0_bus_errors_we = 1'd0;
+wire    [1:0] csr_bankarray_csrbank0_reset0_r;
+reg           csr_bankarray_csrbank0_reset0_re = 1'd0;
+wire    [1:0] csr_bankarray_csrbank0_reset0_w;
+reg           csr_bankarray_csrbank0_reset0_we = 1'd0;
+wire   [31:0] csr_bankarray_csrbank0_scratch0_r;
+reg           csr_bankarray_csrbank0_scratch0_re = 1'd0;
+wire   [31:0] csr_bankarray_csrbank0_scratch0_w;
+reg           csr_bankarray_csrbank0_scratch0_we = 1'd0;
+wire          csr_bankarray_csrbank0_sel;
+wire          csr_bankarray_csrbank1_edge0_r;
+reg           csr_bankarray_csrbank1_edge0_re = 1'd0;
+wire          csr_bankarray_csrbank1_edge0_w;
+reg           csr_bankarray_csrbank1_edge0_we = 1'd0;
+wire          csr_bankarray_csrbank1_ev_enable0_r;
+reg           csr_bankarray_csrbank1_ev_enable0_re = 1'd0;
+wire          csr_bankarray_csrbank1_ev_enable0_w;
+reg           csr_bankarray_csrbank1_ev_enable0_we = 1'd0;
+wire          csr_bankarray_csrbank1_ev_pending_r;
+reg           csr_bankarray_csrbank1_ev_pending_re = 1'd0;
+wire          csr_bankarray_csrbank1_ev_pending_w;
+reg           csr_bankarray_csrbank1_ev_pending_we = 1'd0;
+wire          csr_bankarray_csrbank1_ev_status_r;
+reg           csr_bankarray_csrbank1_ev_status_re = 1'd0;
+wire          csr_bankarray_csrbank1_ev_status_w;
+reg           csr_bankarray_csrbank1_ev_status_we = 1'd0;
+wire          csr_bankarray_csrbank1_in_r;
+reg           csr_bankarray_csrbank1_in_re = 1'd0;
+wire          csr_bankarray_csrbank1_in_w;
+reg           csr_bankarray_csrbank1_in_we = 1'd0;
+wire          csr_bankarray_csrbank1_mode0_r;
+reg           csr_bankarray_csrbank1_mode0_re = 1'd0;
+wire          csr_bankarray_csrbank1_mode0_w;
+reg           csr_bankarray_csrbank1_mode0_we = 1'd0;
+wire          csr_bankarray_csrbank1_sel;
+wire    [2:0] csr_bankarray_csrbank2_out0_r;
+reg           csr_bankarray_csrbank2_out0_re = 1'd0;
+wire    [2:0] csr_bankarray_csrbank2_out0_w;
+reg           csr_bankarray_csrbank2_out0_we = 1'd0;
+wire          csr_bankarray_csrbank2_sel;
+wire          csr_bankarray_csrbank3_en0_r;
+reg           csr_bankarray_csrbank3_en0_re = 1'd0;
+wire          csr_bankarray_csrbank3_en0_w;
+reg           csr_bankarray_csrbank3_en0_we = 1'd0;
+wire          csr_bankarray_csrbank3_ev_enable0_r;
+reg           csr_bankarray_csrbank3_ev_enable0_re = 1'd0;
+wire          csr_bankarray_csrbank3_ev_enable0_w;
+reg           csr_bankarray_csrbank3_ev_enable0_we = 1'd0;
+wire          csr_bankarray_csrbank3_ev_pending_r;
+reg           csr_bankarray_csrbank3_ev_pending_re = 1'd0;
+wire          csr_bankarray_csrbank3_ev_pending_w;
+reg           csr_bankarray_csrbank3_ev_pending_we = 1'd0;
+wire          csr_bankarray_csrbank3_ev_status_r;
+reg           csr_bankarray_csrbank3_ev_status_re = 1'd0;
+wire          csr_bankarray_csrbank3_ev_status_w;
+reg           csr_bankarray_csrbank3_ev_status_we = 1'd0;
+wire   [31:0] csr_bankarray_csrbank3_load0_r;
+reg           csr_bankarray_csrbank3_load0_re = 1'd0;
+wire   [31:0] csr_bankarray_csrbank3_load0_w;
+reg           csr_bankarray_csrbank3_load0_we = 1'd0;
+wire   [31:0] csr_bankarray_csrbank3_reload0_r;
+reg           csr_bankarray_csrbank3_reload0_re = 1'd0;
+wire   [31:0] csr_bankarray_csrbank3_reload0_w;
+reg           csr_bankarray_csrbank3_reload0_we = 1'd0;
+wire          csr_bankarray_csrbank3_sel;
+wire          csr_bankarray_csrbank3_update_value0_r;
+reg           csr_bankarray_csrbank3_update_value0_re = 1'd0;
+wire          csr_bankarray_csrbank3_update_value0_w;
+reg           csr_bankarray_csrbank3_update_value0_we = 1'd0;
+wire   [31:0] csr_bankarray_csrbank3_value_r;
+reg           csr_bankarray_csrbank3_value_re = 1'd0;
+wire   [31:0] csr_bankarray_csrbank3_value_w;
+reg           csr_bankarray_csrbank3_value_we = 1'd0;
+wire    [7:0] csr_bankarray_dat_r;
+wire   [13:0] csr_bankarray_interface0_bank_bus_adr;
+reg    [31:0] csr_bankarray_interface0_bank_bus_dat_r = 32'd0;
+wire   [31:0] csr_bankarray_interface0_bank_bus_dat_w;
+wire          csr_bankarray_interface0_bank_bus_re;
+wire          csr_bankarray_interface0_bank_bus_we;
+wire   [13:0] csr_bankarray_interface1_bank_bus_adr;
+reg    [31:0] csr_bankarray_interface1_bank_bus_dat_r = 32'd0;
+wire   [31:0] csr_bankarray_interface1_bank_bus_dat_w;
+wire          csr_bankarray_interface1_bank_bus_re;
+wire          csr_bankarray_interface1_bank_bus_we;
+wire   [13:0] csr_bankarray_interface2_bank_bus_adr;
+reg    [31:0] csr_bankarray_interface2_bank_bus_dat_r = 32'd0;
+wire   [31:0] csr_bankarray_interface2_bank_bus_dat_w;
+wire          csr_bankarray_interface2_bank_bus_re;
+wire          csr_bankarray_interface2_bank_bus_we;
+wire   [13:0] csr_bankarray_interface3_bank_bus_adr;
+reg    [31:0] csr_bankarray_interface3_bank_bus_dat_r = 32'd0;
+wire   [31:0] csr_bankarray_interface3_bank_bus_dat_w;
+wire          csr_bankarray_interface3_bank_bus_re;
+wire          csr_bankarray_interface3_bank_bus_we;
+wire          csr_bankarray_sel;
+reg           csr_bankarray_sel_r = 1'd0;
+wire   [13:0] csr_bankarray_sram_bus_adr;
+reg    [31:0] csr_bankarray_sram_bus_dat_r = 32'd0;
+wire   [31:0] csr_bankarray_sram_bus_dat_w;
+wire          csr_bankarray_sram_bus_re;
+wire          csr_bankarray_sram_bus_we;
+wire   [13:0] csr_interconnect_adr;
+wire   [31:0] csr_interconnect_dat_r;
+wire   [31:0] csr_interconnect_dat_w;
+wire          csr_interconnect_re;
+wire          csr_interconnect_we;
+wire   [31:0] dat_r;
+wire   [31:0] dat_w;
+wire          done;
+reg           en_re = 1'd0;
+reg           en_storage = 1'd0;
+reg           enable_re = 1'd0;
+reg           enable_storage = 1'd0;
+reg           gpioin_clear = 1'd0;
+reg           gpioin_edge_re = 1'd0;
+reg           gpioin_edge_storage = 1'd0;
+reg           gpioin_enable_re = 1'd0;
+reg           gpioin_enable_storage = 1'd0;
+wire          gpioin_i00;
+wire          gpioin_i01;
+wire          gpioin_i02;
+reg           gpioin_in_pads_n_d = 1'd0;
+wire          gpioin_irq;
+reg           gpioin_mode_re = 1'd0;
+reg           gpioin_mode_storage = 1'd0;
+reg           gpioin_pending = 1'd0;
+reg           gpioin_pending_r = 1'd0;
+reg           gpioin_pending_re = 1'd0;
+reg           gpioin_pending_status = 1'd0;
+wire          gpioin_pending_we;
+wire          gpioin_status;
+reg           gpioin_status_re = 1'd0;
+reg           gpioin_status_status = 1'd0;
+wire          gpioin_status_we;
+reg           gpioin_trigger = 1'd0;
+reg           gpioin_trigger_d = 1'd0;
+reg           in_re = 1'd0;
+wire          in_status;
+wire          in_we;
+reg           interface0_ack = 1'd0;
+reg    [29:0] interface0_adr = 30'd0;
+reg           interface0_cyc = 1'd0;
+reg    [31:0] interface0_dat_r = 32'd0;
+reg    [31:0] interface0_dat_w = 32'd0;
+reg     [3:0] interface0_sel = 4'd0;
+reg           interface0_stb = 1'd0;
+reg           interface0_we = 1'd0;
+reg    [13:0] interface1_adr = 14'd0;
+wire   [31:0] interface1_dat_r;
+reg    [31:0] interface1_dat_w = 32'd0;
+reg           interface1_re = 1'd0;
+reg           interface1_we = 1'd0;
+wire          irq;
+reg     [2:0] leds = 3'd0;
+reg           load_re = 1'd0;
+reg    [31:0] load_storage = 32'd0;
+reg           mode = 1'd0;
+reg           next_state = 1'd0;
+reg           pending_r = 1'd0;
+reg           pending_re = 1'd0;
+reg           pending_status = 1'd0;
+wire          pending_we;
+reg           ram_bus_ack = 1'd0;
+reg    [29:0] ram_bus_adr = 30'd0;
+reg           ram_bus_cyc = 1'd0;
+wire   [31:0] ram_bus_dat_r;
+reg    [31:0] ram_bus_dat_w = 32'd0;
+reg     [3:0] ram_bus_sel = 4'd0;
+reg           ram_bus_stb = 1'd0;
+reg           ram_bus_we = 1'd0;
+reg           re = 1'd0;
+reg           regs0 = 1'd0;
+reg           regs1 = 1'd0;
+reg           reload_re = 1'd0;
+reg    [31:0] reload_storage = 32'd0;
+reg           reset_re = 1'd0;
+reg     [1:0] reset_storage = 2'd0;
+reg           scratch_re = 1'd0;
+reg    [31:0] scratch_storage = 32'd305419896;
+reg           soc_rst = 1'd0;
+reg           state = 1'd0;
+reg           status_re = 1'd0;
+reg           status_status = 1'd0;
+wire          status_we;
+reg     [2:0] storage = 3'd0;
+wire          sys_clk;
+wire          sys_rst;
+reg           update_value_re = 1'd0;
+reg           update_value_storage = 1'd0;
+reg    [31:0] value = 32'd0;
+reg           value_re = 1'd0;
+reg    [31:0] value_status = 32'd0;
+wire          value_we;
+wire          wait_1;
+reg     [3:0] we = 4'd0;
+wire          zero0;
+wire          zero1;
+wire          zero2;
+reg           zero_clear = 1'd0;
+reg           zero_pending = 1'd0;
+wire          zero_status;
+wire          zero_trigger;
+reg           zero_trigger_d = 1'd0;
+
+//------------------------------------------------------------------------------
+// Combinatorial Logic
+//------------------------------------------------------------------------------
+
+always @(*) begin
+    crg_rst0 <= 1'd0;
+    if (soc_rst) begin
+        crg_rst0 <= 1'd1;
+    end
+end
+assign bus_errors_status = bus_errors;
+always @(*) begin
+    we <= 4'd0;
+    we[0] <= (((ram_bus_cyc & ram_bus_stb) & ram_bus_we) & ram_bus_sel[0]);
+    we[1] <= (((ram_bus_cyc & ram_bus_stb) & ram_bus_we) & ram_bus_sel[1]);
+    we[2] <= (((ram_bus_cyc & ram_bus_stb) & ram_bus_we) & ram_bus_sel[2]);
+    we[3] <= (((ram_bus_cyc & ram_bus_stb) & ram_bus_we) & ram_bus_sel[3]);
+end
+assign adr = ram_bus_adr[10:0];
+assign ram_bus_dat_r = dat_r;
+assign dat_w = ram_bus_dat_w;
+assign zero_trigger = (value == 1'd0);
+assign zero0 = zero_status;
+assign zero1 = zero_pending;
+always @(*) begin
+    zero_clear <= 1'd0;
+    if ((pending_re & pending_r)) begin
+        zero_clear <= 1'd1;
+    end
+end
+assign irq = (pending_status & enable_storage);
+assign zero_status = zero_trigger;
+assign wait_1 = (~done);
+always @(*) begin
+    leds <= 3'd0;
+    if ((mode == 1'd1)) begin
+        leds <= storage;
+    end else begin
+        leds <= chaser;
+    end
+end
+assign {user_led2, user_led1, user_led0} = (leds ^ 1'd0);
+assign done = (count == 1'd0);
+always @(*) begin
+    gpioin_trigger <= 1'd0;
+    if (gpioin_mode_storage) begin
+        gpioin_trigger <= (in_status ^ gpioin_in_pads_n_d);
+    end else begin
+        gpioin_trigger <= (in_status ^ gpioin_edge_storage);
+    end
+end
+assign gpioin_i00 = gpioin_status;
+assign gpioin_i01 = gpioin_pending;
+always @(*) begin
+    gpioin_clear <= 1'd0;
+    if ((gpioin_pending_re & gpioin_pending_r)) begin
+        gpioin_clear <= 1'd1;
+    end
+end
+assign gpioin_irq = (gpioin_pending_status & gpioin_enable_storage);
+assign gpioin_status = gpioin_trigger;
+always @(*) begin
+    interface0_ack <= 1'd0;
+    interface0_dat_r <= 32'd0;
+    interface1_adr <= 14'd0;
+    interface1_dat_w <= 32'd0;
+    interface1_re <= 1'd0;
+    interface1_we <= 1'd0;
+    next_state <= 1'd0;
+    next_state <= state;
+    case (state)
+        1'd1: begin
+            interface0_ack <= 1'd1;
+            interface0_dat_r <= interface1_dat_r;
+            next_state <= 1'd0;
+        end
+        default: begin
+            interface1_dat_w <= interface0_dat_w;
+            if ((interface0_cyc & interface0_stb)) begin
+                interface1_adr <= interface0_adr[29:0];
+                interface1_re <= ((~interface0_we) & (interface0_sel != 1'd0));
+                interface1_we <= (interface0_we & (interface0_sel != 1'd0));
+                next_state <= 1'd1;
+            end
+        end
+    endcase
+end
+assign csr_bankarray_csrbank0_sel = (csr_bankarray_interface0_bank_bus_adr[13:9] == 1'd0);
+assign csr_bankarray_csrbank0_reset0_r = csr_bankarray_interface0_bank_bus_dat_w[1:0];
+always @(*) begin
+    csr_bankarray_csrbank0_reset0_re <= 1'd0;
+    csr_bankarray_csrbank0_reset0_we <= 1'd0;
+    if ((csr_bankarray_csrbank0_sel & (csr_bankarray_interface0_bank_bus_adr[8:0] == 1'd0))) begin
+        csr_bankarray_csrbank0_reset0_re <= csr_bankarray_interface0_bank_bus_we;
+        csr_bankarray_csrbank0_reset0_we <= csr_bankarray_interface0_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank0_scratch0_r = csr_bankarray_interface0_bank_bus_dat_w[31:0];
+always @(*) begin
+    csr_bankarray_csrbank0_scratch0_re <= 1'd0;
+    csr_bankarray_csrbank0_scratch0_we <= 1'd0;
+    if ((csr_bankarray_csrbank0_sel & (csr_bankarray_interface0_bank_bus_adr[8:0] == 1'd1))) begin
+        csr_bankarray_csrbank0_scratch0_re <= csr_bankarray_interface0_bank_bus_we;
+        csr_bankarray_csrbank0_scratch0_we <= csr_bankarray_interface0_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank0_bus_errors_r = csr_bankarray_interface0_bank_bus_dat_w[31:0];
+always @(*) begin
+    csr_bankarray_csrbank0_bus_errors_re <= 1'd0;
+    csr_bankarray_csrbank0_bus_errors_we <= 1'd0;
+    if ((csr_bankarray_csrbank0_sel & (csr_bankarray_interface0_bank_bus_adr[8:0] == 2'd2))) begin
+        csr_bankarray_csrbank0_bus_errors_re <= csr_bankarray_interface0_bank_bus_we;
+        csr_bankarray_csrbank0_bus_errors_we <= csr_bankarray_interface0_bank_bus_re;
+    end
+end
+always @(*) begin
+    soc_rst <= 1'd0;
+    if (reset_re) begin
+        soc_rst <= reset_storage[0];
+    end
+end
+assign cpu_rst = reset_storage[1];
+assign csr_bankarray_csrbank0_reset0_w = reset_storage[1:0];
+assign csr_bankarray_csrbank0_scratch0_w = scratch_storage[31:0];
+assign csr_bankarray_csrbank0_bus_errors_w = bus_errors_status[31:0];
+assign bus_errors_we = csr_bankarray_csrbank0_bus_errors_we;
+assign csr_bankarray_csrbank1_sel = (csr_bankarray_interface1_bank_bus_adr[13:9] == 1'd1);
+assign csr_bankarray_csrbank1_in_r = csr_bankarray_interface1_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank1_in_re <= 1'd0;
+    csr_bankarray_csrbank1_in_we <= 1'd0;
+    if ((csr_bankarray_csrbank1_sel & (csr_bankarray_interface1_bank_bus_adr[8:0] == 1'd0))) begin
+        csr_bankarray_csrbank1_in_re <= csr_bankarray_interface1_bank_bus_we;
+        csr_bankarray_csrbank1_in_we <= csr_bankarray_interface1_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank1_mode0_r = csr_bankarray_interface1_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank1_mode0_re <= 1'd0;
+    csr_bankarray_csrbank1_mode0_we <= 1'd0;
+    if ((csr_bankarray_csrbank1_sel & (csr_bankarray_interface1_bank_bus_adr[8:0] == 1'd1))) begin
+        csr_bankarray_csrbank1_mode0_re <= csr_bankarray_interface1_bank_bus_we;
+        csr_bankarray_csrbank1_mode0_we <= csr_bankarray_interface1_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank1_edge0_r = csr_bankarray_interface1_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank1_edge0_re <= 1'd0;
+    csr_bankarray_csrbank1_edge0_we <= 1'd0;
+    if ((csr_bankarray_csrbank1_sel & (csr_bankarray_interface1_bank_bus_adr[8:0] == 2'd2))) begin
+        csr_bankarray_csrbank1_edge0_re <= csr_bankarray_interface1_bank_bus_we;
+        csr_bankarray_csrbank1_edge0_we <= csr_bankarray_interface1_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank1_ev_status_r = csr_bankarray_interface1_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank1_ev_status_re <= 1'd0;
+    csr_bankarray_csrbank1_ev_status_we <= 1'd0;
+    if ((csr_bankarray_csrbank1_sel & (csr_bankarray_interface1_bank_bus_adr[8:0] == 2'd3))) begin
+        csr_bankarray_csrbank1_ev_status_re <= csr_bankarray_interface1_bank_bus_we;
+        csr_bankarray_csrbank1_ev_status_we <= csr_bankarray_interface1_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank1_ev_pending_r = csr_bankarray_interface1_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank1_ev_pending_re <= 1'd0;
+    csr_bankarray_csrbank1_ev_pending_we <= 1'd0;
+    if ((csr_bankarray_csrbank1_sel & (csr_bankarray_interface1_bank_bus_adr[8:0] == 3'd4))) begin
+        csr_bankarray_csrbank1_ev_pending_re <= csr_bankarray_interface1_bank_bus_we;
+        csr_bankarray_csrbank1_ev_pending_we <= csr_bankarray_interface1_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank1_ev_enable0_r = csr_bankarray_interface1_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank1_ev_enable0_re <= 1'd0;
+    csr_bankarray_csrbank1_ev_enable0_we <= 1'd0;
+    if ((csr_bankarray_csrbank1_sel & (csr_bankarray_interface1_bank_bus_adr[8:0] == 3'd5))) begin
+        csr_bankarray_csrbank1_ev_enable0_re <= csr_bankarray_interface1_bank_bus_we;
+        csr_bankarray_csrbank1_ev_enable0_we <= csr_bankarray_interface1_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank1_in_w = in_status;
+assign in_we = csr_bankarray_csrbank1_in_we;
+assign csr_bankarray_csrbank1_mode0_w = gpioin_mode_storage;
+assign csr_bankarray_csrbank1_edge0_w = gpioin_edge_storage;
+always @(*) begin
+    gpioin_status_status <= 1'd0;
+    gpioin_status_status <= gpioin_i00;
+end
+assign csr_bankarray_csrbank1_ev_status_w = gpioin_status_status;
+assign gpioin_status_we = csr_bankarray_csrbank1_ev_status_we;
+always @(*) begin
+    gpioin_pending_status <= 1'd0;
+    gpioin_pending_status <= gpioin_i01;
+end
+assign csr_bankarray_csrbank1_ev_pending_w = gpioin_pending_status;
+assign gpioin_pending_we = csr_bankarray_csrbank1_ev_pending_we;
+assign gpioin_i02 = gpioin_enable_storage;
+assign csr_bankarray_csrbank1_ev_enable0_w = gpioin_enable_storage;
+assign csr_bankarray_sel = (csr_bankarray_sram_bus_adr[13:9] == 2'd2);
+always @(*) begin
+    csr_bankarray_sram_bus_dat_r <= 32'd0;
+    if (csr_bankarray_sel_r) begin
+        csr_bankarray_sram_bus_dat_r <= csr_bankarray_dat_r;
+    end
+end
+assign csr_bankarray_adr = csr_bankarray_sram_bus_adr[5:0];
+assign csr_bankarray_csrbank2_sel = (csr_bankarray_interface2_bank_bus_adr[13:9] == 2'd3);
+assign csr_bankarray_csrbank2_out0_r = csr_bankarray_interface2_bank_bus_dat_w[2:0];
+always @(*) begin
+    csr_bankarray_csrbank2_out0_re <= 1'd0;
+    csr_bankarray_csrbank2_out0_we <= 1'd0;
+    if ((csr_bankarray_csrbank2_sel & (csr_bankarray_interface2_bank_bus_adr[8:0] == 1'd0))) begin
+        csr_bankarray_csrbank2_out0_re <= csr_bankarray_interface2_bank_bus_we;
+        csr_bankarray_csrbank2_out0_we <= csr_bankarray_interface2_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank2_out0_w = storage[2:0];
+assign csr_bankarray_csrbank3_sel = (csr_bankarray_interface3_bank_bus_adr[13:9] == 3'd4);
+assign csr_bankarray_csrbank3_load0_r = csr_bankarray_interface3_bank_bus_dat_w[31:0];
+always @(*) begin
+    csr_bankarray_csrbank3_load0_re <= 1'd0;
+    csr_bankarray_csrbank3_load0_we <= 1'd0;
+    if ((csr_bankarray_csrbank3_sel & (csr_bankarray_interface3_bank_bus_adr[8:0] == 1'd0))) begin
+        csr_bankarray_csrbank3_load0_re <= csr_bankarray_interface3_bank_bus_we;
+        csr_bankarray_csrbank3_load0_we <= csr_bankarray_interface3_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank3_reload0_r = csr_bankarray_interface3_bank_bus_dat_w[31:0];
+always @(*) begin
+    csr_bankarray_csrbank3_reload0_re <= 1'd0;
+    csr_bankarray_csrbank3_reload0_we <= 1'd0;
+    if ((csr_bankarray_csrbank3_sel & (csr_bankarray_interface3_bank_bus_adr[8:0] == 1'd1))) begin
+        csr_bankarray_csrbank3_reload0_re <= csr_bankarray_interface3_bank_bus_we;
+        csr_bankarray_csrbank3_reload0_we <= csr_bankarray_interface3_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank3_en0_r = csr_bankarray_interface3_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank3_en0_re <= 1'd0;
+    csr_bankarray_csrbank3_en0_we <= 1'd0;
+    if ((csr_bankarray_csrbank3_sel & (csr_bankarray_interface3_bank_bus_adr[8:0] == 2'd2))) begin
+        csr_bankarray_csrbank3_en0_re <= csr_bankarray_interface3_bank_bus_we;
+        csr_bankarray_csrbank3_en0_we <= csr_bankarray_interface3_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank3_update_value0_r = csr_bankarray_interface3_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank3_update_value0_re <= 1'd0;
+    csr_bankarray_csrbank3_update_value0_we <= 1'd0;
+    if ((csr_bankarray_csrbank3_sel & (csr_bankarray_interface3_bank_bus_adr[8:0] == 2'd3))) begin
+        csr_bankarray_csrbank3_update_value0_re <= csr_bankarray_interface3_bank_bus_we;
+        csr_bankarray_csrbank3_update_value0_we <= csr_bankarray_interface3_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank3_value_r = csr_bankarray_interface3_bank_bus_dat_w[31:0];
+always @(*) begin
+    csr_bankarray_csrbank3_value_re <= 1'd0;
+    csr_bankarray_csrbank3_value_we <= 1'd0;
+    if ((csr_bankarray_csrbank3_sel & (csr_bankarray_interface3_bank_bus_adr[8:0] == 3'd4))) begin
+        csr_bankarray_csrbank3_value_re <= csr_bankarray_interface3_bank_bus_we;
+        csr_bankarray_csrbank3_value_we <= csr_bankarray_interface3_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank3_ev_status_r = csr_bankarray_interface3_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank3_ev_status_re <= 1'd0;
+    csr_bankarray_csrbank3_ev_status_we <= 1'd0;
+    if ((csr_bankarray_csrbank3_sel & (csr_bankarray_interface3_bank_bus_adr[8:0] == 3'd5))) begin
+        csr_bankarray_csrbank3_ev_status_re <= csr_bankarray_interface3_bank_bus_we;
+        csr_bankarray_csrbank3_ev_status_we <= csr_bankarray_interface3_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank3_ev_pending_r = csr_bankarray_interface3_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank3_ev_pending_re <= 1'd0;
+    csr_bankarray_csrbank3_ev_pending_we <= 1'd0;
+    if ((csr_bankarray_csrbank3_sel & (csr_bankarray_interface3_bank_bus_adr[8:0] == 3'd6))) begin
+        csr_bankarray_csrbank3_ev_pending_re <= csr_bankarray_interface3_bank_bus_we;
+        csr_bankarray_csrbank3_ev_pending_we <= csr_bankarray_interface3_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank3_ev_enable0_r = csr_bankarray_interface3_bank_bus_dat_w[0];
+always @(*) begin
+    csr_bankarray_csrbank3_ev_enable0_re <= 1'd0;
+    csr_bankarray_csrbank3_ev_enable0_we <= 1'd0;
+    if ((csr_bankarray_csrbank3_sel & (csr_bankarray_interface3_bank_bus_adr[8:0] == 3'd7))) begin
+        csr_bankarray_csrbank3_ev_enable0_re <= csr_bankarray_interface3_bank_bus_we;
+        csr_bankarray_csrbank3_ev_enable0_we <= csr_bankarray_interface3_bank_bus_re;
+    end
+end
+assign csr_bankarray_csrbank3_load0_w = load_storage[31:0];
+assign csr_bankarray_csrbank3_reload0_w = reload_storage[31:0];
+assign csr_bankarray_csrbank3_en0_w = en_storage;
+assign csr_bankarray_csrbank3_update_value0_w = update_value_storage;
+assign csr_bankarray_csrbank3_value_w = value_status[31:0];
+assign value_we = csr_bankarray_csrbank3_value_we;
+always @(*) begin
+    status_status <= 1'd0;
+    status_status <= zero0;
+end
+assign csr_bankarray_csrbank3_ev_status_w = status_status;
+assign status_we = csr_bankarray_csrbank3_ev_status_we;
+always @(*) begin
+    pending_status <= 1'd0;
+    pending_status <= zero1;
+end
+assign csr_bankarray_csrbank3_ev_pending_w = pending_status;
+assign pending_we = csr_bankarray_csrbank3_ev_pending_we;
+assign zero2 = enable_storage;
+assign csr_bankarray_csrbank3_ev_enable0_w = enable_storage;
+assign csr_interconnect_adr = interface1_adr;
+assign csr_interconnect_re = interface1_re;
+assign csr_interconnect_we = interface1_we;
+assign csr_interconnect_dat_w = interface1_dat_w;
+assign interface1_dat_r = csr_interconnect_dat_r;
+assign csr_bankarray_interface0_bank_bus_adr = csr_interconnect_adr;
+assign csr_bankarray_interface1_bank_bus_adr = csr_interconnect_adr;
+assign csr_bankarray_interface2_bank_bus_adr = csr_interconnect_adr;
+assign csr_bankarray_interface3_bank_bus_adr = csr_interconnect_adr;
+assign csr_bankarray_sram_bus_adr = csr_interconnect_adr;
+assign csr_bankarray_interface0_bank_bus_re = csr_interconnect_re;
+assign csr_bankarray_interface1_bank_bus_re = csr_interconnect_re;
+assign csr_bankarray_interface2_bank_bus_re = csr_interconnect_re;
+assign csr_bankarray_interface3_bank_bus_re = csr_interconnect_re;
+assign csr_bankarray_sram_bus_re = csr_interconnect_re;
+assign csr_bankarray_interface0_bank_bus_we = csr_interconnect_we;
+assign csr_bankarray_interface1_bank_bus_we = csr_interconnect_we;
+assign csr_bankarray_interface2_bank_bus_we = csr_interconnect_we;
+assign csr_bankarray_interface3_bank_bus_we = csr_interconnect_we;
+assign csr_bankarray_sram_bus_we = csr_interconnect_we;
+assign csr_bankarray_interface0_bank_bus_dat_w = csr_interconnect_dat_w;
+assign csr_bankarray_interface1_bank_bus_dat_w = csr_interconnect_dat_w;
+assign csr_bankarray_interface2_bank_bus_dat_w = csr_interconnect_dat_w;
+assign csr_bankarray_interface3_bank_bus_dat_w = csr_interconnect_dat_w;
+assign csr_bankarray_sram_bus_dat_w = csr_interconnect_dat_w;
+assign csr_interconnect_dat_r = ((((csr_bankarray_interface0_bank_bus_dat_r | csr_bankarray_interface1_bank_bus_dat_r) | csr_bankarray_interface2_bank_bus_dat_r) | csr_bankarray_interface3_bank_bus_dat_r) | csr_bankarray_sram_bus_dat_r);
+assign in_status = regs1;
+
+
+//------------------------------------------------------------------------------
+// Synchronous Logic
+//------------------------------------------------------------------------------
+
+always @(posedge sys_clk) begin
+    if ((bus_errors != 32'd4294967295)) begin
+        if (bus_error) begin
+            bus_errors <= (bus_errors + 1'd1);
+        end
+    end
+    ram_bus_ack <= 1'd0;
+    if (((ram_bus_cyc & ram_bus_stb) & ((~ram_bus_ack) | adr_burst))) begin
+        ram_bus_ack <= 1'd1;
+    end
+    if (en_storage) begin
+        if ((value == 1'd0)) begin
+            value <= reload_storage;
+        end else begin
+            value <= (value - 1'd1);
+        end
+    end else begin
+        value <= load_storage;
+    end
+    if (update_value_re) begin
+        value_status <= value;
+    end
+    if (zero_clear) begin
+        zero_pending <= 1'd0;
+    end
+    zero_trigger_d <= zero_trigger;
+    if ((zero_trigger & (~zero_trigger_d))) begin
+        zero_pending <= 1'd1;
+    end
+    if (done) begin
+        chaser <= {chaser, (~chaser[2])};
+    end
+    if (re) begin
+        mode <= 1'd1;
+    end
+    if (wait_1) begin
+        if ((~done)) begin
+            count <= (count - 1'd1);
+        end
+    end else begin
+        count <= 21'd1666666;
+    end
+    gpioin_in_pads_n_d <= in_status;
+    if (gpioin_clear) begin
+        gpioin_pending <= 1'd0;
+    end
+    gpioin_trigger_d <= gpioin_trigger;
+    if ((gpioin_trigger & (~gpioin_trigger_d))) begin
+        gpioin_pending <= 1'd1;
+    end
+    state <= next_state;
+    csr_bankarray_interface0_bank_bus_dat_r <= 1'd0;
+    if (csr_bankarray_csrbank0_sel) begin
+        case (csr_bankarray_interface0_bank_bus_adr[8:0])
+            1'd0: begin
+                csr_bankarray_interface0_bank_bus_dat_r <= csr_bankarray_csrbank0_reset0_w;
+            end
+            1'd1: begin
+                csr_bankarray_interface0_bank_bus_dat_r <= csr_bankarray_csrbank0_scratch0_w;
+            end
+            2'd2: begin
+                csr_bankarray_interface0_bank_bus_dat_r <= csr_bankarray_csrbank0_bus_errors_w;
+            end
+        endcase
+    end
+    if (csr_bankarray_csrbank0_reset0_re) begin
+        reset_storage[1:0] <= csr_bankarray_csrbank0_reset0_r;
+    end
+    reset_re <= csr_bankarray_csrbank0_reset0_re;
+    if (csr_bankarray_csrbank0_scratch0_re) begin
+        scratch_storage[31:0] <= csr_bankarray_csrbank0_scratch0_r;
+    end
+    scratch_re <= csr_bankarray_csrbank0_scratch0_re;
+    bus_errors_re <= csr_bankarray_csrbank0_bus_errors_re;
+    csr_bankarray_interface1_bank_bus_dat_r <= 1'd0;
+    if (csr_bankarray_csrbank1_sel) begin
+        case (csr_bankarray_interface1_bank_bus_adr[8:0])
+            1'd0: begin
+                csr_bankarray_interface1_bank_bus_dat_r <= csr_bankarray_csrbank1_in_w;
+            end
+            1'd1: begin
+                csr_bankarray_interface1_bank_bus_dat_r <= csr_bankarray_csrbank1_mode0_w;
+            end
+            2'd2: begin
+                csr_bankarray_interface1_bank_bus_dat_r <= csr_bankarray_csrbank1_edge0_w;
+            end
+            2'd3: begin
+                csr_bankarray_interface1_bank_bus_dat_r <= csr_bankarray_csrbank1_ev_status_w;
+            end
+            3'd4: begin
+                csr_bankarray_interface1_bank_bus_dat_r <= csr_bankarray_csrbank1_ev_pending_w;
+            end
+            3'd5: begin
+                csr_bankarray_interface1_bank_bus_dat_r <= csr_bankarray_csrbank1_ev_enable0_w;
+            end
+        endcase
+    end
+    in_re <= csr_bankarray_csrbank1_in_re;
+    if (csr_bankarray_csrbank1_mode0_re) begin
+        gpioin_mode_storage <= csr_bankarray_csrbank1_mode0_r;
+    end
+    gpioin_mode_re <= csr_bankarray_csrbank1_mode0_re;
+    if (csr_bankarray_csrbank1_edge0_re) begin
+        gpioin_edge_storage <= csr_bankarray_csrbank1_edge0_r;
+    end
+    gpioin_edge_re <= csr_bankarray_csrbank1_edge0_re;
+    gpioin_status_re <= csr_bankarray_csrbank1_ev_status_re;
+    if (csr_bankarray_csrbank1_ev_pending_re) begin
+        gpioin_pending_r <= csr_bankarray_csrbank1_ev_pending_r;
+    end
+    gpioin_pending_re <= csr_bankarray_csrbank1_ev_pending_re;
+    if (csr_bankarray_csrbank1_ev_enable0_re) begin
+        gpioin_enable_storage <= csr_bankarray_csrbank1_ev_enable0_r;
+    end
+    gpioin_enable_re <= csr_bankarray_csrbank1_ev_enable0_re;
+    csr_bankarray_sel_r <= csr_bankarray_sel;
+    csr_bankarray_interface2_bank_bus_dat_r <= 1'd0;
+    if (csr_bankarray_csrbank2_sel) begin
+        case (csr_bankarray_interface2_bank_bus_adr[8:0])
+            1'd0: begin
+                csr_bankarray_interface2_bank_bus_dat_r <= csr_bankarray_csrbank2_out0_w;
+            end
+        endcase
+    end
+    if (csr_bankarray_csrbank2_out0_re) begin
+        storage[2:0] <= csr_bankarray_csrbank2_out0_r;
+    end
+    re <= csr_bankarray_csrbank2_out0_re;
+    csr_bankarray_interface3_bank_bus_dat_r <= 1'd0;
+    if (csr_bankarray_csrbank3_sel) begin
+        case (csr_bankarray_interface3_bank_bus_adr[8:0])
+            1'd0: begin
+                csr_bankarray_interface3_bank_bus_dat_r <= csr_bankarray_csrbank3_load0_w;
+            end
+            1'd1: begin
+                csr_bankarray_interface3_bank_bus_dat_r <= csr_bankarray_csrbank3_reload0_w;
+            end
+            2'd2: begin
+                csr_bankarray_interface3_bank_bus_dat_r <= csr_bankarray_csrbank3_en0_w;
+            end
+            2'd3: begin
+                csr_bankarray_interface3_bank_bus_dat_r <= csr_bankarray_csrbank3_update_value0_w;
+            end
+            3'd4: begin
+                csr_bankarray_interface3_bank_bus_dat_r <= csr_bankarray_csrbank3_value_w;
+            end
+            3'd5: begin
+                csr_bankarray_interface3_bank_bus_dat_r <= csr_bankarray_csrbank3_ev_status_w;
+            end
+            3'd6: begin
+                csr_bankarray_interface3_bank_bus_dat_r <= csr_bankarray_csrbank3_ev_pending_w;
+            end
+            3'd7: begin
+                csr_bankarray_interface3_bank_bus_dat_r <= csr_bankarray_csrbank3_ev_enable0_w;
+            end
+        endcase
+    end
+    if (csr_bankarray_csrbank3_load0_re) begin
+        load_storage[31:0] <= csr_bankarray_csrbank3_load0_r;
+    end
+    load_re <= csr_bankarray_csrbank3_load0_re;
+    if (csr_bankarray_csrbank3_reload0_re) begin
+        reload_storage[31:0] <= csr_bankarray_csrbank3_reload0_r;
+    end
+    reload_re <= csr_bankarray_csrbank3_reload0_re;
+    if (csr_bankarray_csrbank3_en0_re) begin
+        en_storage <= csr_bankarray_csrbank3_en0_r;
+    end
+    en_re <= csr_bankarray_csrbank3_en0_re;
+    if (csr_bankarray_csrbank3_update_value0_re) begin
+        update_value_storage <= csr_bankarray_csrbank3_update_value0_r;
+    end
+    update_value_re <= csr_bankarray_csrbank3_update_value0_re;
+    value_re <= csr_bankarray_csrbank3_value_re;
+    status_re <= csr_bankarray_csrbank3_ev_status_re;
+    if (csr_bankarray_csrbank3_ev_pending_re) begin
+        pending_r <= csr_bankarray_csrbank3_ev_pending_r;
+    end
+    pending_re <= csr_bankarray_csrbank3_ev_pending_re;
+    if (csr_bankarray_csrbank3_ev_enable0_re) begin
+        enable_storage <= csr_bankarray_csrbank3_ev_enable0_r;
+    end
+    enable_re <= csr_bankarray_csrbank3_ev_enable0_re;
+    if (sys_rst) begin
+        reset_storage <= 2'd0;
+        reset_re <= 1'd0;
+        scratch_storage <= 32'd305419896;
+        scratch_re <= 1'd0;
+        bus_errors_re <= 1'd0;
+        bus_errors <= 32'd0;
+        ram_bus_ack <= 1'd0;
+        load_storage <= 32'd0;
+        load_re <= 1'd0;
+        reload_storage <= 32'd0;
+        reload_re <= 1'd0;
+        en_storage <= 1'd0;
+        en_re <= 1'd0;
+        update_value_storage <= 1'd0;
+        update_value_re <= 1'd0;
+        value_status <= 32'd0;
+        value_re <= 1'd0;
+        zero_pending <= 1'd0;
+        zero_trigger_d <= 1'd0;
+        status_re <= 1'd0;
+        pending_re <= 1'd0;
+        pending_r <= 1'd0;
+        enable_storage <= 1'd0;
+        enable_re <= 1'd0;
+        value <= 32'd0;
+        storage <= 3'd0;
+        re <= 1'd0;
+        chaser <= 3'd0;
+        mode <= 1'd0;
+        count <= 21'd1666666;
+        in_re <= 1'd0;
+        gpioin_mode_storage <= 1'd0;
+        gpioin_mode_re <= 1'd0;
+        gpioin_edge_storage <= 1'd0;
+        gpioin_edge_re <= 1'd0;
+        gpioin_in_pads_n_d <= 1'd0;
+        gpioin_pending <= 1'd0;
+        gpioin_trigger_d <= 1'd0;
+        gpioin_status_re <= 1'd0;
+        gpioin_pending_re <= 1'd0;
+        gpioin_pending_r <= 1'd0;
+        gpioin_enable_storage <= 1'd0;
+        gpioin_enable_re <= 1'd0;
+        csr_bankarray_sel_r <= 1'd0;
+        state <= 1'd0;
+    end
+    regs0 <= {user_btn_n0};
+    regs1 <= regs0;
+end
+
+
+//------------------------------------------------------------------------------
+// Specialized Logic
+//------------------------------------------------------------------------------
+
+//------------------------------------------------------------------------------
+// Instance qlal4s3b_cell_macro of qlal4s3b_cell_macro Module.
+//------------------------------------------------------------------------------
+qlal4s3b_cell_macro qlal4s3b_cell_macro(
+	// Outputs.
+	.Clk_C16     (sys_clk),
+	.Clk_C16_Rst (sys_rst),
+	.Clk_C21     (crg0),
+	.Clk_C21_Rst (crg1)
+);
+
+//------------------------------------------------------------------------------
+// Memory sram: 2048-words x 32-bit
+//------------------------------------------------------------------------------
+// Port 0 | Read: Sync  | Write: Sync | Mode: Write-First | Write-Granularity: 8 
+reg [31:0] sram[0:2047];
+initial begin
+	$readmemh("quicklogic_quickfeather_sram.init", sram);
+end
+reg [10:0] sram_adr0;
+always @(posedge sys_clk) begin
+	if (we[0])
+		sram[adr][7:0] <= dat_w[7:0];
+	if (we[1])
+		sram[adr][15:8] <= dat_w[15:8];
+	if (we[2])
+		sram[adr][23:16] <= dat_w[23:16];
+	if (we[3])
+		sram[adr][31:24] <= dat_w[31:24];
+	sram_adr0 <= adr;
+end
+assign dat_r = sram[sram_adr0];
+
+
+//------------------------------------------------------------------------------
+// Memory mem: 57-words x 8-bit
+//------------------------------------------------------------------------------
+// Port 0 | Read: Sync  | Write: ---- | 
+reg [7:0] mem[0:56];
+initial begin
+	$readmemh("quicklogic_quickfeather_mem.init", mem);
+end
+reg [5:0] mem_adr0;
+always @(posedge sys_clk) begin
+	mem_adr0 <= csr_bankarray_adr;
+end
+assign csr_bankarray_dat_r = mem[mem_adr0];
+
+
+endmodule
+
+// -----------------------------------------------------------------------------
+//  Auto-Generated by LiteX on 2026-10-19 11:59:39.
+//------------------------------------------------------------------------------
@@ -0,0 +1,217 @@
+//--------------------------------------------------------------------------------
+// Auto-generated by LiteX (519ce9d) on 2026-10-19 11:59:39
+//--------------------------------------------------------------------------------
+
+//--------------------------------------------------------------------------------
+// CSR Includes.
+//--------------------------------------------------------------------------------
+
+#include <generated/soc.h>
+#ifndef __GENERATED_CSR_H
+#define __GENERATED_CSR_H
+#include <stdint.h>
+#include <system.h>
+#ifndef CSR_ACCESSORS_DEFINED
+#include <hw/common.h>
+#endif /* ! CSR_ACCESSORS_DEFINED */
+
+#ifndef CSR_BASE
+#define CSR_BASE 0x0L
+#endif /* ! CSR_BASE */
+
+//--------------------------------------------------------------------------------
+// CSR Registers/Fields Definition.
+//--------------------------------------------------------------------------------
+
+/* CTRL Registers */
+#define CSR_CTRL_BASE (CSR_BASE + 0x0L)
+#define CSR_CTRL_RESET_ADDR (CSR_BASE + 0x0L)
+#define CSR_CTRL_RESET_SIZE 1
+#define CSR_CTRL_SCRATCH_ADDR (CSR_BASE + 0x4L)
+#define CSR_CTRL_SCRATCH_SIZE 1
+#define CSR_CTRL_BUS_ERRORS_ADDR (CSR_BASE + 0x8L)
+#define CSR_CTRL_BUS_ERRORS_SIZE 1
+
+/* CTRL Fields */
+#define CSR_CTRL_RESET_SOC_RST_OFFSET 0
+#define CSR_CTRL_RESET_SOC_RST_SIZE 1
+#define CSR_CTRL_RESET_CPU_RST_OFFSET 1
+#define CSR_CTRL_RESET_CPU_RST_SIZE 1
+
+/* GPIO Registers */
+#define CSR_GPIO_BASE (CSR_BASE + 0x800L)
+#define CSR_GPIO_IN_ADDR (CSR_BASE + 0x800L)
+#define CSR_GPIO_IN_SIZE 1
+#define CSR_GPIO_MODE_ADDR (CSR_BASE + 0x804L)
+#define CSR_GPIO_MODE_SIZE 1
+#define CSR_GPIO_EDGE_ADDR (CSR_BASE + 0x808L)
+#define CSR_GPIO_EDGE_SIZE 1
+#define CSR_GPIO_EV_STATUS_ADDR (CSR_BASE + 0x80cL)
+#define CSR_GPIO_EV_STATUS_SIZE 1
+#define CSR_GPIO_EV_PENDING_ADDR (CSR_BASE + 0x810L)
+#define CSR_GPIO_EV_PENDING_SIZE 1
+#define CSR_GPIO_EV_ENABLE_ADDR (CSR_BASE + 0x814L)
+#define CSR_GPIO_EV_ENABLE_SIZE 1
+
+/* GPIO Fields */
+#define CSR_GPIO_EV_STATUS_I0_OFFSET 0
+#define CSR_GPIO_EV_STATUS_I0_SIZE 1
+#define CSR_GPIO_EV_PENDING_I0_OFFSET 0
+#define CSR_GPIO_EV_PENDING_I0_SIZE 1
+#define CSR_GPIO_EV_ENABLE_I0_OFFSET 0
+#define CSR_GPIO_EV_ENABLE_I0_SIZE 1
+
+/* IDENTIFIER_MEM Registers */
+#define CSR_IDENTIFIER_MEM_BASE (CSR_BASE + 0x1000L)
+
+/* IDENTIFIER_MEM Fields */
+
+/* LEDS Registers */
+#define CSR_LEDS_BASE (CSR_BASE + 0x1800L)
+#define CSR_LEDS_OUT_ADDR (CSR_BASE + 0x1800L)
+#define CSR_LEDS_OUT_SIZE 1
+
+/* LEDS Fields */
+
+/* TIMER0 Registers */
+#define CSR_TIMER0_BASE (CSR_BASE + 0x2000L)
+#define CSR_TIMER0_LOAD_ADDR (CSR_BASE + 0x2000L)
+#define CSR_TIMER0_LOAD_SIZE 1
+#define CSR_TIMER0_RELOAD_ADDR (CSR_BASE + 0x2004L)
+#define CSR_TIMER0_RELOAD_SIZE 1
+#define CSR_TIMER0_EN_ADDR (CSR_BASE + 0x2008L)
+#define CSR_TIMER0_EN_SIZE 1
+#define CSR_TIMER0_UPDATE_VALUE_ADDR (CSR_BASE + 0x200cL)
+#define CSR_TIMER0_UPDATE_VALUE_SIZE 1
+#define CSR_TIMER0_VALUE_ADDR (CSR_BASE + 0x2010L)
+#define CSR_TIMER0_VALUE_SIZE 1
+#define CSR_TIMER0_EV_STATUS_ADDR (CSR_BASE + 0x2014L)
+#define CSR_TIMER0_EV_STATUS_SIZE 1
+#define CSR_TIMER0_EV_PENDING_ADDR (CSR_BASE + 0x2018L)
+#define CSR_TIMER0_EV_PENDING_SIZE 1
+#define CSR_TIMER0_EV_ENABLE_ADDR (CSR_BASE + 0x201cL)
+#define CSR_TIMER0_EV_ENABLE_SIZE 1
+
+/* TIMER0 Fields */
+#define CSR_TIMER0_EV_STATUS_ZERO_OFFSET 0
+#define CSR_TIMER0_EV_STATUS_ZERO_SIZE 1
+#define CSR_TIMER0_EV_PENDING_ZERO_OFFSET 0
+#define CSR_TIMER0_EV_PENDING_ZERO_SIZE 1
+#define CSR_TIMER0_EV_ENABLE_ZERO_OFFSET 0
+#define CSR_TIMER0_EV_ENABLE_ZERO_SIZE 1
+
+//--------------------------------------------------------------------------------
+// CSR Registers Access Functions.
+//--------------------------------------------------------------------------------
+
+#ifndef LITEX_CSR_ACCESS_FUNCTIONS
+#define LITEX_CSR_ACCESS_FUNCTIONS 1
+#endif
+
+#if LITEX_CSR_ACCESS_FUNCTIONS
+
+/* CTRL Access Functions */
+static inline uint32_t ctrl_reset_read(void) {
+	return csr_read_simple((CSR_BASE + 0x0L));
+}
+static inline void ctrl_reset_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x0L));
+}
+static inline uint32_t ctrl_scratch_read(void) {
+	return csr_read_simple((CSR_BASE + 0x4L));
+}
+static inline void ctrl_scratch_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x4L));
+}
+static inline uint32_t ctrl_bus_errors_read(void) {
+	return csr_read_simple((CSR_BASE + 0x8L));
+}
+
+/* GPIO Access Functions */
+static inline uint32_t gpio_in_read(void) {
+	return csr_read_simple((CSR_BASE + 0x800L));
+}
+static inline uint32_t gpio_mode_read(void) {
+	return csr_read_simple((CSR_BASE + 0x804L));
+}
+static inline void gpio_mode_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x804L));
+}
+static inline uint32_t gpio_edge_read(void) {
+	return csr_read_simple((CSR_BASE + 0x808L));
+}
+static inline void gpio_edge_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x808L));
+}
+static inline uint32_t gpio_ev_status_read(void) {
+	return csr_read_simple((CSR_BASE + 0x80cL));
+}
+static inline uint32_t gpio_ev_pending_read(void) {
+	return csr_read_simple((CSR_BASE + 0x810L));
+}
+static inline void gpio_ev_pending_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x810L));
+}
+static inline uint32_t gpio_ev_enable_read(void) {
+	return csr_read_simple((CSR_BASE + 0x814L));
+}
+static inline void gpio_ev_enable_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x814L));
+}
+
+/* IDENTIFIER_MEM Access Functions */
+
+/* LEDS Access Functions */
+static inline uint32_t leds_out_read(void) {
+	return csr_read_simple((CSR_BASE + 0x1800L));
+}
+static inline void leds_out_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x1800L));
+}
+
+/* TIMER0 Access Functions */
+static inline uint32_t timer0_load_read(void) {
+	return csr_read_simple((CSR_BASE + 0x2000L));
+}
+static inline void timer0_load_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x2000L));
+}
+static inline uint32_t timer0_reload_read(void) {
+	return csr_read_simple((CSR_BASE + 0x2004L));
+}
+static inline void timer0_reload_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x2004L));
+}
+static inline uint32_t timer0_en_read(void) {
+	return csr_read_simple((CSR_BASE + 0x2008L));
+}
+static inline void timer0_en_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x2008L));
+}
+static inline uint32_t timer0_update_value_read(void) {
+	return csr_read_simple((CSR_BASE + 0x200cL));
+}
+static inline void timer0_update_value_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x200cL));
+}
+static inline uint32_t timer0_value_read(void) {
+	return csr_read_simple((CSR_BASE + 0x2010L));
+}
+static inline uint32_t timer0_ev_status_read(void) {
+	return csr_read_simple((CSR_BASE + 0x2014L));
+}
+static inline uint32_t timer0_ev_pending_read(void) {
+	return csr_read_simple((CSR_BASE + 0x2018L));
+}
+static inline void timer0_ev_pending_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x2018L));
+}
+static inline uint32_t timer0_ev_enable_read(void) {
+	return csr_read_simple((CSR_BASE + 0x201cL));
+}
+static inline void timer0_ev_enable_write(uint32_t v) {
+	csr_write_simple(v, (CSR_BASE + 0x201cL));
+}
+#endif /* LITEX_CSR_ACCESS_FUNCTIONS */
+
+#endif /* ! __GENERATED_CSR_H */
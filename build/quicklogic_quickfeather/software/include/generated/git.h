@@ -0,0 +1,8 @@
+//--------------------------------------------------------------------------------
+// Auto-generated by LiteX (519ce9d) on 2026-10-19 11:59:39
+//--------------------------------------------------------------------------------
+#ifndef __GENERATED_GIT_H
+#define __GENERATED_GIT_H
+
+#define LITEX_GIT_SHA1 "519ce9d"
+#endif
@@ -0,0 +1,54 @@
+//--------------------------------------------------------------------------------
+// Auto-generated by LiteX (519ce9d) on 2026-10-19 11:59:39
+//--------------------------------------------------------------------------------
+#ifndef __GENERATED_SOC_H
+#define __GENERATED_SOC_H
+#define CONFIG_PLATFORM_NAME "quicklogic_quickfeather"
+#define CONFIG_CLOCK_FREQUENCY 10000000
+#define CONFIG_CPU_TYPE_NONE
+#define CONFIG_CPU_VARIANT_STANDARD
+#define CONFIG_CPU_FAMILY
+#define CONFIG_CPU_NAME
+#define CONFIG_CPU_HUMAN_NAME "Unknown"
+#define CONFIG_IDENTIFIER "LiteX SoC on QuickLogic QuickFeather 2026-10-19 11:59:39"
+#define CONFIG_CSR_DATA_WIDTH 32
+#define CONFIG_CSR_ALIGNMENT 32
+#define CONFIG_BUS_STANDARD "wishbone"
+#define CONFIG_BUS_DATA_WIDTH 32
+#define CONFIG_BUS_ADDRESS_WIDTH 32
+#define CONFIG_BUS_BURSTING 0
+
+#ifndef __ASSEMBLER__
+static inline const char * config_platform_name_read(void) {
+	return "quicklogic_quickfeather";
+}
+static inline int config_clock_frequency_read(void) {
+	return 10000000;
+}
+static inline const char * config_cpu_human_name_read(void) {
+	return "Unknown";
+}
+static inline const char * config_identifier_read(void) {
+	return "LiteX SoC on QuickLogic QuickFeather 2026-10-19 11:59:39";
+}
+static inline int config_csr_data_width_read(void) {
+	return 32;
+}
+static inline int config_csr_alignment_read(void) {
+	return 32;
+}
+static inline const char * config_bus_standard_read(void) {
+	return "wishbone";
+}
+static inline int config_bus_data_width_read(void) {
+	return 32;
+}
+static inline int config_bus_address_width_read(void) {
+	return 32;
+}
+static inline int config_bus_bursting_read(void) {
+	return 0;
+}
+#endif // !__ASSEMBLER__
+
+#endif
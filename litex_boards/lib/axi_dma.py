@@ -0,0 +1,254 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# AXI Ring-Buffer DMAs (ex for Zynq HP/ACP ports).
+#
+# The DMAs move a stream to/from a ring of equally-sized buffers in memory: descriptor n of the ring
+# is implicit (base + n*size) and the ownership is tracked with two wrapping buffer counters:
+# - hw_count: buffers completed by the DMA (written to memory / read from memory).
+# - sw_count: buffers released by the software (consumed for the writer / filled for the reader).
+# The writer only starts a buffer when less than "buffers" are owned by the hardware (otherwise the
+# stream is dropped once the FIFO is full and accounted in drops), the reader only starts a buffer
+# when one has been filled by the software. In loop mode, both ignore sw_count. Counters are
+# restarted on enable, sw_count must then be set to 0 by the software. done is pulsed on each buffer
+# completion (ex for an interrupt).
+#
+# Transfers are done with INCR bursts of burst_length words, shortened at 4KB boundaries (that AXI
+# bursts must not cross) and at buffer ends; base/size must be word-aligned.
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _axi_max_burst_length(axi):
+    return {"axi3": 16, "axi4": 256}[axi.version]
+
+class _AXIRingBuffer(LiteXModule):
+    def add_csrs(self):
+        self.control  = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, description="DMA enable (restarts the counters)."),
+            CSRField("loop",   size=1, offset=1, description="Loop over the ring (ignore sw_count)."),
+        ])
+        self.base     = CSRStorage(32,          description="Ring base address (in bytes).")
+        self.size     = CSRStorage(32,          description="Buffer size (in bytes).")
+        self.buffers  = CSRStorage(16, reset=4, description="Number of buffers in the ring.")
+        self.hw_count = CSRStatus(32,           description="Buffers completed by the DMA.")
+        self.sw_count = CSRStorage(32,          description="Buffers released by the software.")
+
+    def add_ring(self, beat_bytes, burst_length, start):
+        # Current buffer address/offset and burst length (in beats), advanced by the burst on start.
+        self.issued      = issued      = Signal(32)
+        self.buffer_addr = buffer_addr = Signal(32)
+        self.offset      = offset      = Signal(32)
+        self.index       = index       = Signal(16)
+        self.length      = length      = Signal(max=burst_length + 1)
+        self.buffer_end  = buffer_end  = Signal()
+        self.comb += self.addr.eq(Mux(index == 0, self.base.storage, buffer_addr) + offset)
+
+        # Burst length (shortened at 4KB boundaries and buffer ends).
+        shift          = log2_int(beat_bytes)
+        boundary_beats = Signal(13)
+        buffer_beats   = Signal(32)
+        self.comb += [
+            boundary_beats.eq((4096 - self.addr[:12]) >> shift),
+            buffer_beats.eq((self.size.storage - offset) >> shift),
+            If((buffer_beats < burst_length) & (buffer_beats < boundary_beats),
+                length.eq(buffer_beats)
+            ).Elif(boundary_beats < burst_length,
+                length.eq(boundary_beats)
+            ).Else(
+                length.eq(burst_length)
+            ),
+            buffer_end.eq(buffer_beats == length),
+        ]
+
+        self.sync += [
+            If(~self.control.fields.enable,
+                issued.eq(0),
+                offset.eq(0),
+                index.eq(0),
+            ).Elif(start,
+                If(offset == 0,
+                    issued.eq(issued + 1)
+                ),
+                offset.eq(offset + (length << shift)),
+                If(buffer_end,
+                    offset.eq(0),
+                    index.eq(index + 1),
+                    buffer_addr.eq(self.addr - offset + self.size.storage),
+                    If(index == (self.buffers.storage - 1),
+                        index.eq(0)
+                    )
+                )
+            )
+        ]
+
+    def add_completion(self, start, done, outstanding=16):
+        # Bursts are completed in order: the bursts ending a buffer are tracked through a FIFO
+        # (written on start, read on done), hw_count is incremented and done pulsed on their completion.
+        self.done   = Signal()
+        self.bursts = bursts = ResetInserter()(stream.SyncFIFO([("buffer_end", 1)], outstanding))
+        hw_count    = self.hw_count.status
+        self.comb += [
+            bursts.reset.eq(~self.control.fields.enable),
+            bursts.sink.valid.eq(start),
+            bursts.sink.buffer_end.eq(self.buffer_end),
+            bursts.source.ready.eq(done),
+            self.done.eq(done & bursts.source.valid & bursts.source.buffer_end),
+        ]
+        self.sync += [
+            If(~self.control.fields.enable,
+                hw_count.eq(0),
+            ).Elif(self.done,
+                hw_count.eq(hw_count + 1),
+            )
+        ]
+
+# AXI Ring-Buffer Writer ---------------------------------------------------------------------------
+
+class AXIRingBufferWriter(_AXIRingBuffer):
+    def __init__(self, axi, fifo_depth=512, burst_length=16, cache=0b0011):
+        assert burst_length <= _axi_max_burst_length(axi)
+        assert fifo_depth >= 2*burst_length
+        dw          = len(axi.w.data)
+        self.sink   = stream.Endpoint([("data", dw)])
+        self.addr   = Signal(32)
+        self.add_csrs()
+        self.drops  = CSRStatus(32, description="Stream words dropped (ring full or memory too slow).")
+
+        # # #
+
+        enable = self.control.fields.enable
+
+        # FIFO.
+        self.fifo = fifo = stream.SyncFIFO([("data", dw)], fifo_depth, buffered=True)
+        self.comb += [
+            fifo.sink.valid.eq(self.sink.valid & enable),
+            fifo.sink.data.eq(self.sink.data),
+            self.sink.ready.eq(1),
+        ]
+        self.sync += [
+            If(~enable,
+                self.drops.status.eq(0)
+            ).Elif(self.sink.valid & ~fifo.sink.ready,
+                self.drops.status.eq(self.drops.status + 1)
+            )
+        ]
+
+        # Ring.
+        aw_start  = Signal()
+        ring_full = Signal()
+        self.add_ring(dw//8, burst_length, aw_start)
+        self.add_completion(aw_start, axi.b.valid)
+        self.comb += ring_full.eq(~self.control.fields.loop & ((self.issued - self.sw_count.storage)[:32] >= self.buffers.storage))
+
+        # AXI Write FSM (a burst is only started when its data is available in the FIFO).
+        beat   = Signal(max=burst_length)
+        length = Signal(max=burst_length + 1)
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(~enable,
+                fifo.source.ready.eq(1)
+            ).Elif((fifo.level >= self.length) & ((self.offset != 0) | ~ring_full) & self.bursts.sink.ready,
+                NextState("AW")
+            )
+        )
+        fsm.act("AW",
+            axi.aw.valid.eq(1),
+            If(axi.aw.ready,
+                aw_start.eq(1),
+                NextValue(beat, 0),
+                NextValue(length, self.length),
+                NextState("W")
+            )
+        )
+        fsm.act("W",
+            axi.w.valid.eq(fifo.source.valid),
+            axi.w.last.eq(beat == (length - 1)),
+            fifo.source.ready.eq(axi.w.ready),
+            If(axi.w.valid & axi.w.ready,
+                NextValue(beat, beat + 1),
+                If(axi.w.last,
+                    NextState("IDLE")
+                )
+            )
+        )
+        self.comb += [
+            axi.aw.addr.eq(self.addr),
+            axi.aw.burst.eq(0b01), # INCR.
+            axi.aw.len.eq(self.length - 1),
+            axi.aw.size.eq(log2_int(dw//8)),
+            axi.aw.cache.eq(cache),
+            axi.aw.id.eq(0),
+            axi.w.data.eq(fifo.source.data),
+            axi.w.strb.eq(2**(dw//8) - 1),
+            axi.w.id.eq(0),
+            axi.b.ready.eq(1),
+        ]
+
+# AXI Ring-Buffer Reader ---------------------------------------------------------------------------
+
+class AXIRingBufferReader(_AXIRingBuffer):
+    def __init__(self, axi, fifo_depth=512, burst_length=16, cache=0b0011):
+        assert burst_length <= _axi_max_burst_length(axi)
+        assert fifo_depth >= 2*burst_length
+        dw          = len(axi.r.data)
+        self.source = stream.Endpoint([("data", dw)])
+        self.addr   = Signal(32)
+        self.add_csrs()
+
+        # # #
+
+        enable = self.control.fields.enable
+
+        # FIFO.
+        self.fifo = fifo = stream.SyncFIFO([("data", dw)], fifo_depth, buffered=True)
+        self.comb += [
+            fifo.source.connect(self.source, omit={"ready"}),
+            self.source.valid.eq(fifo.source.valid & enable),
+            fifo.source.ready.eq(self.source.ready | ~enable),
+        ]
+
+        # Ring.
+        ar_start   = Signal()
+        ring_empty = Signal()
+        self.add_ring(dw//8, burst_length, ar_start)
+        self.add_completion(ar_start, axi.r.valid & axi.r.last)
+        self.comb += ring_empty.eq(~self.control.fields.loop & (self.issued == self.sw_count.storage))
+
+        # FIFO space reserved by the outstanding bursts (so that R is never stalled).
+        reserved = Signal(max=fifo_depth + 1)
+        self.sync += reserved.eq(reserved + Mux(ar_start, self.length, 0) - (axi.r.valid & axi.r.ready))
+
+        # AXI Read FSM.
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(enable & ((fifo.level + reserved) <= (fifo_depth - burst_length)) & ((self.offset != 0) | ~ring_empty) & self.bursts.sink.ready,
+                NextState("AR")
+            )
+        )
+        fsm.act("AR",
+            axi.ar.valid.eq(1),
+            If(axi.ar.ready,
+                ar_start.eq(1),
+                NextState("IDLE")
+            )
+        )
+        self.comb += [
+            axi.ar.addr.eq(self.addr),
+            axi.ar.burst.eq(0b01), # INCR.
+            axi.ar.len.eq(self.length - 1),
+            axi.ar.size.eq(log2_int(dw//8)),
+            axi.ar.cache.eq(cache),
+            axi.ar.id.eq(0),
+            fifo.sink.valid.eq(axi.r.valid),
+            fifo.sink.data.eq(axi.r.data),
+            axi.r.ready.eq(1),
+        ]
@@ -0,0 +1,178 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Board CRG.
+#
+# Shared CRG for the targets: the targets declare their clock domains against BoardCRG (input clock,
+# reset, PLL) and get the clocking of the FPGA family (from the PLL type) with consistent reset
+# synchronization, clock buffers and constraints, so clocking improvements apply to all the targets
+# using it:
+# - add_sys(with_dram=True) creates the sys domain and the DRAM PHY domains of the family:
+#   - 7-Series:      sys4x/sys4x_dqs (+sys2x) from the PLL, idelay + IDELAYCTRL.
+#   - UltraScale(+): pll4x from the PLL, sys/sys4x through BUFGCE_DIV/BUFGCE, idelay + IDELAYCTRL.
+#   - ECP5:          sys2x through ECLKSYNCB (stop/reset from the PHY), sys through CLKDIVF, init.
+#   The DRAM PHY IO clocks (sys2x/sys4x/pll4x) are reset-less: Their logic is reset from sys.
+#   Domains passed in domains={name: freq} are created just after sys (before the DRAM domains), to
+#   keep the clkout order (and so the PLL configuration/cache key) of the targets creating them there.
+# - add_domain() adds other domains (Ethernet, Video, USB...) from the main or a secondary PLL
+#   (add_pll()), all sharing the input clock and reset (Power-On-Reset, user reset, SoC's reset).
+# - PLLs are looked up in the PLL configuration cache (see pll_cache.py).
+
+from migen import *
+from migen.genlib.resetsync import AsyncResetSynchronizer
+
+from litex.gen import *
+
+from litex.soc.cores.clock import *
+
+from litex_boards.lib.pll_cache import use_pll_cache
+
+# Families -----------------------------------------------------------------------------------------
+
+crg_families = {
+    S7PLL   : "s7",
+    S7MMCM  : "s7",
+    USPLL   : "us",
+    USMMCM  : "us",
+    USPPLL  : "usp",
+    USPMMCM : "usp",
+    ECP5PLL : "ecp5",
+}
+
+def get_crg_family(pll):
+    for cls, family in crg_families.items():
+        if isinstance(pll, cls):
+            return family
+    raise ValueError(f"Unsupported PLL {pll.__class__.__name__} for BoardCRG.")
+
+# Board CRG ----------------------------------------------------------------------------------------
+
+class BoardCRG(LiteXModule):
+    def __init__(self, platform, pll, clkin, clkin_freq, rst=0, with_por=False, with_pll_cache=True):
+        self.rst = Signal()
+
+        # # #
+
+        self.platform       = platform
+        self.family         = get_crg_family(pll)
+        self.clkin          = clkin
+        self.clkin_freq     = clkin_freq
+        self.with_pll_cache = with_pll_cache
+
+        # Power-On-Reset.
+        self.pll_reset = rst | self.rst
+        if with_por:
+            self.cd_por = ClockDomain("por")
+            por_count = Signal(16, reset=2**16-1)
+            por_done  = Signal()
+            self.comb += self.cd_por.clk.eq(clkin)
+            self.comb += por_done.eq(por_count == 0)
+            self.sync.por += If(~por_done, por_count.eq(por_count - 1))
+            self.pll_reset = ~por_done | self.pll_reset
+
+        # PLL.
+        self.pll = self.add_pll(pll)
+
+    def add_pll(self, pll, name=None):
+        # PLL sharing the input clock and reset.
+        if self.with_pll_cache:
+            pll = use_pll_cache(pll)
+        self.comb += pll.reset.eq(self.pll_reset)
+        pll.register_clkin(self.clkin, self.clkin_freq)
+        if name is not None:
+            setattr(self, name, pll)
+        return pll
+
+    def add_domain(self, name, freq, pll=None, reset_less=False, **kwargs):
+        cd = ClockDomain(name, reset_less=reset_less)
+        setattr(self, f"cd_{name}", cd)
+        if freq is not None:
+            pll = self.pll if pll is None else pll
+            pll.create_clkout(cd, freq, with_reset=not reset_less, **kwargs)
+        return cd
+
+    def add_sys(self, sys_clk_freq, with_dram=False,
+        domains         = {},
+        with_sys2x      = False,
+        dqs_phase       = 90,
+        idelay_clk_freq = 200e6,
+        init_clk_freq   = 25e6,
+        with_eclkbridge = False,
+        **kwargs):
+        if not with_dram:
+            self.add_domain("sys", sys_clk_freq, **kwargs)
+            self._add_domains(domains)
+        elif self.family == "s7":
+            self._add_sys_s7(sys_clk_freq, with_sys2x, dqs_phase, idelay_clk_freq, domains, **kwargs)
+        elif self.family in ["us", "usp"]:
+            self._add_sys_us(sys_clk_freq, idelay_clk_freq)
+            self._add_domains(domains)
+        elif self.family == "ecp5":
+            self._add_sys_ecp5(sys_clk_freq, init_clk_freq, with_eclkbridge)
+            self._add_domains(domains)
+        if self.family != "ecp5":
+            # Ignore sys_clk to pll.clkin path created by SoC's rst.
+            self.platform.add_false_path_constraints(self.cd_sys.clk, self.pll.clkin)
+
+    def _add_domains(self, domains):
+        for name, freq in domains.items():
+            self.add_domain(name, freq)
+
+    def _add_sys_s7(self, sys_clk_freq, with_sys2x, dqs_phase, idelay_clk_freq, domains, **kwargs):
+        self.add_domain("sys", sys_clk_freq, **kwargs)
+        self._add_domains(domains)
+        if with_sys2x:
+            self.add_domain("sys2x", 2*sys_clk_freq, reset_less=True)
+        self.add_domain("sys4x", 4*sys_clk_freq, reset_less=True)
+        if dqs_phase is not None:
+            self.add_domain("sys4x_dqs", 4*sys_clk_freq, phase=dqs_phase, reset_less=True)
+        if idelay_clk_freq is not None:
+            self.add_domain("idelay", idelay_clk_freq)
+            self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
+
+    def _add_sys_us(self, sys_clk_freq, idelay_clk_freq):
+        self.add_domain("sys",   None)
+        self.add_domain("sys4x", None, reset_less=True)
+        self.add_domain("pll4x", 4*sys_clk_freq, buf=None, reset_less=True)
+        self.add_domain("idelay", idelay_clk_freq)
+        self.specials += [
+            Instance("BUFGCE_DIV",
+                p_BUFGCE_DIVIDE=4,
+                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys.clk),
+            Instance("BUFGCE",
+                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys4x.clk),
+        ]
+        # Reset of sys from the IDELAYCTRL (released after IDELAYCTRL's reset/ready).
+        idelayctrl_cls = {"us": USIDELAYCTRL, "usp": USPIDELAYCTRL}[self.family]
+        self.idelayctrl = idelayctrl_cls(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
+
+    def _add_sys_ecp5(self, sys_clk_freq, init_clk_freq, with_eclkbridge):
+        # Stop/Reset from the ECP5DDRPHY's initialization.
+        self.stop  = Signal()
+        self.reset = Signal()
+        self.add_domain("sys",     None)
+        self.add_domain("sys2x",   None, reset_less=True)
+        self.add_domain("sys2x_i", 2*sys_clk_freq, reset_less=True)
+        self.add_domain("init",    init_clk_freq)
+        sys2x_clk = self.cd_sys2x_i.clk
+        if with_eclkbridge:
+            sys2x_clk = Signal()
+            self.specials += Instance("ECLKBRIDGECS",
+                i_CLK0   = self.cd_sys2x_i.clk,
+                i_SEL    = 0,
+                o_ECSOUT = sys2x_clk)
+        self.specials += [
+            Instance("ECLKSYNCB",
+                i_ECLKI = sys2x_clk,
+                i_STOP  = self.stop,
+                o_ECLKO = self.cd_sys2x.clk),
+            Instance("CLKDIVF",
+                p_DIV     = "2.0",
+                i_ALIGNWD = 0,
+                i_CLKI    = self.cd_sys2x.clk,
+                i_RST     = self.reset,
+                o_CDIVX   = self.cd_sys.clk),
+            AsyncResetSynchronizer(self.cd_sys, ~self.pll.locked | self.reset),
+        ]
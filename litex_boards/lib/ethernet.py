@@ -0,0 +1,104 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Ethernet helpers/modules shared by the targets.
+#
+# EthUDPRelay forwards UDP packets received on a LiteEth UDP port to another UDP port (ex of a second
+# PHY's UDP/IP stack), re-targeted to a (CSR) remote IP, store-and-forward so that packets are sent
+# without gaps at the PHY level.
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect.packet import PacketFIFO
+
+from liteeth.common import convert_ip, eth_udp_user_description
+
+# Ethernet Data Width ------------------------------------------------------------------------------
+
+eth_data_widths = [8, 32]
+
+# Maximum line rate (bits/s) of the LiteEth PHYs (by class name, shared by the vendor variants).
+eth_line_rates = {
+    # 10/100Mbps.
+    "LiteEthPHYMII"      : 100e6,
+    "LiteEthPHYRMII"     : 100e6,
+    # 10/100/1000Mbps.
+    "LiteEthPHYGMII"     : 1e9,
+    "LiteEthPHYGMIIMII"  : 1e9,
+    "LiteEthPHYRGMII"    : 1e9,
+    "A7_1000BASEX"       : 1e9,
+    "K7_1000BASEX"       : 1e9,
+    "V7_1000BASEX"       : 1e9,
+    "KU_1000BASEX"       : 1e9,
+    "USP_GTH_1000BASEX"  : 1e9,
+    "USP_GTY_1000BASEX"  : 1e9,
+    # 2.5Gbps.
+    "A7_2500BASEX"       : 2.5e9,
+    "K7_2500BASEX"       : 2.5e9,
+    "V7_2500BASEX"       : 2.5e9,
+    "KU_2500BASEX"       : 2.5e9,
+    "USP_GTH_2500BASEX"  : 2.5e9,
+    "USP_GTY_2500BASEX"  : 2.5e9,
+    # 10Gbps.
+    "LiteEthPHYXGMII"    : 10e9,
+}
+
+def get_eth_line_rate(phy):
+    # Line rate of the PHY (or of the PHY it derives from).
+    for cls in type(phy).__mro__:
+        if cls.__name__ in eth_line_rates:
+            return eth_line_rates[cls.__name__]
+    raise ValueError(f"Unknown line rate for Ethernet PHY {type(phy).__name__}, add it to eth_line_rates or use --eth-data-width=8.")
+
+def check_eth_data_width(phy, sys_clk_freq, data_width):
+    # With data_width=8, the MAC/UDP-IP stack runs in the PHY's clock domains. With data_width=32,
+    # it runs in the sys clock domain on a 32-bit datapath, which then has to sustain the PHY's
+    # line rate (ex: sys_clk_freq >= 31.25MHz for a Gigabit PHY).
+    if data_width not in eth_data_widths:
+        raise ValueError(f"Unsupported Ethernet data width {data_width}, supported: {eth_data_widths}.")
+    if data_width == 8:
+        return
+    line_rate = get_eth_line_rate(phy)
+    if sys_clk_freq*data_width < line_rate:
+        raise ValueError("Ethernet data width {} at sys_clk_freq={:3.2f}MHz ({:3.2f}Gbps) can't sustain {} line rate ({:3.2f}Gbps), increase sys_clk_freq to at least {:3.2f}MHz or use --eth-data-width=8.".format(
+            data_width,
+            sys_clk_freq/1e6,
+            sys_clk_freq*data_width/1e9,
+            type(phy).__name__,
+            line_rate/1e9,
+            line_rate/data_width/1e6))
+
+# Ethernet UDP Relay -------------------------------------------------------------------------------
+
+class EthUDPRelay(LiteXModule):
+    def __init__(self, rx_port, tx_port, udp_port, remote_ip, depth=512):
+        self.remote_ip = CSRStorage(32, reset=convert_ip(remote_ip), description="Destination IP Address.")
+        self.packets   = CSRStatus(32, description="Forwarded packets count.")
+
+        # # #
+
+        # Store-and-Forward.
+        self.fifo = fifo = PacketFIFO(eth_udp_user_description(32),
+            payload_depth = depth,
+            param_depth   = 4,
+            buffered      = True,
+        )
+
+        # RX Port -> FIFO (re-targeted to the remote IP).
+        self.comb += [
+            rx_port.source.connect(fifo.sink, omit={"src_port", "dst_port", "ip_address"}),
+            fifo.sink.src_port.eq(udp_port),
+            fifo.sink.dst_port.eq(udp_port),
+            fifo.sink.ip_address.eq(self.remote_ip.storage),
+        ]
+
+        # FIFO -> TX Port.
+        self.comb += fifo.source.connect(tx_port.sink)
+        self.sync += If(fifo.source.valid & fifo.source.ready & fifo.source.last,
+            self.packets.status.eq(self.packets.status + 1)
+        )
@@ -0,0 +1,69 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# sys_clk_freq Results Database.
+#
+# Maximum passing sys_clk_freq of the targets buildable with the open-source toolchains, measured
+# with bench/sys_clk_freq_sweep.py and recorded per target/configuration (target arguments) in
+# fmax.json with the LiteX/toolchain versions used. Target parsers use it to suggest the maximum
+# frequency in the --sys-clk-freq help and accept --sys-clk-freq=max.
+
+import os
+import json
+import argparse
+
+# Results Database ---------------------------------------------------------------------------------
+
+class FmaxDatabase:
+    version = 1
+
+    def __init__(self, filename=None):
+        default = os.path.join(os.path.dirname(__file__), "fmax.json")
+        self.filename = default if filename is None else filename
+        self.targets  = {}
+        if os.path.exists(self.filename):
+            with open(self.filename) as f:
+                content = json.load(f)
+            if content.get("version", None) != self.version:
+                raise ValueError(f"{self.filename}: Unsupported version {content.get('version', None)}.")
+            self.targets = content["targets"]
+
+    def get(self, target, config="default"):
+        return self.targets.get(target, {}).get(config, None)
+
+    def set(self, target, config, result):
+        self.targets.setdefault(target, {})[config] = result
+
+    def save(self, filename=None):
+        filename = self.filename if filename is None else filename
+        with open(filename, "w") as f:
+            json.dump({"version": self.version, "targets": self.targets}, f, indent=1, sort_keys=True)
+            f.write("\n")
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def get_max_sys_clk_freq(target, config="default", db=None):
+    # Maximum passing sys_clk_freq recorded for target/config (None if not measured).
+    db     = FmaxDatabase() if db is None else db
+    result = db.get(target, config)
+    return None if result is None else result["sys_clk_freq"]
+
+def get_sys_clk_freq_help(target, help="System clock frequency."):
+    # --sys-clk-freq help with the recorded maximum passing frequency.
+    sys_clk_freq = get_max_sys_clk_freq(target)
+    if sys_clk_freq is None:
+        return help
+    return help + f" Max passing (open-source toolchain): {sys_clk_freq/1e6:.2f}MHz, use max to select it."
+
+def get_sys_clk_freq_type(target):
+    # --sys-clk-freq type: float or max (recorded maximum passing frequency).
+    def sys_clk_freq_type(value):
+        if value == "max":
+            sys_clk_freq = get_max_sys_clk_freq(target)
+            if sys_clk_freq is None:
+                raise argparse.ArgumentTypeError(f"No sys_clk_freq results for {target} (see bench/sys_clk_freq_sweep.py).")
+            return sys_clk_freq
+        return float(value)
+    return sys_clk_freq_type
@@ -0,0 +1,316 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# HUB75 LED panels driver for LED receiver cards (Colorlight, Linsn).
+#
+# The frames are stored in a SDRAM framebuffer (32-bit 0x00RRGGBB pixels, one width x height image
+# per output, images of the outputs stacked vertically) that is filled by a UDP receiver, and
+# continuously scanned to the HUB75 outputs by HUB75Scanner with Binary Coded Modulation, so that
+# no CPU is involved in the datapath.
+#
+# UDP packet format (little-endian 32-bit words):
+# - Word 0     : Pixel offset in the framebuffer.
+# - Words 1..N : Pixels (0x00RRGGBB).
+# Pixels outside of the framebuffer are dropped (and counted).
+
+from math import ceil
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def parse_hub75_panel(panel):
+    # "64x32" -> (64, 32).
+    width, height = (int(v) for v in panel.lower().split("x"))
+    if height % 2:
+        raise ValueError(f"Invalid HUB75 panel {panel}: height must be even.")
+    return width, height
+
+def get_hub75_gamma_lut(gamma=2.2, bit_depth=8):
+    return [round(((i/255)**gamma)*(2**bit_depth - 1)) for i in range(256)]
+
+# HUB75 Scanner ------------------------------------------------------------------------------------
+
+class HUB75Scanner(LiteXModule):
+    def __init__(self, control_pads, chain_pads, port, sys_clk_freq,
+        width     = 64,
+        height    = 32,
+        bit_depth = 8,
+        gamma     = 2.2,
+        base      = 0x00000000,
+        clk_freq  = 15e6):
+        assert port.data_width == 32
+        assert 1 <= bit_depth <= 12
+        self.enable  = CSRStorage(reset=1, description="Scanner enable.")
+        self.base    = CSRStorage(32, reset=base, description="Framebuffer base (byte offset in SDRAM).")
+        self.oe_time = CSRStorage(16, reset=8,    description="Display time of the LSB bit-plane (in sys_clk cycles).")
+        self.gamma   = CSRStorage(fields=[
+            CSRField("addr", size=8,  description="Gamma LUT address (8-bit input value)."),
+            CSRField("data", size=16, description="Gamma LUT data ({}-bit output value).".format(bit_depth)),
+        ], description="Gamma LUT, written on each write of the register.")
+        self.frames  = CSRStatus(32, description="Scanned frames count.")
+
+        # # #
+
+        n_chains = len(chain_pads)
+        n_slots  = 2*n_chains # Upper/Lower half of each chain.
+        n_rows   = height//2  # Scan rows.
+        slot_dw  = 3*bit_depth
+        clk_div  = max(2, ceil(sys_clk_freq/(2*clk_freq)))
+
+        # Gamma LUT (shared by the R/G/B channels).
+        lut      = Memory(bit_depth, 256, init=get_hub75_gamma_lut(gamma, bit_depth))
+        lut_wr   = lut.get_port(write_capable=True)
+        lut_rds  = [lut.get_port() for _ in range(3)]
+        self.specials += lut, lut_wr, *lut_rds
+        self.comb += [
+            lut_wr.adr.eq(self.gamma.fields.addr),
+            lut_wr.dat_w.eq(self.gamma.fields.data),
+            lut_wr.we.eq(self.gamma.re),
+        ]
+
+        # Line Buffer (double-buffered, one word per column with the pixels of all slots).
+        linebuf    = Memory(n_slots*slot_dw, 2*width)
+        linebuf_wr = linebuf.get_port(write_capable=True, we_granularity=slot_dw)
+        linebuf_rd = linebuf.get_port()
+        self.specials += linebuf, linebuf_wr, linebuf_rd
+
+        # Loader: SDRAM -> Gamma LUT -> Line Buffer ------------------------------------------------
+        self.reader = reader = LiteDRAMDMAReader(port, fifo_depth=16, fifo_buffered=True)
+
+        load_start = Signal()
+        load_done  = Signal()
+        load_row   = Signal(max=max(n_rows, 2))
+        load_bank  = Signal()
+        base_word  = Signal(port.address_width)
+        self.comb += base_word.eq(self.base.storage[2:])
+
+        # Commands.
+        cmd_x    = Signal(max=max(width, 2))
+        cmd_slot = Signal(max=max(n_slots, 2))
+        cmd_busy = Signal()
+        cmd_y    = Signal(max=max(n_chains*height, 2))
+        self.comb += cmd_y.eq(cmd_slot[1:]*height + load_row + Mux(cmd_slot[0], n_rows, 0))
+        self.comb += [
+            reader.sink.valid.eq(cmd_busy),
+            reader.sink.address.eq(base_word + cmd_y*width + cmd_x),
+        ]
+        self.sync += [
+            If(load_start,
+                cmd_busy.eq(1),
+                cmd_x.eq(0),
+                cmd_slot.eq(0),
+            ).Elif(reader.sink.valid & reader.sink.ready,
+                cmd_x.eq(cmd_x + 1),
+                If(cmd_x == (width - 1),
+                    cmd_x.eq(0),
+                    cmd_slot.eq(cmd_slot + 1),
+                    If(cmd_slot == (n_slots - 1),
+                        cmd_busy.eq(0)
+                    )
+                )
+            )
+        ]
+
+        # Datas (1 cycle of Gamma LUT latency).
+        dat_x     = Signal(max=max(width, 2))
+        dat_slot  = Signal(max=max(n_slots, 2))
+        wr_valid  = Signal()
+        wr_x      = Signal(max=max(width, 2))
+        wr_slot   = Signal(max=max(n_slots, 2))
+        self.comb += [
+            reader.source.ready.eq(1),
+            lut_rds[0].adr.eq(reader.source.data[16:24]), # R.
+            lut_rds[1].adr.eq(reader.source.data[ 8:16]), # G.
+            lut_rds[2].adr.eq(reader.source.data[ 0: 8]), # B.
+        ]
+        self.sync += [
+            wr_valid.eq(reader.source.valid),
+            wr_x.eq(dat_x),
+            wr_slot.eq(dat_slot),
+            If(load_start,
+                dat_x.eq(0),
+                dat_slot.eq(0),
+            ).Elif(reader.source.valid,
+                dat_x.eq(dat_x + 1),
+                If(dat_x == (width - 1),
+                    dat_x.eq(0),
+                    dat_slot.eq(dat_slot + 1),
+                )
+            )
+        ]
+        self.comb += [
+            linebuf_wr.adr.eq(Cat(wr_x, load_bank)),
+            linebuf_wr.dat_w.eq(Replicate(Cat(*[lut_rd.dat_r for lut_rd in lut_rds]), n_slots)),
+            load_done.eq(wr_valid & (wr_x == (width - 1)) & (wr_slot == (n_slots - 1))),
+        ]
+        for n in range(n_slots):
+            self.comb += linebuf_wr.we[n].eq(wr_valid & (wr_slot == n))
+
+        # Display: Line Buffer -> HUB75 (Binary Coded Modulation) ----------------------------------
+        bank     = Signal()
+        row      = Signal(max=max(n_rows, 2))
+        plane    = Signal(max=max(bit_depth, 2))
+        x        = Signal(max=max(width, 2))
+        timer    = Signal(max=2*clk_div)
+        oe_timer = Signal(16 + bit_depth)
+        oe_load  = Signal()
+        loading  = Signal()
+        self.comb += linebuf_rd.adr.eq(Cat(x, bank))
+        self.sync += [
+            If(load_start, loading.eq(1)),
+            If(load_done,  loading.eq(0)),
+            If(oe_load,
+                oe_timer.eq(self.oe_time.storage << plane)
+            ).Elif(oe_timer != 0,
+                oe_timer.eq(oe_timer - 1)
+            )
+        ]
+
+        # Outputs.
+        clk   = Signal()
+        stb   = Signal()
+        addr  = Signal(len(control_pads.bank))
+        datas = Signal(n_slots*3)
+        self.sync += [
+            control_pads.clk.eq(clk),
+            control_pads.stb.eq(stb),
+            control_pads.oe.eq(oe_timer == 0), # Active low.
+            control_pads.bank.eq(addr),
+        ]
+        for n, pads in enumerate(chain_pads):
+            for h in range(2):
+                slot = 2*n + h
+                self.sync += [
+                    pads.r[h].eq(datas[3*slot + 0]),
+                    pads.g[h].eq(datas[3*slot + 1]),
+                    pads.b[h].eq(datas[3*slot + 2]),
+                ]
+
+        # Current bit-plane of each slot/color, sampled once the Line Buffer read is done.
+        planes = []
+        for slot in range(n_slots):
+            for c in range(3):
+                start = slot*slot_dw + c*bit_depth
+                planes.append((linebuf_rd.dat_r[start:start + bit_depth] >> plane)[0])
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        self.sync += If(fsm.ongoing("SHIFT") & (timer == 1), datas.eq(Cat(*planes)))
+        fsm.act("IDLE",
+            If(self.enable.storage & ~loading,
+                load_start.eq(1),
+                NextValue(load_row,  0),
+                NextValue(load_bank, ~bank),
+                NextState("SWAP")
+            )
+        )
+        fsm.act("SWAP",
+            # Wait next row to be loaded, display it and load the following one in the other bank.
+            If(~loading,
+                load_start.eq(1),
+                NextValue(bank,      ~bank),
+                NextValue(row,       load_row),
+                NextValue(load_bank, bank),
+                NextValue(load_row,  load_row + 1),
+                If(load_row == (n_rows - 1),
+                    NextValue(load_row, 0),
+                    NextValue(self.frames.status, self.frames.status + 1)
+                ),
+                NextValue(plane, 0),
+                NextValue(x,     0),
+                NextValue(timer, 0),
+                NextState("SHIFT")
+            )
+        )
+        fsm.act("SHIFT",
+            clk.eq(timer >= clk_div),
+            NextValue(timer, timer + 1),
+            If(timer == (2*clk_div - 1),
+                NextValue(timer, 0),
+                NextValue(x, x + 1),
+                If(x == (width - 1),
+                    NextValue(x, 0),
+                    NextState("WAIT-OE")
+                )
+            )
+        )
+        fsm.act("WAIT-OE",
+            # Wait display of the previous bit-plane to be done.
+            If(oe_timer == 0,
+                NextState("LATCH")
+            )
+        )
+        fsm.act("LATCH",
+            stb.eq(1),
+            NextValue(addr, row),
+            NextValue(timer, timer + 1),
+            If(timer == (clk_div - 1),
+                oe_load.eq(1),
+                NextValue(timer, 0),
+                NextValue(plane, plane + 1),
+                If(plane == (bit_depth - 1),
+                    If(self.enable.storage,
+                        NextState("SWAP")
+                    ).Else(
+                        NextState("IDLE")
+                    )
+                ).Else(
+                    NextState("SHIFT")
+                )
+            )
+        )
+
+# HUB75 UDP Receiver -------------------------------------------------------------------------------
+
+class HUB75UDPReceiver(LiteXModule):
+    def __init__(self, udp_port, port, base=0x00000000, size=None):
+        assert port.data_width == 32
+        size = min(4*2**port.address_width - base, 2**32 - 4) if size is None else size # Default: Up to the end of the port.
+        self.base   = CSRStorage(32, reset=base, description="Framebuffer base (byte offset in SDRAM).")
+        self.size   = CSRStorage(32, reset=size, description="Framebuffer size (in bytes).")
+        self.pixels = CSRStatus(32, description="Received pixels count.")
+        self.drops  = CSRStatus(32, description="Dropped pixels count (outside of the framebuffer).")
+
+        # # #
+
+        self.writer = writer = LiteDRAMDMAWriter(port, fifo_depth=16, fifo_buffered=True)
+
+        sink     = stream.Endpoint([("data", 32)])
+        offset   = Signal(32)
+        in_range = Signal()
+        self.comb += udp_port.source.connect(sink, keep={"valid", "ready", "last", "data"})
+        self.comb += in_range.eq(offset < self.size.storage[2:])
+
+        self.fsm = fsm = FSM(reset_state="HEADER")
+        fsm.act("HEADER",
+            sink.ready.eq(1),
+            If(sink.valid & ~sink.last,
+                NextValue(offset, sink.data),
+                NextState("DATA")
+            )
+        )
+        fsm.act("DATA",
+            writer.sink.valid.eq(sink.valid & in_range),
+            writer.sink.address.eq(self.base.storage[2:] + offset),
+            writer.sink.data.eq(sink.data),
+            sink.ready.eq(writer.sink.ready | ~in_range),
+            If(sink.valid & sink.ready,
+                NextValue(offset, offset + 1),
+                NextValue(self.pixels.status, self.pixels.status + 1),
+                If(~in_range,
+                    NextValue(self.drops.status, self.drops.status + 1)
+                ),
+                If(sink.last,
+                    NextState("HEADER")
+                )
+            )
+        )
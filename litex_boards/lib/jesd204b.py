@@ -0,0 +1,682 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# JESD204B (Subclass 1) Transport/Link layers over 8b10b transceivers (ex liteiclink's GTH/GTY with
+# 40-bit words: 4 octets per device clock, octet 0 first on the line) and sample streaming (ex to/
+# from PCIe DMAs).
+#
+# - Transport: N = N' = 16, F = 1, 2 or 4 octets per frame, no control bits. Samples words hold 4/F
+#   frames of M converters x S samples (16-bit, frame-major): [frame][converter][sample].
+# - Link: CGS, ILAS (4 multiframes, link configuration in the 2nd multiframe) and scrambled user
+#   data (1 + x^14 + x^15, SCR=1) with /F/ /A/ alignment characters. The LMFC is aligned on the first
+#   SYSREF rising edge after the links are enabled (plus lmfc_offset), SYSREF edges received off the
+#   LMFC boundary are reported.
+# - RX lanes are buffered from their /R/ and released together on the first LMFC boundary once all
+#   lanes are started: lanes are deskewed and the latency is deterministic as long as the lanes
+#   skew/arrival is below a multiframe.
+
+from functools import reduce
+from operator import and_, or_
+
+from migen import *
+from migen.genlib.cdc import MultiReg, BusSynchronizer
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+# Constants ----------------------------------------------------------------------------------------
+
+K28_0 = 0x1c # /R/: ILAS multiframe start.
+K28_3 = 0x7c # /A/: Lane alignment (multiframe end).
+K28_4 = 0x9c # /Q/: ILAS link configuration start.
+K28_5 = 0xbc # /K/: Code group synchronization.
+K28_7 = 0xfc # /F/: Frame alignment.
+
+# Settings -----------------------------------------------------------------------------------------
+
+class JESD204BSettings:
+    def __init__(self, m, l, f, s=1, k=32, n=16, did=0, bid=0):
+        np = 16
+        if f not in [1, 2, 4]:
+            raise ValueError(f"Unsupported JESD204B F={f}, supported: 1, 2, 4.")
+        if m*s*np != 8*f*l:
+            raise ValueError(f"Invalid JESD204B settings: M*S*N' ({m*s*np}) != 8*F*L ({8*f*l}).")
+        if (k > 32) or (f*k < 20) or ((f*k) % 4):
+            raise ValueError(f"Invalid JESD204B K={k}: F*K must be a multiple of 4 in [20, 1024].")
+        self.m, self.l, self.f, self.s, self.k, self.n, self.np = m, l, f, s, k, n, np
+        self.did, self.bid = did, bid
+
+        self.lmfc_words      = f*k//4      # Device clocks per multiframe.
+        self.frames_per_word = 4//f
+        self.nsamples        = m*s*4//f    # Samples per device clock.
+        self.data_width      = 32*l
+
+    def get_config_octets(self, lid):
+        hd = int(self.f == 1)
+        fields = {
+            "did"       : self.did,
+            "adjcnt"    : 0,
+            "bid"       : self.bid,
+            "adjdir"    : 0,
+            "phadj"     : 0,
+            "lid"       : lid,
+            "scr"       : 1,
+            "l"         : self.l  - 1,
+            "f"         : self.f  - 1,
+            "k"         : self.k  - 1,
+            "m"         : self.m  - 1,
+            "cs"        : 0,
+            "n"         : self.n  - 1,
+            "subclassv" : 1,
+            "np"        : self.np - 1,
+            "jesdv"     : 1,
+            "s"         : self.s  - 1,
+            "hd"        : hd,
+            "cf"        : 0,
+        }
+        return [
+            fields["did"],
+            (fields["adjcnt"] << 4) | fields["bid"],
+            (fields["adjdir"] << 6) | (fields["phadj"] << 5) | fields["lid"],
+            (fields["scr"] << 7) | fields["l"],
+            fields["f"],
+            fields["k"],
+            fields["m"],
+            (fields["cs"] << 6) | fields["n"],
+            (fields["subclassv"] << 5) | fields["np"],
+            (fields["jesdv"] << 5) | fields["s"],
+            (fields["hd"] << 7) | fields["cf"],
+            0, # RES1.
+            0, # RES2.
+            sum(fields.values()) % 256, # FCHK.
+        ]
+
+    def get_ilas_words(self, lid):
+        # ILAS words (data | ctrl << 32) of the 4 multiframes, ramp on the data octets.
+        config = self.get_config_octets(lid)
+        words  = []
+        for mf in range(4):
+            for w in range(self.lmfc_words):
+                data, ctrl = 0, 0
+                for i in range(4):
+                    p, k = 4*w + i, 0
+                    octet = p % 256
+                    if p == 0:
+                        octet, k = K28_0, 1
+                    elif p == (4*self.lmfc_words - 1):
+                        octet, k = K28_3, 1
+                    elif mf == 1 and p == 1:
+                        octet, k = K28_4, 1
+                    elif mf == 1 and p < 16:
+                        octet = config[p - 2]
+                    data |= octet << 8*i
+                    ctrl |= k << i
+                words.append(data | (ctrl << 32))
+        return words
+
+    def get_transport_map(self):
+        # (sample, high octet) for each octet of each lane's word.
+        lanes = [[None]*4 for _ in range(self.l)]
+        for fr in range(self.frames_per_word):
+            octets = []
+            for m in range(self.m):
+                for s in range(self.s):
+                    sample = (fr*self.m + m)*self.s + s
+                    octets += [(sample, 1), (sample, 0)] # MSB first.
+            for lane in range(self.l):
+                for j in range(self.f):
+                    lanes[lane][fr*self.f + j] = octets[lane*self.f + j]
+        return lanes
+
+# Transport ----------------------------------------------------------------------------------------
+
+def jesd204b_samples_to_lanes(settings, samples):
+    lanes = []
+    for octets in settings.get_transport_map():
+        lanes.append(Cat(*[samples[16*sample + 8*high:16*sample + 8*high + 8] for sample, high in octets]))
+    return lanes
+
+def jesd204b_lanes_to_samples(settings, lanes):
+    octets = {}
+    for lane, lane_octets in zip(lanes, settings.get_transport_map()):
+        for i, (sample, high) in enumerate(lane_octets):
+            octets[(sample, high)] = lane[8*i:8*(i + 1)]
+    return Cat(*[Cat(octets[(sample, 0)], octets[(sample, 1)]) for sample in range(settings.nsamples)])
+
+# Scrambler ----------------------------------------------------------------------------------------
+
+class JESD204BScrambler(LiteXModule):
+    # Self-synchronous (de)scrambler (1 + x^14 + x^15) on 4 octets, octet 0 first, MSB first. State
+    # is cleared when not enabled.
+    def __init__(self, descramble=False):
+        self.enable = Signal()
+        self.i      = Signal(32)
+        self.o      = Signal(32)
+
+        # # #
+
+        state   = Signal(15)
+        history = [state[n] for n in range(15)] # Scrambled bits, oldest first.
+        for octet in range(4):
+            for bit in reversed(range(8)):
+                n = 8*octet + bit
+                o = Signal()
+                self.comb += o.eq(self.i[n] ^ history[-14] ^ history[-15])
+                self.comb += self.o[n].eq(o)
+                history.append(self.i[n] if descramble else o)
+        self.sync += If(self.enable,
+            state.eq(Cat(*history[-15:]))
+        ).Else(
+            state.eq(0)
+        )
+
+# LMFC ---------------------------------------------------------------------------------------------
+
+class JESD204BLMFC(LiteXModule):
+    def __init__(self, settings):
+        self.sysref  = Signal()  # SYSREF (sampled in the device clock domain).
+        self.offset  = Signal(8) # LMFC position on SYSREF.
+        self.restart = Signal()  # Re-align on next SYSREF.
+        self.count   = Signal(max=settings.lmfc_words)
+        self.aligned = Signal()
+        self.error   = Signal()  # SYSREF edge off the LMFC boundary.
+
+        # # #
+
+        sysref_d    = Signal()
+        sysref_rise = Signal()
+        count_next  = Signal(max=settings.lmfc_words)
+        self.comb += [
+            sysref_rise.eq(self.sysref & ~sysref_d),
+            count_next.eq(Mux(self.count == (settings.lmfc_words - 1), 0, self.count + 1)),
+            self.error.eq(sysref_rise & self.aligned & (count_next != self.offset)),
+        ]
+        self.sync += [
+            sysref_d.eq(self.sysref),
+            self.count.eq(count_next),
+            If(self.restart,
+                self.aligned.eq(0)
+            ).Elif(sysref_rise & ~self.aligned,
+                self.count.eq(self.offset),
+                self.aligned.eq(1)
+            )
+        ]
+
+# Link TX ------------------------------------------------------------------------------------------
+
+class JESD204BLinkTX(LiteXModule):
+    def __init__(self, settings, lid):
+        self.jsync        = Signal() # SYNC~ from the receiver (active low).
+        self.lmfc_count   = Signal(max=settings.lmfc_words)
+        self.data         = Signal(32) # Lane data, transmitted when ready.
+        self.ready        = Signal()
+        self.resync       = Signal() # Synchronization request received.
+        self.error_report = Signal() # Error reported by the receiver (short SYNC~ pulse).
+        self.source       = source = stream.Endpoint([("data", 32), ("ctrl", 4)])
+
+        # # #
+
+        W = settings.lmfc_words
+        F = settings.f
+
+        # Synchronization requests (SYNC~ asserted for at least 5 frames + 9 octets).
+        sync_request_words = (5*F + 9 + 3)//4
+        sync_count   = Signal(max=sync_request_words + 1)
+        sync_request = Signal()
+        self.comb += sync_request.eq(sync_count == sync_request_words)
+        self.sync += If(self.jsync,
+            sync_count.eq(0)
+        ).Elif(~sync_request,
+            sync_count.eq(sync_count + 1)
+        )
+
+        # Scrambler.
+        self.scrambler = scrambler = JESD204BScrambler()
+        self.comb += scrambler.i.eq(self.data)
+
+        # Alignment characters (on scrambled data): /A/ on multiframe end (0x7c), /F/ on frame end (0xfc).
+        data_ctrl = Signal(4)
+        for i in range(F - 1, 4, F):
+            octet = scrambler.o[8*i:8*(i + 1)]
+            if i == 3:
+                self.comb += If(self.lmfc_count == (W - 1),
+                    data_ctrl[i].eq(octet == K28_3)
+                ).Else(
+                    data_ctrl[i].eq(octet == K28_7)
+                )
+            else:
+                self.comb += data_ctrl[i].eq(octet == K28_7)
+
+        # FSM.
+        multiframe = Signal(2)
+        self.fsm = fsm = FSM(reset_state="CGS")
+        fsm.act("CGS",
+            If(self.jsync & (self.lmfc_count == (W - 1)),
+                NextValue(multiframe, 0),
+                NextState("ILAS")
+            )
+        )
+        fsm.act("ILAS",
+            If(~self.jsync,
+                self.resync.eq(1),
+                NextState("CGS")
+            ).Elif(self.lmfc_count == (W - 1),
+                NextValue(multiframe, multiframe + 1),
+                If(multiframe == 3,
+                    NextState("DATA")
+                )
+            )
+        )
+        fsm.act("DATA",
+            self.ready.eq(1),
+            scrambler.enable.eq(1),
+            self.error_report.eq(self.jsync & (sync_count != 0)),
+            If(sync_request,
+                self.resync.eq(1),
+                NextState("CGS")
+            )
+        )
+
+        # Output.
+        ilas = Array(Constant(word, 36) for word in settings.get_ilas_words(lid))
+        self.comb += source.valid.eq(1)
+        self.sync += [
+            If(fsm.ongoing("ILAS"),
+                Cat(source.data, source.ctrl).eq(ilas[multiframe*W + self.lmfc_count])
+            ).Elif(fsm.ongoing("DATA"),
+                source.data.eq(scrambler.o),
+                source.ctrl.eq(data_ctrl),
+            ).Else(
+                source.data.eq(Replicate(Constant(K28_5, 8), 4)),
+                source.ctrl.eq(0b1111),
+            )
+        ]
+
+# Link RX ------------------------------------------------------------------------------------------
+
+class JESD204BLinkRX(LiteXModule):
+    def __init__(self, settings, lid, buffer_depth=None):
+        W = settings.lmfc_words
+        F = settings.f
+        buffer_depth = buffer_depth or max(2*W, 16)
+        self.sink    = sink = stream.Endpoint([("data", 32), ("ctrl", 4)])
+        self.invalid = Signal(4)  # 8b10b invalid characters.
+        self.align   = Signal()   # Comma alignment enable (to transceiver).
+        self.synced  = Signal()   # CGS done.
+        self.started = Signal()   # /R/ received, lane buffered.
+        self.release = Signal()   # Release the lane buffer (all lanes started, on LMFC boundary).
+        self.data    = Signal(32) # Lane data, valid when ready.
+        self.ready   = Signal()
+        self.restart = Signal()   # Restart request (lane buffer error, transmitter in CGS).
+
+        # Errors.
+        self.error_invalid    = Signal() # 8b10b disparity/not-in-table errors.
+        self.error_unexpected = Signal() # Unexpected control characters.
+        self.error_config     = Signal() # ILAS link configuration mismatch.
+
+        # # #
+
+        all_k = Signal()
+        self.comb += all_k.eq((sink.data == Replicate(Constant(K28_5, 8), 4)) & (sink.ctrl == 0b1111))
+
+        # Lane buffer (from /R/).
+        self.buffer = buffer = stream.SyncFIFO([("data", 32), ("ctrl", 4), ("invalid", 4)], buffer_depth)
+
+        # CGS/ILAS start (write side).
+        cgs_count = Signal(2)
+        self.fsm = fsm = FSM(reset_state="CGS")
+        fsm.act("CGS",
+            self.align.eq(1),
+            If(all_k & (self.invalid == 0),
+                NextValue(cgs_count, cgs_count + 1),
+                If(cgs_count == 3,
+                    NextState("SYNCED")
+                )
+            ).Else(
+                NextValue(cgs_count, 0)
+            )
+        )
+        fsm.act("SYNCED",
+            self.synced.eq(1),
+            If(sink.ctrl[0] & (sink.data[:8] == K28_0) & (self.invalid == 0),
+                buffer.sink.valid.eq(1),
+                NextState("BUFFER")
+            ).Elif(~all_k,
+                self.restart.eq(1),
+            )
+        )
+        fsm.act("BUFFER",
+            self.synced.eq(1),
+            self.started.eq(1),
+            buffer.sink.valid.eq(1),
+            If(~buffer.sink.ready,
+                self.restart.eq(1)
+            )
+        )
+        self.comb += [
+            buffer.sink.data.eq(sink.data),
+            buffer.sink.ctrl.eq(sink.ctrl),
+            buffer.sink.invalid.eq(self.invalid),
+        ]
+
+        # Read side (lanes read together once released).
+        position   = Signal(max=W)
+        multiframe = Signal(3)
+        data       = buffer.source
+        self.comb += buffer.source.ready.eq(self.release)
+        self.sync += [
+            If(~self.release,
+                position.eq(0),
+                multiframe.eq(0),
+            ).Else(
+                position.eq(position + 1),
+                If(position == (W - 1),
+                    position.eq(0),
+                    If(multiframe != 4,
+                        multiframe.eq(multiframe + 1)
+                    )
+                )
+            )
+        ]
+        self.comb += If(self.release & ~data.valid, self.restart.eq(1))
+
+        # ILAS link configuration check (2nd multiframe, words 0-3: /R/, /Q/ and configuration).
+        ilas = Array(Constant(word, 36) for word in settings.get_ilas_words(lid)[W:W + 4])
+        self.comb += If(self.release & data.valid & (multiframe == 1) & (position < 4),
+            self.error_config.eq(Cat(data.data, data.ctrl) != ilas[position[:2]])
+        )
+
+        # User data: alignment characters replacement (same octet value), checks.
+        user = Signal()
+        self.comb += user.eq(self.release & data.valid & (multiframe == 4))
+        unexpected = Signal(4)
+        for i in range(4):
+            octet = data.data[8*i:8*(i + 1)]
+            if (i % F) == (F - 1):
+                if i == 3:
+                    allowed = Mux(position == (W - 1), octet == K28_3, octet == K28_7)
+                else:
+                    allowed = (octet == K28_7)
+                self.comb += unexpected[i].eq(data.ctrl[i] & ~allowed)
+            else:
+                self.comb += unexpected[i].eq(data.ctrl[i])
+        self.comb += [
+            self.error_invalid.eq(self.release & data.valid & (data.invalid != 0)),
+            self.error_unexpected.eq(user & (unexpected != 0)),
+            # Transmitter back in CGS.
+            If(user & (data.data == Replicate(Constant(K28_5, 8), 4)) & (data.ctrl == 0b1111),
+                self.restart.eq(1)
+            )
+        ]
+
+        # Descrambler.
+        self.descrambler = descrambler = JESD204BScrambler(descramble=True)
+        self.comb += [
+            descrambler.enable.eq(user),
+            descrambler.i.eq(data.data),
+        ]
+        self.sync += [
+            self.ready.eq(user),
+            self.data.eq(descrambler.o),
+        ]
+
+# Core ---------------------------------------------------------------------------------------------
+
+class JESD204BCore(LiteXModule):
+    # TX/RX links on the transceivers (liteiclink, 40-bit with stream endpoints, in clock_domain).
+    def __init__(self, phys, settings, clock_domain="jesd"):
+        assert len(phys) == settings.l
+        self.settings = settings
+
+        # Device clock domain.
+        self.sysref   = Signal()                    # SYSREF.
+        self.tx_jsync = Signal()                    # SYNC~ from the converter's deframer.
+        self.rx_jsync = Signal()                    # SYNC~ to the converter's framer.
+        self.tx_data  = Signal(settings.data_width) # TX samples, transmitted when tx_ready.
+        self.tx_ready = Signal()
+        self.rx_data  = Signal(settings.data_width) # RX samples, valid when rx_ready.
+        self.rx_ready = Signal()
+
+        self.control = CSRStorage(fields=[
+            CSRField("enable",   size=1, offset=0, reset=1, description="Links enable (0: restart the links and re-align the LMFC)."),
+            CSRField("loopback", size=1, offset=1, description="Internal loopback (transceivers near-end PMA loopback, RX SYNC~ to TX SYNC~)."),
+        ])
+        self.lmfc_offset = CSRStorage(8, description="LMFC position on SYSREF (in device clocks).")
+        self.status = CSRStatus(fields=[
+            CSRField("lmfc",     size=1,          offset=0, description="LMFC aligned on SYSREF."),
+            CSRField("tx_jsync", size=1,          offset=1, description="TX SYNC~ deasserted by the converter."),
+            CSRField("tx_ready", size=1,          offset=2, description="TX link transmitting user data."),
+            CSRField("rx_jsync", size=1,          offset=3, description="RX SYNC~ deasserted (all lanes synchronized)."),
+            CSRField("rx_ready", size=1,          offset=4, description="RX link receiving user data."),
+            CSRField("rx_lanes", size=settings.l, offset=8, description="RX lanes synchronized (CGS done)."),
+        ])
+        self.sysref_errors    = CSRStatus(32, description="SYSREF edges off the LMFC boundary count.")
+        self.tx_resyncs       = CSRStatus(32, description="TX synchronization requests count.")
+        self.tx_error_reports = CSRStatus(32, description="TX errors reported by the converter (SYNC~ pulses) count.")
+        self.rx_resyncs       = CSRStatus(32, description="RX link restarts count.")
+        self.rx_config_errors = CSRStatus(32, description="RX ILAS link configuration mismatches count.")
+        for n in range(settings.l):
+            setattr(self, f"rx_lane{n}_errors",     CSRStatus(32, name=f"rx_lane{n}_errors",     description=f"RX lane {n} 8b10b errors count."))
+            setattr(self, f"rx_lane{n}_unexpected", CSRStatus(32, name=f"rx_lane{n}_unexpected", description=f"RX lane {n} unexpected control characters count."))
+
+        # # #
+
+        sync = getattr(self.sync, clock_domain)
+
+        enable   = Signal()
+        loopback = Signal()
+        offset   = Signal(8)
+        self.specials += [
+            MultiReg(self.control.fields.enable,   enable,   clock_domain),
+            MultiReg(self.control.fields.loopback, loopback, clock_domain),
+            MultiReg(self.lmfc_offset.storage,     offset,   clock_domain),
+        ]
+        for phy in phys:
+            self.comb += phy.loopback.eq(Mux(self.control.fields.loopback, 0b010, 0b000))
+
+        # LMFC.
+        self.lmfc = lmfc = ClockDomainsRenamer(clock_domain)(JESD204BLMFC(settings))
+        self.comb += [
+            lmfc.sysref.eq(self.sysref),
+            lmfc.offset.eq(offset),
+            lmfc.restart.eq(~enable),
+        ]
+
+        # TX Links.
+        tx_jsync = Signal()
+        tx_lanes = jesd204b_samples_to_lanes(settings, self.tx_data)
+        tx_links = []
+        for n, phy in enumerate(phys):
+            link = ClockDomainsRenamer(clock_domain)(JESD204BLinkTX(settings, lid=n))
+            self.add_module(name=f"tx_link{n}", module=link)
+            self.comb += [
+                link.jsync.eq(tx_jsync),
+                link.lmfc_count.eq(lmfc.count),
+                link.data.eq(tx_lanes[n]),
+                link.source.connect(phy.sink),
+            ]
+            tx_links.append(link)
+        self.comb += [
+            tx_jsync.eq(enable & lmfc.aligned & Mux(loopback, self.rx_jsync, self.tx_jsync)),
+            self.tx_ready.eq(tx_links[0].ready),
+        ]
+
+        # RX Links.
+        rx_restart  = Signal()
+        rx_released = Signal()
+        rx_links    = []
+        for n, phy in enumerate(phys):
+            link = ClockDomainsRenamer(clock_domain)(ResetInserter()(JESD204BLinkRX(settings, lid=n)))
+            self.add_module(name=f"rx_link{n}", module=link)
+            self.comb += [
+                link.reset.eq(rx_restart),
+                phy.source.connect(link.sink),
+                link.invalid.eq(Cat(*[decoder.invalid for decoder in phy.decoders])),
+                phy.rx_align.eq(link.align),
+                link.release.eq(rx_released),
+            ]
+            rx_links.append(link)
+        self.comb += [
+            rx_restart.eq(~enable | ~lmfc.aligned | reduce(or_, [link.restart for link in rx_links])),
+            self.rx_data.eq(jesd204b_lanes_to_samples(settings, [link.data for link in rx_links])),
+            self.rx_ready.eq(rx_links[0].ready),
+        ]
+        lmfc_zero = Signal()
+        self.comb += lmfc_zero.eq(lmfc.count == 0)
+        sync += [
+            If(rx_restart,
+                self.rx_jsync.eq(0),
+                rx_released.eq(0),
+            ).Else(
+                If(reduce(and_, [link.synced for link in rx_links]) & lmfc_zero,
+                    self.rx_jsync.eq(1)
+                ),
+                If(reduce(and_, [link.started for link in rx_links]) & lmfc_zero,
+                    rx_released.eq(1)
+                )
+            )
+        ]
+
+        # Status/Statistics.
+        self.specials += [
+            MultiReg(lmfc.aligned,   self.status.fields.lmfc),
+            MultiReg(tx_jsync,       self.status.fields.tx_jsync),
+            MultiReg(self.tx_ready,  self.status.fields.tx_ready),
+            MultiReg(self.rx_jsync,  self.status.fields.rx_jsync),
+            MultiReg(self.rx_ready,  self.status.fields.rx_ready),
+            MultiReg(Cat(*[link.synced for link in rx_links]), self.status.fields.rx_lanes),
+        ]
+        rx_was_up = Signal()
+        sync += If(rx_restart, rx_was_up.eq(0)).Elif(self.rx_jsync, rx_was_up.eq(1))
+        counters = [
+            (self.sysref_errors,    lmfc.error),
+            (self.tx_resyncs,       tx_links[0].resync),
+            (self.tx_error_reports, tx_links[0].error_report),
+            (self.rx_resyncs,       rx_restart & rx_was_up),
+            (self.rx_config_errors, reduce(or_, [link.error_config for link in rx_links])),
+        ]
+        for n, link in enumerate(rx_links):
+            counters += [
+                (getattr(self, f"rx_lane{n}_errors"),     link.error_invalid),
+                (getattr(self, f"rx_lane{n}_unexpected"), link.error_unexpected),
+            ]
+        for csr, event in counters:
+            counter = Signal(32)
+            sync += If(event, counter.eq(counter + 1))
+            counter_sync = BusSynchronizer(32, clock_domain, "sys")
+            self.submodules += counter_sync
+            self.comb += [
+                counter_sync.i.eq(counter),
+                csr.status.eq(counter_sync.o),
+            ]
+
+# Streamer -----------------------------------------------------------------------------------------
+
+class JESD204BStreamer(LiteXModule):
+    # RX/TX samples of a JESD204BCore to/from sys streams (ex PCIe DMAs) with FIFOs. RX words are
+    # dropped (and counted as overruns) when the FIFO is full, missing TX words are replaced by zeros
+    # (and counted as underruns). The internal pattern (RX 16-bit counter, TX sink at the link rate)
+    # allows benchmarks without the links.
+    def __init__(self, core, data_width, fifo_depth=1024, clock_domain="jesd"):
+        dw = core.settings.data_width
+        assert (data_width % dw == 0) or (dw % data_width == 0)
+        self.source = source = stream.Endpoint([("data", data_width)]) # RX samples.
+        self.sink   = sink   = stream.Endpoint([("data", data_width)]) # TX samples.
+
+        self.control = CSRStorage(fields=[
+            CSRField("rx_enable", size=1, offset=0, description="RX Streaming enable."),
+            CSRField("tx_enable", size=1, offset=1, description="TX Streaming enable."),
+            CSRField("pattern",   size=1, offset=8, values=[
+                ("``0b0``", "Samples from/to the JESD204B links."),
+                ("``0b1``", "Internal RX counter pattern / TX sink at the links rate."),
+            ], description="Streaming source/sink (the pattern allows DMA benchmarks without the links)."),
+        ])
+        self.rx_overruns  = CSRStatus(32, description="RX overruns (dropped words) count.")
+        self.tx_underruns = CSRStatus(32, description="TX underruns (missing words) count.")
+
+        # # #
+
+        sync = getattr(self.sync, clock_domain)
+
+        rx_enable = Signal()
+        tx_enable = Signal()
+        pattern   = Signal()
+        self.specials += [
+            MultiReg(self.control.fields.rx_enable, rx_enable, clock_domain),
+            MultiReg(self.control.fields.tx_enable, tx_enable, clock_domain),
+            MultiReg(self.control.fields.pattern,   pattern,   clock_domain),
+        ]
+
+        # RX: Core/Pattern -> CDC -> Converter -> FIFO -> Source.
+        pattern_count = Signal(16)
+        sync += If(~rx_enable,
+            pattern_count.eq(0)
+        ).Else(
+            pattern_count.eq(pattern_count + core.settings.nsamples)
+        )
+        self.rx_cdc       = rx_cdc       = stream.ClockDomainCrossing([("data", dw)], cd_from=clock_domain, cd_to="sys", depth=16)
+        self.rx_converter = rx_converter = ResetInserter()(stream.Converter(dw, data_width))
+        self.rx_fifo      = rx_fifo      = ResetInserter()(stream.SyncFIFO([("data", data_width)], fifo_depth, buffered=True))
+        self.comb += [
+            If(pattern,
+                rx_cdc.sink.valid.eq(rx_enable),
+                rx_cdc.sink.data.eq(Cat(*[(pattern_count + n)[:16] for n in range(core.settings.nsamples)])),
+            ).Else(
+                rx_cdc.sink.valid.eq(rx_enable & core.rx_ready),
+                rx_cdc.sink.data.eq(core.rx_data),
+            ),
+            rx_converter.reset.eq(~self.control.fields.rx_enable),
+            rx_fifo.reset.eq(~self.control.fields.rx_enable),
+            rx_cdc.source.connect(rx_converter.sink),
+            rx_converter.source.connect(rx_fifo.sink, omit={"ready"}),
+            rx_converter.source.ready.eq(1),
+            rx_fifo.source.connect(source),
+        ]
+        self.sync += If(~self.control.fields.rx_enable,
+            self.rx_overruns.status.eq(0)
+        ).Elif(rx_converter.source.valid & ~rx_fifo.sink.ready,
+            self.rx_overruns.status.eq(self.rx_overruns.status + 1)
+        )
+
+        # TX: Sink -> FIFO -> Converter -> CDC -> Core/Pattern.
+        self.tx_fifo      = tx_fifo      = ResetInserter()(stream.SyncFIFO([("data", data_width)], fifo_depth, buffered=True))
+        self.tx_converter = tx_converter = ResetInserter()(stream.Converter(data_width, dw))
+        self.tx_cdc       = tx_cdc       = stream.ClockDomainCrossing([("data", dw)], cd_from="sys", cd_to=clock_domain, depth=16)
+        self.comb += [
+            tx_fifo.reset.eq(~self.control.fields.tx_enable),
+            tx_converter.reset.eq(~self.control.fields.tx_enable),
+            sink.connect(tx_fifo.sink),
+            tx_fifo.source.connect(tx_converter.sink),
+            tx_converter.source.connect(tx_cdc.sink),
+        ]
+        tx_consume   = Signal()
+        tx_started   = Signal()
+        tx_underruns = Signal(32)
+        self.comb += [
+            tx_consume.eq(tx_enable & (pattern | core.tx_ready)),
+            tx_cdc.source.ready.eq(tx_consume | ~tx_enable),
+            If(tx_enable & tx_cdc.source.valid,
+                core.tx_data.eq(tx_cdc.source.data)
+            ),
+        ]
+        sync += [
+            If(~tx_enable,
+                tx_started.eq(0),
+                tx_underruns.eq(0),
+            ).Elif(tx_consume,
+                If(tx_cdc.source.valid,
+                    tx_started.eq(1)
+                ).Elif(tx_started,
+                    tx_underruns.eq(tx_underruns + 1)
+                )
+            )
+        ]
+        self.tx_underruns_sync = tx_underruns_sync = BusSynchronizer(32, clock_domain, "sys")
+        self.comb += [
+            tx_underruns_sync.i.eq(tx_underruns),
+            self.tx_underruns.status.eq(tx_underruns_sync.o),
+        ]
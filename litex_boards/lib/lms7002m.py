@@ -0,0 +1,400 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LimeMicro LMS7002M RF transceiver: Control/SPI, LML (LimeLight) RX/TX interfaces and timestamped
+# sample streaming (ex to/from PCIe DMAs).
+#
+# The LML ports are used in MIMO DDR mode (IQSEL high: channel A, low: channel B, I on rising edge,
+# Q on falling edge), Port 1 for RX (LMS -> FPGA) and Port 2 for TX (FPGA -> LMS).
+#
+# Sample format (64-bit words, 12-bit I/Q sign-extended to 16-bit):
+# [15:0] AI, [31:16] AQ, [47:32] BI, [63:48] BQ.
+#
+# Packet format (64-bit words, packet_words words per packet: one packet per DMA buffer):
+# - Word 0     : Header: [63:32] Sync (0x5aa55aa5), [31:0] RX overruns count (RX) / unused (TX).
+# - Word 1     : Timestamp (in RX samples): RX: First sample of the packet, TX: Transmission time
+#                of the first sample of the packet (0: immediate).
+# - Words 2..N : Samples.
+
+from migen import *
+from migen.genlib.cdc import BusSynchronizer
+from migen.genlib.resetsync import AsyncResetSynchronizer
+
+from litex.gen import *
+
+from litex.build.io import DDRInput, DDROutput
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.cores.spi import SPIMaster
+
+# Helpers ------------------------------------------------------------------------------------------
+
+LMS7002M_SYNC = 0x5aa55aa5
+
+def sign_extend(value, width=16):
+    return Cat(value, Replicate(value[-1], width - len(value)))
+
+# LMS7002M Control ---------------------------------------------------------------------------------
+
+class LMS7002MControl(LiteXModule):
+    def __init__(self, pads, sys_clk_freq, spi_clk_freq=10e6, spi_pads=None):
+        self.control = CSRStorage(fields=[
+            CSRField("rst_n",    size=1, offset=0, reset=1, description="LMS7002M reset (active low)."),
+            CSRField("pwrdwn_n", size=1, offset=1, reset=1, description="LMS7002M power-down (active low)."),
+            CSRField("rxen",     size=1, offset=2, reset=1, description="LMS7002M RX enable."),
+            CSRField("txen",     size=1, offset=3, reset=1, description="LMS7002M TX enable."),
+            CSRField("txnrx1",   size=1, offset=4, reset=0, description="LML Port 1 direction (0: RX)."),
+            CSRField("txnrx2",   size=1, offset=5, reset=1, description="LML Port 2 direction (1: TX)."),
+        ])
+
+        # # #
+
+        # Control (pins not available on all boards).
+        for name in ["rst_n", "pwrdwn_n", "rxen", "txen", "txnrx1", "txnrx2"]:
+            if hasattr(pads, name):
+                self.comb += getattr(pads, name).eq(getattr(self.control.fields, name))
+
+        # SPI (32-bit transactions: 1-bit Write/Read, 15-bit Address, 16-bit Data), from the LMS7002M
+        # pads or from separate (ex shared) SPI pads.
+        spi_pads = pads if spi_pads is None else spi_pads
+        if hasattr(spi_pads, "cs_n"):
+            self.spi = SPIMaster(spi_pads, data_width=32, sys_clk_freq=sys_clk_freq, spi_clk_freq=spi_clk_freq)
+
+# LMS7002M LML RX ----------------------------------------------------------------------------------
+
+class LMS7002MRX(LiteXModule):
+    def __init__(self, pads):
+        self.source = source = stream.Endpoint([("data", 64)])
+        self.rst    = Signal()
+
+        # # #
+
+        # Clocking (LMS's MCLK1, forwarded back on FCLK1).
+        self.cd_lms_rx = ClockDomain()
+        self.comb += self.cd_lms_rx.clk.eq(pads.mclk1)
+        self.specials += AsyncResetSynchronizer(self.cd_lms_rx, self.rst)
+        self.specials += DDROutput(1, 0, pads.fclk1, ClockSignal("lms_rx"))
+
+        # DDR Inputs.
+        i     = Signal(12)
+        q     = Signal(12)
+        iqsel = Signal()
+        for n in range(12):
+            self.specials += DDRInput(pads.diq1[n], i[n], q[n], ClockSignal("lms_rx"))
+        self.specials += DDRInput(pads.iqsel1, iqsel, Signal(), ClockSignal("lms_rx"))
+
+        # A/B Demux.
+        a = Signal(32)
+        self.sync.lms_rx += [
+            source.valid.eq(0),
+            If(iqsel,
+                a.eq(Cat(sign_extend(i), sign_extend(q)))
+            ).Else(
+                source.valid.eq(1),
+                source.data.eq(Cat(a, sign_extend(i), sign_extend(q)))
+            )
+        ]
+
+# LMS7002M LML TX ----------------------------------------------------------------------------------
+
+class LMS7002MTX(LiteXModule):
+    def __init__(self, pads):
+        self.sink      = sink = stream.Endpoint([("data", 64)])
+        self.rst       = Signal()
+        self.underruns = Signal(32) # In lms_tx clock domain.
+
+        # # #
+
+        # Clocking (LMS's MCLK2, forwarded back on FCLK2).
+        self.cd_lms_tx = ClockDomain()
+        self.comb += self.cd_lms_tx.clk.eq(pads.mclk2)
+        self.specials += AsyncResetSynchronizer(self.cd_lms_tx, self.rst)
+        self.specials += DDROutput(1, 0, pads.fclk2, ClockSignal("lms_tx"))
+
+        # A/B Mux (Underrun when no sample is available once started).
+        i       = Signal(12)
+        q       = Signal(12)
+        iqsel   = Signal()
+        phase   = Signal()
+        b       = Signal(24)
+        started = Signal()
+        self.comb += sink.ready.eq(~phase)
+        self.sync.lms_tx += [
+            phase.eq(~phase),
+            iqsel.eq(~phase),
+            If(~phase,
+                If(sink.valid,
+                    started.eq(1),
+                    i.eq(sink.data[ 0:12]),
+                    q.eq(sink.data[16:28]),
+                    b.eq(Cat(sink.data[32:44], sink.data[48:60])),
+                ).Else(
+                    i.eq(0),
+                    q.eq(0),
+                    b.eq(0),
+                    If(started,
+                        self.underruns.eq(self.underruns + 1)
+                    )
+                )
+            ).Else(
+                i.eq(b[:12]),
+                q.eq(b[12:]),
+            )
+        ]
+
+        # DDR Outputs.
+        for n in range(12):
+            self.specials += DDROutput(i[n], q[n], pads.diq2[n], ClockSignal("lms_tx"))
+        self.specials += DDROutput(iqsel, iqsel, pads.iqsel2, ClockSignal("lms_tx"))
+
+# LMS7002M RX Packetizer ---------------------------------------------------------------------------
+
+class LMS7002MRXPacketizer(LiteXModule):
+    # Insert the header/timestamp every packet_words words. Samples are never backpressured: they
+    # are buffered while the header/timestamp are inserted and dropped (and counted as drops) when
+    # the buffer is full; packets are dropped (and counted as overruns) when the FIFO does not have
+    # room for a full packet. The timestamp counts all the samples (including the dropped ones).
+    def __init__(self, fifo_depth=8192, packet_words=1024, buffer_depth=16):
+        assert fifo_depth >= 2*packet_words
+        self.sink      = sink   = stream.Endpoint([("data", 64)])
+        self.source    = source = stream.Endpoint([("data", 64)])
+        self.timestamp = Signal(64)
+        self.overruns  = Signal(32)
+        self.drops     = Signal(32)
+
+        # # #
+
+        # Input Buffer.
+        self.buffer = buffer = stream.SyncFIFO([("data", 64)], buffer_depth)
+        samples = buffer.source
+        drop    = Signal()
+        self.comb += [
+            buffer.sink.valid.eq(sink.valid),
+            buffer.sink.data.eq(sink.data),
+            sink.ready.eq(1),
+            drop.eq(sink.valid & ~buffer.sink.ready),
+        ]
+        self.sync += [
+            If(drop, self.drops.eq(self.drops + 1)),
+            self.timestamp.eq(self.timestamp + (samples.valid & samples.ready) + drop),
+        ]
+
+        self.fifo = fifo = stream.SyncFIFO([("data", 64)], fifo_depth, buffered=True)
+        self.comb += fifo.source.connect(source)
+
+        count = Signal(max=packet_words)
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            NextValue(count, 0),
+            If(samples.valid,
+                If(fifo.level <= (fifo_depth - packet_words),
+                    NextState("HEADER")
+                ).Else(
+                    NextValue(self.overruns, self.overruns + 1),
+                    NextState("DROP")
+                )
+            )
+        )
+        fsm.act("HEADER",
+            fifo.sink.valid.eq(1),
+            fifo.sink.data.eq(Cat(self.overruns, Constant(LMS7002M_SYNC, 32))),
+            If(fifo.sink.ready,
+                NextState("TIMESTAMP")
+            )
+        )
+        fsm.act("TIMESTAMP",
+            fifo.sink.valid.eq(1),
+            fifo.sink.data.eq(self.timestamp),
+            If(fifo.sink.ready,
+                NextState("DATA")
+            )
+        )
+        fsm.act("DATA",
+            samples.connect(fifo.sink, omit={"last"}),
+            fifo.sink.last.eq(count == (packet_words - 3)),
+            If(samples.valid & samples.ready,
+                NextValue(count, count + 1),
+                If(fifo.sink.last,
+                    NextState("IDLE")
+                )
+            )
+        )
+        fsm.act("DROP",
+            samples.ready.eq(1),
+            If(samples.valid,
+                NextValue(count, count + 1),
+                If(count == (packet_words - 3),
+                    NextState("IDLE")
+                )
+            )
+        )
+
+# LMS7002M TX Depacketizer -------------------------------------------------------------------------
+
+class LMS7002MTXDepacketizer(LiteXModule):
+    # Remove the header/timestamp of the packets and release the samples at the packet's timestamp
+    # (compared to the RX timestamp, 0: immediate).
+    def __init__(self, fifo_depth=8192, packet_words=1024):
+        self.sink      = sink   = stream.Endpoint([("data", 64)])
+        self.source    = source = stream.Endpoint([("data", 64)])
+        self.timestamp = Signal(64)
+
+        # # #
+
+        self.fifo = fifo = stream.SyncFIFO([("data", 64)], fifo_depth, buffered=True)
+        self.comb += sink.connect(fifo.sink)
+
+        count     = Signal(max=packet_words)
+        timestamp = Signal(64)
+
+        self.fsm = fsm = FSM(reset_state="HEADER")
+        fsm.act("HEADER",
+            fifo.source.ready.eq(1),
+            NextValue(count, 0),
+            # Skip words until a valid header is found.
+            If(fifo.source.valid & (fifo.source.data[32:] == LMS7002M_SYNC),
+                NextState("TIMESTAMP")
+            )
+        )
+        fsm.act("TIMESTAMP",
+            fifo.source.ready.eq(1),
+            If(fifo.source.valid,
+                NextValue(timestamp, fifo.source.data),
+                NextState("WAIT")
+            )
+        )
+        fsm.act("WAIT",
+            If((timestamp == 0) | (self.timestamp >= timestamp),
+                NextState("DATA")
+            )
+        )
+        fsm.act("DATA",
+            fifo.source.connect(source, omit={"last"}),
+            source.last.eq(count == (packet_words - 3)),
+            If(source.valid & source.ready,
+                NextValue(count, count + 1),
+                If(source.last,
+                    NextState("HEADER")
+                )
+            )
+        )
+
+# LMS7002M -----------------------------------------------------------------------------------------
+
+class LMS7002M(LiteXModule):
+    def __init__(self, pads, sys_clk_freq, fifo_depth=8192, packet_words=1024, spi_pads=None):
+        self.source = source = stream.Endpoint([("data", 64)]) # RX Packets (ex to PCIe DMA Writer).
+        self.sink   = sink   = stream.Endpoint([("data", 64)]) # TX Packets (ex from PCIe DMA Reader).
+
+        # FIFOs urgency (ex for adaptive scheduling of a half-duplex link).
+        self.rx_urgent = Signal() # RX FIFO 3/4 full.
+        self.tx_urgent = Signal() # TX FIFO less than 1/4 full.
+
+        self.stream = CSRStorage(fields=[
+            CSRField("rx_enable", size=1, offset=0, description="RX Streaming enable."),
+            CSRField("tx_enable", size=1, offset=1, description="TX Streaming enable."),
+            CSRField("pattern",   size=1, offset=8, values=[
+                ("``0b0``", "Samples from/to the LMS7002M."),
+                ("``0b1``", "Internal RX counter pattern / TX sink at ``pattern_rate``."),
+            ], description="Streaming source/sink (the pattern allows DMA benchmarks without RF)."),
+        ])
+        self.pattern_rate = CSRStorage(32, description="Pattern sample rate: sys_clk_freq*value/2^32.")
+        self.timestamp    = CSRStatus(64, description="Current RX timestamp (in samples).")
+        self.rx_overruns  = CSRStatus(32, description="RX overruns (dropped packets) count.")
+        self.rx_drops     = CSRStatus(32, description="RX dropped samples (packetizer input buffer full) count.")
+        self.tx_underruns = CSRStatus(32, description="TX underruns (missing samples) count.")
+
+        # # #
+
+        rx_enable = self.stream.fields.rx_enable
+        tx_enable = self.stream.fields.tx_enable
+        pattern   = self.stream.fields.pattern
+
+        # Control/SPI.
+        self.ctrl = LMS7002MControl(pads, sys_clk_freq, spi_pads=spi_pads)
+
+        # LML PHYs.
+        self.rx_phy = rx_phy = LMS7002MRX(pads)
+        self.tx_phy = tx_phy = LMS7002MTX(pads)
+        self.comb += rx_phy.rst.eq(~self.ctrl.control.fields.rst_n)
+        self.comb += tx_phy.rst.eq(~self.ctrl.control.fields.rst_n)
+
+        # Clock Domain Crossings.
+        self.rx_cdc = rx_cdc = stream.ClockDomainCrossing([("data", 64)], cd_from="lms_rx", cd_to="sys", depth=16)
+        self.tx_cdc = tx_cdc = stream.ClockDomainCrossing([("data", 64)], cd_from="sys", cd_to="lms_tx", depth=16)
+        self.comb += rx_phy.source.connect(rx_cdc.sink)
+        self.comb += tx_cdc.source.connect(tx_phy.sink)
+
+        # Pattern (sample strobe from phase accumulator).
+        pattern_phase  = Signal(32)
+        pattern_strobe = Signal()
+        pattern_count  = Signal(64)
+        self.sync += [
+            Cat(pattern_phase, pattern_strobe).eq(pattern_phase + self.pattern_rate.storage),
+            If(~rx_enable,
+                pattern_count.eq(0)
+            ).Elif(pattern_strobe,
+                pattern_count.eq(pattern_count + 1)
+            )
+        ]
+
+        # RX: LMS/Pattern -> Packetizer -> FIFO -> Source.
+        self.rx_packetizer = rx_packetizer = ResetInserter()(LMS7002MRXPacketizer(fifo_depth, packet_words))
+        self.comb += [
+            rx_packetizer.reset.eq(~rx_enable),
+            rx_cdc.source.ready.eq(rx_packetizer.sink.ready),
+            If(pattern,
+                rx_packetizer.sink.valid.eq(pattern_strobe),
+                rx_packetizer.sink.data.eq(pattern_count),
+            ).Else(
+                rx_packetizer.sink.valid.eq(rx_cdc.source.valid),
+                rx_packetizer.sink.data.eq(rx_cdc.source.data),
+            ),
+            rx_packetizer.source.connect(source),
+        ]
+
+        # TX: Sink -> FIFO -> Depacketizer -> LMS/Pattern.
+        self.tx_depacketizer = tx_depacketizer = ResetInserter()(LMS7002MTXDepacketizer(fifo_depth, packet_words))
+        tx_pattern_underruns = Signal(32)
+        tx_pattern_started   = Signal()
+        self.comb += [
+            tx_depacketizer.reset.eq(~tx_enable),
+            tx_depacketizer.timestamp.eq(rx_packetizer.timestamp),
+            sink.connect(tx_depacketizer.sink),
+            If(pattern,
+                tx_depacketizer.source.ready.eq(pattern_strobe),
+            ).Else(
+                tx_depacketizer.source.connect(tx_cdc.sink),
+            )
+        ]
+        self.sync += [
+            If(~tx_enable,
+                tx_pattern_started.eq(0)
+            ).Elif(pattern_strobe,
+                If(tx_depacketizer.source.valid,
+                    tx_pattern_started.eq(1)
+                ).Elif(tx_pattern_started,
+                    tx_pattern_underruns.eq(tx_pattern_underruns + 1)
+                )
+            )
+        ]
+
+        # Urgency.
+        self.comb += [
+            self.rx_urgent.eq(rx_enable & (rx_packetizer.fifo.level   >= (3*fifo_depth//4))),
+            self.tx_urgent.eq(tx_enable & (tx_depacketizer.fifo.level <  (1*fifo_depth//4))),
+        ]
+
+        # Status.
+        self.tx_underruns_sync = tx_underruns_sync = BusSynchronizer(32, "lms_tx", "sys")
+        self.comb += tx_underruns_sync.i.eq(tx_phy.underruns)
+        self.comb += [
+            self.timestamp.status.eq(rx_packetizer.timestamp),
+            self.rx_overruns.status.eq(rx_packetizer.overruns),
+            self.rx_drops.status.eq(rx_packetizer.drops),
+            self.tx_underruns.status.eq(Mux(pattern, tx_pattern_underruns, tx_underruns_sync.o)),
+        ]
@@ -0,0 +1,416 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# MIPI CSI-2 camera receiver (over a D-PHY RX byte interface) and frame capture to a Wishbone memory
+# (ex HyperRAM) ring buffer with burst writes.
+#
+# - D-PHY: HS bytes of each lane (Gear 8) in the byte clock domain, from the vendor D-PHY RX (ex
+#   Lattice's CrossLink-NX D-PHY Receiver IP with word aligner disabled).
+# - Lanes: The SoT sync byte (0xb8) is searched on each lane, lanes are then deskewed through small
+#   FIFOs and merged to 32-bit words (lane 0 byte first). The end of the HS burst (EoT) is detected
+#   when all lanes are back to LP.
+# - Packets: One packet per HS burst: Frame Start/End short packets and long packets of the selected
+#   data type (payload of word count bytes, multiple of 4, CRC ignored), header ECC is checked.
+
+from functools import reduce
+from operator import and_, or_, xor
+
+from migen import *
+from migen.genlib.cdc import MultiReg, BusSynchronizer
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.cores.dma import WishboneDMAWriter
+
+# Constants ----------------------------------------------------------------------------------------
+
+CSI2_SYNC_BYTE = 0xb8
+
+CSI2_DT_FRAME_START = 0x00
+CSI2_DT_FRAME_END   = 0x01
+CSI2_DT_RAW8        = 0x2a
+CSI2_DT_RAW10       = 0x2b
+
+# Header ECC parity bits (data bits of the 24-bit header: DI, WC LSB, WC MSB).
+CSI2_ECC_BITS = [
+    [0, 1, 2, 4, 5, 7, 10, 11, 13, 16, 20, 21, 22, 23],
+    [0, 1, 3, 4, 6, 8, 10, 12, 14, 17, 20, 21, 22, 23],
+    [0, 2, 3, 5, 6, 9, 11, 12, 15, 18, 20, 21, 22],
+    [1, 2, 3, 7, 8, 9, 13, 14, 15, 19, 20, 21, 23],
+    [4, 5, 6, 7, 8, 9, 16, 17, 18, 19, 20, 22, 23],
+    [10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23],
+]
+
+def csi2_ecc(header):
+    ecc = 0
+    for n, bits in enumerate(CSI2_ECC_BITS):
+        ecc |= (sum((header >> b) & 0b1 for b in bits) % 2) << n
+    return ecc
+
+def csi2_packet_header(dt, wc, vc=0):
+    header = (vc << 6) | dt | (wc << 8)
+    return header | (csi2_ecc(header) << 24)
+
+# Lane Merger --------------------------------------------------------------------------------------
+
+class CSI2LaneMerger(LiteXModule):
+    def __init__(self, nlanes=4, fifo_depth=8):
+        assert nlanes in [1, 2, 4]
+        self.data   = [Signal(8) for _ in range(nlanes)] # HS bytes.
+        self.valid  = [Signal()  for _ in range(nlanes)] # HS active.
+        self.source = source = stream.Endpoint([("data", 32)]) # No backpressure.
+        self.eot    = Signal() # End of HS burst.
+
+        # # #
+
+        active  = Signal() # HS burst ongoing (sync byte received on a lane).
+        restart = Signal()
+
+        # Lanes Sync/Deskew.
+        fifos = []
+        for n in range(nlanes):
+            synced = Signal()
+            fifo   = ResetInserter()(stream.SyncFIFO([("data", 8)], fifo_depth))
+            self.add_module(name=f"fifo{n}", module=fifo)
+            self.comb += [
+                fifo.reset.eq(restart),
+                fifo.sink.valid.eq(self.valid[n] & synced),
+                fifo.sink.data.eq(self.data[n]),
+            ]
+            self.sync += If(~self.valid[n] | restart,
+                synced.eq(0)
+            ).Elif(self.data[n] == CSI2_SYNC_BYTE,
+                synced.eq(1)
+            )
+            self.sync += If(restart,
+                active.eq(0)
+            ).Elif(self.valid[n] & ~synced & (self.data[n] == CSI2_SYNC_BYTE),
+                active.eq(1)
+            )
+            fifos.append(fifo)
+
+        # Lanes Merge.
+        available = Signal()
+        self.comb += available.eq(reduce(and_, [fifo.source.valid for fifo in fifos]))
+        for fifo in fifos:
+            self.comb += fifo.source.ready.eq(available)
+        lanes_data = Cat(*[fifo.source.data for fifo in fifos])
+        if nlanes == 4:
+            self.comb += [
+                source.valid.eq(available),
+                source.data.eq(lanes_data),
+            ]
+        else:
+            count = Signal(max=4//nlanes)
+            data  = Signal(32 - 8*nlanes)
+            self.sync += [
+                If(restart,
+                    count.eq(0)
+                ).Elif(available,
+                    count.eq(count + 1),
+                    data.eq(Cat(data[8*nlanes:], lanes_data)),
+                )
+            ]
+            self.comb += [
+                source.valid.eq(available & (count == (4//nlanes - 1))),
+                source.data.eq(Cat(data, lanes_data)),
+            ]
+
+        # End of HS burst (all lanes back to LP, remaining bytes are trail bytes).
+        self.comb += [
+            restart.eq(active & ~reduce(or_, self.valid) & ~available),
+            self.eot.eq(restart),
+        ]
+
+# Depacketizer -------------------------------------------------------------------------------------
+
+class CSI2Depacketizer(LiteXModule):
+    def __init__(self):
+        self.sink      = sink   = stream.Endpoint([("data", 32)]) # No backpressure.
+        self.eot       = Signal()
+        self.data_type = Signal(6, reset=CSI2_DT_RAW10)
+        self.source    = source = stream.Endpoint([("data", 32)]) # Frame payload, first on frame start.
+
+        # Events/Measurements.
+        self.frame_start = Signal()
+        self.frame_end   = Signal()
+        self.ecc_error   = Signal()
+        self.line_error  = Signal()   # Long packet shorter than its word count.
+        self.h_active    = Signal(16) # Words per line (last line).
+        self.v_active    = Signal(16) # Lines per frame (last frame).
+
+        # # #
+
+        header = sink.data
+        dt     = header[0:6]
+        wc     = header[8:24]
+        ecc    = header[24:32]
+        ecc_ok = Signal()
+        self.comb += ecc_ok.eq(Cat(*[reduce(xor, [header[b] for b in bits]) for bits in CSI2_ECC_BITS]) == ecc[:6])
+
+        count = Signal(16)
+        first = Signal()
+        lines = Signal(16)
+        self.fsm = fsm = FSM(reset_state="HEADER")
+        fsm.act("HEADER",
+            If(sink.valid,
+                If(~ecc_ok,
+                    self.ecc_error.eq(1),
+                    NextState("SKIP")
+                ).Elif(dt == CSI2_DT_FRAME_START,
+                    self.frame_start.eq(1),
+                    NextValue(first, 1),
+                    NextValue(lines, 0),
+                    NextState("SKIP")
+                ).Elif(dt == CSI2_DT_FRAME_END,
+                    self.frame_end.eq(1),
+                    NextValue(self.v_active, lines),
+                    NextState("SKIP")
+                ).Elif((dt == self.data_type) & (wc[2:] != 0),
+                    NextValue(count, wc[2:]),
+                    NextValue(self.h_active, wc[2:]),
+                    NextValue(lines, lines + 1),
+                    NextState("PAYLOAD")
+                ).Else(
+                    NextState("SKIP")
+                )
+            )
+        )
+        fsm.act("PAYLOAD",
+            source.valid.eq(sink.valid),
+            source.first.eq(first),
+            source.last.eq(count == 1),
+            source.data.eq(sink.data),
+            If(sink.valid,
+                NextValue(first, 0),
+                NextValue(count, count - 1),
+                If(count == 1,
+                    NextState("SKIP")
+                )
+            ),
+            If(self.eot,
+                self.line_error.eq(1),
+                NextState("HEADER")
+            )
+        )
+        fsm.act("SKIP",
+            If(self.eot,
+                NextState("HEADER")
+            )
+        )
+
+# CSI-2 Receiver -----------------------------------------------------------------------------------
+
+class CSI2Receiver(LiteXModule):
+    # D-PHY bytes (in clock_domain) -> Lane Merger -> Depacketizer -> CDC -> Frame stream (in sys).
+    def __init__(self, nlanes=4, clock_domain="sys", cdc_depth=64):
+        self.data   = [Signal(8) for _ in range(nlanes)]
+        self.valid  = [Signal()  for _ in range(nlanes)]
+        self.source = source = stream.Endpoint([("data", 32)]) # No backpressure.
+
+        self.control = CSRStorage(fields=[
+            CSRField("data_type", size=6, offset=0, reset=CSI2_DT_RAW10, description="Captured data type (ex 0x2a: RAW8, 0x2b: RAW10)."),
+        ])
+        self.resolution = CSRStatus(fields=[
+            CSRField("h_active", size=16, offset=0,  description="Measured 32-bit words per line."),
+            CSRField("v_active", size=16, offset=16, description="Measured lines per frame."),
+        ])
+        self.ecc_errors  = CSRStatus(32, description="Packet headers ECC errors count.")
+        self.line_errors = CSRStatus(32, description="Truncated long packets count.")
+        self.overflows   = CSRStatus(32, description="Words lost in the Clock Domain Crossing count.")
+
+        # # #
+
+        sync = getattr(self.sync, clock_domain)
+
+        # Lanes/Packets.
+        self.merger       = merger       = ClockDomainsRenamer(clock_domain)(CSI2LaneMerger(nlanes))
+        self.depacketizer = depacketizer = ClockDomainsRenamer(clock_domain)(CSI2Depacketizer())
+        for n in range(nlanes):
+            self.comb += [
+                merger.data[n].eq(self.data[n]),
+                merger.valid[n].eq(self.valid[n]),
+            ]
+        self.comb += [
+            merger.source.connect(depacketizer.sink),
+            depacketizer.eot.eq(merger.eot),
+        ]
+        self.specials += MultiReg(self.control.fields.data_type, depacketizer.data_type, clock_domain)
+
+        # Clock Domain Crossing (no backpressure on video, frames with lost words will be dropped as
+        # short frames by the ring buffer).
+        self.cdc = cdc = stream.ClockDomainCrossing([("data", 32)], cd_from=clock_domain, cd_to="sys", depth=cdc_depth)
+        self.comb += [
+            depacketizer.source.connect(cdc.sink, omit={"ready"}),
+            depacketizer.source.ready.eq(1),
+            cdc.source.connect(source),
+        ]
+
+        # Status/Statistics.
+        self.specials += [
+            MultiReg(depacketizer.h_active, self.resolution.fields.h_active),
+            MultiReg(depacketizer.v_active, self.resolution.fields.v_active),
+        ]
+        counters = [
+            (self.ecc_errors,  depacketizer.ecc_error),
+            (self.line_errors, depacketizer.line_error),
+            (self.overflows,   cdc.sink.valid & ~cdc.sink.ready),
+        ]
+        for csr, event in counters:
+            counter = Signal(32)
+            sync += If(event, counter.eq(counter + 1))
+            counter_sync = BusSynchronizer(32, clock_domain, "sys")
+            self.submodules += counter_sync
+            self.comb += [
+                counter_sync.i.eq(counter),
+                csr.status.eq(counter_sync.o),
+            ]
+
+# Wishbone Frame Ring Buffer -----------------------------------------------------------------------
+
+class WishboneFrameRingBuffer(LiteXModule):
+    # Write the frames of a video stream (first set on the first word of each frame) to a ring buffer
+    # of nslots frames in a Wishbone memory (ex HyperRAM), with incrementing bursts of burst_length
+    # words. The last complete frame is reported for readout and a slot can be locked (not written)
+    # while read. Frames with lost/missing words are dropped.
+    def __init__(self, bus, base, slot_size, nslots=3, burst_length=64, sys_clk_freq=None):
+        assert nslots >= 3
+        assert bus.addressing == "word"
+        self.sink = sink = stream.Endpoint([("data", 32)]) # No backpressure.
+
+        self.frame_size = CSRStorage(32, reset=slot_size, description="Frame size (in bytes).")
+        self.lock       = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, description="Lock a slot (not written while locked)."),
+            CSRField("slot",   size=8, offset=8, description="Locked slot."),
+        ])
+        self.latest = CSRStatus(fields=[
+            CSRField("valid", size=1, offset=0, description="A frame has been captured."),
+            CSRField("slot",  size=8, offset=8, description="Slot of the last captured frame."),
+        ])
+        self.offset     = CSRConstant(base)
+        self.slot_size  = CSRConstant(slot_size)
+        self.frames     = CSRStatus(32, description="Captured frames count.")
+        self.drops      = CSRStatus(32, description="Dropped frames count.")
+        if sys_clk_freq is not None:
+            self.frame_rate = CSRStatus(32, description="Captured frames during the last second.")
+            self.throughput = CSRStatus(32, description="Received bytes during the last second.")
+
+        # # #
+
+        wr_bytes = bus.data_width//8
+
+        # Slots.
+        slot      = Signal(8)
+        slot_next = Signal(8)
+        def slot_incr(s):
+            return Mux(s == (nslots - 1), 0, s + 1)
+        self.comb += [
+            slot_next.eq(slot_incr(slot)),
+            If(self.lock.fields.enable & (slot_next == self.lock.fields.slot),
+                slot_next.eq(slot_incr(slot_incr(slot)))
+            )
+        ]
+
+        # Burst FIFO: Words are released to the DMA by bursts (or at the end of the frame) to keep
+        # the Wishbone cycles back-to-back (detected/notified incrementing bursts on the HyperRAM).
+        self.fifo = fifo = stream.SyncFIFO([("address", bus.adr_width), ("data", bus.data_width)], 2*burst_length)
+        self.dma  = dma  = WishboneDMAWriter(bus, endianness="big") # Bytes already in memory order.
+        burst     = Signal(max=burst_length + 1)
+        flush     = Signal()
+        self.sync += [
+            If(burst == 0,
+                If(fifo.level >= burst_length,
+                    burst.eq(burst_length)
+                ).Elif(flush & (fifo.level != 0),
+                    burst.eq(fifo.level)
+                )
+            ).Elif(fifo.source.valid & fifo.source.ready,
+                burst.eq(burst - 1)
+            )
+        ]
+        self.comb += [
+            If(burst != 0,
+                fifo.source.connect(dma.sink)
+            ),
+            bus.cti.eq(Mux(burst == 1, 0b111, 0b010)),
+            bus.bte.eq(0b00),
+        ]
+
+        # Writer.
+        count   = Signal(32)
+        words   = Signal(32)
+        lost    = Signal()
+        self.comb += words.eq(self.frame_size.storage[log2_int(wr_bytes):])
+        self.comb += [
+            fifo.sink.address.eq(base//wr_bytes + slot*(slot_size//wr_bytes) + count),
+            fifo.sink.data.eq(sink.data),
+        ]
+        frame_done = Signal()
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            sink.ready.eq(1),
+            flush.eq(1),
+            NextValue(count, 0),
+            NextValue(lost,  0),
+            If(sink.valid & sink.first,
+                fifo.sink.valid.eq(1),
+                NextValue(lost, ~fifo.sink.ready),
+                NextValue(count, 1),
+                NextState("WRITE")
+            )
+        )
+        fsm.act("WRITE",
+            If(sink.valid & sink.first,
+                # Short frame: drop it and restart on the new frame (from IDLE).
+                NextValue(self.drops.status, self.drops.status + 1),
+                NextValue(slot, slot_next),
+                NextState("IDLE")
+            ).Elif(sink.valid,
+                sink.ready.eq(1),
+                fifo.sink.valid.eq(1),
+                NextValue(count, count + 1),
+                If(~fifo.sink.ready,
+                    NextValue(lost, 1)
+                ),
+                If(count == (words - 1),
+                    frame_done.eq(1),
+                    NextState("IDLE")
+                )
+            )
+        )
+        self.sync += If(frame_done,
+            slot.eq(slot_next),
+            If(lost | ~fifo.sink.ready,
+                self.drops.status.eq(self.drops.status + 1)
+            ).Else(
+                self.frames.status.eq(self.frames.status + 1),
+                self.latest.fields.valid.eq(1),
+                self.latest.fields.slot.eq(slot),
+            )
+        )
+
+        # Frame rate/Throughput (over 1s windows).
+        if sys_clk_freq is not None:
+            timer       = Signal(max=int(sys_clk_freq))
+            frames      = Signal(32)
+            throughput  = Signal(32)
+            frame_count = Signal()
+            self.comb += frame_count.eq(frame_done & ~lost & fifo.sink.ready)
+            self.sync += [
+                timer.eq(timer + 1),
+                frames.eq(frames + frame_count),
+                If(sink.valid,
+                    throughput.eq(throughput + wr_bytes)
+                ),
+                If(timer == (int(sys_clk_freq) - 1),
+                    timer.eq(0),
+                    self.frame_rate.status.eq(frames + frame_count),
+                    self.throughput.status.eq(throughput + Mux(sink.valid, wr_bytes, 0)),
+                    frames.eq(0),
+                    throughput.eq(0),
+                )
+            ]
@@ -0,0 +1,102 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Yosys/NextPNR Reports.
+#
+# Parsing of the Yosys/NextPNR (ice40/ecp5/nexus/himbaechel) logs of builds done with the open-source
+# toolchains (yosys+nextpnr), ex from the output of a target build.
+
+import re
+import shutil
+import subprocess
+
+# Timing -------------------------------------------------------------------------------------------
+
+def parse_nextpnr_fmax(log):
+    # Returns {clock: (fmax, constraint, passed)} from the last (post-route) timing report.
+    fmax = {}
+    for m in re.finditer(r"Max frequency for clock\s+'([^']+)':\s+([0-9.]+) MHz \((PASS|FAIL) at ([0-9.]+) MHz\)", log):
+        fmax[m.group(1)] = (float(m.group(2))*1e6, float(m.group(4))*1e6, m.group(3) == "PASS")
+    return fmax
+
+def get_nextpnr_timing_pass(log):
+    # Timing met on all the constrained clocks (False when no timing report found).
+    fmax = parse_nextpnr_fmax(log)
+    return (len(fmax) > 0) and all(passed for (_, _, passed) in fmax.values())
+
+# Utilization --------------------------------------------------------------------------------------
+
+# Resources categories from NextPNR BEL types (ECP5/iCE40/Nexus/Gowin).
+nextpnr_resources = {
+    "lut"  : r"(TRELLIS_COMB|ICESTORM_LC|OXIDE_COMB|^LUT[1-6]?$|SLICE)",
+    "ff"   : r"(TRELLIS_FF|OXIDE_FF|^DFF)",
+    "bram" : r"(DP16KD|ICESTORM_RAM|ICESTORM_SPRAM|OXIDE_EBR|LRAM_CORE|BSRAM|^RAM)",
+    "dsp"  : r"(MULT|ICESTORM_DSP|ALU54)",
+}
+
+def parse_nextpnr_utilization(log):
+    # Returns {bel: (used, available)} from the last Device utilisation report.
+    blocks  = []
+    current = None
+    for line in log.splitlines():
+        if "Device utilisation:" in line:
+            current = {}
+            blocks.append(current)
+            continue
+        if current is not None:
+            m = re.match(r"Info:\s+(\S+):\s+(\d+)/\s*(\d+)", line)
+            if m:
+                current[m.group(1)] = (int(m.group(2)), int(m.group(3)))
+            elif line.strip() not in ["Info:", ""]:
+                current = None
+    return blocks[-1] if blocks else {}
+
+def get_nextpnr_resources(utilization):
+    # Returns {lut/ff/bram/dsp: (used, available)} from the BEL utilization.
+    resources = {}
+    for name, regexp in nextpnr_resources.items():
+        used, available = 0, 0
+        for bel, (u, a) in utilization.items():
+            if re.search(regexp, bel):
+                used      += u
+                available += a
+        if available:
+            resources[name] = (used, available)
+    return resources
+
+def parse_yosys_cells(log):
+    # Returns {cell: count} from the last Yosys statistics (old/new stat formats).
+    blocks  = []
+    current = None
+    for line in log.splitlines():
+        if re.match(r"\s+Number of cells:\s+\d+", line) or re.match(r"\s+\d+ cells$", line):
+            current = {}
+            blocks.append(current)
+            continue
+        if current is not None:
+            m_old = re.match(r"\s+(\$?[\w$]+)\s+(\d+)$", line)
+            m_new = re.match(r"\s+(\d+)\s+(\$?[\w$]+)$", line)
+            if m_old:
+                current[m_old.group(1)] = int(m_old.group(2))
+            elif m_new:
+                current[m_new.group(2)] = int(m_new.group(1))
+            else:
+                current = None
+    return blocks[-1] if blocks else {}
+
+def get_yosys_ff_count(cells):
+    # Flip-Flops from the Yosys cells (for architectures where NextPNR packs them with the LUTs).
+    return sum(n for cell, n in cells.items() if re.search(r"(DFF|TRELLIS_FF|FD1P3|FD1S3)", cell))
+
+# Versions -----------------------------------------------------------------------------------------
+
+def get_toolchain_versions():
+    # Versions of the open-source toolchain tools found in the PATH (recorded with the results).
+    versions = {}
+    for tool in ["yosys", "nextpnr-ecp5", "nextpnr-ice40", "nextpnr-nexus", "nextpnr-himbaechel"]:
+        if shutil.which(tool) is not None:
+            r = subprocess.run([tool, "--version"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            versions[tool] = r.stdout.strip().splitlines()[0] if r.stdout.strip() else ""
+    return versions
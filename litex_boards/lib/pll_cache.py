@@ -0,0 +1,114 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# PLL/MMCM Configuration Cache.
+#
+# LiteX's clocking modules (S7PLL/S7MMCM, USPMMCM, ECP5PLL, GW5APLL, ...) search their
+# divider/multiplier configuration at finalization. PLLs wrapped with use_pll_cache() first look
+# up the solved configuration in a persistent table, keyed on the PLL class, its device/speedgrade
+# parameters (frequency/divider ranges, margins) and the requested input/outputs
+# (frequencies/phases/margins), and only run the search on a miss.
+#
+# The table (pll_cache.json, next to this file or from $LITEX_BOARDS_PLL_CACHE) is generated for the
+# default and common frequencies of the targets with bench/pll_cache_precompute.py; configurations
+# solved on a miss are kept in memory for the session (and saved by the precompute tool).
+
+import os
+import json
+import time
+import hashlib
+
+from migen import Signal
+
+from litex.soc.cores.clock.common import compute_config_log
+
+# PLL Key ------------------------------------------------------------------------------------------
+
+def get_pll_key(pll):
+    # Parameters (Class attributes/Instance attributes of simple types, ex ranges/margins/speedgrade).
+    params = {}
+    for k in sorted(dir(pll)):
+        if k.startswith("_") or k in ["clkouts", "config", "logger"]:
+            continue
+        try:
+            v = getattr(pll, k)
+        except Exception:
+            continue
+        if isinstance(v, (bool, int, float, str, tuple, type(None))):
+            params[k] = v
+    # Outputs (without the Signals).
+    clkouts = {n: [v for v in clkout[1:]] for n, clkout in sorted(pll.clkouts.items())}
+    key = repr((type(pll).__name__, params, clkouts))
+    return f"{type(pll).__name__}:{hashlib.sha1(key.encode()).hexdigest()[:16]}"
+
+# PLL Config Cache ---------------------------------------------------------------------------------
+
+class PLLConfigCache:
+    version = 1
+
+    def __init__(self, filename=None):
+        self.filename    = filename
+        self.configs     = {}
+        self.hits        = 0
+        self.misses      = 0
+        self.search_time = 0.0 # Time spent searching configurations on misses (in s).
+        if filename is not None and os.path.exists(filename):
+            with open(filename) as f:
+                content = json.load(f)
+            if content.get("version", None) == self.version:
+                self.configs = content["configs"]
+
+    def get(self, key):
+        config = self.configs.get(key, None)
+        if config is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return config
+
+    def set(self, key, config):
+        self.configs[key] = config
+
+    def save(self, filename=None):
+        filename = self.filename if filename is None else filename
+        with open(filename, "w") as f:
+            json.dump({"version": self.version, "configs": self.configs}, f, indent=1, sort_keys=True)
+            f.write("\n")
+
+_pll_cache = None
+
+def get_pll_cache():
+    global _pll_cache
+    if _pll_cache is None:
+        default = os.path.join(os.path.dirname(__file__), "pll_cache.json")
+        _pll_cache = PLLConfigCache(os.environ.get("LITEX_BOARDS_PLL_CACHE", default))
+    return _pll_cache
+
+# PLL Wrapper --------------------------------------------------------------------------------------
+
+def use_pll_cache(pll, cache=None):
+    # Replace pll.compute_config by a cached version (returns the PLL).
+    compute_config = pll.compute_config
+
+    def cached_compute_config():
+        _cache = get_pll_cache() if cache is None else cache
+        key    = get_pll_key(pll)
+        config = _cache.get(key)
+        if config is None:
+            start  = time.time()
+            config = compute_config()
+            _cache.search_time += time.time() - start
+            _cache.set(key, dict(config))
+        else:
+            config = dict(config)
+            # Feedback output allocated by the search (ex ECP5PLL): Reserve it.
+            clkfb = config.get("clkfb", None)
+            if isinstance(clkfb, int) and clkfb not in pll.clkouts:
+                pll.clkouts[clkfb] = (Signal(), 0, 0, 0, 0)
+            compute_config_log(pll.logger, config)
+        return config
+
+    pll.compute_config = cached_compute_config
+    return pll
@@ -0,0 +1,167 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SDCard High-Speed helpers.
+#
+# Native 4-bit SDCard (LiteSDCard) with DMA statistics and optional High-Speed (SDR25, up to 50MHz)
+# clock: The BIOS/liblitesdcard initializes the card with its own clocks (400KHz, then 25MHz from
+# ACMD41) and switches it to High-Speed with CMD6 at the end of sdcard_init. When enabled, the
+# SDCard clock divider is only raised to the High-Speed one once this CMD6 SDR25 switch has been
+# reported successful by the card (function 1 selected in the switch status). Otherwise the card is
+# kept at the BIOS clock. The SDCard clock can still be changed at runtime from the BIOS
+# (sdcard_freq) and SPI-mode (--with-spi-sdcard) is kept as a fallback.
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+
+from litesdcard.common import SDCARD_CTRL_DATA_TRANSFER_READ
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def get_sdcard_clk_freq(sys_clk_freq, max_freq=50e6):
+    # SDCard clock from SDPHYClocker: sys_clk_freq/divider with divider a power of 2 in [2, 256].
+    divider = 2
+    while (sys_clk_freq/divider > max_freq) and (divider < 256):
+        divider *= 2
+    return sys_clk_freq/divider
+
+# SDCard High-Speed Switch -------------------------------------------------------------------------
+
+# CMD6 argument of the BIOS High-Speed switch: Switch mode, Access Mode (group 1) to SDR25, others kept.
+SD_SWITCH_SDR25_ARG = 0x80fffff1
+
+class SDCardHSSwitch(LiteXModule):
+    def __init__(self, core, clocker, divider):
+        self.status = CSRStatus(fields=[
+            CSRField("hs", size=1, offset=0, description="High-Speed clock applied (CMD6 SDR25 switch successful)."),
+        ])
+
+        # # #
+
+        hs       = Signal()
+        count    = Signal(7)
+        selected = Signal(4)
+        done_d   = Signal()
+
+        cmd_switch = Signal()
+        cmd_reset  = Signal()
+        data_done  = Signal()
+        self.sync += done_d.eq(core.data_event.fields.done)
+        self.comb += [
+            cmd_switch.eq(core.cmd_send.re &
+                (core.cmd_command.fields.cmd == 6) &
+                (core.cmd_command.fields.data_type == SDCARD_CTRL_DATA_TRANSFER_READ) &
+                (core.cmd_argument.storage == SD_SWITCH_SDR25_ARG)),
+            cmd_reset.eq(core.cmd_send.re & (core.cmd_command.fields.cmd == 0)),
+            data_done.eq(core.data_event.fields.done & ~done_d),
+            self.status.fields.hs.eq(hs),
+        ]
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(cmd_switch,
+                NextValue(count,    0),
+                NextValue(selected, 0xf),
+                NextState("SWITCH")
+            ),
+            # GO_IDLE: Card re-initialized, back to the BIOS clocks.
+            If(cmd_reset,
+                NextValue(hs, 0)
+            )
+        )
+        fsm.act("SWITCH",
+            # Snoop the 512-bit switch status (MSB first): Access Mode selected function in bits
+            # 379:376 (byte 16, 4 LSBs), 0xf when the switch failed.
+            If(core.source.valid & core.source.ready,
+                NextValue(count, count + 1),
+                If(count == 16,
+                    NextValue(selected, core.source.data[0:4])
+                )
+            ),
+            If(data_done,
+                If(~core.data_event.fields.error & ~core.data_event.fields.timeout &
+                    (count == 64) & (selected == 1),
+                    NextState("HIGH-SPEED")
+                ).Else(
+                    NextState("IDLE")
+                )
+            ),
+            # Command retried/aborted by the software.
+            If(core.cmd_send.re,
+                NextState("IDLE")
+            )
+        )
+        fsm.act("HIGH-SPEED",
+            NextValue(hs, 1),
+            NextState("IDLE")
+        )
+        self.sync += If(fsm.ongoing("HIGH-SPEED"), clocker.divider.storage.eq(divider))
+
+# SDCard DMA Statistics ----------------------------------------------------------------------------
+
+class SDCardDMAStats(LiteXModule):
+    def __init__(self, read_endpoint=None, write_endpoint=None):
+        self.control = CSRStorage(fields=[
+            CSRField("reset", size=1, offset=0, pulse=True, description="Reset the statistics."),
+        ])
+        self.read_bytes  = CSRStatus(32, description="Bytes read from the SDCard (to Block2Mem DMA).")
+        self.read_time   = CSRStatus(32, description="Cycles between first and last bytes read.")
+        self.write_bytes = CSRStatus(32, description="Bytes written to the SDCard (from Mem2Block DMA).")
+        self.write_time  = CSRStatus(32, description="Cycles between first and last bytes written.")
+
+        # # #
+
+        cycles = Signal(32)
+        self.sync += cycles.eq(cycles + 1)
+
+        for endpoint, nbytes, time in [
+            (read_endpoint,  self.read_bytes.status,  self.read_time.status),
+            (write_endpoint, self.write_bytes.status, self.write_time.status)]:
+            if endpoint is None:
+                continue
+            first = Signal(32)
+            self.sync += [
+                If(endpoint.valid & endpoint.ready,
+                    nbytes.eq(nbytes + len(endpoint.data)//8),
+                    If(nbytes == 0,
+                        first.eq(cycles),
+                        time.eq(0),
+                    ).Else(
+                        time.eq(cycles - first),
+                    )
+                ),
+                If(self.control.fields.reset,
+                    nbytes.eq(0),
+                    time.eq(0),
+                )
+            ]
+
+# SoC Helper ---------------------------------------------------------------------------------------
+
+def add_sdcard_hs(soc, name="sdcard", mode="read+write", hs_clk_freq=None, with_stats=True, **kwargs):
+    # Same than SoC.add_sdcard with optional High-Speed clock (opt-in, hs_clk_freq: max SDCard clock
+    # frequency once switched to SDR25, ex 50e6) and DMA statistics.
+    soc.add_sdcard(name=name, mode=mode, **kwargs)
+    sdcard_phy  = getattr(soc, f"{name}_phy")
+    sdcard_core = getattr(soc, f"{name}_core")
+
+    # High-Speed Switch.
+    if hs_clk_freq is not None:
+        soc.check_if_exists(f"{name}_hs")
+        divider   = int(soc.sys_clk_freq/get_sdcard_clk_freq(soc.sys_clk_freq, hs_clk_freq))
+        sdcard_hs = SDCardHSSwitch(sdcard_core, sdcard_phy.clocker, divider)
+        soc.add_module(name=f"{name}_hs", module=sdcard_hs)
+
+    # Statistics.
+    if with_stats:
+        soc.check_if_exists(f"{name}_stats")
+        sdcard_stats = SDCardDMAStats(
+            read_endpoint  = sdcard_core.source if "read"  in mode else None,
+            write_endpoint = sdcard_core.sink   if "write" in mode else None,
+        )
+        soc.add_module(name=f"{name}_stats", module=sdcard_stats)
@@ -0,0 +1,167 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Board Simulation (Verilator).
+#
+# Cycle simulation of a target's SoC configuration on a Linux host: CPU/Bus/L2/ROM/RAM settings come
+# from the target's arguments and the DRAM module geometry/timings (at the target's sys_clk_freq)
+# from the target itself (BaseSoC.sdram_module and platform DRAM pads), while the PHYs are swapped for simulation models (SDRAMPHYModel,
+# LiteEthPHYModel over a tap interface, UART to the console). Used by the targets' --sim option to
+# benchmark memory throughputs and firmware (ex BIOS mem_speed, firmware preloaded in DRAM with
+# --sim-ram-init) and compare configurations without the hardware.
+#
+# Note: The DRAM model uses the standard DFI rate of the memory type (ex 1:4 for DDR3), which can
+# differ from the hardware PHY (ex 1:2 ECP5DDRPHY) and doesn't model the PHY read/write latencies.
+
+from migen import *
+
+from litex.gen import *
+
+from litex.build.io import CRG
+from litex.build.sim import SimPlatform
+from litex.build.sim.config import SimConfig
+
+from litex.soc.integration.soc_core import SoCCore
+from litex.soc.integration.builder import Builder
+from litex.soc.integration.common import get_mem_data, get_boot_address
+
+# Sim Platform -------------------------------------------------------------------------------------
+
+def get_sim_platform():
+    from litex.tools.litex_sim import _io
+    return SimPlatform("SIM", _io)
+
+# Sim SoC ------------------------------------------------------------------------------------------
+
+class SimBaseSoC(SoCCore):
+    def __init__(self, sys_clk_freq, ident="LiteX SoC",
+        sdram_module     = None,
+        sdram_data_width = None,
+        sdram_init       = [],
+        with_ethernet    = False,
+        with_etherbone   = False,
+        eth_ip           = "192.168.1.50",
+        remote_ip        = "192.168.1.100",
+        **kwargs):
+        from litedram.phy.model import SDRAMPHYModel, sdram_module_nphases
+        from liteeth.phy.model import LiteEthPHYModel
+        from liteeth.common import convert_ip
+
+        platform = get_sim_platform()
+
+        # CRG --------------------------------------------------------------------------------------
+        self.crg = CRG(platform.request("sys_clk"))
+
+        # SoCCore ----------------------------------------------------------------------------------
+        SoCCore.__init__(self, platform, sys_clk_freq, ident=f"{ident} (Simulation)", **kwargs)
+
+        # SDRAM (Model) ----------------------------------------------------------------------------
+        if not self.integrated_main_ram_size and sdram_module is not None:
+            sdram_rate   = f"1:{sdram_module_nphases[sdram_module.memtype]}"
+            sdram_module = sdram_module(sys_clk_freq, sdram_rate)
+            self.sdrphy  = SDRAMPHYModel(
+                module     = sdram_module,
+                data_width = sdram_data_width,
+                clk_freq   = sys_clk_freq,
+                init       = sdram_init,
+            )
+            self.add_sdram("sdram",
+                phy              = self.sdrphy,
+                module           = sdram_module,
+                l2_cache_size    = kwargs.get("l2_size", 8192),
+                l2_cache_reverse = False,
+            )
+            if sdram_init != []:
+                # Skip SDRAM test to preserve the preloaded contents.
+                self.add_constant("SDRAM_TEST_DISABLE")
+            else:
+                # Reduce memtest size for simulation speedup.
+                self.add_constant("MEMTEST_DATA_SIZE", 8*1024)
+                self.add_constant("MEMTEST_ADDR_SIZE", 8*1024)
+
+        # Ethernet / Etherbone (Model) -------------------------------------------------------------
+        if with_ethernet or with_etherbone:
+            self.ethphy = LiteEthPHYModel(platform.request("eth", 0))
+            self.add_constant("HW_PREAMBLE_CRC")
+            if with_etherbone:
+                self.add_etherbone(phy=self.ethphy,
+                    ip_address       = convert_ip(eth_ip) + int(with_ethernet), # +1 when both to avoid conflict.
+                    mac_address      = 0x10e2d5000001,
+                    with_ethmac      = with_ethernet,
+                    ethmac_address   = 0x10e2d5000000,
+                    ethmac_local_ip  = eth_ip,
+                    ethmac_remote_ip = remote_ip,
+                )
+            else:
+                self.add_ethernet(phy=self.ethphy, local_ip=eth_ip, remote_ip=remote_ip)
+
+# Sim SDRAM Configuration --------------------------------------------------------------------------
+
+def get_sim_sdram_args(soc_cls, platform, pads="ddram"):
+    # SDRAM module of the target's BaseSoC (sdram_module, also used for its add_sdram) and data width
+    # of the platform's DRAM pads.
+    return {
+        "sdram_module"     : soc_cls.sdram_module,
+        "sdram_data_width" : len(platform.request(pads).dq),
+    }
+
+# Sim Arguments ------------------------------------------------------------------------------------
+
+def add_sim_args(parser):
+    parser.add_target_argument("--sim",          action="store_true",      help="Simulate the SoC with Verilator (DRAM/Ethernet models).")
+    parser.add_target_argument("--sim-threads",  default=1, type=int,      help="Verilator threads.")
+    parser.add_target_argument("--sim-trace",    action="store_true",      help="Enable Verilator VCD tracing.")
+    parser.add_target_argument("--sim-ram-init", default=None,             help="Preload main RAM with a binary/JSON (and boot from it).")
+
+# Sim Run ------------------------------------------------------------------------------------------
+
+def run_sim(args, parser, sys_clk_freq, **kwargs):
+    # Build/Run the target configuration in simulation.
+    soc_kwargs = dict(parser.soc_argdict)
+    sim_config = SimConfig()
+    sim_config.add_clocker("sys_clk", freq_hz=int(sys_clk_freq))
+
+    # UART.
+    if soc_kwargs.get("uart_name", "serial") == "serial":
+        soc_kwargs["uart_name"] = "sim"
+        sim_config.add_module("serial2console", "serial")
+
+    # Ethernet.
+    if kwargs.get("with_ethernet", False) or kwargs.get("with_etherbone", False):
+        sim_config.add_module("ethernet", "eth", args={"interface": "tap0", "ip": kwargs.get("remote_ip", "192.168.1.100")})
+
+    # RAM Init.
+    boot_address = None
+    if args.sim_ram_init is not None:
+        conf_soc = SimBaseSoC(sys_clk_freq, **kwargs, **soc_kwargs)
+        main_ram = conf_soc.mem_map["main_ram"]
+        ram_init = get_mem_data(args.sim_ram_init,
+            data_width = conf_soc.bus.data_width,
+            endianness = conf_soc.cpu.endianness,
+            offset     = main_ram,
+        )
+        if soc_kwargs.get("integrated_main_ram_size", 0):
+            soc_kwargs["integrated_main_ram_init"] = ram_init
+        else:
+            kwargs["sdram_init"] = ram_init
+        boot_address = get_boot_address(args.sim_ram_init) or main_ram
+
+    # SoC.
+    soc = SimBaseSoC(sys_clk_freq, **kwargs, **soc_kwargs)
+    if boot_address is not None:
+        soc.add_constant("ROM_BOOT_ADDRESS", boot_address)
+
+    # Build/Run.
+    builder_kwargs = dict(parser.builder_argdict)
+    builder_kwargs["output_dir"] = builder_kwargs.get("output_dir") or "build/sim"
+    builder = Builder(soc, **builder_kwargs)
+    builder.build(
+        sim_config = sim_config,
+        run        = builder.compile_gateware,
+        threads    = args.sim_threads,
+        trace      = args.sim_trace,
+        opt_level  = "O3",
+    )
+    return soc
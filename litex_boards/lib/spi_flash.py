@@ -0,0 +1,137 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SPI Flash Execute-In-Place (XIP) Cache.
+#
+# Read cache (in EBR/Block RAMs) in front of the memory-mapped SPI Flash for boards executing their
+# BIOS/firmware from the Flash (ex iCE40UP5K boards with only 128KB of SPRAM). Cache lines are filled
+# with sequential 32-bit accesses that LiteSPIMMAP chains in the same SPI burst (continuous read,
+# command/address/dummy only sent once per line), reducing the SPI overhead of the code fetches.
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+from litex.soc.integration.soc import SoCRegion
+
+# SPI Flash XIP Cache ------------------------------------------------------------------------------
+
+class SPIFlashXIPCache(LiteXModule):
+    def __init__(self, flash_bus, size=4096, line_size=16):
+        assert size      in [2**n for n in range(8, 16)]
+        assert line_size in [4, 8, 16, 32]
+        self.bus = bus = wishbone.Interface(data_width=32, address_width=32, addressing="word")
+
+        self.control = CSRStorage(fields=[
+            CSRField("bypass", size=1, offset=0, description="Bypass the Cache (direct SPI Flash accesses)."),
+            CSRField("reset",  size=1, offset=1, pulse=True, description="Reset the statistics."),
+        ])
+        self.accesses    = CSRStatus(32, description="Bus read accesses.")
+        self.misses      = CSRStatus(32, description="SPI Flash accesses (Line fills or bypassed reads).")
+        self.wait_cycles = CSRStatus(32, description="Cycles the Bus waited for the SPI Flash/Cache.")
+
+        # # #
+
+        # Read-only: Writes are acked but discarded (no dirty lines to write back to the Flash).
+        bus_rd = wishbone.Interface(data_width=32, address_width=32, addressing="word")
+        self.comb += [
+            bus.connect(bus_rd, omit={"cyc", "stb", "ack"}),
+            bus_rd.cyc.eq(bus.cyc & ~bus.we),
+            bus_rd.stb.eq(bus.stb & ~bus.we),
+            bus.ack.eq(bus_rd.ack | (bus.cyc & bus.stb & bus.we)),
+        ]
+
+        # Cache (line_size-bytes lines, filled through a Down-Converter to the 32-bit Flash bus).
+        cache_bus = wishbone.Interface(data_width=32,          address_width=32, addressing="word")
+        line_bus  = wishbone.Interface(data_width=8*line_size, address_width=32, addressing="word")
+        conv_bus  = wishbone.Interface(data_width=32,          address_width=32, addressing="word")
+        self.cache     = wishbone.Cache(cachesize=size//4, master=cache_bus, slave=line_bus, reverse=False)
+        self.converter = wishbone.Converter(line_bus, conv_bus)
+
+        # Bypass (only switched when the Bus is idle).
+        bypass = Signal()
+        self.sync += If(~bus.cyc, bypass.eq(self.control.fields.bypass))
+        self.comb += [
+            If(bypass,
+                *bus_rd.connect(flash_bus)
+            ).Else(
+                *bus_rd.connect(cache_bus),
+                *conv_bus.connect(flash_bus)
+            )
+        ]
+
+        # Statistics.
+        accesses    = self.accesses.status
+        misses      = self.misses.status
+        wait_cycles = self.wait_cycles.status
+        self.sync += [
+            If(bus_rd.cyc & bus_rd.stb & bus_rd.ack,
+                accesses.eq(accesses + 1)
+            ),
+            If(bypass & flash_bus.cyc & flash_bus.stb & flash_bus.ack,
+                misses.eq(misses + 1)
+            ),
+            If(~bypass & line_bus.cyc & line_bus.stb & line_bus.ack,
+                misses.eq(misses + 1)
+            ),
+            If(bus_rd.cyc & bus_rd.stb & ~bus_rd.ack,
+                wait_cycles.eq(wait_cycles + 1)
+            ),
+            If(self.control.fields.reset,
+                accesses.eq(0),
+                misses.eq(0),
+                wait_cycles.eq(0),
+            )
+        ]
+
+# SoC Helper ---------------------------------------------------------------------------------------
+
+def add_spi_flash_xip(soc, name="spiflash", mode="4x", clk_freq=20e6, module=None, rate="1:1",
+    cache_size      = 4096,
+    cache_line_size = 16,
+    **kwargs):
+    # Same than SoC.add_spi_flash but with the memory-mapped Flash behind a SPIFlashXIPCache.
+    import math
+    from litespi import LiteSPI
+    from litespi.phy.generic import LiteSPIPHY
+    from litespi.opcodes import SpiNorFlashOpCodes
+
+    # Checks/Parameters.
+    assert mode in ["1x", "4x"]
+    default_divisor = math.ceil(soc.sys_clk_freq/(2*clk_freq)) - 1
+    clk_freq        = int(soc.sys_clk_freq/(2*(default_divisor + 1)))
+
+    # PHY.
+    soc.check_if_exists(f"{name}_phy")
+    spiflash_pads = soc.platform.request(name if mode == "1x" else name + mode)
+    spiflash_phy  = LiteSPIPHY(spiflash_pads, module, device=soc.platform.device, default_divisor=default_divisor, rate=rate)
+    soc.add_module(name=f"{name}_phy", module=spiflash_phy)
+
+    # Core.
+    soc.check_if_exists(f"{name}_mmap")
+    spiflash_core = LiteSPI(spiflash_phy, mmap_endianness=soc.cpu.endianness, **kwargs)
+    soc.add_module(name=f"{name}_core", module=spiflash_core)
+
+    # XIP Cache.
+    spiflash_cache = SPIFlashXIPCache(spiflash_core.bus, size=cache_size, line_size=cache_line_size)
+    soc.add_module(name=f"{name}_cache", module=spiflash_cache)
+    spiflash_region = SoCRegion(origin=soc.mem_map.get(name, None), size=module.total_size)
+    soc.bus.add_slave(name=name, slave=spiflash_cache.bus, region=spiflash_region)
+    soc.comb += spiflash_core.mmap.offset.eq(soc.bus.regions.get(name, None).origin)
+
+    # Constants.
+    soc.add_constant(f"{name}_PHY_FREQUENCY",     clk_freq)
+    soc.add_constant(f"{name}_MODULE_NAME",       module.name)
+    soc.add_constant(f"{name}_MODULE_TOTAL_SIZE", module.total_size)
+    soc.add_constant(f"{name}_MODULE_PAGE_SIZE",  module.page_size)
+    soc.add_constant(f"{name}_CACHE_SIZE",        cache_size)
+    soc.add_constant(f"{name}_CACHE_LINE_SIZE",   cache_line_size)
+    if mode in [ "4x" ]:
+        if SpiNorFlashOpCodes.READ_1_1_4 in module.supported_opcodes:
+            soc.add_constant(f"{name}_MODULE_QUAD_CAPABLE")
+        if SpiNorFlashOpCodes.READ_4_4_4 in module.supported_opcodes:
+            soc.add_constant(f"{name}_MODULE_QPI_CAPABLE")
@@ -0,0 +1,537 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Hardware TFTP Receiver (Netboot acceleration).
+#
+# TFTP client running on a LiteEth UDP port that writes the received DATA payloads directly to their
+# load address (Wishbone DMA) and ACKs them in hardware, with large blocks (RFC 2348 blksize) and
+# windowed transfers (RFC 7440 windowsize: only the last block of each window is ACKed).
+#
+# The RRQ (filename/mode/options) is written to the request memory by the host/CPU, the transfer is
+# then fully handled in hardware:
+# - OACK:       blksize/windowsize options parsed and checked against the blksize/windowsize CSRs
+#               (options omitted by the server: 512/1), ACK of block 0 when matching, error otherwise.
+# - DATA:       In-order blocks written to base + (block - 1)*blksize, ACK at the end of each window
+#               and on the last (short) block. Out-of-order blocks are dropped and the last in-order
+#               block is ACKed (once) for the server to resume the window from there. Blocks larger
+#               than blksize or exceeding max_length, and DATA without OACK when options other than
+#               512/1 are configured, abort the transfer with an error.
+# - ERROR:      Transfer aborted.
+# - Timeout:    Last in-order block ACKed again (or RRQ sent again before the first response).
+#
+# blksize must be a multiple of 4 and the load address 32-bit aligned.
+#
+# UDP port data is 32-bit, bytes in wire order from LSBs (little-endian memory layout).
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+# TFTP Constants -----------------------------------------------------------------------------------
+
+TFTP_RRQ   = 1
+TFTP_DATA  = 3
+TFTP_ACK   = 4
+TFTP_ERROR = 5
+TFTP_OACK  = 6
+
+TFTP_DEFAULT_BLKSIZE    = 512
+TFTP_DEFAULT_WINDOWSIZE = 1
+
+# TFTP Error Causes.
+TFTP_CAUSE_ERROR      = 0 # ERROR packet from the server.
+TFTP_CAUSE_TIMEOUT    = 1 # Max consecutive timeouts.
+TFTP_CAUSE_OPTIONS    = 2 # Options (blksize/windowsize) not matching the configuration.
+TFTP_CAUSE_BLKSIZE    = 3 # DATA block larger than blksize.
+TFTP_CAUSE_MAX_LENGTH = 4 # Transfer larger than max_length.
+
+def tftp_request(filename, blksize=1468, windowsize=16):
+    # RRQ packet with blksize/windowsize options.
+    request  = bytes([0, TFTP_RRQ]) + filename.encode() + b"\x00octet\x00"
+    request += b"blksize\x00"    + str(blksize).encode()    + b"\x00"
+    request += b"windowsize\x00" + str(windowsize).encode() + b"\x00"
+    return request
+
+# TFTP Receiver ------------------------------------------------------------------------------------
+
+class TFTPReceiver(LiteXModule):
+    def __init__(self, udp_port, bus, local_port, clk_freq, request_depth=64, fifo_depth=512,
+        blksize    = 1468,
+        windowsize = 16,
+        max_length = 0):
+        assert len(udp_port.source.data) == 32
+        assert len(bus.dat_w) == 32
+        self.control = CSRStorage(fields=[
+            CSRField("start", size=1, offset=0, pulse=True, description="Start the transfer."),
+            CSRField("abort", size=1, offset=1, pulse=True, description="Abort the transfer."),
+            CSRField("clear", size=1, offset=2, pulse=True, description="Clear the request memory."),
+        ])
+        self.server_ip      = CSRStorage(32, description="TFTP Server IP address.")
+        self.server_port    = CSRStorage(16, reset=69, description="TFTP Server port.")
+        self.request_data   = CSRStorage(32, description="Request data (appended to the request memory on write).")
+        self.request_length = CSRStorage(16, description="Request length (in bytes).")
+        self.base           = CSRStorage(32, description="Load address (in bytes, 32-bit aligned).")
+        self.blksize        = CSRStorage(16, reset=blksize,    description="Block size (in bytes, multiple of 4).")
+        self.windowsize     = CSRStorage(16, reset=windowsize, description="Window size (in blocks).")
+        self.max_length     = CSRStorage(32, reset=max_length, description="Max transfer length (in bytes, 0: unlimited).")
+        self.timeout        = CSRStorage(32, reset=int(clk_freq*10e-3), description="Timeout (in cycles).")
+        self.retries        = CSRStorage(8,  reset=8, description="Max consecutive timeouts.")
+        self.status = CSRStatus(fields=[
+            CSRField("busy",  size=1, offset=0, description="Transfer in progress."),
+            CSRField("done",  size=1, offset=1, description="Transfer done."),
+            CSRField("error", size=1, offset=2, description="Transfer error."),
+            CSRField("cause", size=3, offset=4, description="Transfer error cause.", values=[
+                ("``0b000``", "ERROR packet from the server."),
+                ("``0b001``", "Max consecutive timeouts."),
+                ("``0b010``", "Options (blksize/windowsize) not matching the configuration."),
+                ("``0b011``", "DATA block larger than blksize."),
+                ("``0b100``", "Transfer larger than max_length."),
+            ]),
+        ])
+        self.bytes    = CSRStatus(32, description="Received bytes.")
+        self.blocks   = CSRStatus(32, description="Received blocks.")
+        self.acks     = CSRStatus(32, description="Sent ACKs.")
+        self.timeouts = CSRStatus(32, description="Timeouts.")
+        self.cycles   = CSRStatus(32, description="Transfer duration (in cycles).")
+
+        # # #
+
+        source = udp_port.source # RX.
+        sink   = udp_port.sink   # TX.
+
+        # Request Memory.
+        request_mem    = Memory(32, request_depth)
+        request_wrport = request_mem.get_port(write_capable=True)
+        request_rdport = request_mem.get_port(async_read=True)
+        self.specials += request_mem, request_wrport, request_rdport
+        request_wr_adr = Signal(max=request_depth)
+        self.comb += [
+            request_wrport.adr.eq(request_wr_adr),
+            request_wrport.dat_w.eq(self.request_data.storage),
+            request_wrport.we.eq(self.request_data.re),
+        ]
+        self.sync += [
+            If(self.request_data.re,
+                request_wr_adr.eq(request_wr_adr + 1)
+            ),
+            If(self.control.fields.clear,
+                request_wr_adr.eq(0)
+            )
+        ]
+
+        # DMA (Wishbone writes from FIFO).
+        self.fifo = fifo = stream.SyncFIFO([("adr", 30), ("data", 32), ("sel", 4)], fifo_depth)
+        self.comb += [
+            bus.cyc.eq(fifo.source.valid),
+            bus.stb.eq(fifo.source.valid),
+            bus.we.eq(1),
+            bus.adr.eq(fifo.source.adr),
+            bus.dat_w.eq(fifo.source.data),
+            bus.sel.eq(fifo.source.sel),
+            fifo.source.ready.eq(bus.ack),
+        ]
+
+        # Transfer State.
+        tid          = Signal(16)  # Server Transfer ID (port).
+        tid_valid    = Signal()
+        expected     = Signal(16)  # Expected DATA block number (16-bit, wraps).
+        block_adr    = Signal(30)  # Word address of the expected block.
+        word_adr     = Signal(30)
+        window       = Signal(16)
+        finished     = Signal()
+        resync       = Signal()
+        ack_pending  = Signal()
+        error        = Signal()
+        cause        = Signal(3)
+        negotiated   = Signal()
+        retries      = Signal(8)
+        timer        = Signal(32)
+        timer_clr    = Signal()
+        opcode       = Signal(16)
+        block        = Signal(16)
+        payload_len  = Signal(16)
+        self.comb += [
+            opcode.eq(Cat(source.data[8:16],  source.data[0:8])),
+            block.eq( Cat(source.data[24:32], source.data[16:24])),
+            payload_len.eq(source.length - 4),
+            self.status.fields.cause.eq(cause),
+        ]
+        self.sync += [
+            If(timer_clr,
+                timer.eq(0)
+            ).Else(
+                timer.eq(timer + 1)
+            ),
+            If(self.status.fields.busy,
+                self.cycles.status.eq(self.cycles.status + 1)
+            )
+        ]
+
+        # OACK Parser (one byte per cycle: "name\0value\0" options, names case-insensitive).
+        oack_word       = Signal(32)
+        oack_byte       = Signal(2)
+        oack_last       = Signal()
+        oack_pos        = Signal(16)
+        oack_length     = Signal(16)
+        oack_char       = Signal(8)
+        oack_lower      = Signal(8)
+        oack_in_value   = Signal()
+        oack_name_pos   = Signal(4)
+        oack_invalid    = Signal()
+        oack_value      = Signal(32)
+        oack_options    = {"blksize": self.blksize.storage, "windowsize": self.windowsize.storage}
+        oack_defaults   = {"blksize": TFTP_DEFAULT_BLKSIZE, "windowsize": TFTP_DEFAULT_WINDOWSIZE}
+        oack_match      = {name: Signal(name=f"oack_match_{name}")    for name in oack_options}
+        oack_selected   = {name: Signal(name=f"oack_selected_{name}") for name in oack_options}
+        oack_received   = {name: Signal(name=f"oack_received_{name}") for name in oack_options}
+        oack_values     = {name: Signal(32, name=f"oack_value_{name}") for name in oack_options}
+        oack_valid      = Signal()
+        self.comb += [
+            Case(oack_byte, {n: oack_char.eq(oack_word[8*n:8*(n + 1)]) for n in range(4)}),
+            oack_lower.eq(oack_char),
+            If((oack_char >= ord("A")) & (oack_char <= ord("Z")),
+                oack_lower.eq(oack_char | 0x20)
+            ),
+            oack_valid.eq(~oack_invalid & ~oack_in_value & (oack_name_pos == 0)),
+        ]
+        for name, storage in oack_options.items():
+            self.comb += If(oack_received[name],
+                If(oack_values[name] != storage, oack_valid.eq(0))
+            ).Elif(storage != oack_defaults[name],
+                oack_valid.eq(0)
+            )
+
+        oack_parse = [
+            NextValue(oack_pos,  oack_pos  + 1),
+            NextValue(oack_byte, oack_byte + 1),
+            # End of name/value.
+            If(oack_char == 0,
+                NextValue(oack_in_value, ~oack_in_value),
+                NextValue(oack_name_pos, 0),
+                NextValue(oack_value,    0),
+                If(~oack_in_value,
+                    *[NextValue(oack_selected[name], oack_match[name] & (oack_name_pos == len(name)))
+                        for name in oack_options],
+                ).Else(
+                    *[If(oack_selected[name],
+                        NextValue(oack_received[name], 1),
+                        NextValue(oack_values[name],   oack_value),
+                    ) for name in oack_options],
+                    *[NextValue(oack_match[name], 1) for name in oack_options],
+                )
+            # Name.
+            ).Elif(~oack_in_value,
+                NextValue(oack_name_pos, oack_name_pos + 1),
+                *[Case(oack_name_pos, {
+                    **{n: If(oack_lower != ord(c), NextValue(oack_match[name], 0)) for n, c in enumerate(name)},
+                    "default": NextValue(oack_match[name], 0)
+                }) for name in oack_options],
+            # Value (decimal).
+            ).Else(
+                NextValue(oack_value, oack_value*10 + (oack_char - ord("0"))),
+                If((oack_char < ord("0")) | (oack_char > ord("9")),
+                    NextValue(oack_invalid, 1)
+                )
+            )
+        ]
+
+        # Block completion.
+        def complete_block(payload_len):
+            return [
+                NextValue(self.blocks.status, self.blocks.status + 1),
+                NextValue(self.bytes.status,  self.bytes.status + payload_len),
+                NextValue(expected,  expected + 1),
+                NextValue(block_adr, block_adr + self.blksize.storage[2:]),
+                NextValue(window,    window + 1),
+                NextValue(retries,   0),
+                NextValue(resync,    0),
+                timer_clr.eq(1),
+                If(payload_len < self.blksize.storage,
+                    NextValue(finished, 1),
+                    NextState("ACK")
+                ).Elif(window == (self.windowsize.storage - 1),
+                    NextState("ACK")
+                ).Else(
+                    NextState("WAIT")
+                )
+            ]
+
+        # FSM.
+        self.fsm = fsm = ResetInserter()(FSM(reset_state="IDLE"))
+        self.comb += fsm.reset.eq(self.control.fields.abort)
+        fsm.act("IDLE",
+            source.ready.eq(1),
+            If(self.control.fields.start,
+                NextValue(tid_valid,   0),
+                NextValue(expected,    1),
+                NextValue(block_adr,   self.base.storage[2:]),
+                NextValue(window,      0),
+                NextValue(finished,    0),
+                NextValue(resync,      0),
+                NextValue(ack_pending, 0),
+                NextValue(error,       0),
+                NextValue(cause,       0),
+                NextValue(negotiated,  0),
+                NextValue(retries,     0),
+                NextValue(self.bytes.status,    0),
+                NextValue(self.blocks.status,   0),
+                NextValue(self.acks.status,     0),
+                NextValue(self.timeouts.status, 0),
+                NextValue(self.cycles.status,   0),
+                NextState("RRQ")
+            )
+        )
+        fsm.act("RRQ",
+            self.status.fields.busy.eq(1),
+            timer_clr.eq(1),
+            sink.valid.eq(1),
+            sink.src_port.eq(local_port),
+            sink.dst_port.eq(self.server_port.storage),
+            sink.ip_address.eq(self.server_ip.storage),
+            sink.length.eq(self.request_length.storage),
+            sink.data.eq(request_rdport.dat_r),
+            request_rdport.adr.eq(word_adr),
+            If(word_adr == ((self.request_length.storage - 1) >> 2),
+                sink.last.eq(1),
+                sink.last_be.eq(1 << (self.request_length.storage - 1)[:2]),
+            ),
+            If(sink.ready,
+                NextValue(word_adr, word_adr + 1),
+                If(sink.last,
+                    NextValue(word_adr, 0),
+                    NextState("WAIT")
+                )
+            )
+        )
+        fsm.act("WAIT",
+            self.status.fields.busy.eq(1),
+            source.ready.eq(1),
+            If(source.valid,
+                # Packets from other hosts/ports: Drop.
+                If((source.ip_address != self.server_ip.storage) |
+                   (tid_valid & (source.src_port != tid)),
+                    If(~source.last, NextState("DROP"))
+                # DATA.
+                ).Elif(opcode == TFTP_DATA,
+                    NextValue(tid, source.src_port),
+                    NextValue(tid_valid, 1),
+                    # Options ignored by the server (DATA without OACK): 512/1 expected.
+                    If(~negotiated &
+                        ((self.blksize.storage    != TFTP_DEFAULT_BLKSIZE) |
+                         (self.windowsize.storage != TFTP_DEFAULT_WINDOWSIZE)),
+                        NextValue(error, 1),
+                        NextValue(cause, TFTP_CAUSE_OPTIONS),
+                        NextState("ERROR")
+                    ).Elif(block == expected,
+                        NextValue(word_adr, block_adr),
+                        If(payload_len > self.blksize.storage,
+                            NextValue(error, 1),
+                            NextValue(cause, TFTP_CAUSE_BLKSIZE),
+                            NextState("ERROR")
+                        ).Elif((self.max_length.storage != 0) &
+                               ((self.bytes.status + payload_len) > self.max_length.storage),
+                            NextValue(error, 1),
+                            NextValue(cause, TFTP_CAUSE_MAX_LENGTH),
+                            NextState("ERROR")
+                        ).Elif(source.last,
+                            # Empty last block.
+                            *complete_block(0)
+                        ).Else(
+                            NextState("DATA")
+                        )
+                    ).Else(
+                        # Out-of-order: ACK last in-order block (once).
+                        NextValue(ack_pending, ~resync),
+                        NextValue(resync, 1),
+                        If(source.last,
+                            If(~resync, NextState("ACK"))
+                        ).Else(
+                            NextState("DROP")
+                        )
+                    )
+                # OACK: Parse options (from byte 2), ACK block 0 when matching.
+                ).Elif(opcode == TFTP_OACK,
+                    NextValue(tid, source.src_port),
+                    NextValue(tid_valid, 1),
+                    NextValue(oack_word,     source.data),
+                    NextValue(oack_byte,     2),
+                    NextValue(oack_last,     source.last),
+                    NextValue(oack_pos,      2),
+                    NextValue(oack_length,   source.length),
+                    NextValue(oack_in_value, 0),
+                    NextValue(oack_name_pos, 0),
+                    NextValue(oack_invalid,  0),
+                    NextValue(oack_value,    0),
+                    *[NextValue(oack_match[name],    1) for name in oack_options],
+                    *[NextValue(oack_selected[name], 0) for name in oack_options],
+                    *[NextValue(oack_received[name], 0) for name in oack_options],
+                    If(source.length <= 2,
+                        NextState("OACK-CHECK")
+                    ).Else(
+                        NextState("OACK-PARSE")
+                    )
+                # ERROR.
+                ).Elif(opcode == TFTP_ERROR,
+                    NextValue(error, 1),
+                    NextValue(cause, TFTP_CAUSE_ERROR),
+                    NextState("ERROR")
+                ).Else(
+                    If(~source.last, NextState("DROP"))
+                )
+            # Timeout: ACK last in-order block again (or resend RRQ).
+            ).Elif(timer >= self.timeout.storage,
+                timer_clr.eq(1),
+                NextValue(self.timeouts.status, self.timeouts.status + 1),
+                NextValue(retries, retries + 1),
+                If(retries == self.retries.storage,
+                    NextValue(error, 1),
+                    NextValue(cause, TFTP_CAUSE_TIMEOUT),
+                    NextState("ERROR")
+                ).Elif(tid_valid,
+                    NextState("ACK")
+                ).Else(
+                    NextState("RRQ")
+                )
+            )
+        )
+        fsm.act("OACK-PARSE",
+            self.status.fields.busy.eq(1),
+            *oack_parse,
+            If(oack_pos == (oack_length - 1),
+                NextState("OACK-CHECK")
+            ).Elif(oack_byte == 3,
+                NextState("OACK-LOAD")
+            )
+        )
+        fsm.act("OACK-LOAD",
+            self.status.fields.busy.eq(1),
+            source.ready.eq(1),
+            If(source.valid,
+                NextValue(oack_word, source.data),
+                NextValue(oack_byte, 0),
+                NextValue(oack_last, source.last),
+                NextState("OACK-PARSE")
+            )
+        )
+        fsm.act("OACK-CHECK",
+            self.status.fields.busy.eq(1),
+            If(oack_valid,
+                NextValue(negotiated,  1),
+                NextValue(ack_pending, 1),
+                If(oack_last,
+                    NextState("ACK")
+                ).Else(
+                    NextState("DROP")
+                )
+            ).Else(
+                NextValue(error, 1),
+                NextValue(cause, TFTP_CAUSE_OPTIONS),
+                NextState("ERROR")
+            )
+        )
+        fsm.act("DATA",
+            self.status.fields.busy.eq(1),
+            fifo.sink.valid.eq(source.valid),
+            fifo.sink.adr.eq(word_adr),
+            fifo.sink.data.eq(source.data),
+            fifo.sink.sel.eq(0b1111),
+            If(source.last,
+                fifo.sink.sel.eq((source.last_be << 1) - 1),
+            ),
+            source.ready.eq(fifo.sink.ready),
+            If(source.valid & source.ready,
+                NextValue(word_adr, word_adr + 1),
+                If(source.last,
+                    If(source.error != 0,
+                        # Corrupted: Will be sent again by the server.
+                        NextState("WAIT")
+                    ).Else(
+                        *complete_block(payload_len)
+                    )
+                )
+            )
+        )
+        fsm.act("DROP",
+            self.status.fields.busy.eq(1),
+            source.ready.eq(1),
+            If(source.valid & source.last,
+                If(ack_pending,
+                    NextState("ACK")
+                ).Else(
+                    NextState("WAIT")
+                )
+            )
+        )
+        fsm.act("ACK",
+            self.status.fields.busy.eq(1),
+            timer_clr.eq(1),
+            sink.valid.eq(1),
+            sink.last.eq(1),
+            sink.last_be.eq(0b1000),
+            sink.src_port.eq(local_port),
+            sink.dst_port.eq(tid),
+            sink.ip_address.eq(self.server_ip.storage),
+            sink.length.eq(4),
+            sink.data.eq(Cat(C(0, 8), C(TFTP_ACK, 8), (expected - 1)[8:16], (expected - 1)[0:8])),
+            If(sink.ready,
+                NextValue(self.acks.status, self.acks.status + 1),
+                NextValue(window,      0),
+                NextValue(ack_pending, 0),
+                If(finished,
+                    NextState("FLUSH")
+                ).Else(
+                    NextState("WAIT")
+                )
+            )
+        )
+        fsm.act("FLUSH",
+            self.status.fields.busy.eq(1),
+            source.ready.eq(1),
+            If(~fifo.source.valid,
+                NextState("DONE")
+            )
+        )
+        fsm.act("DONE",
+            self.status.fields.done.eq(1),
+            source.ready.eq(1),
+            If(self.control.fields.start,
+                NextState("IDLE")
+            )
+        )
+        fsm.act("ERROR",
+            self.status.fields.error.eq(error),
+            source.ready.eq(1),
+            If(self.control.fields.start,
+                NextState("IDLE")
+            )
+        )
+
+# SoC Helper ---------------------------------------------------------------------------------------
+
+def add_tftp_receiver(soc, name="tftp", ethcore=None, udp_port=6969, cd="sys", **kwargs):
+    # Hardware TFTP Receiver on a LiteEth UDP/IP core (ex the Etherbone one) writing to the SoC bus.
+    from litex.soc.interconnect import wishbone
+    ethcore = getattr(soc, "ethcore_etherbone", None) if ethcore is None else ethcore
+    if ethcore is None:
+        raise ValueError("Hardware TFTP Receiver requires a LiteEth UDP/IP core (ex --with-etherbone).")
+    bus = wishbone.Interface(
+        data_width = 32,
+        adr_width  = soc.bus.get_address_width(standard="wishbone"),
+        addressing = "word",
+    )
+    soc.check_if_exists(name)
+    tftp = TFTPReceiver(
+        udp_port   = ethcore.udp.crossbar.get_port(udp_port, dw=32, cd=cd),
+        bus        = bus,
+        local_port = udp_port,
+        clk_freq   = soc.sys_clk_freq,
+        **kwargs)
+    soc.add_module(name=name, module=tftp)
+    dma_bus = getattr(soc, "dma_bus", soc.bus)
+    dma_bus.add_master(name=name, master=bus)
+    soc.add_constant(f"{name}_udp_port", udp_port)
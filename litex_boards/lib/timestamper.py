@@ -0,0 +1,196 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Time Counter / Timestamper.
+#
+# TimeCounter maintains the time in hardware (seconds/nanoseconds with a 8.24 fixed point increment
+# per sys_clk cycle for the servo, set/adjust/latch controls) and generates a PPS Output from it.
+#
+# Timestamper timestamps the rising edges of inputs sampled at 8x sys_clk (ISERDESE2 on the sys4x
+# DDR clock) and of the PPS Output, and streams them as 64-bit events:
+# - [29: 0]: Nanoseconds.
+# - [32:30]: Sub-cycle position of the edge (in 1/8 of sys_clk period, to add to nanoseconds).
+# - [35:33]: Channel.
+# - [63:36]: Seconds (28 LSBs).
+# The time captured on an edge is compensated for the latency of the channel's path (in sys_clk
+# cycles, from the first sample of the 8-sample window to the capture): ISERDESE2 + edge detection
+# for the inputs, PPS Output register for the PPS Output (not going through an ISERDESE2).
+
+from functools import reduce
+from operator import or_
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.packet import Arbiter
+
+# Time Counter -------------------------------------------------------------------------------------
+
+class TimeCounter(LiteXModule):
+    def __init__(self, sys_clk_freq, frac_bits=24):
+        self.sys_clk_freq = sys_clk_freq
+        self.seconds      = Signal(48)
+        self.nanoseconds  = Signal(30)
+        self.pps          = Signal()
+
+        self.control = CSRStorage(fields=[
+            CSRField("set",    size=1, offset=0, pulse=True, description="Set time to ``set_seconds``/``set_nanoseconds``."),
+            CSRField("adjust", size=1, offset=1, pulse=True, description="Add ``adjust`` (signed, in ns, < 1s) to time."),
+            CSRField("latch",  size=1, offset=2, pulse=True, description="Latch time to ``seconds``/``nanoseconds``."),
+        ])
+        self.increment           = CSRStorage(32, reset=int((1e9/sys_clk_freq)*2**frac_bits), description="Time increment per sys_clk cycle (in ns, 8.24 fixed point).")
+        self.set_seconds         = CSRStorage(48, description="Seconds to set.")
+        self.set_nanoseconds     = CSRStorage(30, description="Nanoseconds to set.")
+        self.adjust              = CSRStorage(32, description="Time adjustment (signed, in ns).")
+        self.pps_width           = CSRStorage(30, reset=100000000, description="PPS Output pulse width (in ns).")
+        self.latched_seconds     = CSRStatus(48,  description="Latched seconds.")
+        self.latched_nanoseconds = CSRStatus(30,  description="Latched nanoseconds.")
+
+        # # #
+
+        one_second = int(1e9) << frac_bits
+
+        # Nanoseconds accumulator (with fractional part for fine frequency adjustment).
+        ns      = Signal(30 + frac_bits)
+        ns_next = Signal((32 + frac_bits, True))
+        adjust  = Signal((32 + frac_bits, True))
+        self.comb += If(self.control.fields.adjust, adjust.eq(Cat(Replicate(0, frac_bits), self.adjust.storage)))
+        self.comb += ns_next.eq(ns + self.increment.storage + adjust)
+        self.sync += [
+            If(self.control.fields.set,
+                ns.eq(self.set_nanoseconds.storage << frac_bits),
+                self.seconds.eq(self.set_seconds.storage),
+            ).Elif(ns_next >= one_second,
+                ns.eq(ns_next - one_second),
+                self.seconds.eq(self.seconds + 1),
+            ).Elif(ns_next < 0,
+                ns.eq(ns_next + one_second),
+                self.seconds.eq(self.seconds - 1),
+            ).Else(
+                ns.eq(ns_next)
+            ),
+            If(self.control.fields.latch,
+                self.latched_seconds.status.eq(self.seconds),
+                self.latched_nanoseconds.status.eq(self.nanoseconds),
+            )
+        ]
+        self.comb += self.nanoseconds.eq(ns[frac_bits:])
+
+        # PPS Output.
+        self.sync += self.pps.eq(self.nanoseconds < self.pps_width.storage)
+
+# Timestamper Core ---------------------------------------------------------------------------------
+
+class TimestamperCore(LiteXModule):
+    # Timestamps the rising edges of channels given as (samples, latency): 8 samples per sys_clk
+    # cycle (samples[0]: Oldest) and latency of the path (in sys_clk cycles).
+    def __init__(self, time, channels, enable, fifo_depth=1024):
+        self.source   = stream.Endpoint([("data", 64)])
+        self.overflow = Signal() # Cycle with lost events.
+
+        # # #
+
+        # Time compensated for the latency of the paths.
+        timestamps = {}
+        for latency in sorted(set(latency for _, latency in channels)):
+            latency_ns  = round(latency*1e9/time.sys_clk_freq)
+            seconds     = Signal(28)
+            nanoseconds = Signal(30)
+            self.comb += If(time.nanoseconds < latency_ns,
+                nanoseconds.eq(time.nanoseconds + int(1e9) - latency_ns),
+                seconds.eq(time.seconds - 1),
+            ).Else(
+                nanoseconds.eq(time.nanoseconds - latency_ns),
+                seconds.eq(time.seconds),
+            )
+            timestamps[latency] = (seconds, nanoseconds)
+
+        # Events.
+        fifos     = []
+        overflows = []
+        for n, (samples, latency) in enumerate(channels):
+            # Rising edge detection and position.
+            last   = Signal()
+            rising = Signal(8)
+            sub    = Signal(3)
+            self.sync += last.eq(samples[-1])
+            self.comb += rising.eq(samples & ~Cat(last, samples[:-1]))
+            for i in reversed(range(8)):
+                self.comb += If(rising[i], sub.eq(i))
+
+            # Per-channel FIFO (capture of time on the edge).
+            seconds, nanoseconds = timestamps[latency]
+            fifo = stream.SyncFIFO([("data", 64)], 4, buffered=True)
+            self.add_module(name=f"fifo{n}", module=fifo)
+            self.comb += [
+                fifo.sink.valid.eq(enable[n] & (rising != 0)),
+                fifo.sink.last.eq(1),
+                fifo.sink.data.eq(Cat(nanoseconds, sub, C(n, 3), seconds)),
+            ]
+            overflows.append(fifo.sink.valid & ~fifo.sink.ready)
+            fifos.append(fifo.source)
+
+        self.comb += self.overflow.eq(reduce(or_, overflows))
+
+        # Arbitration / Buffering.
+        self.fifo = fifo = stream.SyncFIFO([("data", 64)], fifo_depth, buffered=True)
+        self.arbiter = Arbiter(fifos, fifo.sink)
+        self.comb += fifo.source.connect(self.source)
+
+# Timestamper --------------------------------------------------------------------------------------
+
+class Timestamper(LiteXModule):
+    def __init__(self, time, sma_pads, gnss_tp, fifo_depth=1024, iserdes_latency=2):
+        self.source = stream.Endpoint([("data", 64)])
+
+        n_smas     = len(sma_pads)
+        n_channels = n_smas + 2 # SMA inputs + GNSS Timepulse + PPS Output.
+        self.control = CSRStorage(fields=[
+            CSRField("in_en",  size=n_smas,     offset=0,  description="SMA Input  enable control (1bit per SMA)."),
+            CSRField("out_en", size=n_smas,     offset=8,  description="SMA Output enable control (1bit per SMA, PPS Output)."),
+            CSRField("enable", size=n_channels, offset=16, description="Timestamping enable (1bit per channel)."),
+        ])
+        self.overflows = CSRStatus(32, description="Cycles with lost events.")
+
+        # # #
+
+        # SMA Buffers / PPS Output.
+        for i, pads in enumerate(sma_pads):
+            self.sync += [
+                pads.dat_in_en.eq(self.control.fields.in_en[i]),
+                pads.dat_out_en.eq(self.control.fields.out_en[i]),
+                pads.dat_out.eq(time.pps & self.control.fields.out_en[i]),
+            ]
+
+        # Channels: 8 samples per sys_clk cycle for the inputs (ISERDES on sys4x DDR clock).
+        channels = []
+        for pad in [pads.dat_in for pads in sma_pads] + [gnss_tp]:
+            samples = Signal(8)
+            self.specials += Instance("ISERDESE2",
+                p_DATA_WIDTH     = 8,
+                p_DATA_RATE      = "DDR",
+                p_SERDES_MODE    = "MASTER",
+                p_INTERFACE_TYPE = "NETWORKING",
+                p_NUM_CE         = 1,
+                p_IOBDELAY       = "NONE",
+                i_D       = pad,
+                i_CE1     = 1,
+                i_RST     = ResetSignal("sys"),
+                i_CLK     = ClockSignal("sys4x"),
+                i_CLKB    = ~ClockSignal("sys4x"),
+                i_CLKDIV  = ClockSignal("sys"),
+                i_BITSLIP = 0,
+                **{f"o_Q{8 - n}": samples[n] for n in range(8)} # samples[0]: Oldest.
+            )
+            channels.append((samples, iserdes_latency))
+        channels.append((Replicate(time.pps, 8), 1)) # PPS Output (registered from time).
+
+        # Events.
+        self.core = TimestamperCore(time, channels, self.control.fields.enable, fifo_depth)
+        self.comb += self.core.source.connect(self.source)
+        self.sync += If(self.core.overflow, self.overflows.status.eq(self.overflows.status + 1))
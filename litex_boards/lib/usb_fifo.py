@@ -0,0 +1,203 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# FT245 Synchronous FIFO PHY (FT232H/FT601) with tunable/adaptive read/write time slices.
+#
+# Same datapath than LiteX's FT245PHYSynchronous, but the maximum read/write times (in usb_clk
+# cycles, before switching direction when the other one is requested) are set from CSRs and can be
+# boosted by the SoC when one of the directions becomes urgent (ex RX samples FIFO almost full or
+# TX samples FIFO almost empty).
+
+from migen import *
+from migen.genlib.cdc import MultiReg
+
+from litex.gen import *
+
+from litex.build.io import SDRTristate
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.cores.usb_fifo import phy_description
+
+# FT245 Synchronous FIFO Timed PHY -----------------------------------------------------------------
+
+class FT245PHYSynchronousTimed(LiteXModule):
+    def __init__(self, pads, clk_freq, fifo_depth=64, cdc_depth=16, read_time=128, write_time=128):
+        self.dw     = dw = len(pads.data)
+        self.pads   = pads
+        self.sink   = stream.Endpoint(phy_description(dw))
+        self.source = stream.Endpoint(phy_description(dw))
+
+        # Urgency (sys clock domain, driven by the SoC when adaptive mode is used).
+        self.read_urgent  = Signal() # Host -> FPGA data is urgent (ex TX FIFO almost empty).
+        self.write_urgent = Signal() # FPGA -> Host data is urgent (ex RX FIFO almost full).
+
+        self.timing = CSRStorage(fields=[
+            CSRField("read_time",  size=16, offset=0,  reset=read_time,  description="Max read time (in usb_clk cycles, 0: unlimited)."),
+            CSRField("write_time", size=16, offset=16, reset=write_time, description="Max write time (in usb_clk cycles, 0: unlimited)."),
+        ])
+        self.adaptive = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, reset=1, description="Adaptive time slices enable."),
+            CSRField("shift",  size=4, offset=8, reset=2, description="Time slice multiplier (2^shift) of the urgent direction."),
+        ])
+
+        # # #
+
+        # Pads Reset.
+        pads.oe_n.reset = 1
+        pads.rd_n.reset = 1
+        pads.wr_n.reset = 1
+
+        # Read CDC/FIFO (FTDI --> SoC).
+        # Note: CDCs deeper than the AsyncFIFO pointers synchronization round-trip (~8 cycles), to
+        # sustain one word per usb_clk cycle during read/write time slices longer than it.
+        self.read_cdc  = stream.ClockDomainCrossing(phy_description(dw),
+            cd_from         = "usb",
+            cd_to           = "sys",
+            depth           = cdc_depth,
+            with_common_rst = True
+        )
+        self.read_fifo = stream.SyncFIFO(phy_description(dw), fifo_depth)
+        self.comb += self.read_cdc.source.connect(self.read_fifo.sink)
+        self.comb += self.read_fifo.source.connect(self.source)
+        read_fifo_almost_full     = (self.read_fifo.level > (fifo_depth - 4))
+        read_fifo_almost_full_usb = Signal()
+        self.specials += MultiReg(read_fifo_almost_full, read_fifo_almost_full_usb, "usb")
+
+        # Write FIFO/CDC (SoC --> FTDI).
+        self.write_fifo = stream.SyncFIFO(phy_description(dw), fifo_depth)
+        self.write_cdc  = stream.ClockDomainCrossing(phy_description(dw),
+            cd_from         = "sys",
+            cd_to           = "usb",
+            depth           = cdc_depth,
+            with_common_rst = True
+        )
+        self.comb += self.sink.connect(self.write_fifo.sink)
+        self.comb += self.write_fifo.source.connect(self.write_cdc.sink)
+
+        # Read / Write Time Slices.
+        max_read_time  = Signal(32)
+        max_write_time = Signal(32)
+        self.sync += [
+            max_read_time.eq(self.timing.fields.read_time),
+            max_write_time.eq(self.timing.fields.write_time),
+            If(self.adaptive.fields.enable & self.read_urgent & ~self.write_urgent,
+                max_read_time.eq(self.timing.fields.read_time << self.adaptive.fields.shift)
+            ),
+            If(self.adaptive.fields.enable & self.write_urgent & ~self.read_urgent,
+                max_write_time.eq(self.timing.fields.write_time << self.adaptive.fields.shift)
+            ),
+        ]
+        max_read_time_usb  = Signal(32)
+        max_write_time_usb = Signal(32)
+        self.specials += MultiReg(max_read_time,  max_read_time_usb,  "usb")
+        self.specials += MultiReg(max_write_time, max_write_time_usb, "usb")
+
+        time          = Signal(32)
+        read_timeout  = Signal()
+        write_timeout = Signal()
+        self.comb += [
+            read_timeout.eq( (max_read_time_usb  != 0) & (time >= max_read_time_usb)),
+            write_timeout.eq((max_write_time_usb != 0) & (time >= max_write_time_usb)),
+        ]
+
+        # Read / Write Detection.
+        self.wants_write = wants_write = Signal()
+        self.wants_read  = wants_read  = Signal()
+        self.comb += [
+            wants_write.eq(~pads.txe_n & self.write_cdc.source.valid),
+            wants_read.eq( ~pads.rxf_n & (self.read_cdc.sink.ready & ~read_fifo_almost_full_usb)),
+        ]
+
+        # Data Bus Tristate.
+        self.data_w  = data_w  = Signal(dw)
+        self.data_r  = data_r  = Signal(dw)
+        self.data_oe = data_oe = Signal()
+        for i in range(dw):
+            self.specials += SDRTristate(
+                io  = pads.data[i],
+                o   = data_w[i],
+                oe  = data_oe,
+                i   = data_r[i],
+                clk = ClockSignal("usb")
+            )
+        if hasattr(pads, "be"):
+            for i in range(dw//8):
+                self.specials += SDRTristate(
+                    io  = pads.be[i],
+                    o   = Signal(reset=0b1),
+                    oe  = data_oe,
+                    i   = Signal(),
+                    clk = ClockSignal("usb")
+                )
+
+        # Read / Write FSM.
+        self.fsm = fsm = ClockDomainsRenamer("usb")(FSM(reset_state="READ"))
+        fsm.act("READ",
+            # Arbitration.
+            NextValue(time, time + 1),
+            If(wants_write,
+                If(~wants_read | read_timeout,
+                    NextValue(time, 0),
+                    NextState("READ-TO-WRITE")
+                )
+            ),
+            # Control/Data-Path.
+            data_oe.eq(0),
+            NextValue(pads.oe_n, ~wants_read),
+            NextValue(pads.rd_n, pads.oe_n | ~wants_read),
+            NextValue(pads.wr_n, 1),
+        )
+        self.comb += self.read_cdc.sink.data.eq(data_r)
+        self.sync.usb += self.read_cdc.sink.valid.eq(~pads.rd_n & ~pads.rxf_n)
+
+        fsm.act("READ-TO-WRITE",
+            NextState("WRITE")
+        )
+        fsm.act("WRITE",
+            # Arbitration.
+            NextValue(time, time + 1),
+            If(wants_read,
+                If(~wants_write | write_timeout,
+                    NextValue(time, 0),
+                    NextState("WRITE-TO-READ")
+                )
+            ),
+            # Control/Data-Path.
+            data_oe.eq(1),
+            NextValue(pads.oe_n, 1),
+            NextValue(pads.rd_n, 1),
+            NextValue(pads.wr_n, ~wants_write),
+            NextValue(data_w, self.write_cdc.source.data),
+            self.write_cdc.source.ready.eq(wants_write),
+        )
+        fsm.act("WRITE-TO-READ",
+            # Last word of the write time slice is on the bus this cycle, release wr_n with it (no
+            # extra/duplicated write once the bus is released).
+            NextValue(pads.wr_n, 1),
+            NextState("READ")
+        )
+
+    def get_litescope_probes(self):
+        return [
+            # Physical.
+            self.pads.oe_n,
+            self.pads.rd_n,
+            self.pads.wr_n,
+            self.pads.txe_n,
+            self.pads.rxf_n,
+            self.data_w,
+            self.data_r,
+            self.data_oe,
+
+            # Core.
+            self.wants_write,
+            self.wants_read,
+            self.fsm,
+
+            # FIFOs.
+            self.write_fifo.source,
+            self.read_cdc.sink,
+        ]
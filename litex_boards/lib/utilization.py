@@ -0,0 +1,66 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Resource Utilization History.
+#
+# LUT/FF/BRAM/DSP utilization and Fmax of the targets built with the open-source toolchains at
+# their default configuration, recorded over time (LiteX/toolchain versions) in utilization.json by
+# bench/utilization_tracker.py. New results are compared to the last recorded ones to flag size
+# (resources increase) and speed (Fmax decrease) regressions and designs getting close to the
+# capacity of the device.
+
+import os
+import json
+
+# Utilization History ------------------------------------------------------------------------------
+
+class UtilizationHistory:
+    version = 1
+
+    def __init__(self, filename=None):
+        default = os.path.join(os.path.dirname(__file__), "utilization.json")
+        self.filename = default if filename is None else filename
+        self.targets  = {}
+        if os.path.exists(self.filename):
+            with open(self.filename) as f:
+                content = json.load(f)
+            if content.get("version", None) != self.version:
+                raise ValueError(f"{self.filename}: Unsupported version {content.get('version', None)}.")
+            self.targets = content["targets"]
+
+    def last(self, target):
+        history = self.targets.get(target, [])
+        return history[-1] if history else None
+
+    def append(self, target, result):
+        self.targets.setdefault(target, []).append(result)
+
+    def save(self, filename=None):
+        filename = self.filename if filename is None else filename
+        with open(filename, "w") as f:
+            json.dump({"version": self.version, "targets": self.targets}, f, indent=1, sort_keys=True)
+            f.write("\n")
+
+# Regressions --------------------------------------------------------------------------------------
+
+def check_utilization(previous, current, resource_threshold=0.02, fmax_threshold=0.05, capacity_threshold=0.90):
+    # Returns (regressions, warnings) messages between 2 results.
+    regressions = []
+    warnings    = []
+    for name, (used, available) in current["resources"].items():
+        if available and used > available*capacity_threshold:
+            warnings.append(f"{name}: {used}/{available} ({100*used/available:.1f}% of the device).")
+        if previous is None or name not in previous["resources"]:
+            continue
+        previous_used = previous["resources"][name][0]
+        if used > previous_used*(1 + resource_threshold) and (used - previous_used) > 1:
+            regressions.append(f"{name}: {previous_used} -> {used} (+{100*(used - previous_used)/max(previous_used, 1):.1f}%).")
+    if previous is not None:
+        for clock, fmax in current["fmax"].items():
+            previous_fmax = previous["fmax"].get(clock, None)
+            if previous_fmax is not None and fmax < previous_fmax*(1 - fmax_threshold):
+                regressions.append(f"{clock}: {previous_fmax/1e6:.2f}MHz -> {fmax/1e6:.2f}MHz "
+                                   f"({100*(fmax - previous_fmax)/previous_fmax:.1f}%).")
+    return regressions, warnings
@@ -0,0 +1,1084 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Video helpers shared by the targets.
+
+from migen import *
+from migen.genlib.cdc import MultiReg, BusSynchronizer
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.integration.soc import SoCRegion
+from litex.soc.cores.code_tmds import control_tokens
+from litex.soc.cores.video import video_timings, video_timing_layout
+
+from litedram.common import LiteDRAMNativePort
+from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+
+# Video Timings ------------------------------------------------------------------------------------
+
+# Maximum pixel clock of the Video PHYs (serializers/IOs limits).
+video_phy_max_pix_clk = {
+    "VideoVGAPHY"           : 148.5e6, # Parallel RGB/Syncs (ex to a resistor/VGA DAC).
+    "VideoDVIPHY"           : 148.5e6, # Parallel RGB/Syncs to an external DVI/HDMI transmitter.
+    "VideoGenericPHY"       : 148.5e6, # Parallel RGB/Syncs to an external DVI/HDMI transmitter.
+    "VideoDDRPHY"           :  80e6,   # Parallel DDR RGB/Syncs.
+    "VideoHDMIPHY"          :  80e6,   # 10:1 DDR serialization at 5x pix_clk in fabric (ex ECP5: 400MHz).
+    "VideoS6HDMIPHY"        :  75e6,   # Spartan6 OSERDES2 (10:1).
+    "VideoS7HDMIPHY"        :  95e6,   # 7-Series OSERDESE2 (10:1, 950Mbps on -1 HR banks).
+    "VideoS7GTPHDMIPHY"     : 297e6,   # 7-Series GTP (10:1).
+    "VideoS7GTPHDMIPHY2PPC" : 297e6,   # 7-Series GTP (20:1, 2 pixels/clock, HDMI 1.4 2.97Gbps max).
+}
+
+# Pixels per clock of the Video PHYs (when > 1, timings are selected from video_timings_2ppc).
+video_phy_ppc = {
+    "VideoS7GTPHDMIPHY2PPC" : 2,
+}
+
+# Video timings for the 2 pixels/clock PHYs (in pixels, horizontal timings have to be even).
+video_timings_2ppc = {
+    "1920x1080@60Hz": {
+        "pix_clk"       : 148.5e6,
+        "h_active"      : 1920,
+        "h_blanking"    : 280,
+        "h_sync_offset" : 88,
+        "h_sync_width"  : 44,
+        "v_active"      : 1080,
+        "v_blanking"    : 45,
+        "v_sync_offset" : 4,
+        "v_sync_width"  : 5,
+    },
+    "2560x1440@60Hz": { # CVT-RB.
+        "pix_clk"       : 241.5e6,
+        "h_active"      : 2560,
+        "h_blanking"    : 160,
+        "h_sync_offset" : 48,
+        "h_sync_width"  : 32,
+        "v_active"      : 1440,
+        "v_blanking"    : 41,
+        "v_sync_offset" : 3,
+        "v_sync_width"  : 5,
+    },
+    "3840x2160@25Hz": { # CEA-861 VIC 94.
+        "pix_clk"       : 297e6,
+        "h_active"      : 3840,
+        "h_blanking"    : 1440,
+        "h_sync_offset" : 1056,
+        "h_sync_width"  : 88,
+        "v_active"      : 2160,
+        "v_blanking"    : 90,
+        "v_sync_offset" : 8,
+        "v_sync_width"  : 10,
+    },
+    "3840x2160@30Hz": { # CEA-861 VIC 95.
+        "pix_clk"       : 297e6,
+        "h_active"      : 3840,
+        "h_blanking"    : 560,
+        "h_sync_offset" : 176,
+        "h_sync_width"  : 88,
+        "v_active"      : 2160,
+        "v_blanking"    : 90,
+        "v_sync_offset" : 8,
+        "v_sync_width"  : 10,
+    },
+}
+
+# Video PHYs clocks (as multiples of the pixel clock).
+video_phy_clk_ratios = {
+    "VideoHDMIPHY"   : [1, 5],
+    "VideoS6HDMIPHY" : [1, 5],
+    "VideoS7HDMIPHY" : [1, 5],
+}
+
+# Framebuffer DMA share of the DRAM peak bandwidth: refresh/page misses overhead on sequential
+# reads, and bandwidth reserved for each other DRAM master (ex CPU through the L2 cache).
+video_dram_efficiency     = 0.9
+video_dram_master_reserve = 0.1
+
+# Minimum pixel clock of the selectable video timings (TMDS minimum, lower ones are for simulation).
+video_min_pix_clk = 25e6
+
+video_format_bits = {
+    "rgb888" : 32,
+    "rgb565" : 16,
+    "rgb332" :  8,
+    "mono8"  :  8,
+    "mono1"  :  1,
+}
+
+def get_dram_data_width(databits, rate="1:1", memtype="SDR"):
+    # Bits transferred per sys_clk cycle on the LiteDRAM native ports.
+    nphases = int(rate.split(":")[1])
+    return databits*nphases*(1 if memtype == "SDR" else 2)
+
+def _get_video_timings_dict(timings):
+    # 2 pixels/clock timings take precedence (the 4K ones are only defined there).
+    return video_timings_2ppc.get(timings, None) or video_timings[timings]
+
+def get_video_pix_clk(timings):
+    return _get_video_timings_dict(timings)["pix_clk"]
+
+def get_video_timings_2ppc(timings):
+    # Timings for a VideoTimingGenerator running at 2 pixels/clock (horizontal timings/pixel clock halved).
+    t = dict(_get_video_timings_dict(timings))
+    for k in ["h_active", "h_blanking", "h_sync_offset", "h_sync_width"]:
+        assert t[k] % 2 == 0, f"{timings} {k} is not even."
+        t[k] //= 2
+    t["pix_clk"] /= 2
+    return t
+
+def get_video_framebuffer_bandwidth(timings, format="rgb888"):
+    # Average Bytes/s read by the framebuffer DMA (active pixels only, FIFO absorbs the blankings).
+    t = _get_video_timings_dict(timings)
+    h_total = t["h_active"] + t["h_blanking"]
+    v_total = t["v_active"] + t["v_blanking"]
+    return t["pix_clk"]*video_format_bits[format]/8*(t["h_active"]*t["v_active"])/(h_total*v_total)
+
+def get_video_dram_bandwidth(sys_clk_freq, dram_data_width, other_masters=1):
+    # Bytes/s the framebuffer DMA can get from the DRAM.
+    peak = sys_clk_freq*dram_data_width/8
+    return peak*video_dram_efficiency*(1 - video_dram_master_reserve*other_masters)
+
+def get_video_pll_feasible(pll, clkin_freq, clk_freqs):
+    # Check that a (fresh) PLL can generate the clocks (with the default create_clkout margin).
+    pll = pll()
+    pll.register_clkin(Signal(), clkin_freq)
+    for n, clk_freq in enumerate(clk_freqs):
+        pll.create_clkout(ClockDomain(f"video{n}"), clk_freq)
+    try:
+        pll.compute_config()
+    except ValueError:
+        return False
+    return True
+
+def get_video_timings(timings, phy, sys_clk_freq, dram_data_width, format="rgb888", other_masters=1,
+    pll=None, clkin_freq=None, pll_shared_clk_freqs=[]):
+    # Validate the framebuffer video timings against the Video PHY's maximum pixel clock and the
+    # DRAM bandwidth budget (and the video PLL capabilities when pll/clkin_freq are provided, with
+    # the other clocks generated by this PLL in pll_shared_clk_freqs), or select the largest
+    # feasible ones when timings is None. phy is the Video PHY class (or name).
+    phy         = phy if isinstance(phy, str) else phy.__name__
+    max_pix_clk = video_phy_max_pix_clk[phy]
+    clk_ratios  = video_phy_clk_ratios.get(phy, [1])
+    candidates  = video_timings_2ppc if video_phy_ppc.get(phy, 1) == 2 else video_timings
+    budget      = get_video_dram_bandwidth(sys_clk_freq, dram_data_width, other_masters)
+    def check(timings):
+        pix_clk   = candidates[timings]["pix_clk"]
+        bandwidth = get_video_framebuffer_bandwidth(timings, format)
+        if pix_clk > max_pix_clk:
+            return "{} pixel clock ({:3.2f}MHz) exceeds {} maximum ({:3.2f}MHz)".format(
+                timings, pix_clk/1e6, phy, max_pix_clk/1e6)
+        if bandwidth > budget:
+            return "{} {} framebuffer ({:3.2f}MB/s) exceeds DRAM budget ({:3.2f}MB/s: {}-bit at {:3.2f}MHz, {} other master(s))".format(
+                timings, format, bandwidth/1e6, budget/1e6, dram_data_width, sys_clk_freq/1e6, other_masters)
+        if pll is not None and not get_video_pll_feasible(pll, clkin_freq, [r*pix_clk for r in clk_ratios] + pll_shared_clk_freqs):
+            return "{} clocks ({}) can't be generated by the video PLL from {:3.2f}MHz".format(
+                timings, "/".join(f"{r*pix_clk/1e6:3.2f}MHz" for r in clk_ratios), clkin_freq/1e6)
+        return None
+    if timings is None:
+        feasibles = [t for t in candidates.keys()
+            if candidates[t]["pix_clk"] >= video_min_pix_clk and check(t) is None]
+        if not feasibles:
+            raise ValueError(f"No feasible video timings for {phy} with a {budget/1e6:3.2f}MB/s DRAM budget.")
+        return max(feasibles, key=lambda t: (
+            candidates[t]["h_active"]*candidates[t]["v_active"],
+            candidates[t]["pix_clk"],
+            -candidates[t]["h_blanking"]))
+    if timings not in candidates:
+        raise ValueError(f"Unsupported video timings {timings}, supported: {', '.join(candidates.keys())}.")
+    error = check(timings)
+    if error is not None:
+        raise ValueError(f"Infeasible video timings: {error}.")
+    return timings
+
+# TMDS Decoder -------------------------------------------------------------------------------------
+
+class TMDSDecoder(LiteXModule):
+    def __init__(self):
+        self.input = Signal(10)
+        self.de    = Signal()
+        self.c     = Signal(2)
+        self.d     = Signal(8)
+
+        # # #
+
+        d = Signal(8)
+        self.comb += d.eq(Mux(self.input[9], ~self.input[:8], self.input[:8]))
+        self.sync += [
+            self.de.eq(1),
+            Case(self.input, {token: [self.de.eq(0), self.c.eq(n)] for n, token in enumerate(control_tokens)}),
+            self.d[0].eq(d[0]),
+        ]
+        for i in range(1, 8):
+            self.sync += self.d[i].eq(Mux(self.input[8], d[i] ^ d[i-1], ~(d[i] ^ d[i-1])))
+
+# TMDS Word Aligner --------------------------------------------------------------------------------
+
+class TMDSAligner(LiteXModule):
+    # Find the position of the 2 TMDS symbols in the 20-bit words of a deserializer (LSB first),
+    # based on the control tokens sent during blanking.
+    def __init__(self, check_period=2**16, min_tokens=64):
+        self.input   = Signal(20)
+        self.output  = Signal(20)
+        self.aligned = Signal()
+
+        # # #
+
+        last   = Signal(20)
+        offset = Signal(max=10)
+        window = Cat(last, self.input)
+        self.sync += last.eq(self.input)
+        self.sync += self.output.eq(Array([window[k:k + 20] for k in range(10)])[offset])
+
+        # Count words with 2 control tokens over the check period, try next offset if not enough.
+        is_token = Signal(2)
+        tokens   = Signal(max=min_tokens + 1)
+        timer    = Signal(max=check_period)
+        for n in range(2):
+            self.comb += is_token[n].eq(reduce(or_, [self.output[10*n:10*(n + 1)] == t for t in control_tokens]))
+        self.sync += [
+            timer.eq(timer + 1),
+            If((is_token == 0b11) & (tokens != min_tokens),
+                tokens.eq(tokens + 1)
+            ),
+            If(timer == (check_period - 1),
+                timer.eq(0),
+                tokens.eq(0),
+                If(tokens == min_tokens,
+                    self.aligned.eq(1)
+                ).Else(
+                    self.aligned.eq(0),
+                    offset.eq(Mux(offset == 9, 0, offset + 1))
+                )
+            )
+        ]
+
+# HDMI Capture -------------------------------------------------------------------------------------
+
+hdmi_channel_layout = [("d", 16), ("de", 2), ("c", 4)] # 2 symbols per word.
+
+class HDMICaptureChannel(LiteXModule):
+    def __init__(self):
+        self.input   = Signal(20)
+        self.aligned = Signal()
+        self.source  = source = stream.Endpoint(hdmi_channel_layout)
+
+        # # #
+
+        # Word Alignment / Decoding.
+        self.aligner  = aligner = TMDSAligner()
+        self.decoders = decoders = [TMDSDecoder() for _ in range(2)]
+        self.submodules += decoders
+        self.comb += aligner.input.eq(self.input)
+        self.comb += self.aligned.eq(aligner.aligned)
+        for n in range(2):
+            self.comb += decoders[n].input.eq(aligner.output[10*n:10*(n + 1)])
+
+        # Symbol Phase Alignment (so that active video always starts on the first symbol).
+        last_de = Signal()
+        last_d  = Signal(8)
+        last_c  = Signal(2)
+        phase   = Signal()
+        self.sync += [
+            last_de.eq(decoders[1].de),
+            last_d.eq(decoders[1].d),
+            last_c.eq(decoders[1].c),
+            If(~last_de & ~decoders[0].de & decoders[1].de,
+                phase.eq(1)
+            ).Elif(~last_de & decoders[0].de,
+                phase.eq(0)
+            )
+        ]
+        self.comb += [
+            source.valid.eq(1),
+            If(phase,
+                source.d.eq( Cat(last_d,  decoders[0].d)),
+                source.de.eq(Cat(last_de, decoders[0].de)),
+                source.c.eq( Cat(last_c,  decoders[0].c)),
+            ).Else(
+                source.d.eq( Cat(decoders[0].d,  decoders[1].d)),
+                source.de.eq(Cat(decoders[0].de, decoders[1].de)),
+                source.c.eq( Cat(decoders[0].c,  decoders[1].c)),
+            )
+        ]
+
+
+class HDMICapture(LiteXModule):
+    # Capture the 3 TMDS channels (20-bit deserialized words, in a common clock domain) and
+    # output the active pixels (2 pixels per word, 0x00RRGGBB) with first set on the first
+    # word of each frame.
+    def __init__(self, fifo_depth=8):
+        self.inputs  = [Signal(20) for _ in range(3)] # B, G, R.
+        self.aligned = Signal()
+        self.source  = source = stream.Endpoint([("data", 64)])
+
+        # Measurements (Video clock domain).
+        self.h_active = Signal(16)
+        self.v_active = Signal(16)
+
+        # # #
+
+        # Channels.
+        self.channels = channels = [HDMICaptureChannel() for _ in range(3)]
+        self.submodules += channels
+        for n in range(3):
+            self.comb += channels[n].input.eq(self.inputs[n])
+        self.comb += self.aligned.eq(reduce(and_, [channel.aligned for channel in channels]))
+
+        # Channels Deskew: FIFOs start being filled on active video start, then are read together.
+        deskew_reset = Signal()
+        fifos = []
+        for n, channel in enumerate(channels):
+            fifo    = ResetInserter()(stream.SyncFIFO(hdmi_channel_layout, fifo_depth))
+            started = Signal()
+            last_de = Signal()
+            self.submodules += fifo
+            self.sync += last_de.eq(channel.source.de[1])
+            self.sync += [
+                If(channel.source.de[0] & ~last_de,
+                    started.eq(1)
+                ),
+                If(deskew_reset,
+                    started.eq(0)
+                )
+            ]
+            self.comb += [
+                fifo.reset.eq(deskew_reset),
+                channel.source.connect(fifo.sink),
+                fifo.sink.valid.eq(started | (channel.source.de[0] & ~last_de)),
+            ]
+            fifos.append(fifo.source)
+        fifos_valid = reduce(and_, [fifo.valid for fifo in fifos])
+        self.comb += [fifo.ready.eq(fifos_valid) for fifo in fifos]
+        self.comb += If(fifos_valid & ((fifos[0].de != fifos[1].de) | (fifos[0].de != fifos[2].de)),
+            deskew_reset.eq(1)
+        )
+        self.comb += If(~self.aligned, deskew_reset.eq(1))
+
+        # Pixels / Frame Start.
+        de       = Signal()
+        last_de  = Signal()
+        gap      = Signal(24)
+        h_blank  = Signal(24, reset=2**23)
+        h_count  = Signal(16)
+        v_count  = Signal(16)
+        sof      = Signal()
+        self.comb += de.eq(fifos_valid & fifos[0].de[0])
+        self.comb += sof.eq(de & ~last_de & (gap > 2*h_blank))
+        self.sync += [
+            If(fifos_valid,
+                last_de.eq(de),
+                # Blanking gap between active lines (gap larger than twice the line's one: new frame).
+                If(~de,
+                    gap.eq(gap + 1)
+                ).Elif(~last_de,
+                    gap.eq(0),
+                    h_blank.eq(gap)
+                ),
+                # Active pixels/lines.
+                If(de,
+                    h_count.eq(h_count + 2),
+                    If(~last_de,
+                        h_count.eq(2),
+                        v_count.eq(v_count + 1),
+                    )
+                ),
+                If(~de & last_de,
+                    self.h_active.eq(h_count)
+                ),
+                If(sof,
+                    v_count.eq(1),
+                    self.v_active.eq(v_count)
+                )
+            )
+        ]
+        for n in range(2):
+            self.comb += source.data[32*n:32*(n + 1)].eq(Cat(
+                fifos[0].d[8*n:8*(n + 1)], # B.
+                fifos[1].d[8*n:8*(n + 1)], # G.
+                fifos[2].d[8*n:8*(n + 1)], # R.
+            ))
+        self.comb += [
+            source.valid.eq(de),
+            source.first.eq(sof),
+        ]
+
+# Video Ring Buffer --------------------------------------------------------------------------------
+
+class VideoRingBuffer(LiteXModule):
+    # Write the frames of a video stream (first set on the first word of each frame) to a DRAM ring
+    # buffer of nslots frames, and read them back to a stream (ex to PCIe DMA). Frames are dropped
+    # when the ring buffer is full (ex when the reader is not able to follow).
+    def __init__(self, write_port, read_port, base, slot_size, nslots=4):
+        assert nslots >= 2
+        self.sink   = sink   = stream.Endpoint([("data", write_port.data_width)])
+        self.source = source = stream.Endpoint([("data", read_port.data_width)])
+
+        self.frame_size = CSRStorage(32, reset=1920*1080*4, description="Frame size (in bytes).")
+        self.frames     = CSRStatus(32, description="Written frames count.")
+        self.drops      = CSRStatus(32, description="Dropped frames count.")
+        self.dma_frames = CSRStatus(32, description="Read frames count.")
+
+        # # #
+
+        wr_bytes = write_port.data_width//8
+        rd_bytes = read_port.data_width//8
+
+        # Ring buffer pointers (with an extra bit to distinguish full from empty).
+        wr_slot = Signal(max=2*nslots)
+        rd_slot = Signal(max=2*nslots)
+        level   = Signal(max=2*nslots)
+        self.comb += level.eq(Mux(wr_slot >= rd_slot, wr_slot - rd_slot, wr_slot + 2*nslots - rd_slot))
+
+        def slot_next(slot):
+            return Mux(slot == (2*nslots - 1), 0, slot + 1)
+
+        def slot_base(slot, nbytes):
+            return base//nbytes + Mux(slot >= nslots, slot - nslots, slot)*(slot_size//nbytes)
+
+        # Writer.
+        self.writer = writer = LiteDRAMDMAWriter(write_port, fifo_depth=32, fifo_buffered=True)
+        wr_count = Signal(32)
+        wr_words = Signal(32)
+        self.comb += wr_words.eq(self.frame_size.storage[log2_int(wr_bytes):])
+        self.wr_fsm = wr_fsm = FSM(reset_state="IDLE")
+        wr_fsm.act("IDLE",
+            sink.ready.eq(1),
+            NextValue(wr_count, 0),
+            If(sink.valid & sink.first,
+                sink.ready.eq(0),
+                If(level == nslots,
+                    NextValue(self.drops.status, self.drops.status + 1),
+                    NextState("DROP")
+                ).Else(
+                    NextState("WRITE")
+                )
+            )
+        )
+        wr_fsm.act("DROP",
+            sink.ready.eq(1),
+            If(sink.valid & sink.ready,
+                NextState("IDLE")
+            )
+        )
+        wr_fsm.act("WRITE",
+            writer.sink.valid.eq(sink.valid),
+            writer.sink.address.eq(slot_base(wr_slot, wr_bytes) + wr_count),
+            writer.sink.data.eq(sink.data),
+            sink.ready.eq(writer.sink.ready),
+            If(sink.valid & sink.ready,
+                NextValue(wr_count, wr_count + 1),
+                If(wr_count == (wr_words - 1),
+                    NextValue(wr_slot, slot_next(wr_slot)),
+                    NextValue(self.frames.status, self.frames.status + 1),
+                    NextState("IDLE")
+                )
+            ),
+            # Short frame: drop it.
+            If(sink.valid & sink.first & (wr_count != 0),
+                writer.sink.valid.eq(0),
+                sink.ready.eq(0),
+                NextValue(self.drops.status, self.drops.status + 1),
+                NextState("IDLE")
+            )
+        )
+
+        # Reader.
+        self.reader = reader = LiteDRAMDMAReader(read_port, fifo_depth=32, fifo_buffered=True)
+        rd_cmd   = Signal(32)
+        rd_data  = Signal(32)
+        rd_words = Signal(32)
+        self.comb += rd_words.eq(self.frame_size.storage[log2_int(rd_bytes):])
+        self.rd_fsm = rd_fsm = FSM(reset_state="IDLE")
+        rd_fsm.act("IDLE",
+            NextValue(rd_cmd,  0),
+            NextValue(rd_data, 0),
+            If(level != 0,
+                NextState("READ")
+            )
+        )
+        rd_fsm.act("READ",
+            reader.sink.valid.eq(rd_cmd != rd_words),
+            reader.sink.address.eq(slot_base(rd_slot, rd_bytes) + rd_cmd),
+            If(reader.sink.valid & reader.sink.ready,
+                NextValue(rd_cmd, rd_cmd + 1)
+            ),
+            reader.source.connect(source, omit={"last"}),
+            source.last.eq(rd_data == (rd_words - 1)),
+            If(source.valid & source.ready,
+                NextValue(rd_data, rd_data + 1),
+                If(source.last,
+                    NextValue(rd_slot, slot_next(rd_slot)),
+                    NextValue(self.dma_frames.status, self.dma_frames.status + 1),
+                    NextState("IDLE")
+                )
+            )
+        )
+
+# HDMI Capture To DRAM/DMA -------------------------------------------------------------------------
+
+class HDMICaptureDMA(LiteXModule):
+    # HDMI Capture (in clock_domain) -> DRAM Ring Buffer -> Stream (in sys clock domain).
+    def __init__(self, write_port, read_port, base, slot_size, nslots=4, clock_domain="sys"):
+        self.inputs = [Signal(20) for _ in range(3)]
+        self.source = stream.Endpoint([("data", read_port.data_width)])
+
+        self.status = CSRStatus(fields=[
+            CSRField("aligned",  size=1,  offset=0,  description="TMDS channels aligned."),
+            CSRField("h_active", size=16, offset=16, description="Measured active pixels per line."),
+        ])
+        self.v_active = CSRStatus(16, description="Measured active lines per frame.")
+
+        # # #
+
+        # Capture.
+        self.capture = capture = ClockDomainsRenamer(clock_domain)(HDMICapture())
+        for n in range(3):
+            self.comb += capture.inputs[n].eq(self.inputs[n])
+        self.specials += [
+            MultiReg(capture.aligned,  self.status.fields.aligned),
+            MultiReg(capture.h_active, self.status.fields.h_active),
+            MultiReg(capture.v_active, self.v_active.status),
+        ]
+
+        # Clock Domain Crossing (no backpressure on video, frames with lost pixels will be dropped
+        # as short frames by the ring buffer).
+        self.cdc = cdc = stream.ClockDomainCrossing([("data", 64)], cd_from=clock_domain, cd_to="sys", depth=64)
+        self.comb += capture.source.connect(cdc.sink)
+
+        # DRAM Ring Buffer.
+        self.ringbuffer = ringbuffer = VideoRingBuffer(write_port, read_port, base, slot_size, nslots)
+        self.comb += cdc.source.connect(ringbuffer.sink)
+        self.comb += ringbuffer.source.connect(self.source)
+
+# Video FrameBuffer Page Flipper -------------------------------------------------------------------
+
+class VideoFrameBufferPageFlipper(LiteXModule):
+    # Sits between a VideoFrameBuffer and its DRAM port and offsets the DMA addresses by the page
+    # being scanned out (nbuffers pages of stride bytes). Flips requested through the flip CSR are
+    # only applied once the last word of the current frame has been requested by the DMA (or
+    # directly when the DMA is disabled), so the CPU/Blitter can draw in a back page without tearing.
+    def __init__(self, dram_port, nbuffers=2, stride=0):
+        assert nbuffers >= 2
+        self.enable = Signal(reset=1) # FrameBuffer DMA enable.
+        self.port = port = LiteDRAMNativePort(
+            mode          = dram_port.mode,
+            address_width = dram_port.address_width,
+            data_width    = dram_port.data_width,
+            clock_domain  = dram_port.clock_domain,
+            id            = dram_port.id,
+        )
+
+        self.stride = CSRStorage(32, reset=stride, description="Page stride (in bytes).")
+        self.flip   = CSRStorage(fields=[
+            CSRField("page", size=bits_for(nbuffers - 1), offset=0, description="Page to scan out from the next frame."),
+        ])
+        self.status = CSRStatus(fields=[
+            CSRField("page",    size=bits_for(nbuffers - 1), offset=0, description="Page being scanned out."),
+            CSRField("pending", size=1,                      offset=8, description="Flip pending (applied at the end of the current frame)."),
+        ])
+        self.frames = CSRStatus(32, description="Scanned out frames count (to wait for the next frame).")
+
+        # # #
+
+        shift = log2_int(dram_port.data_width//8)
+
+        # Page/Flip.
+        page      = Signal(bits_for(nbuffers - 1))
+        pending   = Signal()
+        offset    = Signal(dram_port.address_width)
+        frame_end = Signal()
+        self.comb += frame_end.eq(port.cmd.valid & port.cmd.ready & port.cmd.last)
+        self.sync += [
+            If(self.flip.re,
+                pending.eq(1),
+            ).Elif((frame_end | ~self.enable) & pending,
+                pending.eq(0),
+                page.eq(self.flip.fields.page),
+                offset.eq(self.flip.fields.page*self.stride.storage[shift:]),
+            ),
+            If(frame_end,
+                self.frames.status.eq(self.frames.status + 1)
+            )
+        ]
+        self.comb += [
+            self.status.fields.page.eq(page),
+            self.status.fields.pending.eq(pending),
+        ]
+
+        # Port (Commands offset by the page, Data unchanged).
+        self.comb += [
+            port.cmd.connect(dram_port.cmd, omit={"addr"}),
+            dram_port.cmd.addr.eq(port.cmd.addr + offset),
+            dram_port.flush.eq(port.flush),
+            port.lock.eq(dram_port.lock),
+            dram_port.rdata.connect(port.rdata),
+        ]
+        if dram_port.mode in ["write", "both"]:
+            self.comb += port.wdata.connect(dram_port.wdata)
+
+# Video Blitter ------------------------------------------------------------------------------------
+
+class VideoBlitter(LiteXModule):
+    # DMA 2D Fill/Copy engine: fills (with a 32-bit pattern) or copies (from src) a rectangle of
+    # width bytes x height lines to dst, lines separated by src_stride/dst_stride bytes. Addresses,
+    # width and strides have to be aligned on the DRAM port data width (edges not aligned are left
+    # to the CPU).
+    def __init__(self, read_port, write_port):
+        assert read_port.data_width == write_port.data_width
+        self.control = CSRStorage(fields=[
+            CSRField("start", size=1, offset=0, pulse=True, description="Start operation."),
+            CSRField("mode",  size=1, offset=1, values=[
+                ("``0b0``", "Fill."),
+                ("``0b1``", "Copy."),
+            ]),
+        ])
+        self.src        = CSRStorage(32, description="Copy source address (in bytes).")
+        self.dst        = CSRStorage(32, description="Destination address (in bytes).")
+        self.width      = CSRStorage(16, description="Rectangle width (in bytes).")
+        self.height     = CSRStorage(16, description="Rectangle height (in lines).")
+        self.src_stride = CSRStorage(32, description="Source line stride (in bytes).")
+        self.dst_stride = CSRStorage(32, description="Destination line stride (in bytes).")
+        self.color      = CSRStorage(32, description="Fill pattern (replicated over the DRAM words).")
+        self.status     = CSRStatus(fields=[
+            CSRField("busy", size=1, offset=0, description="Operation ongoing."),
+        ])
+        self.cycles     = CSRStatus(32, description="Duration of the last operation (in sys_clk cycles).")
+
+        # # #
+
+        dw    = write_port.data_width
+        aw    = write_port.address_width
+        shift = log2_int(dw//8)
+        copy  = Signal()
+        words = Signal(16)
+        self.comb += words.eq(self.width.storage[shift:])
+
+        # DMAs.
+        self.reader = reader = LiteDRAMDMAReader(read_port,  fifo_depth=32, fifo_buffered=True)
+        self.writer = writer = LiteDRAMDMAWriter(write_port, fifo_depth=32, fifo_buffered=True)
+
+        # Reader/Writer Address Generators (x in words, line base incremented by the stride).
+        rd_x    = Signal(16)
+        rd_y    = Signal(16)
+        rd_line = Signal(aw)
+        wr_x    = Signal(16)
+        wr_y    = Signal(16)
+        wr_line = Signal(aw)
+        rd_end  = Signal()
+        wr_end  = Signal()
+        self.comb += [
+            rd_end.eq(rd_y == self.height.storage),
+            wr_end.eq(wr_y == self.height.storage),
+        ]
+
+        # Writes posted to the DRAM controller.
+        wr_pending = Signal(8)
+        self.sync += wr_pending.eq(wr_pending
+            + (writer.sink.valid & writer.sink.ready)
+            - (write_port.wdata.valid & write_port.wdata.ready))
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(self.control.fields.start,
+                NextValue(copy, self.control.fields.mode),
+                NextValue(rd_x, 0),
+                NextValue(rd_y, 0),
+                NextValue(rd_line, self.src.storage[shift:]),
+                NextValue(wr_x, 0),
+                NextValue(wr_y, 0),
+                NextValue(wr_line, self.dst.storage[shift:]),
+                NextValue(self.cycles.status, 0),
+                NextState("RUN")
+            )
+        )
+        fsm.act("RUN",
+            self.status.fields.busy.eq(1),
+            NextValue(self.cycles.status, self.cycles.status + 1),
+            # Reader (Copy only).
+            reader.sink.valid.eq(copy & ~rd_end & (words != 0)),
+            reader.sink.address.eq(rd_line + rd_x),
+            If(reader.sink.valid & reader.sink.ready,
+                NextValue(rd_x, rd_x + 1),
+                If(rd_x == (words - 1),
+                    NextValue(rd_x, 0),
+                    NextValue(rd_y, rd_y + 1),
+                    NextValue(rd_line, rd_line + self.src_stride.storage[shift:]),
+                )
+            ),
+            # Writer (Copy from Reader or Fill).
+            writer.sink.valid.eq(~wr_end & (words != 0) & (~copy | reader.source.valid)),
+            writer.sink.address.eq(wr_line + wr_x),
+            writer.sink.data.eq(Mux(copy, reader.source.data, Replicate(self.color.storage, max(dw//32, 1))[:dw])),
+            reader.source.ready.eq(copy & writer.sink.valid & writer.sink.ready),
+            If(writer.sink.valid & writer.sink.ready,
+                NextValue(wr_x, wr_x + 1),
+                If(wr_x == (words - 1),
+                    NextValue(wr_x, 0),
+                    NextValue(wr_y, wr_y + 1),
+                    NextValue(wr_line, wr_line + self.dst_stride.storage[shift:]),
+                )
+            ),
+            # Done when all the writes have been posted.
+            If((wr_end | (words == 0)) & (wr_pending == 0),
+                NextState("IDLE")
+            )
+        )
+
+def add_video_page_flip_framebuffer(soc, name="video_framebuffer", phy=None, timings="800x600@60Hz",
+    clock_domain="sys", format="rgb888", nbuffers=2, fifo_depth=64*KILOBYTE, with_blitter=False):
+    # Same as SoC.add_video_framebuffer with nbuffers pages (and a VideoFrameBufferPageFlipper
+    # as {name}_flipper) and an optional VideoBlitter (as video_blitter) on its own DRAM ports.
+    from litex.soc.cores.video import VideoTimingGenerator, VideoFrameBuffer
+
+    # Video Timing Generator.
+    vtg = VideoTimingGenerator(default_video_timings=timings if isinstance(timings, str) else timings[1])
+    vtg = ClockDomainsRenamer(clock_domain)(vtg)
+    soc.add_module(name=f"{name}_vtg", module=vtg)
+
+    # Pages.
+    timings = timings if isinstance(timings, str) else timings[0]
+    hres    = int(timings.split("@")[0].split("x")[0])
+    vres    = int(timings.split("@")[0].split("x")[1])
+    stride  = -(-hres*vres*video_format_bits[format]//8 // 4096)*4096
+    base    = soc.mem_map.get(name, None)
+    if base is None:
+        soc.bus.add_region(name, SoCRegion(
+            origin = 0x40c00000,
+            size   = max(0x800000, 2**log2_int(nbuffers*stride, need_pow2=False)),
+            linker = True)
+        )
+        base = soc.bus.regions[name].origin
+
+    # Video FrameBuffer (through the Page Flipper).
+    flipper = VideoFrameBufferPageFlipper(soc.sdram.crossbar.get_port(mode="read"), nbuffers=nbuffers, stride=stride)
+    soc.add_module(name=f"{name}_flipper", module=flipper)
+    vfb = VideoFrameBuffer(flipper.port,
+        hres                  = hres,
+        vres                  = vres,
+        base                  = base,
+        fifo_depth            = fifo_depth,
+        format                = format,
+        clock_domain          = clock_domain,
+        clock_faster_than_sys = vtg.video_timings["pix_clk"] >= soc.sys_clk_freq,
+    )
+    soc.add_module(name=name, module=vfb)
+    soc.comb += flipper.enable.eq(vfb.dma.enable)
+    soc.comb += vtg.source.connect(vfb.vtg_sink)
+    soc.comb += vfb.source.connect(phy if isinstance(phy, stream.Endpoint) else phy.sink)
+
+    # Video Blitter.
+    if with_blitter:
+        blitter = VideoBlitter(
+            read_port  = soc.sdram.crossbar.get_port(mode="read"),
+            write_port = soc.sdram.crossbar.get_port(mode="write"),
+        )
+        soc.add_module(name="video_blitter", module=blitter)
+
+    # Constants.
+    soc.add_constant("VIDEO_FRAMEBUFFER_BASE",     base)
+    soc.add_constant("VIDEO_FRAMEBUFFER_HRES",     hres)
+    soc.add_constant("VIDEO_FRAMEBUFFER_VRES",     vres)
+    soc.add_constant("VIDEO_FRAMEBUFFER_DEPTH",    vfb.depth)
+    soc.add_constant("VIDEO_FRAMEBUFFER_NBUFFERS", nbuffers)
+    soc.add_constant("VIDEO_FRAMEBUFFER_STRIDE",   stride)
+
+# 2 Pixels/Clock Video (4K) ------------------------------------------------------------------------
+
+video_data_layout_2ppc = [
+    # Synchronization signals (shared by the 2 pixels).
+    ("hsync", 1),
+    ("vsync", 1),
+    ("de",    1),
+    # Data signals (pixel 0 first on the link).
+    ("r0",    8),
+    ("g0",    8),
+    ("b0",    8),
+    ("r1",    8),
+    ("g1",    8),
+    ("b1",    8),
+]
+
+class TMDSEncoder2PPC(LiteXModule):
+    # TMDS Encoder for 2 pixels/clock: Same pipeline as LiteX's TMDSEncoder with the DC balancing
+    # (running disparity) of the 2nd pixel chained on the 1st one in the final stage. out is the
+    # 20-bit symbols pair (pixel 0 in LSBs).
+    def __init__(self):
+        self.d   = [Signal(8), Signal(8)]
+        self.c   = Signal(2)
+        self.de  = Signal()
+
+        self.out = Signal(20)
+
+        # # #
+
+        # Stage 1 - Count number of 1s in data.
+        d   = [Signal(8)     for _ in range(2)]
+        n1d = [Signal(max=9) for _ in range(2)]
+        for i in range(2):
+            self.sync += [
+                n1d[i].eq(Reduce("ADD", [self.d[i][j] for j in range(8)])),
+                d[i].eq(self.d[i])
+            ]
+
+        # Stage 2 - Add 9th bit.
+        q_m = [Signal(9) for _ in range(2)]
+        for i in range(2):
+            q_m8_n = Signal()
+            self.comb += q_m8_n.eq((n1d[i] > 4) | ((n1d[i] == 4) & ~d[i][0]))
+            for j in range(8):
+                if j:
+                    curval = curval ^ d[i][j] ^ q_m8_n
+                else:
+                    curval = d[i][0]
+                self.sync += q_m[i][j].eq(curval)
+            self.sync += q_m[i][8].eq(~q_m8_n)
+
+        # Stage 3 - Count number of 1s and 0s in q_m[:8].
+        q_m_r = [Signal(9)     for _ in range(2)]
+        n0q_m = [Signal(max=9) for _ in range(2)]
+        n1q_m = [Signal(max=9) for _ in range(2)]
+        for i in range(2):
+            self.sync += [
+                n0q_m[i].eq(Reduce("ADD", [~q_m[i][j] for j in range(8)])),
+                n1q_m[i].eq(Reduce("ADD", [q_m[i][j] for j in range(8)])),
+                q_m_r[i].eq(q_m[i])
+            ]
+
+        # Stage 4 - Final encoding (Pixel 1 uses the disparity after Pixel 0).
+        s_c  = self.c
+        s_de = self.de
+        for p in range(3):
+            new_c  = Signal(2)
+            new_de = Signal()
+            self.sync += new_c.eq(s_c), new_de.eq(s_de)
+            s_c, s_de = new_c, new_de
+
+        cnt  = Signal((6, True))
+        cnts = [cnt, Signal((6, True)), Signal((6, True))]
+        outs = [Signal(10), Signal(10)]
+        for i in range(2):
+            self.comb += [
+                If((cnts[i] == 0) | (n1q_m[i] == n0q_m[i]),
+                    outs[i][9].eq(~q_m_r[i][8]),
+                    outs[i][8].eq(q_m_r[i][8]),
+                    If(q_m_r[i][8],
+                        outs[i][:8].eq(q_m_r[i][:8]),
+                        cnts[i+1].eq(cnts[i] + n1q_m[i] - n0q_m[i])
+                    ).Else(
+                        outs[i][:8].eq(~q_m_r[i][:8]),
+                        cnts[i+1].eq(cnts[i] + n0q_m[i] - n1q_m[i])
+                    )
+                ).Else(
+                    If((~cnts[i][5] & (n1q_m[i] > n0q_m[i])) | (cnts[i][5] & (n0q_m[i] > n1q_m[i])),
+                        outs[i][9].eq(1),
+                        outs[i][8].eq(q_m_r[i][8]),
+                        outs[i][:8].eq(~q_m_r[i][:8]),
+                        cnts[i+1].eq(cnts[i] + Cat(0, q_m_r[i][8]) + n0q_m[i] - n1q_m[i])
+                    ).Else(
+                        outs[i][9].eq(0),
+                        outs[i][8].eq(q_m_r[i][8]),
+                        outs[i][:8].eq(q_m_r[i][:8]),
+                        cnts[i+1].eq(cnts[i] - Cat(0, ~q_m_r[i][8]) + n1q_m[i] - n0q_m[i])
+                    )
+                )
+            ]
+        self.sync += [
+            If(s_de,
+                self.out.eq(Cat(*outs)),
+                cnt.eq(cnts[2])
+            ).Else(
+                self.out.eq(Cat(Array(control_tokens)[s_c], Array(control_tokens)[s_c])),
+                cnt.eq(0)
+            )
+        ]
+
+class VideoFrameBuffer2PPC(LiteXModule):
+    # RGB888 Video FrameBuffer at 2 pixels/clock: Same structure than LiteX's VideoFrameBuffer (DMA
+    # looping on the frame, resynchronized on the VTG's end of frame) with a DMA reader on a full
+    # width DRAM port and a deep prefetch FIFO to absorb the DRAM latencies at 4K rates. Underflows
+    # (active pixel pairs without data) are counted in the video domain and reported in sys.
+    def __init__(self, dram_port, hres=3840, vres=2160, base=0x00000000, fifo_depth=128*KILOBYTE, clock_domain="sys"):
+        self.vtg_sink = vtg_sink = stream.Endpoint(video_timing_layout)
+        self.source   = source   = stream.Endpoint(video_data_layout_2ppc)
+        self.depth    = depth    = 32
+
+        self.underflows = CSRStatus(32, description="Active pixel pairs without data (DMA underflows) count.")
+
+        # # #
+
+        # Video DMA.
+        assert dram_port.data_width >= 2*depth
+        self.dma = LiteDRAMDMAReader(dram_port, fifo_depth=fifo_depth//(dram_port.data_width//8), fifo_buffered=True)
+        self.dma.add_csr(
+            default_base   = base,
+            default_length = hres*vres*depth//8,
+            default_enable = 0,
+            default_loop   = 1
+        )
+
+        # Data-Width Conversion (to pixel pairs) and Clock Domain Crossing.
+        self.conv = stream.Converter(dram_port.data_width, 2*depth)
+        self.cdc  = stream.ClockDomainCrossing([("data", 2*depth)], cd_from="sys", cd_to=clock_domain, depth=64)
+        self.comb += self.dma.source.connect(self.conv.sink)
+        self.comb += self.conv.source.connect(self.cdc.sink)
+        video_pipe_source = self.cdc.source
+
+        # Video Synchronization/Generation (as LiteX's VideoFrameBuffer).
+        first = Signal()
+        fsm = FSM(reset_state="SYNC")
+        fsm = ClockDomainsRenamer(clock_domain)(fsm)
+        fsm = ResetInserter()(fsm)
+        self.submodules += fsm
+        self.specials += MultiReg(self.dma.fsm.reset, fsm.reset, clock_domain)
+        underflow = Signal()
+        fsm.act("SYNC",
+            vtg_sink.ready.eq(1),
+            If(fsm.reset,
+                vtg_sink.ready.eq(0),
+                NextValue(first, 1)
+            ),
+            If(vtg_sink.valid & vtg_sink.last,
+                NextState("RUN")
+            ),
+            vtg_sink.connect(source, keep={"hsync", "vsync"}),
+        )
+        fsm.act("RUN",
+            vtg_sink.ready.eq(1),
+            If(vtg_sink.valid & vtg_sink.de,
+                video_pipe_source.connect(source, keep={"valid", "ready"}),
+                If(first,
+                    source.valid.eq(0)
+                ),
+                underflow.eq(~first & ~video_pipe_source.valid),
+                vtg_sink.ready.eq(source.valid & source.ready),
+                If(video_pipe_source.valid & video_pipe_source.last,
+                    NextValue(first, 0),
+                    NextState("SYNC"),
+                )
+            ),
+            vtg_sink.connect(source, keep={"de", "hsync", "vsync"}),
+        )
+        self.comb += [
+            source.r0.eq(video_pipe_source.data[ 0: 8]),
+            source.g0.eq(video_pipe_source.data[ 8:16]),
+            source.b0.eq(video_pipe_source.data[16:24]),
+            source.r1.eq(video_pipe_source.data[32:40]),
+            source.g1.eq(video_pipe_source.data[40:48]),
+            source.b1.eq(video_pipe_source.data[48:56]),
+        ]
+
+        # Underflows.
+        underflows = Signal(32)
+        sync = getattr(self.sync, clock_domain)
+        sync += If(underflow, underflows.eq(underflows + 1))
+        if clock_domain == "sys":
+            self.comb += self.underflows.status.eq(underflows)
+        else:
+            self.underflows_sync = BusSynchronizer(32, clock_domain, "sys")
+            self.comb += self.underflows_sync.i.eq(underflows)
+            self.comb += self.underflows.status.eq(self.underflows_sync.o)
+
+class VideoS7GTPHDMIPHY2PPC(LiteXModule):
+    # HDMI PHY over 7-Series GTPs at 2 pixels/clock: Same as LiteX's VideoS7GTPHDMIPHY with the 20
+    # bits of the 2 TMDS symbols serialized directly by the GTPs (so up to 297MHz pixel clock/2.97Gbps
+    # with clock_domain at pix_clk/2). The HDMI clock is forwarded from clock_domain_2x (pix_clk).
+    def __init__(self, pads, sys_clk_freq, clock_domain="sys", clock_domain_2x="sys2x", clk_freq=148.5e6, refclk=None):
+        assert sys_clk_freq >= clk_freq
+        self.sink = sink = stream.Endpoint(video_data_layout_2ppc)
+
+        # # #
+
+        from litex.build.io import DDROutput
+        from liteiclink.serdes.gtp_7series import GTPQuadPLL, GTP
+
+        # Always ack Sink, no backpressure.
+        self.comb += sink.ready.eq(1)
+
+        # Clocking + Differential Signaling.
+        pads_clk = Signal()
+        self.specials += DDROutput(i1=1, i2=0, o=pads_clk, clk=ClockSignal(clock_domain_2x))
+        self.specials += Instance("OBUFDS", i_I=pads_clk, o_O=pads.clk_p, o_OB=pads.clk_n)
+
+        # GTP Quad PLL.
+        if refclk is None:
+            # No RefClk provided, use the Video Clk as GTP RefClk.
+            refclk = ClockSignal(clock_domain)
+        self.pll = pll = GTPQuadPLL(refclk, clk_freq, 20*clk_freq)
+
+        # Encode/Serialize Datas.
+        for color, channel in {"b": 0, "g": 1, "r": 2}.items():
+            # TMDS Encoding (2 pixels/clock).
+            encoder = ClockDomainsRenamer(clock_domain)(TMDSEncoder2PPC())
+            self.submodules += encoder
+            self.comb += encoder.d[0].eq(getattr(sink, f"{color}0"))
+            self.comb += encoder.d[1].eq(getattr(sink, f"{color}1"))
+            self.comb += encoder.c.eq(Cat(sink.hsync, sink.vsync) if channel == 0 else 0)
+            self.comb += encoder.de.eq(sink.de)
+
+            # Clock Domain Crossing (video_clk --> gtp_tx)
+            cdc = stream.ClockDomainCrossing([("data", 20)], cd_from=clock_domain, cd_to=f"gtp{color}_tx")
+            self.submodules += cdc
+            self.comb += cdc.sink.valid.eq(1)
+            self.comb += cdc.sink.data.eq(encoder.out)
+            self.comb += cdc.source.ready.eq(1) # No backpressure.
+
+            # 20:1 Serialization + Differential Signaling.
+            class GTPPads:
+                def __init__(self, p, n):
+                    self.p = p
+                    self.n = n
+            tx_pads = GTPPads(p=getattr(pads, f"data{channel}_p"), n=getattr(pads, f"data{channel}_n"))
+            # FIXME: Find a way to avoid RX pads.
+            rx_pads = GTPPads(p=getattr(pads, f"rx{channel}_p"),    n=getattr(pads, f"rx{channel}_n"))
+            gtp = GTP(pll, tx_pads, rx_pads=rx_pads, sys_clk_freq=sys_clk_freq,
+                tx_polarity      = 1, # FIXME: Specific to Decklink Mini 4K, make it configurable.
+                tx_buffer_enable = True,
+                rx_buffer_enable = True,
+                clock_aligner    = False
+            )
+            setattr(self.submodules, f"gtp{color}", gtp)
+            self.comb += gtp.tx_produce_pattern.eq(1)
+            self.comb += gtp.tx_pattern.eq(cdc.source.data)
+
+def add_video_framebuffer_2ppc(soc, name="video_framebuffer", phy=None, timings="3840x2160@30Hz",
+    clock_domain="sys", fifo_depth=128*KILOBYTE):
+    # Same as SoC.add_video_framebuffer for 2 pixels/clock PHYs (RGB888 only, clock_domain at pix_clk/2).
+    from litex.soc.cores.video import VideoTimingGenerator
+
+    # Video Timing Generator (at 2 pixels/clock).
+    vtg = VideoTimingGenerator(default_video_timings=get_video_timings_2ppc(timings))
+    vtg = ClockDomainsRenamer(clock_domain)(vtg)
+    soc.add_module(name=f"{name}_vtg", module=vtg)
+
+    # Video FrameBuffer.
+    hres = int(timings.split("@")[0].split("x")[0])
+    vres = int(timings.split("@")[0].split("x")[1])
+    base = soc.mem_map.get(name, None)
+    if base is None:
+        soc.bus.add_region(name, SoCRegion(
+            origin = 0x40c00000,
+            size   = max(0x800000, 2**log2_int(hres*vres*4, need_pow2=False)),
+            linker = True)
+        )
+        base = soc.bus.regions[name].origin
+    vfb = VideoFrameBuffer2PPC(soc.sdram.crossbar.get_port(mode="read"),
+        hres         = hres,
+        vres         = vres,
+        base         = base,
+        fifo_depth   = fifo_depth,
+        clock_domain = clock_domain,
+    )
+    soc.add_module(name=name, module=vfb)
+    soc.comb += vtg.source.connect(vfb.vtg_sink)
+    soc.comb += vfb.source.connect(phy.sink)
+
+    # Constants.
+    soc.add_constant("VIDEO_FRAMEBUFFER_BASE",  base)
+    soc.add_constant("VIDEO_FRAMEBUFFER_HRES",  hres)
+    soc.add_constant("VIDEO_FRAMEBUFFER_VRES",  vres)
+    soc.add_constant("VIDEO_FRAMEBUFFER_DEPTH", vfb.depth)
@@ -0,0 +1,200 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Xilinx configuration (bitstream loading from SPI Flash) helpers shared by the platforms/targets.
+#
+# Platforms declare the configuration SPI Flash part and the number of data lines wired to the FPGA:
+#
+#   class Platform(Xilinx7SeriesPlatform):
+#       config_flash_part     = "s25fl128s"
+#       config_flash_buswidth = 4
+#
+# and targets apply the fastest safe configuration settings (compression, bus width and the highest
+# master CCLK rate the Flash still supports with the CCLK oscillator tolerance) with --fast-config.
+
+import re
+
+# Configuration Flashes ----------------------------------------------------------------------------
+
+# Maximum SPI clock frequency of the (Quad/Fast) Read commands used by the FPGA configuration logic.
+config_flash_max_freq = {
+    # Spansion/Cypress/Infineon.
+    "s25fl032p" : 80e6,
+    "s25fl128l" : 133e6,
+    "s25fl128s" : 104e6,
+    "s25fl256l" : 133e6,
+    "s25fl256s" : 104e6,
+    # Micron.
+    "n25q032"   : 108e6,
+    "n25q064"   : 108e6,
+    "n25q128"   : 108e6,
+    "n25q256"   : 108e6,
+    "mt25ql128" : 133e6,
+    "mt25ql256" : 133e6,
+    "mt25qu256" : 133e6,
+    "mt25qu01g" : 133e6,
+    "mt25qu02g" : 133e6,
+    # Macronix.
+    "mx25l25645g" : 133e6,
+    # ISSI.
+    "is25lp128" : 133e6,
+    "is25lp256" : 133e6,
+    # Winbond.
+    "w25q128"   : 104e6,
+}
+
+def get_config_flash_max_freq(part):
+    # Parts are matched on their prefix (ex: "N25Q128A13ESE40F" -> "n25q128").
+    part = part.lower()
+    for name in sorted(config_flash_max_freq.keys(), key=len, reverse=True):
+        if part.startswith(name):
+            return config_flash_max_freq[name]
+    raise ValueError(f"Unknown configuration Flash {part}, supported: {', '.join(config_flash_max_freq.keys())}.")
+
+# FPGA Families ------------------------------------------------------------------------------------
+
+# Master CCLK rates (MHz), CCLK oscillator tolerance and bus widths of the SPI configuration modes.
+config_families = {
+    "spartan6" : {
+        "rates"     : [2, 4, 6, 10, 12, 16, 22, 26, 33],
+        "tolerance" : 0.50,
+        "buswidths" : [1, 2, 4],
+    },
+    "7series" : {
+        "rates"     : [3, 6, 9, 12, 16, 22, 26, 33, 40, 50, 66],
+        "tolerance" : 0.50,
+        "buswidths" : [1, 2, 4],
+    },
+    "ultrascale" : {
+        "rates"     : [3.0, 6.0, 9.0, 12.0, 16.0, 22.0, 26.0, 33.0, 40.0, 50.0, 66.0, 85.0],
+        "tolerance" : 0.15,
+        "buswidths" : [1, 2, 4, 8],
+    },
+}
+
+def get_config_family(device):
+    device = device.lower()
+    if device.startswith("xc6s"):
+        return "spartan6"
+    if device.startswith(("xc7z", "xczu", "xck26")):
+        return None # PL configured by the PS.
+    if device.startswith("xc7"):
+        return "7series"
+    if device.startswith(("xcku", "xcvu", "xcau", "xcu")):
+        return "ultrascale"
+    return None
+
+# Uncompressed bitstream sizes (bits, from the configuration user guides).
+config_bitstream_bits = {
+    "xc6slx9"   :   2742528,
+    "xc6slx16"  :   3731264,
+    "xc6slx25"  :   6440432,
+    "xc6slx45"  :  11939296,
+    "xc6slx150" :  33761696,
+    "xc7a35t"   :  17536096,
+    "xc7a50t"   :  17536096,
+    "xc7a75t"   :  30606304,
+    "xc7a100t"  :  30606304,
+    "xc7a200t"  :  77845216,
+    "xc7s15"    :   4310752,
+    "xc7s25"    :   9934432,
+    "xc7s50"    :  17536096,
+    "xc7k70t"   :  24090592,
+    "xc7k160t"  :  53540576,
+    "xc7k325t"  :  91548896,
+    "xc7k410t"  : 127023328,
+    "xc7k420t"  : 149880032,
+    "xc7vx485t" : 162187488,
+    "xcku040"   : 128055264,
+    "xcvu9p"    : 641272864,
+    "xcu200"    : 641272864, # VU9P.
+}
+
+def get_config_bitstream_bits(device):
+    device = device.lower()
+    for name in sorted(config_bitstream_bits.keys(), key=len, reverse=True):
+        if device.startswith(name):
+            return config_bitstream_bits[name]
+    return None
+
+# Fast Configuration -------------------------------------------------------------------------------
+
+def get_fast_config(device, flash_part, buswidth):
+    # Fastest safe settings: highest CCLK rate whose upper tolerance bound stays within the Flash
+    # maximum frequency, with the platform's bus width.
+    family = get_config_family(device)
+    if family is None:
+        raise ValueError(f"{device}: no master SPI configuration (PL configured by the PS or unknown family).")
+    settings = config_families[family]
+    if buswidth not in settings["buswidths"]:
+        raise ValueError(f"{device}: unsupported SPI configuration bus width {buswidth}.")
+    max_freq = get_config_flash_max_freq(flash_part)
+    rates    = [r for r in settings["rates"] if r*1e6*(1 + settings["tolerance"]) <= max_freq]
+    return {
+        "family"   : family,
+        "rate"     : max(rates),
+        "buswidth" : buswidth,
+        "compress" : True,
+    }
+
+def get_config_time(device, rate, buswidth, compress_ratio=1.0, tolerance=0.0):
+    # Bitstream load time estimate (s) at the slowest CCLK of the tolerance range, compress_ratio is
+    # the compressed/uncompressed bitstream size ratio (design dependent).
+    bits = get_config_bitstream_bits(device)
+    if bits is None:
+        return None
+    return bits*compress_ratio/(rate*1e6*(1 - tolerance)*buswidth)
+
+_config_properties = ["BITSTREAM.CONFIG.CONFIGRATE", "BITSTREAM.CONFIG.SPI_BUSWIDTH", "BITSTREAM.GENERAL.COMPRESS", "CONFIG_MODE"]
+
+def get_platform_config(platform):
+    # Current configuration settings of a platform (from its bitstream/platform commands).
+    commands = list(getattr(platform.toolchain, "bitstream_commands", []))
+    commands += [c for c, _ in platform.constraint_manager.platform_commands]
+    config   = {"rate": None, "buswidth": 1, "compress": False}
+    for command in commands:
+        for prop, key in [("CONFIGRATE", "rate"), ("SPI_BUSWIDTH", "buswidth")]:
+            m = re.search(rf"BITSTREAM\.CONFIG\.{prop}\s+([0-9.]+)", command)
+            if m is not None:
+                config[key] = float(m.group(1)) if key == "rate" else int(m.group(1))
+        if re.search(r"BITSTREAM\.GENERAL\.COMPRESS\s+true", command, re.IGNORECASE):
+            config["compress"] = True
+    bitgen_opt = getattr(platform.toolchain, "bitgen_opt", "")
+    m = re.search(r"ConfigRate:([0-9.]+)", bitgen_opt)
+    if m is not None:
+        config["rate"] = float(m.group(1))
+    m = re.search(r"SPI_buswidth:([0-9])", bitgen_opt)
+    if m is not None:
+        config["buswidth"] = int(m.group(1))
+    if "-g Compress" in bitgen_opt:
+        config["compress"] = True
+    if config["rate"] is None:
+        config["rate"] = {"spartan6": 2, "7series": 3, "ultrascale": 3.0}.get(get_config_family(platform.device), None)
+    return config
+
+def apply_fast_config(platform):
+    # Replace the configuration settings of the platform with the fastest safe ones.
+    part = getattr(platform, "config_flash_part", None)
+    if part is None:
+        raise ValueError(f"{platform.name}: no config_flash_part declared, can't select a safe configuration rate.")
+    config = get_fast_config(platform.device, part, getattr(platform, "config_flash_buswidth", 1))
+    if config["family"] == "spartan6":
+        bitgen_opt = re.sub(r"\s*-g (Compress|ConfigRate:\S+|SPI_buswidth:\S+)", "", platform.toolchain.bitgen_opt)
+        platform.toolchain.bitgen_opt = bitgen_opt + " -g Compress -g ConfigRate:{} -g SPI_buswidth:{}".format(
+            config["rate"], config["buswidth"])
+    else:
+        if not hasattr(platform.toolchain, "bitstream_commands"):
+            raise ValueError(f"{platform.name}: --fast-config is only supported with Vivado.")
+        def keep(command):
+            return not any(p in command for p in _config_properties)
+        platform.toolchain.bitstream_commands = [c for c in platform.toolchain.bitstream_commands if keep(c)]
+        platform.constraint_manager.platform_commands = [(c, s) for c, s in platform.constraint_manager.platform_commands if keep(c)]
+        platform.toolchain.bitstream_commands += [
+            "set_property BITSTREAM.GENERAL.COMPRESS TRUE [current_design]",
+            "set_property BITSTREAM.CONFIG.SPI_BUSWIDTH {} [current_design]".format(config["buswidth"]),
+            "set_property BITSTREAM.CONFIG.CONFIGRATE {} [current_design]".format(config["rate"]),
+            "set_property CONFIG_MODE SPIx{} [current_design]".format(config["buswidth"]),
+        ]
+    return config
@@ -0,0 +1,261 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Zynq7000/ZynqMP PL-to-PS DMA.
+#
+# Enables a PS slave port (HP/ACP on Zynq7000, HP/HPC/ACP on ZynqMP) and adds a stream-to-memory
+# (and memory-to-stream) ring-buffer DMA to PS DDR on it (see axi_dma.py), with a bandwidth test
+# (pattern generator/checker and beats/cycles counters) and an interrupt on buffer completions.
+#
+# Ports:
+# - hp:  High Performance ports (Zynq7000: 64-bit HP0-3, ZynqMP: 128-bit HP0-3), non-coherent.
+# - hpc: ZynqMP High Performance Coherent ports (128-bit HPC0-1), IO-coherent when enabled in Linux.
+# - acp: Accelerator Coherency Port (Zynq7000: 64-bit, ZynqMP: 128-bit 64-byte bursts), coherent.
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import axi
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect.csr_eventmanager import *
+
+from litex_boards.lib.axi_dma import AXIRingBufferWriter, AXIRingBufferReader
+
+ps_dma_ports = ["hp", "hpc", "acp"]
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _axi_slave_params(axi, name, upper=False):
+    # PS slave port Instance params (<name>_<channel><signal>, ex saxigp2_awaddr / S_AXI_ACP_AWADDR).
+    channels = {
+        "aw": ["id", "addr", "len", "size", "burst", "lock", "cache", "prot", "qos"],
+        "w" : ["data", "strb", "last"] + (["id"] if axi.version == "axi3" else []),
+        "b" : ["id", "resp"],
+        "ar": ["id", "addr", "len", "size", "burst", "lock", "cache", "prot", "qos"],
+        "r" : ["id", "data", "resp", "last"],
+    }
+    params = {}
+    for channel, signals in channels.items():
+        endpoint = getattr(axi, channel)
+        to_ps    = channel in ["aw", "w", "ar"]
+        for signal in signals + ["valid"]:
+            port = f"{name}_{channel}{signal}"
+            params[("i_" if to_ps else "o_") + (port.upper() if upper else port)] = getattr(endpoint, signal)
+        port = f"{name}_{channel}ready"
+        params[("o_" if to_ps else "i_") + (port.upper() if upper else port)] = endpoint.ready
+    return params
+
+def add_ps_config(soc, config):
+    # Zynq7000 PS7 set with set_ps7: config applied by the CPU. With set_ps7_xci, the IP has to be
+    # reconfigured/regenerated before synthesis.
+    cpu = soc.cpu
+    if soc.cpu_type == "zynqmp":
+        cpu.config.update(config)
+    elif cpu.ps7_name is None:
+        raise ValueError("PS7 must be set (set_ps7/set_ps7_xci) before adding PS7 config.")
+    elif len(cpu.ps7_tcl):
+        cpu.add_ps7_config(config)
+    else:
+        commands = soc.platform.toolchain.pre_synthesis_commands
+        values   = " ".join(f"CONFIG.{k} {{{{{v}}}}}" for k, v in config.items())
+        generate = f"generate_target all [get_ips {cpu.ps7_name}]"
+        if generate not in commands:
+            commands += [generate, f"synth_ip [get_ips {cpu.ps7_name}]"]
+        # Insert before (single) IP regeneration.
+        commands.insert(commands.index(generate), f"set_property -dict [list {values}] [get_ips {cpu.ps7_name}]")
+
+def add_ps_slave_port(soc, port="hp", clock_domain="sys"):
+    # Returns the AXI interface of the next free PS slave port of the given type.
+    if port not in ps_dma_ports:
+        raise ValueError(f"Unsupported PS port {port}, supported: {ps_dma_ports}.")
+    cpu = soc.cpu
+
+    # Zynq7000.
+    if soc.cpu_type == "zynq7000":
+        if port == "hp":
+            n       = len(cpu.axi_hp_slaves)
+            axi_hpn = cpu.add_axi_hp_slave(clock_domain=clock_domain)
+            add_ps_config(soc, {
+                f"PCW_USE_S_AXI_HP{n}"        : 1,
+                f"PCW_S_AXI_HP{n}_DATA_WIDTH" : 64,
+            })
+            return axi_hpn
+        if port == "acp":
+            assert "i_S_AXI_ACP_ACLK" not in cpu.cpu_params
+            axi_acp = axi.AXIInterface(
+                data_width    = 64,
+                address_width = 32,
+                id_width      = 3,
+                version       = "axi3",
+                clock_domain  = clock_domain
+            )
+            cpu.cpu_params.update(_axi_slave_params(axi_acp, "S_AXI_ACP", upper=True))
+            cpu.cpu_params.update({
+                "i_S_AXI_ACP_ACLK"   : ClockSignal(clock_domain),
+                "i_S_AXI_ACP_AWUSER" : 0b11111, # Coherent (shared) accesses.
+                "i_S_AXI_ACP_ARUSER" : 0b11111,
+            })
+            add_ps_config(soc, {"PCW_USE_S_AXI_ACP" : 1})
+            return axi_acp
+        raise ValueError(f"PS port {port} not available on Zynq7000.")
+
+    # ZynqMP.
+    if soc.cpu_type == "zynqmp":
+        if port == "acp":
+            assert "i_saxiacp_fpd_aclk" not in cpu.cpu_params
+            axi_acp = axi.AXIInterface(
+                data_width    = 128,
+                address_width = 40,
+                id_width      = 5,
+                clock_domain  = clock_domain
+            )
+            cpu.cpu_params.update(_axi_slave_params(axi_acp, "saxiacp"))
+            cpu.cpu_params.update({
+                "i_saxiacp_fpd_aclk" : ClockSignal(clock_domain),
+                "i_saxiacp_awuser"   : 0b11, # Coherent (shared) accesses.
+                "i_saxiacp_aruser"   : 0b11,
+            })
+            add_ps_config(soc, {"PSU__USE__S_AXI_ACP" : 1})
+            return axi_acp
+        # HPC0-1: S_AXI_GP0-1, HP0-3: S_AXI_GP2-5.
+        ports = {"hpc": [0, 1], "hp": [2, 3, 4, 5]}[port]
+        free  = [n for n in ports if f"i_saxigp{n}_awvalid" not in cpu.cpu_params]
+        if not len(free):
+            raise ValueError(f"No free ZynqMP {port.upper()} port.")
+        n       = free[0]
+        clk     = {0: "saxihpc0", 1: "saxihpc1", 2: "saxihp0", 3: "saxihp1", 4: "saxihp2", 5: "saxihp3"}[n]
+        axi_gpn = axi.AXIInterface(
+            data_width    = 128,
+            address_width = 49,
+            id_width      = 6,
+            clock_domain  = clock_domain
+        )
+        cpu.cpu_params.update(_axi_slave_params(axi_gpn, f"saxigp{n}"))
+        cpu.cpu_params.update({
+            f"i_{clk}_fpd_aclk"   : ClockSignal(clock_domain),
+            f"i_saxigp{n}_awuser" : 0,
+            f"i_saxigp{n}_aruser" : 0,
+        })
+        add_ps_config(soc, {
+            f"PSU__USE__S_AXI_GP{n}"      : 1,
+            f"PSU__SAXIGP{n}__DATA_WIDTH" : 128,
+        })
+        return axi_gpn
+
+    raise ValueError("PS DMA requires a zynq7000 or zynqmp CPU.")
+
+# PS DMA -------------------------------------------------------------------------------------------
+
+class PSDMA(LiteXModule):
+    def __init__(self, axi, fifo_depth=512, burst_length=16, coherent=False):
+        dw = len(axi.w.data)
+        self.sink   = stream.Endpoint([("data", dw)])
+        self.source = stream.Endpoint([("data", dw)])
+
+        # CSRs.
+        self.test = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, description="Bandwidth test (pattern generator/checker replace sink/source)."),
+        ])
+        self.test_words       = CSRStorage(32, reset=2**16, description="Test pattern period (in words, ring size).")
+        self.test_cycles      = CSRStatus(64, description="Test cycles.")
+        self.test_write_beats = CSRStatus(64, description="Test AXI write beats.")
+        self.test_read_beats  = CSRStatus(64, description="Test AXI read beats.")
+        self.test_errors      = CSRStatus(32, description="Test pattern errors.")
+
+        # IRQ.
+        self.ev = EventManager()
+        self.ev.writer = EventSourcePulse(description="Writer buffer completed.")
+        self.ev.reader = EventSourcePulse(description="Reader buffer completed.")
+        self.ev.finalize()
+
+        # # #
+
+        cache = 0b1111 if coherent else 0b0011
+
+        # Ring-Buffer DMAs.
+        self.writer = writer = AXIRingBufferWriter(axi, fifo_depth=fifo_depth, burst_length=burst_length, cache=cache)
+        self.reader = reader = AXIRingBufferReader(axi, fifo_depth=fifo_depth, burst_length=burst_length, cache=cache)
+        self.comb += [
+            self.ev.writer.trigger.eq(writer.done),
+            self.ev.reader.trigger.eq(reader.done),
+        ]
+
+        test  = self.test.fields.enable
+        words = self.test_words.storage
+        self.comb += [
+            If(test,
+                self.sink.ready.eq(1),
+                reader.source.ready.eq(1),
+            ).Else(
+                self.sink.connect(writer.sink),
+                reader.source.connect(self.source),
+            )
+        ]
+
+        # Pattern Generator (only presents data when the DMA FIFO can accept it, no drops).
+        gen_count = Signal(32)
+        self.sync += [
+            If(~test | ~writer.control.fields.enable,
+                gen_count.eq(0)
+            ).Elif(writer.sink.valid & writer.fifo.sink.ready,
+                gen_count.eq(gen_count + 1),
+                If(gen_count == (words - 1),
+                    gen_count.eq(0)
+                )
+            )
+        ]
+        self.comb += If(test,
+            writer.sink.valid.eq(writer.fifo.sink.ready),
+            writer.sink.data.eq(Replicate(gen_count, dw//32)),
+        )
+
+        # Pattern Checker.
+        chk_count = Signal(32)
+        self.sync += [
+            If(~test | ~reader.control.fields.enable,
+                chk_count.eq(0)
+            ).Elif(reader.source.valid,
+                chk_count.eq(chk_count + 1),
+                If(chk_count == (words - 1),
+                    chk_count.eq(0)
+                )
+            )
+        ]
+
+        # Statistics.
+        self.sync += [
+            If(~test,
+                self.test_cycles.status.eq(0),
+                self.test_write_beats.status.eq(0),
+                self.test_read_beats.status.eq(0),
+                self.test_errors.status.eq(0),
+            ).Else(
+                self.test_cycles.status.eq(self.test_cycles.status + 1),
+                If(axi.w.valid & axi.w.ready,
+                    self.test_write_beats.status.eq(self.test_write_beats.status + 1)
+                ),
+                If(axi.r.valid & axi.r.ready,
+                    self.test_read_beats.status.eq(self.test_read_beats.status + 1)
+                ),
+                If(reader.source.valid & (reader.source.data != Replicate(chk_count, dw//32)),
+                    self.test_errors.status.eq(self.test_errors.status + 1)
+                )
+            )
+        ]
+
+def add_ps_dma(soc, name="ps_dma", port="hp", fifo_depth=512):
+    axi_port   = add_ps_slave_port(soc, port=port, clock_domain="sys")
+    zynqmp_acp = (soc.cpu_type == "zynqmp") and (port == "acp")
+    ps_dma = PSDMA(axi_port,
+        fifo_depth   = fifo_depth,
+        burst_length = 4 if zynqmp_acp else 16, # ZynqMP ACP: 64-byte (cache line) bursts only.
+        coherent     = port == "acp",
+    )
+    soc.add_module(name=name, module=ps_dma)
+    if soc.irq.enabled:
+        soc.irq.add(name, use_loc_if_exists=True)
+    return ps_dma
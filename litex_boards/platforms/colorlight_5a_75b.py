@@ -303,7 +303,65 @@ _connectors_v8_0 = [
     ("j8", "D16 E15 C16 - B16 C15 B15 N4  N5  N3  P3  P4  M3  N1  M4 -"),
 ]
 
-
+# Extension for HUB75E panels on J1-J8 (bank/oe/stb/clk are shared by all the connectors).
+hub75e = [
+    ("hub75_control", 0,
+        # bank select (a, b, c, d, e)
+        Subsignal("bank", Pins("j1:8 j1:9 j1:10 j1:11 j1:7")),
+        Subsignal("oe",   Pins("j1:14")),
+        Subsignal("stb",  Pins("j1:13")),
+        Subsignal("clk",  Pins("j1:12")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 0,
+        Subsignal("r", Pins("j1:0 j1:4")),
+        Subsignal("g", Pins("j1:1 j1:5")),
+        Subsignal("b", Pins("j1:2 j1:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 1,
+        Subsignal("r", Pins("j2:0 j2:4")),
+        Subsignal("g", Pins("j2:1 j2:5")),
+        Subsignal("b", Pins("j2:2 j2:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 2,
+        Subsignal("r", Pins("j3:0 j3:4")),
+        Subsignal("g", Pins("j3:1 j3:5")),
+        Subsignal("b", Pins("j3:2 j3:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 3,
+        Subsignal("r", Pins("j4:0 j4:4")),
+        Subsignal("g", Pins("j4:1 j4:5")),
+        Subsignal("b", Pins("j4:2 j4:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 4,
+        Subsignal("r", Pins("j5:0 j5:4")),
+        Subsignal("g", Pins("j5:1 j5:5")),
+        Subsignal("b", Pins("j5:2 j5:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 5,
+        Subsignal("r", Pins("j6:0 j6:4")),
+        Subsignal("g", Pins("j6:1 j6:5")),
+        Subsignal("b", Pins("j6:2 j6:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 6,
+        Subsignal("r", Pins("j7:0 j7:4")),
+        Subsignal("g", Pins("j7:1 j7:5")),
+        Subsignal("b", Pins("j7:2 j7:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 7,
+        Subsignal("r", Pins("j8:0 j8:4")),
+        Subsignal("g", Pins("j8:1 j8:5")),
+        Subsignal("b", Pins("j8:2 j8:6")),
+        IOStandard("LVCMOS33"),
+    ),
+]
 
 # Platform -----------------------------------------------------------------------------------------
 
@@ -216,6 +216,114 @@ _connectors_v6_0 = [
     ("j16", "G14 G13 F12 - F13 F14 E14 N4 N5 N3 P3 P4 M3 N1 M4 -"),
 ]
 
+# Extension for HUB75E panels on J1-J16 (bank/oe/stb/clk are shared by all the connectors).
+hub75e = [
+    ("hub75_control", 0,
+        # bank select (a, b, c, d, e)
+        Subsignal("bank", Pins("j1:8 j1:9 j1:10 j1:11 j1:7")),
+        Subsignal("oe",   Pins("j1:14")),
+        Subsignal("stb",  Pins("j1:13")),
+        Subsignal("clk",  Pins("j1:12")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 0,
+        Subsignal("r", Pins("j1:0 j1:4")),
+        Subsignal("g", Pins("j1:1 j1:5")),
+        Subsignal("b", Pins("j1:2 j1:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 1,
+        Subsignal("r", Pins("j2:0 j2:4")),
+        Subsignal("g", Pins("j2:1 j2:5")),
+        Subsignal("b", Pins("j2:2 j2:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 2,
+        Subsignal("r", Pins("j3:0 j3:4")),
+        Subsignal("g", Pins("j3:1 j3:5")),
+        Subsignal("b", Pins("j3:2 j3:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 3,
+        Subsignal("r", Pins("j4:0 j4:4")),
+        Subsignal("g", Pins("j4:1 j4:5")),
+        Subsignal("b", Pins("j4:2 j4:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 4,
+        Subsignal("r", Pins("j5:0 j5:4")),
+        Subsignal("g", Pins("j5:1 j5:5")),
+        Subsignal("b", Pins("j5:2 j5:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 5,
+        Subsignal("r", Pins("j6:0 j6:4")),
+        Subsignal("g", Pins("j6:1 j6:5")),
+        Subsignal("b", Pins("j6:2 j6:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 6,
+        Subsignal("r", Pins("j7:0 j7:4")),
+        Subsignal("g", Pins("j7:1 j7:5")),
+        Subsignal("b", Pins("j7:2 j7:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 7,
+        Subsignal("r", Pins("j8:0 j8:4")),
+        Subsignal("g", Pins("j8:1 j8:5")),
+        Subsignal("b", Pins("j8:2 j8:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 8,
+        Subsignal("r", Pins("j9:0 j9:4")),
+        Subsignal("g", Pins("j9:1 j9:5")),
+        Subsignal("b", Pins("j9:2 j9:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 9,
+        Subsignal("r", Pins("j10:0 j10:4")),
+        Subsignal("g", Pins("j10:1 j10:5")),
+        Subsignal("b", Pins("j10:2 j10:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 10,
+        Subsignal("r", Pins("j11:0 j11:4")),
+        Subsignal("g", Pins("j11:1 j11:5")),
+        Subsignal("b", Pins("j11:2 j11:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 11,
+        Subsignal("r", Pins("j12:0 j12:4")),
+        Subsignal("g", Pins("j12:1 j12:5")),
+        Subsignal("b", Pins("j12:2 j12:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 12,
+        Subsignal("r", Pins("j13:0 j13:4")),
+        Subsignal("g", Pins("j13:1 j13:5")),
+        Subsignal("b", Pins("j13:2 j13:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 13,
+        Subsignal("r", Pins("j14:0 j14:4")),
+        Subsignal("g", Pins("j14:1 j14:5")),
+        Subsignal("b", Pins("j14:2 j14:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 14,
+        Subsignal("r", Pins("j15:0 j15:4")),
+        Subsignal("g", Pins("j15:1 j15:5")),
+        Subsignal("b", Pins("j15:2 j15:6")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("hub75_chain", 15,
+        Subsignal("r", Pins("j16:0 j16:4")),
+        Subsignal("g", Pins("j16:1 j16:5")),
+        Subsignal("b", Pins("j16:2 j16:6")),
+        IOStandard("LVCMOS33"),
+    ),
+]
+
 # Platform -----------------------------------------------------------------------------------------
 
 class Platform(LatticeECP5Platform):
@@ -168,6 +168,9 @@ class Platform(XilinxUSPlatform):
     default_clk_name   = "clk200"
     default_clk_period = 1e9/200e6
 
+    config_flash_part     = "mx25l25645g"
+    config_flash_buswidth = 4
+
     def __init__(self, toolchain="vivado"):
         XilinxUSPlatform.__init__(self, "xcku040-ffva1156-2-e", _io, toolchain=toolchain)
 
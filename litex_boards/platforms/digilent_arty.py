@@ -348,6 +348,9 @@ class Platform(Xilinx7SeriesPlatform):
     default_clk_name   = "clk100"
     default_clk_period = 1e9/100e6
 
+    config_flash_part     = "s25fl128s"
+    config_flash_buswidth = 4
+
     def __init__(self, variant="a7-35", toolchain="vivado"):
         device = {
             "a7-35":  "xc7a35ticsg324-1L",
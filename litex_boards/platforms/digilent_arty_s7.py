@@ -207,6 +207,9 @@ class Platform(Xilinx7SeriesPlatform):
     default_clk_name   = "clk100"
     default_clk_period = 1e9/100e6
 
+    config_flash_part     = "s25fl128s"
+    config_flash_buswidth = 4
+
     def __init__(self, variant="s7-50", toolchain="vivado"):
         device = {
             "s7-25": "xc7s25csga324-1",
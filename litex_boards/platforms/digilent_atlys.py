@@ -219,6 +219,9 @@ class Platform(XilinxSpartan6Platform):
     default_clk_name   = "clk100"
     default_clk_period = 1e9/100e6
 
+    config_flash_part     = "n25q128"
+    config_flash_buswidth = 4
+
     def __init__(self, toolchain="ise"):
         XilinxSpartan6Platform.__init__(self,  "xc6slx45-csg324-3", _io, _connectors, toolchain=toolchain)
         self.add_platform_command("""CONFIG VCCAUX="3.3";""")
@@ -82,6 +82,9 @@ class Platform(Xilinx7SeriesPlatform):
     default_clk_name   = "clk12"
     default_clk_period = 1e9/12e6
 
+    config_flash_part     = "n25q032"
+    config_flash_buswidth = 4
+
     def __init__(self, variant="a7-35", toolchain="vivado"):
         device = {
             "a7-35": "xc7a35tcpg236-1"
@@ -161,6 +161,9 @@ class Platform(Xilinx7SeriesPlatform):
     default_clk_name   = "clk50"
     default_clk_period = 1e9/50e6
 
+    config_flash_part     = "n25q128"
+    config_flash_buswidth = 4
+
     def __init__(self, toolchain="vivado", with_core_resources=True):
         device = "xc7a35tftg256-1"
         io = _io
@@ -87,7 +87,7 @@ _io = [
     ),
 
     # Shared camera control signals
-    ("cam_ctrl",
+    ("cam_ctrl", 0,
         Subsignal("cam_reset", Pins("T1")),
         Subsignal("cam_frame_sync", Pins("U1")),
     ),
@@ -160,6 +160,9 @@ class Platform(Xilinx7SeriesPlatform):
     default_clk_name   = "clk200"
     default_clk_period = 1e9/200e6
 
+    config_flash_part     = "s25fl128s"
+    config_flash_buswidth = 4
+
     def __init__(self, toolchain="vivado", with_multiboot=True):
         Xilinx7SeriesPlatform.__init__(self, "xc7a100t-fgg484-2", _io, toolchain=toolchain)
         self.add_platform_command("set_property INTERNAL_VREF 0.750 [get_iobanks 34]")
@@ -141,6 +141,9 @@ class Platform(Xilinx7SeriesPlatform):
     default_clk_period = 1e9/50e6
     kgates             = None
 
+    config_flash_part     = "n25q064"
+    config_flash_buswidth = 4
+
     def __init__(self, kgates=100, toolchain="vivado", with_daughterboard=False, with_rp2040_daughterboard=False):
         assert(kgates in [75, 100, 200], "kgates can only be 75, 100 or 200, representing a XC7A75T, XC7TA100T, XC7A200T")
         self.kgates = kgates
@@ -145,6 +145,9 @@ class Platform(XilinxPlatform):
     default_clk_name   = "clk50"
     default_clk_period = 1e9/50e6
 
+    config_flash_part     = "s25fl128l"
+    config_flash_buswidth = 4
+
     def __init__(self, toolchain="vivado"):
         device = "xc7k325tffg676-1"
         io = _io
@@ -138,6 +138,9 @@ class Platform(Xilinx7SeriesPlatform):
     default_clk_name   = "clk50"
     default_clk_period = 1e9/50e6
 
+    config_flash_part     = "mt25ql128"
+    config_flash_buswidth = 4
+
     # these resources conflict with daughterboard resources
     # so they are only used if the daughterboard is not present
     core_resources = [
@@ -159,6 +159,9 @@ class Platform(Xilinx7SeriesPlatform):
     default_clk_name   = "clk200"
     default_clk_period = 1e9/200e6
 
+    config_flash_part     = "s25fl128s"
+    config_flash_buswidth = 4
+
     def __init__(self, variant="cle-215+", toolchain="vivado"):
         device = {
             "cle-101":  "xc7a100t-fgg484-2",
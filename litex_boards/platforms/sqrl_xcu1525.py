@@ -368,6 +368,9 @@ class Platform(XilinxUSPPlatform):
     default_clk_name   = "clk300"
     default_clk_period = 1e9/300e6
 
+    config_flash_part     = "mt25qu01g"
+    config_flash_buswidth = 4
+
     def __init__(self, toolchain="vivado"):
         XilinxUSPPlatform.__init__(self, "xcvu9p-fsgd2104-2l-e", _io, _connectors, toolchain=toolchain)
 
@@ -333,6 +333,9 @@ class Platform(XilinxUSPPlatform):
     default_clk_name   = "clk300"
     default_clk_period = 1e9/300e6
 
+    config_flash_part     = "mt25qu01g"
+    config_flash_buswidth = 4
+
     def __init__(self, toolchain="vivado"):
         XilinxUSPPlatform.__init__(self, "xcu200-fsgd2104-2-e", _io, _connectors, toolchain=toolchain)
 
@@ -522,6 +522,9 @@ class Platform(XilinxUSPlatform):
     default_clk_name   = "clk125"
     default_clk_period = 1e9/125e6
 
+    config_flash_part     = "mt25qu256"
+    config_flash_buswidth = 4
+
     def __init__(self, toolchain="vivado"):
         XilinxUSPlatform.__init__(self, "xcku040-ffva1156-2-e", _io, _connectors, toolchain=toolchain)
 
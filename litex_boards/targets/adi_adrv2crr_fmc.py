@@ -7,9 +7,15 @@
 # Copyright (c) 2022 Sylvain Munaut <tnt@246tNt.com>
 # SPDX-License-Identifier: BSD-2-Clause
 
+# ADRV9009 RX/TX Streaming (JESD204B links, samples over PCIe DMA: one DMA per ADRV9009):
+# ./adi_adrv2crr_fmc.py --with-pcie --with-jesd --csr-csv=csr.csv --build --driver --load
+# ./bench/adrv9009_jesd_stream.py --csr-csv=csr.csv --devices=0,1
+
 import os
 
 from migen import *
+from migen.genlib.cdc import MultiReg
+from migen.genlib.resetsync import AsyncResetSynchronizer
 
 from litex.gen import *
 
@@ -22,6 +28,8 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.pwm import PWM
 from litex.soc.cores.xadc import ZynqUSPSystemMonitor
+from litex.soc.cores.spi import SPIMaster
+from litex.soc.interconnect.csr import *
 
 from litedram.modules import MT40A512M16
 from litedram.phy import usddrphy
@@ -29,6 +37,10 @@ from litedram.phy import usddrphy
 from litepcie.phy.usppciephy import USPPCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from liteiclink.serdes.gth4_ultrascale import GTH4QuadPLL, GTH4
+
+from litex_boards.lib.jesd204b import JESD204BSettings, JESD204BCore, JESD204BStreamer
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -58,14 +70,122 @@ class CRG(LiteXModule):
 
         self.idelayctrl = USPIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
 
+# ADRV9009 JESD204B -------------------------------------------------------------------------------
+
+class _ADRV9009JESD(LiteXModule):
+    # JESD204B links (Subclass 1) to/from an ADRV9009 (Talise): Framer A (RX1/RX2) -> 4 RX lanes,
+    # 4 TX lanes -> Deframer A (TX1/TX2), M=4, L=4, F=2, S=1, K=32 (ex 245.76MSPS at 4.9152Gbps).
+    # The 4 GTHs share a QPLL and the device clock (linerate/40) derived from the JESD reference
+    # clock (through the RX/TX elastic buffers). The ADRV9009 itself is configured through SPI.
+    def __init__(self, platform, n, linerate, refclk_freq, sys_clk_freq, dma_data_width, fifo_depth):
+        cd = f"jesd{n}"
+        self.cd_jesd = ClockDomain(cd)
+
+        self.ctl = CSRStorage(fields=[
+            CSRField("reset_n",    size=1, offset=0, reset=1, description="ADRV9009 reset (active low)."),
+            CSRField("rx1_enable", size=1, offset=1, reset=1, description="ADRV9009 RX1 enable."),
+            CSRField("rx2_enable", size=1, offset=2, reset=1, description="ADRV9009 RX2 enable."),
+            CSRField("tx1_enable", size=1, offset=3, reset=1, description="ADRV9009 TX1 enable."),
+            CSRField("tx2_enable", size=1, offset=4, reset=1, description="ADRV9009 TX2 enable."),
+        ])
+
+        # # #
+
+        settings = JESD204BSettings(m=4, l=4, f=2, s=1, k=32)
+
+        # Control.
+        ctl_pads = platform.request("talise_ctl", n)
+        self.comb += ctl_pads.test.eq(0)
+        for name in ["reset_n", "rx1_enable", "rx2_enable", "tx1_enable", "tx2_enable"]:
+            self.comb += getattr(ctl_pads, name).eq(getattr(self.ctl.fields, name))
+
+        # Clocking (device clock from the JESD reference clock).
+        jesd_clk_freq = linerate/40
+        refclk_pads   = platform.request("talise_refclk", n)
+        refclk        = Signal()
+        refclk_odiv2  = Signal()
+        refclk_div    = refclk_freq/jesd_clk_freq
+        if (refclk_div != int(refclk_div)) or not (1 <= refclk_div <= 8):
+            raise ValueError(f"JESD device clock ({jesd_clk_freq/1e6:.3f}MHz) not reachable from the reference clock ({refclk_freq/1e6:.3f}MHz).")
+        self.specials += [
+            Instance("IBUFDS_GTE4",
+                p_REFCLK_HROW_CK_SEL = 0b00, # ODIV2 = O.
+                i_CEB   = 0,
+                i_I     = refclk_pads.p,
+                i_IB    = refclk_pads.n,
+                o_O     = refclk,
+                o_ODIV2 = refclk_odiv2
+            ),
+            Instance("BUFG_GT",
+                i_I   = refclk_odiv2,
+                i_DIV = int(refclk_div) - 1,
+                o_O   = self.cd_jesd.clk
+            ),
+            AsyncResetSynchronizer(self.cd_jesd, ResetSignal("sys")),
+        ]
+        platform.add_period_constraint(refclk_pads.p, 1e9/refclk_freq)
+
+        # Transceivers.
+        self.qpll = qpll = GTH4QuadPLL(refclk, refclk_freq, linerate)
+        phys = []
+        for lane in range(settings.l):
+            gth = GTH4(qpll,
+                tx_pads          = platform.request("talise_jesd_tx", 4*n + lane),
+                rx_pads          = platform.request("talise_jesd_rx", 4*n + lane),
+                sys_clk_freq     = sys_clk_freq,
+                tx_clk           = ClockSignal(cd),
+                rx_clk           = ClockSignal(cd),
+                data_width       = 40,
+                tx_buffer_enable = True,
+                rx_buffer_enable = True,
+                clock_aligner    = False,
+                pll_master       = lane == 0)
+            gth = ClockDomainsRenamer({"tx": f"{cd}_tx{lane}", "rx": f"{cd}_rx{lane}"})(gth)
+            gth.add_stream_endpoints()
+            self.add_module(name=f"gth{lane}", module=gth)
+            phys.append(gth)
+
+        # JESD204B Links.
+        self.core = core = JESD204BCore(phys, settings, clock_domain=cd)
+
+        # SYSREF/SYNC~.
+        sysref_pads   = platform.request("talise_sysref",  n)
+        sync_tx_pads  = platform.request("talise_sync_tx", 2*n) # Deframer A SYNC~ (SYNCOUTB0).
+        sync_rx_pads  = platform.request("talise_sync_rx", 2*n) # Framer A SYNC~ (SYNCINB0).
+        sysref        = Signal()
+        sysref_r      = Signal()
+        tx_jsync      = Signal()
+        rx_jsync      = Signal()
+        self.specials += [
+            Instance("IBUFDS", i_I=sysref_pads.p,  i_IB=sysref_pads.n,  o_O=sysref),
+            Instance("IBUFDS", i_I=sync_tx_pads.p, i_IB=sync_tx_pads.n, o_O=tx_jsync),
+            Instance("OBUFDS", i_I=rx_jsync, o_O=sync_rx_pads.p, o_OB=sync_rx_pads.n),
+            MultiReg(tx_jsync, core.tx_jsync, cd),
+        ]
+        sync = getattr(self.sync, cd)
+        sync += [
+            sysref_r.eq(sysref),
+            core.sysref.eq(sysref_r),
+            rx_jsync.eq(core.rx_jsync),
+        ]
+
+        # Streamer.
+        self.stream = JESD204BStreamer(core, dma_data_width, fifo_depth=fifo_depth, clock_domain=cd)
+
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=150e6, ddram_channel=0,
-        with_led_chaser = True,
-        with_pcie       = False,
+        with_led_chaser  = True,
+        with_pcie        = False,
+        with_jesd        = False,
+        jesd_linerate    = 4.9152e9,
+        jesd_refclk_freq = 245.76e6,
+        jesd_fifo_depth  = 4096,
         **kwargs):
         platform = adi_adrv2crr_fmc.Platform()
+        if with_jesd and not with_pcie:
+            raise ValueError("JESD204B streaming requires PCIe (--with-pcie).")
 
         # CRG --------------------------------------------------------------------------------------
         self.crg = CRG(platform, sys_clk_freq, ddram_channel)
@@ -97,7 +217,25 @@ class BaseSoC(SoCCore):
                 speed = "gen3",
                 data_width = 256,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=2 if with_jesd else 1)
+
+        # ADRV9009 JESD204B ------------------------------------------------------------------------
+        # Each ADRV9009 streams its RX samples (RX1/RX2 IQ, 16-bit) to the Host and its TX samples
+        # from the Host through its own PCIe DMA, FIFOs of jesd_fifo_depth 256-bit words absorb the
+        # Host's scheduling latencies. The ADRV9009s and HMC7044s are configured through SPI.
+        if with_jesd:
+            self.spi = SPIMaster(platform.request("spi"), 24, sys_clk_freq, 5e6)
+            for n in range(2):
+                jesd = _ADRV9009JESD(platform, n,
+                    linerate       = jesd_linerate,
+                    refclk_freq    = jesd_refclk_freq,
+                    sys_clk_freq   = sys_clk_freq,
+                    dma_data_width = 256,
+                    fifo_depth     = jesd_fifo_depth)
+                self.add_module(name=f"jesd{n}", module=jesd)
+                self.comb += jesd.stream.source.connect(getattr(self, f"pcie_dma{n}").sink)
+                self.comb += getattr(self, f"pcie_dma{n}").source.connect(jesd.stream.sink)
+                platform.add_false_path_constraints(self.crg.cd_sys.clk, jesd.cd_jesd.clk)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -124,14 +262,22 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=adi_adrv2crr_fmc.Platform, description="LiteX SoC on ADI ADRV2CRR-FMC.")
-    parser.add_target_argument("--sys-clk-freq", default=150e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",     default=150e6,    type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",        action="store_true",          help="Enable PCIe support.")
+    parser.add_target_argument("--with-jesd",        action="store_true",          help="Enable ADRV9009 JESD204B RX/TX streaming over PCIe DMA (requires --with-pcie).")
+    parser.add_target_argument("--jesd-linerate",    default=4.9152e9, type=float, help="JESD204B lane rate.")
+    parser.add_target_argument("--jesd-refclk-freq", default=245.76e6, type=float, help="JESD204B reference clock frequency (from the HMC7044).")
+    parser.add_target_argument("--jesd-fifo-depth",  default=4096,     type=int,   help="JESD204B RX/TX FIFOs depth (in 256-bit words).")
+    parser.add_target_argument("--driver",           action="store_true",          help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
+        sys_clk_freq     = args.sys_clk_freq,
+        with_pcie        = args.with_pcie,
+        with_jesd        = args.with_jesd,
+        jesd_linerate    = args.jesd_linerate,
+        jesd_refclk_freq = args.jesd_refclk_freq,
+        jesd_fifo_depth  = args.jesd_fifo_depth,
         **parser.soc_argdict
     )
 
@@ -54,13 +54,15 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.video import VideoS6HDMIPHY
 from litex.soc.cores.led import LedChaser
 
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+
 from litedram.modules import MT48LC32M8, SDRModule
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1", pix_clk=25.175e6):
         self.rst       = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_hdmi   = ClockDomain()
@@ -81,8 +83,8 @@ class CRG(LiteXModule):
         self.comb += pll.reset.eq(~rst | ~avr_ready | self.rst)
         pll.register_clkin(clk50, 50e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_hdmi,   25e6,  margin=0)
-        pll.create_clkout(self.cd_hdmi5x, 125e6, margin=0)
+        pll.create_clkout(self.cd_hdmi,   pix_clk)
+        pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
         if sdram_rate == "1:2":
             pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
             pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=90)
@@ -99,11 +101,18 @@ class BaseSoC(SoCCore):
         with_video_terminal    = False,
         with_video_framebuffer = False,
         with_video_colorbars   = False,
+        video_timings          = None,
         **kwargs):
         platform = alchitry_mojo.Platform()
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoS6HDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=8, rate=sdram_rate))
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = CRG(platform, sys_clk_freq, sdram_rate)
+        self.crg = CRG(platform, sys_clk_freq, sdram_rate, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Alchitry Mojo", **kwargs)
@@ -137,7 +146,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -159,6 +168,7 @@ def main():
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
+    parser.add_target_argument("--video-timings", default=None, help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     # Note: baudrate is fixed because regardless of USB->TTL baud, the AVR <-> FPGA baudrate is
@@ -171,6 +181,7 @@ def main():
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_colorbars   = args.with_video_colorbars,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
 
@@ -15,6 +15,10 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alientek_davincipro
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -35,75 +39,59 @@ from litepcie.phy.s7pciephy import S7PCIEPHY
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, with_dram=True, with_rst=True, with_hdmi=False):
-        self.rst    = Signal()
-        self.cd_sys = ClockDomain()
-        self.cd_eth = ClockDomain()
+class _CRG(BoardCRG):
+    def __init__(self, platform, sys_clk_freq, with_dram=True, with_rst=True, with_hdmi=False, pix_clk=25.175e6):
+        BoardCRG.__init__(self, platform,
+            pll        = S7PLL(speedgrade=-2),
+            clkin      = platform.request("clk50"),
+            clkin_freq = 50e6,
+            rst        = ~platform.request("cpu_reset") if with_rst else 0,
+        )
+        self.add_sys(sys_clk_freq, with_dram=with_dram, domains={"eth": 25e6})
+
+        # HDMI PLL.
         if with_hdmi:
-            self.cd_hdmi   = ClockDomain()
-            self.cd_hdmi5x = ClockDomain()
-        if with_dram:
-            self.cd_sys4x     = ClockDomain()
-            self.cd_sys4x_dqs = ClockDomain()
-            self.cd_idelay    = ClockDomain()
-
-        # # #
-
-        # Clk/Rst.
-        clk50 = platform.request("clk50")
-        rst   = ~platform.request("cpu_reset") if with_rst else 0
-
-        # PLL.
-        self.pll = pll = S7PLL(speedgrade=-2)
-        self.comb += pll.reset.eq(rst | self.rst)
-        pll.register_clkin(clk50, 50e6)
-        pll.create_clkout(self.cd_sys, sys_clk_freq)
-        pll.create_clkout(self.cd_eth, 25e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-        if with_dram:
-            pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-            pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
-            pll.create_clkout(self.cd_idelay,    200e6)
-
-        # IdelayCtrl.
-        if with_dram:
-            self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
-
-        if with_hdmi:
-            self.submodules.pll2 = pll2 = S7MMCM(speedgrade=-2)
-            self.comb += pll2.reset.eq(rst | self.rst)
-            pll2.register_clkin(clk50, 50e6)
-            pll2.create_clkout(self.cd_hdmi,   25e6,  margin=0)
-            pll2.create_clkout(self.cd_hdmi5x, 125e6, margin=0)
+            self.add_pll(S7MMCM(speedgrade=-2), name="pll2")
+            self.add_domain("hdmi",   pix_clk,   pll=self.pll2)
+            self.add_domain("hdmi5x", 5*pix_clk, pll=self.pll2)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="a7-35", toolchain="vivado", sys_clk_freq=100e6,
-        with_xadc       = False,
-        with_dna        = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_phy         = "rgmii",
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_pcie       = False,
-        with_led_chaser = True,
-        with_buttons    = True,
-        with_gpio       = False,
+        with_xadc              = False,
+        with_dna               = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        eth_phy                = "rgmii",
+        eth_ip                 = "192.168.1.50",
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_pcie              = False,
+        with_led_chaser        = True,
+        with_buttons           = True,
+        with_gpio              = False,
         with_video_colorbars   = False,
         with_video_framebuffer = False,
         with_video_terminal    = False,
+        video_timings          = None,
         **kwargs):
         platform = alientek_davincipro.Platform(variant=variant, toolchain=toolchain)
 
         with_hdmi = with_video_colorbars or with_video_framebuffer or with_video_terminal
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoS7HDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:4", memtype="DDR"))
+
         # CRG --------------------------------------------------------------------------------------
         with_dram = (kwargs.get("integrated_main_ram_size", 0) == 0)
-        self.crg  = _CRG(platform, sys_clk_freq, with_dram, with_rst=True, with_hdmi=with_hdmi)
+        self.crg  = _CRG(platform, sys_clk_freq, with_dram, with_rst=True, with_hdmi=with_hdmi,
+            pix_clk = get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident=f"LiteX SoC on Alientek DaVinci Pro ({variant}t)", **kwargs)
@@ -162,10 +150,11 @@ class BaseSoC(SoCCore):
                     data_pads    = self.platform.request("sfp", 0),
                     sys_clk_freq = self.clk_freq)
 
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
             elif with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip if not eth_dynamic_ip else None, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip if not eth_dynamic_ip else None, remote_ip=remote_ip, data_width=eth_data_width)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
@@ -182,7 +171,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -211,52 +200,58 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=alientek_davincipro.Platform, decription="LiteX SoC on Alientek Davinci Pro.")
-    parser.add_target_argument("--flash",          action="store_true",       help="Flash bitstream.")
-    parser.add_target_argument("--variant",        default="a7-35",           help="Board variant (a7-35 or a7-100).")
-    parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-xadc",      action="store_true",       help="Enable 7-Series XADC.")
-    parser.add_target_argument("--with-dna",       action="store_true",       help="Enable 7-Series DNA.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--with-pcie",      action="store_true",        help="Enable PCIe support.")
+    parser.add_target_argument("--flash",                  action="store_true",       help="Flash bitstream.")
+    parser.add_target_argument("--variant",                default="a7-35",           help="Board variant (a7-35 or a7-100).")
+    parser.add_target_argument("--sys-clk-freq",           default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-xadc",              action="store_true",       help="Enable 7-Series XADC.")
+    parser.add_target_argument("--with-dna",               action="store_true",       help="Enable 7-Series DNA.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,      help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",   help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--with-pcie",              action="store_true",        help="Enable PCIe support.")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
+    parser.add_target_argument("--video-timings", default=None, help="Video Framebuffer timings (default: largest feasible).")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",       action="store_true",       help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",           action="store_true",       help="Enable SDCard support.")
-    parser.add_target_argument("--with-gpio",      action="store_true",       help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true",       help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true",       help="Enable SDCard support.")
+    parser.add_target_argument("--with-gpio",              action="store_true",       help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        variant        = args.variant,
-        toolchain      = args.toolchain,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_xadc      = args.with_xadc,
-        with_dna       = args.with_dna,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_buttons   = True,
-        with_gpio      = args.with_gpio,
-        with_pcie      = args.with_pcie,
+        variant                = args.variant,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_xadc              = args.with_xadc,
+        with_dna               = args.with_dna,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_buttons           = True,
+        with_gpio              = args.with_gpio,
+        with_pcie              = args.with_pcie,
         with_video_colorbars   = args.with_video_colorbars,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         with_video_terminal    = args.with_video_terminal,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import aliexpress_xc7k420t
+from litex_boards.lib.xilinx_config import apply_fast_config
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
@@ -69,12 +70,16 @@ def main():
     parser = LiteXArgumentParser(platform=aliexpress_xc7k420t.Platform, description="LiteX SoC on AliExpress u420t.")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI-mode flash support.")
+    parser.add_target_argument("--fast-config",    action="store_true",       help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
         **parser.soc_argdict
     )
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -12,6 +12,8 @@ from litex.gen import *
 
 from litex.build.io import DDROutput
 from litex_boards.platforms import aliexpress_xc7k70t
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
@@ -27,7 +29,7 @@ from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1", pix_clk=25.175e6):
         self.rst       = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_hdmi   = ClockDomain()
@@ -46,31 +48,46 @@ class CRG(LiteXModule):
         self.comb += pll.reset.eq(self.rst)
         pll.register_clkin(clk50, 50e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_hdmi,   25e6,  margin=0)
-        pll.create_clkout(self.cd_hdmi5x, 125e6, margin=0)
         if sdram_rate == "1:2":
             pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
             pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=90)
         else:
             pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
 
+        # Video PLL
+        self.video_pll = video_pll = S7PLL()
+        self.comb += video_pll.reset.eq(self.rst)
+        video_pll.register_clkin(clk50, 50e6)
+        video_pll.create_clkout(self.cd_hdmi,   pix_clk)
+        video_pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
+
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6, sdram_rate="1:1",
         with_hdmi              = False,
         with_ethernet          = False,
+        eth_data_width         = 8,
         with_pcie              = False,
         with_sdram             = True,
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
         with_video_colorbars   = False,
+        video_timings          = None,
         **kwargs):
         platform = aliexpress_xc7k70t.Platform()
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoS7HDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate=sdram_rate),
+            pll             = S7PLL,
+            clkin_freq      = 50e6)
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = CRG(platform, sys_clk_freq, sdram_rate)
+        self.crg = CRG(platform, sys_clk_freq, sdram_rate, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Alchitry Mojo", **kwargs)
@@ -96,7 +113,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet:
@@ -106,7 +123,8 @@ class BaseSoC(SoCCore):
                 tx_delay = 1.417e-9,
                 rx_delay = 1.417e-9,
             )
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
@@ -129,12 +147,14 @@ def main():
     parser.add_target_argument("--sys-clk-freq",    default=90e6, type=float,  help="System clock frequency.")
     parser.add_target_argument("--sdram-rate",      default="1:1",             help="SDRAM Rate: (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_argument("--with-ethernet",          action="store_true",       help="Enable ethernet")
+    parser.add_target_argument("--eth-data-width",  default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_argument("--with-pcie",              action="store_true",       help="Enable PCIe")
     parser.add_argument("--with-hdmi",              action="store_true",       help="Enable HDMI")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true",       help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true",       help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true",       help="Enable Video Colorbars (HDMI).")
+    parser.add_target_argument("--video-timings",   default=None,              help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     # Note: baudrate is fixed because regardless of USB->TTL baud, the AVR <-> FPGA baudrate is
@@ -143,11 +163,13 @@ def main():
         sys_clk_freq           = args.sys_clk_freq,
         sdram_rate             = args.sdram_rate,
         with_ethernet          = args.with_ethernet,
+        eth_data_width         = args.eth_data_width,
         with_pcie              = args.with_pcie,
         with_hdmi              = args.with_hdmi,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_colorbars   = args.with_video_colorbars,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
 
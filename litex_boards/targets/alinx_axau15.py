@@ -13,6 +13,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alinx_axau15
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.tftp import add_tftp_receiver
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -56,13 +59,16 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(125e6),
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        with_led_chaser = True,
-        with_pcie       = False, pcie_speed="gen3",
-        with_sdcard     = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        with_tftp_dma          = False,
+        eth_data_width         = 8,
+        eth_ip                 = "192.168.1.50",
+        remote_ip              = None,
+        with_led_chaser        = True,
+        with_pcie              = False, pcie_speed="gen3",
+        with_sdcard            = False,
         **kwargs):
         platform = alinx_axau15.Platform()
 
@@ -112,14 +118,18 @@ class BaseSoC(SoCCore):
                 rx_delay   = 1e-9,
                 usp        = True
             )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, remote_ip=remote_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
+            if with_tftp_dma:
+                assert with_etherbone
+                add_tftp_receiver(self, cd={32: "sys", 8: "etherbone"}[eth_data_width])
 
         # SD Card ----------------------------------------------------------------------------------
         if with_sdcard:
-            self.add_sdcard()
+            add_sdcard_hs(self)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -134,29 +144,35 @@ def main():
     parser = LiteXArgumentParser(platform=alinx_axau15.Platform, description="LiteX SoC on AXAU15.")
     parser.add_target_argument("--sys-clk-freq",    default=125e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",        action="store_true",      help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",       action="store_true",      help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",   help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--remote-ip",      default="192.168.1.100",  help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",      help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--with-pcie",      action="store_true",      help="Enable PCIe support.")
-    parser.add_target_argument("--pcie-speed",     default="gen3",           help="PCIe speed.", choices=["gen3", "gen4"])
-    parser.add_target_argument("--driver",         action="store_true",      help="Generate PCIe driver.")
-    parser.add_target_argument("--with-sdcard",    action="store_true",      help="Add SDCard.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",      help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",      help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,     help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--with-tftp-dma",          action="store_true",      help="Enable Hardware TFTP Receiver (Netboot images loaded to memory over Etherbone's UDP/IP stack).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,      help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",   help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",  help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",      help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--with-pcie",              action="store_true",      help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-speed",             default="gen3",           help="PCIe speed.", choices=["gen3", "gen4"])
+    parser.add_target_argument("--driver",                 action="store_true",      help="Generate PCIe driver.")
+    parser.add_target_argument("--with-sdcard",            action="store_true",      help="Add SDCard.")
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_pcie      = args.with_pcie,
-        pcie_speed     = args.pcie_speed,
-        with_sdcard    = args.with_sdcard,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        with_tftp_dma          = args.with_tftp_dma,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_pcie              = args.with_pcie,
+        pcie_speed             = args.pcie_speed,
+        with_sdcard            = args.with_sdcard,
         **parser.soc_argdict
 	)
 
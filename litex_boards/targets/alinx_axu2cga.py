@@ -23,6 +23,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alinx_axu2cga
+from litex_boards.lib.zynq_dma import add_ps_dma, ps_dma_ports
 
 from litex.build.tools import write_to_file
 
@@ -66,7 +67,7 @@ class _CRG(LiteXModule):
 
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=25e6, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=25e6, with_led_chaser=True, with_ps_dma=False, ps_dma_port="hp", **kwargs):
         platform = alinx_axu2cga.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -94,6 +95,10 @@ class BaseSoC(SoCCore):
             )
             self.constants["CONFIG_CLOCK_FREQUENCY"] = 1199880127
 
+        # PS DMA -----------------------------------------------------------------------------------
+        if with_ps_dma:
+            add_ps_dma(self, port=ps_dma_port)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -165,11 +170,15 @@ def main():
     parser = LiteXArgumentParser(platform=alinx_axu2cga.Platform, description="LiteX SoC on Alinx AXU2CGA.")
     parser.add_target_argument("--cable",        default="ft232",          help="JTAG interface.")
     parser.add_target_argument("--sys-clk-freq", default=25e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ps-dma",  action="store_true",      help="Enable PL-to-PS DDR DMA (through a PS HP/HPC/ACP slave port).")
+    parser.add_target_argument("--ps-dma-port",  default="hp", choices=ps_dma_ports, help="PS DMA slave port.")
     parser.set_defaults(cpu_type="zynqmp")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq=args.sys_clk_freq,
+        sys_clk_freq = args.sys_clk_freq,
+        with_ps_dma  = args.with_ps_dma,
+        ps_dma_port  = args.ps_dma_port,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -27,6 +27,8 @@ from litex.soc.cores.clock import CycloneVPLL
 from litedram.modules import AS4C32M16
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
+from litex_boards.lib.video import get_video_timings, get_dram_data_width
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -73,6 +75,14 @@ class BaseSoC(SoCCore):
         **kwargs):
         platform = analog_pocket.Platform()
 
+        # Video Timings (Fixed, validated against the SDRAM bandwidth) -----------------------------
+        video_timings = "640x480@60Hz"
+        if with_video_framebuffer:
+            get_video_timings(video_timings,
+                phy             = "VideoDDRPHY",
+                sys_clk_freq    = sys_clk_freq,
+                dram_data_width = get_dram_data_width(databits=16, rate=sdram_rate))
+
         # CRG --------------------------------------------------------------------------------------
         self.crg = _CRG(platform, sys_clk_freq, sdram_rate)
 
@@ -135,7 +145,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="640x480@60Hz", clock_domain="video")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz", clock_domain="video")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="video")
 
 # Build --------------------------------------------------------------------------------------------
 
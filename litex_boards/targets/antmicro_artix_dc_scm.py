@@ -15,6 +15,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import antmicro_artix_dc_scm
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -63,12 +65,14 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, *, device, toolchain="vivado", sys_clk_freq=100e6,
-        with_pcie      = False,
-        with_etherbone = False,
-        with_ethernet  = False,
-        eth_dynamic_ip = False,
-        eth_reset_time = "10e-3",
-        eth_ip         = "192.168.1.120",
+        with_pcie              = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        with_ethernet          = False,
+        eth_dynamic_ip         = False,
+        eth_reset_time         = "10e-3",
+        eth_ip                 = "192.168.1.120",
         **kwargs):
         platform = antmicro_artix_dc_scm.Platform(device=device, toolchain=toolchain)
 
@@ -97,10 +101,11 @@ class BaseSoC(SoCCore):
                 pads       = self.platform.request("eth"),
                 hw_reset_cycles = math.ceil(float(eth_reset_time) * self.sys_clk_freq)
             )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets main_ethphy_eth_rx_clk_ibuf]")
 
@@ -124,15 +129,17 @@ def main():
     parser.add_target_argument("--flash",        action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--device",       default="xc7a100tfgg484-1", choices=["xc7a100tfgg484-1", "xc7a15tfgg484-1"])
-    parser.add_target_argument("--with-pcie",    action="store_true",      help="Add PCIe.")
+    parser.add_target_argument("--with-pcie",    action="store_true",              help="Add PCIe.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",        action="store_true",    help="Add Ethernet.")
-    ethopts.add_argument("--with-etherbone",       action="store_true",    help="Add EtherBone.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--eth-reset-time", default="10e-3",        help="Duration of Ethernet PHY reset.")
-    parser.add_target_argument("--with-sdram",     action="store_true",    help="Add SDRAM.")
-    parser.add_target_argument("--with-emmc",      action="store_true",    help="Add eMMC.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",    help="Add Ethernet.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",    help="Add EtherBone.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,   help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--eth-reset-time",         default="10e-3",        help="Duration of Ethernet PHY reset.")
+    parser.add_target_argument("--with-sdram",             action="store_true",    help="Add SDRAM.")
+    parser.add_target_argument("--with-emmc",              action="store_true",    help="Add eMMC.")
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -144,6 +151,8 @@ def main():
         with_pcie              = args.with_pcie,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         eth_reset_time         = args.eth_reset_time,
@@ -151,7 +160,7 @@ def main():
     )
 
     if args.with_emmc:
-        soc.add_sdcard(software_debug=False)
+        add_sdcard_hs(soc, software_debug=False)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -14,6 +14,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import antmicro_datacenter_ddr4_test_board
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -38,7 +41,7 @@ from litespi.opcodes import SpiNorFlashOpCodes as Codes
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, iodelay_clk_freq, with_video_pll=False):
+    def __init__(self, platform, sys_clk_freq, iodelay_clk_freq, with_video_pll=False, pix_clk=40e6):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys2x     = ClockDomain()
@@ -70,8 +73,8 @@ class _CRG(LiteXModule):
             self.video_pll = video_pll = S7MMCM(speedgrade=-1)
             self.comb += video_pll.reset.eq(self.rst)
             video_pll.register_clkin(clk100, 100e6)
-            video_pll.create_clkout(self.cd_hdmi,   40e6)
-            video_pll.create_clkout(self.cd_hdmi5x, 5*40e6)
+            video_pll.create_clkout(self.cd_hdmi,   pix_clk)
+            video_pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
 
 # BaseSoC ------------------------------------------------------------------------------------------
@@ -80,6 +83,8 @@ class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=100e6, iodelay_clk_freq=200e6,
             with_ethernet          = False,
             with_etherbone         = False,
+            etherbone_buffer_depth = 16,
+            eth_data_width         = 8,
             eth_ip                 = "192.168.1.50",
             eth_reset_time         = "10e-3",
             eth_dynamic_ip         = False,
@@ -89,12 +94,22 @@ class BaseSoC(SoCCore):
             with_led_chaser        = True,
             with_video_terminal    = False,
             with_video_framebuffer = False,
+            video_timings          = None,
             **kwargs):
         platform = antmicro_datacenter_ddr4_test_board.Platform()
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoS7HDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=64, rate="1:4", memtype="DDR"),
+            pll             = lambda: S7MMCM(speedgrade=-1),
+            clkin_freq      = 100e6)
+
         # CRG --------------------------------------------------------------------------------------
         with_video_pll = (with_video_terminal or with_video_framebuffer)
-        self.crg = _CRG(platform, sys_clk_freq, iodelay_clk_freq=iodelay_clk_freq, with_video_pll=with_video_pll)
+        self.crg = _CRG(platform, sys_clk_freq, iodelay_clk_freq=iodelay_clk_freq, with_video_pll=with_video_pll,
+            pix_clk = get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on data center test board", **kwargs)
@@ -122,7 +137,7 @@ class BaseSoC(SoCCore):
 
         # SD Card ----------------------------------------------------------------------------------
         if with_sdcard:
-            self.add_sdcard()
+            add_sdcard_hs(self)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
@@ -135,10 +150,11 @@ class BaseSoC(SoCCore):
                 rx_delay   = 0.8e-9,
                 hw_reset_cycles = math.ceil(float(eth_reset_time) * self.sys_clk_freq)
             )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -152,7 +168,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -194,6 +210,8 @@ def main():
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",                action="store_true",    help="Add Ethernet.")
     ethopts.add_argument("--with-etherbone",               action="store_true",    help="Add EtherBone.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,   help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_target_argument("--eth-ip",                 default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--eth-dynamic-ip",         action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--eth-reset-time",         default="10e-3",        help="Duration of Ethernet PHY reset.")
@@ -201,6 +219,7 @@ def main():
     parser.add_target_argument("--with-sdcard",            action="store_true",    help="Add SDCard.")
     parser.add_target_argument("--with-video-terminal",    action="store_true",    help="Enable Video Terminal (HDMI).")
     parser.add_target_argument("--with-video-framebuffer", action="store_true",    help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-timings",          default=None,           help="Video Framebuffer timings (default: largest feasible).")
     parser.add_target_argument("--with-spi-flash",         action="store_true",    help="Enable SPI Flash (MMAPed).")
     args = parser.parse_args()
 
@@ -211,6 +230,8 @@ def main():
         iodelay_clk_freq       = args.iodelay_clk_freq,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_hyperram          = args.with_hyperram,
@@ -218,6 +239,7 @@ def main():
         with_spi_flash         = args.with_spi_flash,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -10,6 +10,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import antmicro_lpddr4_test_board
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -49,13 +51,15 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=50e6, iodelay_clk_freq=200e6,
-            with_ethernet   = False,
-            with_etherbone  = False,
-            eth_ip          = "192.168.1.50",
-            eth_dynamic_ip  = False,
-            with_hyperram   = False,
-            with_sdcard     = False,
-            with_led_chaser = True,
+            with_ethernet          = False,
+            with_etherbone         = False,
+            etherbone_buffer_depth = 16,
+            eth_data_width         = 8,
+            eth_ip                 = "192.168.1.50",
+            eth_dynamic_ip         = False,
+            with_hyperram          = False,
+            with_sdcard            = False,
+            with_led_chaser        = True,
             **kwargs):
         platform = antmicro_lpddr4_test_board.Platform()
 
@@ -85,7 +89,7 @@ class BaseSoC(SoCCore):
 
         # SD Card ----------------------------------------------------------------------------------
         if with_sdcard:
-            self.add_sdcard()
+            add_sdcard_hs(self)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
@@ -97,10 +101,11 @@ class BaseSoC(SoCCore):
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0.8e-9,
             )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -113,29 +118,33 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=antmicro_lpddr4_test_board.Platform, description="LiteX SoC on LPDDR4 Test Board.")
-    parser.add_target_argument("--flash",            action="store_true", help="Flash bitstream.")
-    parser.add_target_argument("--sys-clk-freq",     default=50e6,  type=float, help="System clock frequency.")
-    parser.add_target_argument("--iodelay-clk-freq", default=200e6, type=float, help="IODELAYCTRL frequency.")
+    parser.add_target_argument("--flash",                  action="store_true", help="Flash bitstream.")
+    parser.add_target_argument("--sys-clk-freq",           default=50e6,  type=float, help="System clock frequency.")
+    parser.add_target_argument("--iodelay-clk-freq",       default=200e6, type=float, help="IODELAYCTRL frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",          action="store_true",    help="Add Ethernet.")
-    ethopts.add_argument("--with-etherbone",         action="store_true",    help="Add EtherBone.")
-    parser.add_target_argument("--eth-ip",           default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-dynamic-ip",   action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--with-hyperram",    action="store_true",    help="Add HyperRAM.")
-    parser.add_target_argument("--with-sdcard",      action="store_true",    help="Add SDCard.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",    help="Add Ethernet.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",    help="Add EtherBone.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,   help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--with-hyperram",          action="store_true",    help="Add HyperRAM.")
+    parser.add_target_argument("--with-sdcard",            action="store_true",    help="Add SDCard.")
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq      = args.sys_clk_freq,
-        iodelay_clk_freq  = args.iodelay_clk_freq,
-        with_ethernet     = args.with_ethernet,
-        with_etherbone    = args.with_etherbone,
-        eth_ip            = args.eth_ip,
-        eth_dynamic_ip    = args.eth_dynamic_ip,
-        with_hyperram     = args.with_hyperram,
-        with_sdcard       = args.with_sdcard,
+        sys_clk_freq           = args.sys_clk_freq,
+        iodelay_clk_freq       = args.iodelay_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_hyperram          = args.with_hyperram,
+        with_sdcard            = args.with_sdcard,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
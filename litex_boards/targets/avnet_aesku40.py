@@ -14,6 +14,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import avnet_aesku40
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -26,40 +28,23 @@ from liteeth.phy.usrgmii import LiteEthPHYRGMII
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys4x  = ClockDomain(reset_less=True)
-        self.cd_pll4x  = ClockDomain(reset_less=True)
-        self.cd_idelay = ClockDomain()
-        self.cd_eth    = ClockDomain()
-
-        # # #
-
-        self.pll = pll = USMMCM(speedgrade=-2)
-        self.comb += pll.reset.eq(platform.request("cpu_reset") | self.rst)
-        pll.register_clkin(platform.request("clk250"), 250e6)
-        pll.create_clkout(self.cd_pll4x, sys_clk_freq*4, buf=None, with_reset=False)
-        pll.create_clkout(self.cd_idelay, 200e6)
-        pll.create_clkout(self.cd_eth,    200e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.specials += [
-            Instance("BUFGCE_DIV",
-                p_BUFGCE_DIVIDE=4,
-                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys.clk),
-            Instance("BUFGCE",
-                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys4x.clk),
-        ]
-
-        self.idelayctrl = USIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
+        BoardCRG.__init__(self, platform,
+            pll        = USMMCM(speedgrade=-2),
+            clkin      = platform.request("clk250"),
+            clkin_freq = 250e6,
+            rst        = platform.request("cpu_reset"),
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, idelay_clk_freq=200e6)
+        self.add_domain("eth", 200e6)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
         with_ethernet   = False,
+        eth_data_width  = 8,
         with_etherbone  = False,
         eth_ip          = "192.168.1.50",
         with_led_chaser = True,
@@ -81,6 +66,7 @@ class BaseSoC(SoCCore):
                 pads       = self.platform.request("eth"),
                 tx_delay=1e-9, #Supported Delay with 200 MHz ref clk
                 rx_delay=1e-9)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
 
             # Change ref clk for IDELAYE3: FIXME: Allow it direclty in LiteEth?
             for special in self.ethphy.rx._fragment.specials:
@@ -89,7 +75,7 @@ class BaseSoC(SoCCore):
                         if item.name == "REFCLK_FREQUENCY":
                             item.value=200.00
                             
-            self.add_ethernet(phy=self.ethphy)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
@@ -110,16 +96,18 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=avnet_aesku40.Platform, description="LiteX SoC on AESKU40.")
-    parser.add_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
+    parser.add_argument("--sys-clk-freq", default=125e6, type=float,       help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true",    help="Add Ethernet.")
-    ethopts.add_argument("--with-etherbone", action="store_true",    help="Add EtherBone.")
-    parser.add_target_argument("--eth-ip",   default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    ethopts.add_argument("--with-ethernet",        action="store_true",    help="Add Ethernet.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    ethopts.add_argument("--with-etherbone",       action="store_true",    help="Add EtherBone.")
+    parser.add_target_argument("--eth-ip",         default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
         with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
         **parser.soc_argdict
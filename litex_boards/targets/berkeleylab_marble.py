@@ -29,6 +29,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import berkeleylab_marble
+from litex_boards.lib.ethernet import check_eth_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -70,11 +71,13 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        with_rts_reset  = False,
-        with_led_chaser = True,
-        spd_dump        = None,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 255,
+        eth_data_width         = 8,
+        with_rts_reset         = False,
+        with_led_chaser        = True,
+        spd_dump               = None,
         **kwargs):
         platform = berkeleylab_marble.Platform()
 
@@ -120,16 +123,18 @@ class BaseSoC(SoCCore):
                 pads       = self.platform.request("eth"),
                 tx_delay   = 0
             )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
 
         if with_ethernet:
             self.add_ethernet(
                 phy            = self.ethphy,
                 dynamic_ip     = True,
-                software_debug = False
+                software_debug = False,
+                data_width     = eth_data_width,
             )
 
         if with_etherbone:
-            self.add_etherbone(phy=self.ethphy, buffer_depth=255)
+            self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # System I2C (behing multiplexer) ----------------------------------------------------------
         i2c_pads = platform.request('i2c_fpga')
@@ -146,20 +151,24 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=berkeleylab_marble.Platform, description="LiteX SoC on BerkeleyLab Marble.")
-    parser.add_target_argument("--sys-clk-freq",   default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
-    parser.add_target_argument("--with-rts-reset", action="store_true",       help="Connect UART RTS line to sys_clk reset.")
-    parser.add_target_argument("--with-bist",      action="store_true",       help="Add DDR3 BIST Generator/Checker.")
-    parser.add_target_argument("--spd-dump",                                  help="DDR3 configuration file, dumped using the `spdread` command in LiteX BIOS.")
+    parser.add_target_argument("--sys-clk-freq",           default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=255, type=int,     help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--with-rts-reset",         action="store_true",       help="Connect UART RTS line to sys_clk reset.")
+    parser.add_target_argument("--with-bist",              action="store_true",       help="Add DDR3 BIST Generator/Checker.")
+    parser.add_target_argument("--spd-dump",                                          help="DDR3 configuration file, dumped using the `spdread` command in LiteX BIOS.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        with_bist      = args.with_bist,
-        spd_dump       = args.spd_dump,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        with_bist              = args.with_bist,
+        spd_dump               = args.spd_dump,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -42,6 +42,22 @@
 #
 # Note you can also use the i5a-907 board:
 # ./colorlight_5a_75x.py --board=i5a-907 --revision=7.0 --build
+#
+# 4) SoC with both Ethernet PHYs used as a UDP relay (ex to daisy-chain boards):
+# ./colorlight_5a_75x.py --with-eth-relay --eth-ip=192.168.1.50 --eth-relay-ip=192.168.2.50 --build
+# ./colorlight_5a_75x.py --load
+# UDP packets received on PHY 0 on --eth-relay-udp-port are forwarded in hardware on PHY 1 to
+# --eth-relay-remote-ip (and packets received on PHY 1 to --eth-relay-host-ip on PHY 0). Each PHY
+# has its own UDP/IP stack (and answers ARP/ping), destination IPs can be changed at runtime through
+# the ethrelay*_remote_ip CSRs.
+#
+# 5) SoC driving HUB75 LED panels from Ethernet (5A-75B/5A-75E):
+# ./colorlight_5a_75x.py --with-hub75 --hub75-panel=64x32 --hub75-chain-length=2 --build
+# ./colorlight_5a_75x.py --load
+# Frames are sent over UDP on --hub75-udp-port (see litex_boards/lib/hub75.py for the packet format)
+# and written to a SDRAM framebuffer that is scanned to all the HUB75 connectors in hardware.
+# Scanner/Gamma LUT are controlled through the hub75_* CSRs (over Etherbone). HUB75 uses the Etherbone
+# UDP/IP stack and can't be combined with --with-ethernet or --with-eth-relay.
 
 
 from migen import *
@@ -52,6 +68,10 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import colorlight_5a_75b, colorlight_5a_75e, colorlight_i5a_907
+from litex_boards.lib.ethernet import check_eth_data_width, EthUDPRelay
+from litex_boards.lib.hub75 import HUB75Scanner, HUB75UDPReceiver, parse_hub75_panel
+from litex_boards.lib.pll_cache import use_pll_cache
+from litex_boards.lib.fmax import get_sys_clk_freq_type, get_sys_clk_freq_help
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -62,6 +82,7 @@ from litedram.modules import M12L16161A, M12L64322A
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
+from liteeth.core import LiteEthUDPIPCore
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -92,7 +113,7 @@ class _CRG(LiteXModule):
         rst_n = 1 if not with_rst else platform.request("user_btn_n", 0)
 
         # PLL
-        self.pll = pll = ECP5PLL()
+        self.pll = pll = use_pll_cache(ECP5PLL())
         self.comb += pll.reset.eq(~rst_n | self.rst)
         pll.register_clkin(clk, clk_freq)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
@@ -104,7 +125,7 @@ class _CRG(LiteXModule):
 
         # USB PLL
         if with_usb_pll:
-            self.usb_pll = usb_pll = ECP5PLL()
+            self.usb_pll = usb_pll = use_pll_cache(ECP5PLL())
             self.comb += usb_pll.reset.eq(~rst_n | self.rst)
             usb_pll.register_clkin(clk, clk_freq)
             self.cd_usb_12 = ClockDomain()
@@ -120,14 +141,27 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, board, revision, sys_clk_freq=60e6, toolchain="trellis",
-        with_ethernet    = False,
-        with_etherbone   = False,
-        eth_ip           = "192.168.1.50",
-        eth_phy          = 0,
-        with_led_chaser  = True,
-        use_internal_osc = False,
-        sdram_rate       = "1:1",
-        with_spi_flash   = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 32,
+        eth_ip                 = "192.168.1.50",
+        eth_phy                = 0,
+        with_eth_relay         = False,
+        eth_relay_ip           = "192.168.2.50",
+        eth_relay_remote_ip    = "192.168.2.100",
+        eth_relay_host_ip      = "192.168.1.100",
+        eth_relay_udp_port     = 6000,
+        with_hub75             = False,
+        hub75_panel            = "64x32",
+        hub75_chain_length     = 1,
+        hub75_bit_depth        = 8,
+        hub75_gamma            = 2.2,
+        hub75_udp_port         = 7000,
+        with_led_chaser        = True,
+        use_internal_osc       = False,
+        sdram_rate             = "1:1",
+        with_spi_flash         = False,
         **kwargs):
         board = board.lower()
         assert board in ["5a-75b", "5a-75e", "i5a-907"]
@@ -138,7 +172,17 @@ class BaseSoC(SoCCore):
         elif board == "i5a-907":
             platform = colorlight_i5a_907.Platform(revision=revision, toolchain=toolchain)
 
-        if board == "5a-75e" and revision == "6.0" and (with_etherbone or with_ethernet):
+        # HUB75 frames are received over UDP on the Etherbone UDP/IP stack.
+        if with_hub75:
+            if board == "i5a-907":
+                raise ValueError("HUB75 only supported on 5A-75B/5A-75E.")
+            if with_ethernet:
+                raise ValueError("HUB75 can't be used with --with-ethernet.")
+            if with_eth_relay:
+                raise ValueError("HUB75 can't be used with --with-eth-relay (both PHYs used by the relay).")
+            with_etherbone = True
+
+        if board == "5a-75e" and revision == "6.0" and (with_etherbone or with_ethernet or with_eth_relay):
             assert use_internal_osc, "You cannot use the 25MHz clock as system clock since it is provided by the Ethernet PHY and will stop during PHY reset."
 
         # CRG --------------------------------------------------------------------------------------
@@ -161,6 +205,15 @@ class BaseSoC(SoCCore):
 
         SoCCore.__init__(self, platform, int(sys_clk_freq), ident="LiteX SoC on Colorlight " + board.upper(), **kwargs)
 
+        # HUB75 Framebuffer geometry (framebuffer reserved at the end of the SDRAM) ---------------
+        hub75_fb_size = 0
+        if with_hub75:
+            hub75_platform = {"5a-75b": colorlight_5a_75b, "5a-75e": colorlight_5a_75e}[board]
+            hub75_nchains  = len(hub75_platform.hub75e) - 1
+            panel_width, panel_height = parse_hub75_panel(hub75_panel)
+            hub75_width   = panel_width*hub75_chain_length
+            hub75_fb_size = 4*hub75_width*panel_height*hub75_nchains
+
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
@@ -169,9 +222,16 @@ class BaseSoC(SoCCore):
                 sdram_cls  = M12L64322A
             else:
                 sdram_cls  = M12L16161A
+            sdram_module = sdram_cls(sys_clk_freq, sdram_rate)
+            sdram_size   = 2**(sdram_module.geom_settings.bankbits +
+                               sdram_module.geom_settings.rowbits +
+                               sdram_module.geom_settings.colbits)*self.sdrphy.settings.nranks*self.sdrphy.settings.databits//8
+            if hub75_fb_size >= sdram_size:
+                raise ValueError(f"HUB75 framebuffer ({hub75_fb_size} bytes) too large for the SDRAM ({sdram_size} bytes).")
             self.add_sdram("sdram",
                 phy                     = self.sdrphy,
-                module                  = sdram_cls(sys_clk_freq, sdram_rate),
+                module                  = sdram_module,
+                size                    = sdram_size - hub75_fb_size, # main_ram excludes the HUB75 framebuffer.
                 l2_cache_size           = kwargs.get("l2_size", 8192),
                 l2_cache_full_memory_we = False,
 
@@ -183,10 +243,89 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 tx_delay   = 0e-9)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, data_width=32)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=32)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=eth_data_width, buffer_depth=etherbone_buffer_depth)
+
+        # Ethernet Relay ---------------------------------------------------------------------------
+        if with_eth_relay:
+            if with_ethernet or with_etherbone:
+                raise ValueError("Ethernet relay can't be used with --with-ethernet/--with-etherbone.")
+            relay_ips        = [eth_ip,            eth_relay_ip]
+            relay_remote_ips = [eth_relay_host_ip, eth_relay_remote_ip]
+            relay_ports      = []
+            for n in range(2):
+                # Ethernet PHY.
+                ethphy = LiteEthPHYRGMII(
+                    clock_pads = self.platform.request("eth_clocks", n),
+                    pads       = self.platform.request("eth", n),
+                    tx_delay   = 0e-9)
+                self.add_module(name=f"ethphy{n}", module=ethphy)
+                # Relay always runs on the 32-bit sys clock datapath: both PHYs share a clock domain.
+                check_eth_data_width(ethphy, self.sys_clk_freq, 32)
+
+                # UDP/IP Stack.
+                ethcore = LiteEthUDPIPCore(
+                    phy               = ethphy,
+                    mac_address       = 0x10e2d5000000 + n,
+                    ip_address        = relay_ips[n],
+                    clk_freq          = self.clk_freq,
+                    dw                = 32,
+                    with_sys_datapath = True,
+                )
+                ethcore = ClockDomainsRenamer({
+                    "eth_tx": f"ethphy{n}_eth_tx",
+                    "eth_rx": f"ethphy{n}_eth_rx",
+                })(ethcore)
+                self.add_module(name=f"ethcore{n}", module=ethcore)
+                relay_ports.append(ethcore.udp.crossbar.get_port(eth_relay_udp_port, dw=32))
+
+                # Timing Constraints.
+                self.platform.add_period_constraint(ethphy.crg.cd_eth_rx.clk, 1e9/ethphy.rx_clk_freq)
+                self.platform.add_period_constraint(ethphy.crg.cd_eth_tx.clk, 1e9/ethphy.tx_clk_freq)
+                self.platform.add_false_path_constraints(self.crg.cd_sys.clk, ethphy.crg.cd_eth_rx.clk, ethphy.crg.cd_eth_tx.clk)
+
+            # Forwarding Paths (PHY0 -> PHY1 and PHY1 -> PHY0).
+            for n in range(2):
+                self.add_module(name=f"ethrelay{n}", module=EthUDPRelay(
+                    rx_port   = relay_ports[n],
+                    tx_port   = relay_ports[1 - n],
+                    udp_port  = eth_relay_udp_port,
+                    remote_ip = relay_remote_ips[1 - n],
+                ))
+
+        # HUB75 ------------------------------------------------------------------------------------
+        if with_hub75:
+            assert not self.integrated_main_ram_size
+            platform.add_extension(hub75_platform.hub75e)
+            hub75_chains  = [platform.request("hub75_chain", n) for n in range(hub75_nchains)]
+            hub75_fb_base = self.bus.regions["main_ram"].size # At the end of the SDRAM, after main_ram.
+
+            # Scanner: SDRAM Framebuffer -> HUB75.
+            self.hub75 = HUB75Scanner(
+                control_pads = platform.request("hub75_control"),
+                chain_pads   = hub75_chains,
+                port         = self.sdram.crossbar.get_port(mode="read", data_width=32),
+                sys_clk_freq = sys_clk_freq,
+                width        = hub75_width,
+                height       = panel_height,
+                bit_depth    = hub75_bit_depth,
+                gamma        = hub75_gamma,
+                base         = hub75_fb_base,
+            )
+
+            # UDP Receiver: UDP -> SDRAM Framebuffer.
+            self.hub75_rx = HUB75UDPReceiver(
+                udp_port = self.ethcore_etherbone.udp.crossbar.get_port(hub75_udp_port,
+                    dw = 32,
+                    cd = {32: "sys", 8: "etherbone"}[eth_data_width], # Etherbone clock domain runs from sys_clk.
+                ),
+                port     = self.sdram.crossbar.get_port(mode="write", data_width=32),
+                base     = hub75_fb_base,
+                size     = hub75_fb_size,
+            )
 
         # Leds -------------------------------------------------------------------------------------
         # Disable leds when serial is used.
@@ -221,29 +360,55 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=colorlight_5a_75b.Platform, description="LiteX SoC on Colorlight 5A-75X.")
-    parser.add_target_argument("--board",             default="5a-75b",         help="Board type (5a-75b, 5a-75e or i5a-907).")
-    parser.add_target_argument("--revision",          default="7.0",            help="Board revision (6.0, 6.1, 7.0 or 8.0).")
-    parser.add_target_argument("--sys-clk-freq",      default=60e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--board",                  default="5a-75b",         help="Board type (5a-75b, 5a-75e or i5a-907).")
+    parser.add_target_argument("--revision",               default="7.0",            help="Board revision (6.0, 6.1, 7.0 or 8.0).")
+    parser.add_target_argument("--sys-clk-freq",           default=60e6, type=get_sys_clk_freq_type("colorlight_5a_75x"), help=get_sys_clk_freq_help("colorlight_5a_75x"))
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",           action="store_true",    help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",          action="store_true",    help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",            default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-phy",           default=0, type=int,    help="Ethernet PHY (0 or 1).")
-    parser.add_target_argument("--use-internal-osc",  action="store_true",    help="Use internal oscillator.")
-    parser.add_target_argument("--sdram-rate",        default="1:1",          help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
-    parser.add_target_argument("--with-spi-flash",    action="store_true",    help="Add SPI flash support to the SoC")
+    ethopts.add_argument("--with-ethernet",                action="store_true",     help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",     help="Enable Etherbone support.")
+    ethopts.add_argument("--with-eth-relay",               action="store_true",     help="Enable UDP relay between both Ethernet PHYs.")
+    parser.add_target_argument("--with-hub75",             action="store_true",     help="Enable HUB75 LED panels driver fed from UDP (implies Etherbone).")
+    parser.add_target_argument("--hub75-panel",            default="64x32",         help="HUB75 panel size (WidthxHeight).")
+    parser.add_target_argument("--hub75-chain-length",     default=1, type=int,     help="HUB75 panels chained on each connector.")
+    parser.add_target_argument("--hub75-bit-depth",        default=8, type=int,     help="HUB75 bit depth per color (after Gamma LUT).")
+    parser.add_target_argument("--hub75-gamma",            default=2.2, type=float, help="HUB75 Gamma LUT initial gamma.")
+    parser.add_target_argument("--hub75-udp-port",         default=7000, type=int,  help="HUB75 frames UDP port.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,    help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=32, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-phy",                default=0, type=int,     help="Ethernet PHY (0 or 1).")
+    parser.add_target_argument("--eth-relay-ip",           default="192.168.2.50",  help="Ethernet relay IP address of PHY 1 (PHY 0 uses --eth-ip).")
+    parser.add_target_argument("--eth-relay-remote-ip",    default="192.168.2.100", help="Ethernet relay destination IP address on PHY 1.")
+    parser.add_target_argument("--eth-relay-host-ip",      default="192.168.1.100", help="Ethernet relay destination IP address on PHY 0.")
+    parser.add_target_argument("--eth-relay-udp-port",     default=6000, type=int,  help="Ethernet relay UDP port.")
+    parser.add_target_argument("--use-internal-osc",       action="store_true",     help="Use internal oscillator.")
+    parser.add_target_argument("--sdram-rate",             default="1:1",           help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    parser.add_target_argument("--with-spi-flash",         action="store_true",     help="Add SPI flash support to the SoC")
     args = parser.parse_args()
 
     soc = BaseSoC(board=args.board, revision=args.revision,
-        sys_clk_freq     = args.sys_clk_freq,
-        toolchain        = args.toolchain,
-        with_ethernet    = args.with_ethernet,
-        with_etherbone   = args.with_etherbone,
-        eth_ip           = args.eth_ip,
-        eth_phy          = args.eth_phy,
-        use_internal_osc = args.use_internal_osc,
-        sdram_rate       = args.sdram_rate,
-        with_spi_flash   = args.with_spi_flash,
+        sys_clk_freq           = args.sys_clk_freq,
+        toolchain              = args.toolchain,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        eth_phy                = args.eth_phy,
+        with_eth_relay         = args.with_eth_relay,
+        eth_relay_ip           = args.eth_relay_ip,
+        eth_relay_remote_ip    = args.eth_relay_remote_ip,
+        eth_relay_host_ip      = args.eth_relay_host_ip,
+        eth_relay_udp_port     = args.eth_relay_udp_port,
+        with_hub75             = args.with_hub75,
+        hub75_panel            = args.hub75_panel,
+        hub75_chain_length     = args.hub75_chain_length,
+        hub75_bit_depth        = args.hub75_bit_depth,
+        hub75_gamma            = args.hub75_gamma,
+        hub75_udp_port         = args.hub75_udp_port,
+        use_internal_osc       = args.use_internal_osc,
+        sdram_rate             = args.sdram_rate,
+        with_spi_flash         = args.with_spi_flash,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -13,6 +13,9 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import colorlight_i5
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -30,7 +33,7 @@ from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, use_internal_osc=False, with_usb_pll=False, with_video_pll=False, sdram_rate="1:1"):
+    def __init__(self, platform, sys_clk_freq, use_internal_osc=False, with_usb_pll=False, with_video_pll=False, sdram_rate="1:1", pix_clk=40e6):
         self.rst    = Signal()
         self.cd_sys = ClockDomain()
         if sdram_rate == "1:2":
@@ -84,8 +87,8 @@ class _CRG(LiteXModule):
             video_pll.register_clkin(clk, clk_freq)
             self.cd_hdmi   = ClockDomain()
             self.cd_hdmi5x = ClockDomain()
-            video_pll.create_clkout(self.cd_hdmi,    40e6, margin=0)
-            video_pll.create_clkout(self.cd_hdmi5x, 200e6, margin=0)
+            video_pll.create_clkout(self.cd_hdmi,   pix_clk)
+            video_pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
         # SDRAM clock
         sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
@@ -97,6 +100,8 @@ class BaseSoC(SoCCore):
     def __init__(self, board="i5", revision="7.0", toolchain="trellis", sys_clk_freq=60e6,
         with_ethernet          = False,
         with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         local_ip               = "",
         remote_ip              = "",
         eth_phy                = 0,
@@ -105,11 +110,20 @@ class BaseSoC(SoCCore):
         sdram_rate             = "1:1",
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timings          = None,
         **kwargs):
         board = board.lower()
         assert board in ["i5", "i9"]
         platform = colorlight_i5.Platform(board=board, revision=revision, toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoHDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=32, rate=sdram_rate),
+            pll             = ECP5PLL,
+            clkin_freq      = 25e6 if not use_internal_osc else 310e6/5)
+
         # CRG --------------------------------------------------------------------------------------
         with_usb_pll   = kwargs.get("uart_name", None) == "usb_acm"
         with_video_pll = with_video_terminal or with_video_framebuffer
@@ -117,7 +131,8 @@ class BaseSoC(SoCCore):
             use_internal_osc = use_internal_osc,
             with_usb_pll     = with_usb_pll,
             with_video_pll   = with_video_pll,
-            sdram_rate       = sdram_rate
+            sdram_rate       = sdram_rate,
+            pix_clk          = get_video_pix_clk(video_timings),
         )
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -153,10 +168,11 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 tx_delay = 0)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         if local_ip:
             local_ip = local_ip.split(".")
@@ -178,7 +194,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -189,19 +205,22 @@ def main():
     parser.add_target_argument("--revision",         default="7.0",            help="Board revision (7.0).")
     parser.add_target_argument("--sys-clk-freq",     default=60e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",   action="store_true",      help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",  action="store_true",      help="Enable Etherbone support.")
-    parser.add_target_argument("--remote-ip", default="192.168.1.100",  help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--local-ip",  default="192.168.1.50",   help="Local IP address.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",      help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",      help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,     help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,      help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",  help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--local-ip",               default="192.168.1.50",   help="Local IP address.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",  action="store_true", help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",      action="store_true", help="Enable SDCard support.")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true", help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--eth-phy",          default=0, type=int, help="Ethernet PHY (0 or 1).")
     parser.add_target_argument("--use-internal-osc", action="store_true", help="Use internal oscillator.")
     parser.add_target_argument("--sdram-rate",       default="1:1",       help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-timings", default=None, help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     soc = BaseSoC(board=args.board, revision=args.revision,
@@ -209,6 +228,8 @@ def main():
         sys_clk_freq           = args.sys_clk_freq,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         local_ip               = args.local_ip,
         remote_ip              = args.remote_ip,
         eth_phy                = args.eth_phy,
@@ -216,13 +237,14 @@ def main():
         sdram_rate             = args.sdram_rate,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
     soc.platform.add_extension(colorlight_i5._sdcard_pmod_io)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
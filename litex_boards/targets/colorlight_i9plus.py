@@ -28,6 +28,7 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import colorlight_i9plus
+from litex_boards.lib.ethernet import check_eth_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -76,15 +77,17 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, toolchain="vivado", sys_clk_freq=100e6,
-        with_dna        = False,
-        with_pmod_uart  = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_port        = 0,
-        eth_ip          = "192.168.1.50",
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_spi_flash  = False,
+        with_dna               = False,
+        with_pmod_uart         = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        eth_port               = 0,
+        eth_ip                 = "192.168.1.50",
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
+        with_spi_flash         = False,
         **kwargs):
         platform = colorlight_i9plus.Platform(toolchain=toolchain)
 
@@ -121,10 +124,11 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks", eth_port),
                 pads       = self.platform.request("eth", eth_port),
                 tx_delay = 0)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -145,32 +149,36 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=colorlight_i9plus.Platform, description="LiteX SoC on Arty A7.")
-    parser.add_target_argument("--flash",          action="store_true",       help="Flash bitstream.")
-    parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-dna",       action="store_true",       help="Enable 7-Series DNA.")
-    parser.add_target_argument("--with-pmod-uart", action="store_true",       help="Enable uart on P2 (top) PMOD")
+    parser.add_target_argument("--flash",                  action="store_true",       help="Flash bitstream.")
+    parser.add_target_argument("--sys-clk-freq",           default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-dna",               action="store_true",       help="Enable 7-Series DNA.")
+    parser.add_target_argument("--with-pmod-uart",         action="store_true",       help="Enable uart on P2 (top) PMOD")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",        action="store_true",       help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",       action="store_true",       help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-port",       default=0, type=int,       help="Ethernet port to use (0/1)")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI Flash (MMAPed).")
+    ethopts.add_argument("--with-ethernet",                action="store_true",       help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,      help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-port",               default=0, type=int,       help="Ethernet port to use (0/1)")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--with-spi-flash",         action="store_true",       help="Enable SPI Flash (MMAPed).")
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        toolchain      = args.toolchain,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_dna       = args.with_dna,
-        with_pmod_uart = args.with_pmod_uart,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_port       = args.eth_port,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_spi_flash = args.with_spi_flash,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_dna               = args.with_dna,
+        with_pmod_uart         = args.with_pmod_uart,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_port               = args.eth_port,
+        eth_ip                 = args.eth_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_spi_flash         = args.with_spi_flash,
         **parser.soc_argdict
     )
 
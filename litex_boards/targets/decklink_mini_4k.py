@@ -17,6 +17,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import decklink_mini_4k
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.video import VideoS7GTPHDMIPHY2PPC, add_video_framebuffer_2ppc
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -33,13 +35,15 @@ from litepcie.software import generate_litepcie_software
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, pix_clk=148.5e6, with_video_2ppc=False):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys4x     = ClockDomain()
         self.cd_sys4x_dqs = ClockDomain()
         self.cd_idelay    = ClockDomain()
         self.cd_hdmi      = ClockDomain()
+        if with_video_2ppc:
+            self.cd_hdmi2x = ClockDomain()
 
         # # #
 
@@ -56,7 +60,12 @@ class _CRG(LiteXModule):
         pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
         pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
         pll.create_clkout(self.cd_idelay,    200e6, margin=1e-1)   # FIXME: Re-arrange clocking.
-        pll.create_clkout(self.cd_hdmi,      148.5e6, margin=2e-2) # FIXME: Use a second PLL or move to clkout0 that has fractional support.
+        if with_video_2ppc:
+            # 2 Pixels/Clock: Video datapath at pix_clk/2, HDMI clock forwarded from pix_clk.
+            pll.create_clkout(self.cd_hdmi,   pix_clk/2, margin=2e-2)
+            pll.create_clkout(self.cd_hdmi2x, pix_clk,   margin=2e-2)
+        else:
+            pll.create_clkout(self.cd_hdmi,   pix_clk,   margin=2e-2) # FIXME: Use a second PLL or move to clkout0 that has fractional support.
         platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
 
         # IDELAY Ctrl.
@@ -77,13 +86,27 @@ class BaseSoC(SoCMini):
         with_sata              = False,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        with_video_4k          = False,
+        video_timings          = None,
         **kwargs):
-        if with_video_terminal or with_video_framebuffer:
+        if with_video_terminal or with_video_framebuffer or with_video_4k:
             sys_clk_freq = int(148.5e6) # FIXME: For now requires sys_clk >= video_clk.
         platform = decklink_mini_4k.Platform()
 
+        # Video Timings ----------------------------------------------------------------------------
+        # 4K: 2 Pixels/Clock framebuffer/PHY (up to 3840x2160@30Hz), the DDR3 bandwidth budget
+        # (with the CPU as other master) is checked at build time.
+        video_phy = VideoS7GTPHDMIPHY2PPC if with_video_4k else VideoS7GTPHDMIPHY
+        video_timings = "1920x1080@60Hz" if not (with_video_framebuffer or with_video_4k) else get_video_timings(video_timings,
+            phy             = video_phy,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:4", memtype="DDR"))
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq,
+            pix_clk         = get_video_pix_clk(video_timings),
+            with_video_2ppc = with_video_4k,
+        )
 
         # SoCCore ----------------------------------------------------------------------------------
         kwargs["uart_name"] = "jtag_uart"
@@ -147,7 +170,16 @@ class BaseSoC(SoCMini):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="1920x1080@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="1920x1080@60Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
+            platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-49]") # FIXME: Use GTP refclk.
+        if with_video_4k:
+            self.videophy = VideoS7GTPHDMIPHY2PPC(platform.request("hdmi_out"),
+                sys_clk_freq    = sys_clk_freq,
+                clock_domain    = "hdmi",
+                clock_domain_2x = "hdmi2x",
+                clk_freq        = get_video_pix_clk(video_timings)/2,
+            )
+            add_video_framebuffer_2ppc(self, phy=self.videophy, timings=video_timings, clock_domain="hdmi")
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-49]") # FIXME: Use GTP refclk.
 
 # Build --------------------------------------------------------------------------------------------
@@ -162,6 +194,8 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    viopts.add_argument("--with-video-4k",          action="store_true", help="Enable 4K Video Framebuffer (HDMI, 2 pixels/clock, up to 3840x2160@30Hz).")
+    parser.add_target_argument("--video-timings", default=None, help="Video Framebuffer timings (default: largest feasible).")
     pcieopts.add_argument("--with-sata",            action="store_true", help="Enable SATA support (over PCIe2SATA).")
     args = parser.parse_args()
 
@@ -171,6 +205,8 @@ def main():
         with_sata              = args.with_sata,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        with_video_4k          = args.with_video_4k,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -12,6 +12,10 @@
 # Use:
 # litex_server --jtag --jtag-config=openocd_xc7_ft232.cfg
 # litex_term crossover
+#
+# HDMI Capture (Experimental, 4 inputs -> DDR3 ring buffers -> PCIe DMA, one DMA per input):
+# ./decklink_quad_hdmi_recorder.py --with-pcie --with-hdmi-capture --driver --csr-csv=csr.csv --build --load
+# ./bench/hdmi_capture_stats.py --csr-csv=csr.csv
 
 import os
 
@@ -22,6 +26,7 @@ from litex.gen import *
 from litex_boards.platforms import decklink_quad_hdmi_recorder
 
 from litex.soc.cores.clock import *
+from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
@@ -32,37 +37,80 @@ from litedram.phy import usddrphy
 from litepcie.phy.uspciephy import USPCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from liteiclink.serdes.gth3_ultrascale import GTHChannelPLL, GTH3
+
+from litex_boards.lib.video import HDMICaptureDMA
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.crg import BoardCRG
+
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys4x  = ClockDomain()
-        self.cd_pll4x  = ClockDomain()
-        self.cd_idelay = ClockDomain()
+        BoardCRG.__init__(self, platform,
+            pll        = USMMCM(speedgrade=-2),
+            clkin      = platform.request("clk200"),
+            clkin_freq = 200e6,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, idelay_clk_freq=200e6)
+
+# HDMI GTH Receiver --------------------------------------------------------------------------------
+
+class _HDMIGTHReceiver(LiteXModule):
+    # Deserialize the 3 TMDS channels of an HDMI input with GTHs (RX only, 20-bit words). TMDS
+    # channels share the TMDS clock of the source: channel 0's recovered clock is used for the 3
+    # channels (through the RX elastic buffers).
+    def __init__(self, platform, pads, refclk, refclk_freq, linerate, sys_clk_freq, name):
+        self.outputs = [Signal(20) for _ in range(3)]
 
         # # #
 
-        self.pll = pll = USMMCM(speedgrade=-2)
-        self.comb += pll.reset.eq(self.rst)
-        pll.register_clkin(platform.request("clk200"), 200e6)
-        pll.create_clkout(self.cd_pll4x, sys_clk_freq*4, buf=None, with_reset=False)
-        pll.create_clkout(self.cd_idelay, 200e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-        self.specials += [
-            Instance("BUFGCE_DIV",
-                p_BUFGCE_DIVIDE=4,
-                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys.clk),
-            Instance("BUFGCE",
-                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys4x.clk),
-        ]
-        self.idelayctrl = USIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
+        for n in range(3):
+            rx_pads = Record([("p", 1), ("n", 1)])
+            rx_pads.p = getattr(pads, f"data{n}_p")
+            rx_pads.n = getattr(pads, f"data{n}_n")
+            tx_pads = Record([("p", 1), ("n", 1)]) # Unused.
+            pll = GTHChannelPLL(refclk, refclk_freq, linerate)
+            gth = GTH3(pll, tx_pads, rx_pads, sys_clk_freq,
+                rx_clk           = None if n == 0 else ClockSignal(f"{name}_rx"),
+                data_width       = 20,
+                tx_buffer_enable = True,
+                rx_buffer_enable = True,
+                clock_aligner    = False)
+            gth = ClockDomainsRenamer({"tx": f"{name}_tx{n}", "rx": f"{name}_rx" if n == 0 else f"{name}_rx{n}"})(gth)
+            self.add_module(name=f"gth{n}", module=gth)
+            self.comb += gth.rx_align.eq(0) # No comma alignment on TMDS, done by the capture.
+            self.comb += self.outputs[n].eq(Cat(gth.decoders[0].input, gth.decoders[1].input))
+            platform.add_period_constraint(gth.cd_tx.clk, 1e9/gth.tx_clk_freq)
+            if n == 0:
+                platform.add_period_constraint(gth.cd_rx.clk, 1e9/gth.rx_clk_freq)
+
+# HDMI Capture Helpers -----------------------------------------------------------------------------
+
+HDMI_GTH_REFCLK_FREQ = 100e6 # PCIe reference clock (HDMI clock pins not known).
+
+def check_hdmi_linerate(linerate):
+    # The GTHs run from the 100MHz PCIe refclk: Only linerates reachable from it can be received,
+    # which excludes the standard TMDS linerates (ex 742.5Mbps for 720p60, 1.485Gbps for 1080p60).
+    try:
+        GTHChannelPLL.compute_config(HDMI_GTH_REFCLK_FREQ, linerate)
+    except ValueError:
+        raise ValueError(f"HDMI linerate {linerate/1e9:3.4f} Gbps not reachable from the "
+            f"{HDMI_GTH_REFCLK_FREQ/1e6:3.0f}MHz PCIe refclk (experimental HDMI Capture only "
+            f"supports linerates reachable from it, ex 1.25Gbps, not the standard TMDS ones).")
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=200e6, with_pcie=False, pcie_lanes=4, **kwargs):
+    def __init__(self, sys_clk_freq=200e6, with_pcie=False, pcie_lanes=4,
+        with_hdmi_capture = False,
+        hdmi_linerate     = 1.25e9,
+        hdmi_slots        = 4,
+        **kwargs):
+        if with_hdmi_capture and not with_pcie:
+            raise ValueError("HDMI Capture requires PCIe (--with-pcie).")
+        if with_hdmi_capture:
+            check_hdmi_linerate(hdmi_linerate)
         platform = decklink_quad_hdmi_recorder.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -73,6 +121,10 @@ class BaseSoC(SoCCore):
         kwargs["with_jtabone"] = True
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Blackmagic Decklink Quad HDMI Recorder", **kwargs)
 
+        # HDMI Capture Ring Buffers (reserved at the end of the SDRAM) -----------------------------
+        hdmi_slot_size = 0x00800000 # Up to 1920x1080 RGB32.
+        hdmi_ring_size = 4*hdmi_slots*hdmi_slot_size if with_hdmi_capture else 0
+
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
             self.ddrphy = usddrphy.USDDRPHY(
@@ -80,9 +132,16 @@ class BaseSoC(SoCCore):
                 memtype          = "DDR3",
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
+            sdram_module = MT41J256M16(sys_clk_freq, "1:4")
+            sdram_size   = 2**(sdram_module.geom_settings.bankbits +
+                               sdram_module.geom_settings.rowbits +
+                               sdram_module.geom_settings.colbits)*self.ddrphy.settings.nranks*self.ddrphy.settings.databits//8
+            if hdmi_ring_size >= sdram_size:
+                raise ValueError(f"HDMI Capture ring buffers ({hdmi_ring_size} bytes) too large for the SDRAM ({sdram_size} bytes).")
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
-                module        = MT41J256M16(sys_clk_freq, "1:4"),
+                module        = sdram_module,
+                size          = sdram_size - hdmi_ring_size, # main_ram excludes the HDMI Capture ring buffers.
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
@@ -98,26 +157,67 @@ class BaseSoC(SoCCore):
                 speed      = "gen3",
                 data_width = data_width,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=4 if with_hdmi_capture else 1)
             # False Paths (FIXME: Improve integration).
             platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks sys_clk] -to [get_clocks pcie_clk_1]")
             platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks pcie_clk_1] -to [get_clocks sys_clk]")
 
+        # HDMI Capture (Experimental) --------------------------------------------------------------
+        # Each input is deserialized/decoded/deskewed in its recovered clock domain and its frames
+        # are written to a DDR3 ring buffer, then sent to the Host through its own PCIe DMA. Frames
+        # are dropped (and counted) when the ring buffer is full.
+        # Note: The HDMI clock pins are not known, the GTHs use the PCIe reference clock (100MHz) so
+        # the TMDS linerate (10x pixel clock) has to be reachable from it (ex 1.25Gbps: 125MHz),
+        # which is not the case of the standard video modes (see check_hdmi_linerate).
+        if with_hdmi_capture:
+            assert not self.integrated_main_ram_size
+            self.hdmi_ring_base = self.bus.regions["main_ram"].size # At the end of the SDRAM, after main_ram.
+            for n in range(4):
+                hdmi_rx = _HDMIGTHReceiver(platform, platform.request("hdmi_in", n),
+                    refclk       = self.pcie_phy.pcie_refclk_gt,
+                    refclk_freq  = HDMI_GTH_REFCLK_FREQ,
+                    linerate     = hdmi_linerate,
+                    sys_clk_freq = sys_clk_freq,
+                    name         = f"hdmi{n}")
+                self.add_module(name=f"hdmi{n}_rx", module=hdmi_rx)
+                hdmi_capture = HDMICaptureDMA(
+                    write_port   = self.sdram.crossbar.get_port(mode="write", data_width=64),
+                    read_port    = self.sdram.crossbar.get_port(mode="read",  data_width=data_width),
+                    base         = self.hdmi_ring_base + n*hdmi_slots*hdmi_slot_size,
+                    slot_size    = hdmi_slot_size,
+                    nslots       = hdmi_slots,
+                    clock_domain = f"hdmi{n}_rx")
+                self.add_module(name=f"hdmi{n}_capture", module=hdmi_capture)
+                for i in range(3):
+                    self.comb += hdmi_capture.inputs[i].eq(hdmi_rx.outputs[i])
+                self.comb += hdmi_capture.source.connect(getattr(self, f"pcie_dma{n}").sink)
+                platform.add_false_path_constraints(self.crg.cd_sys.clk, hdmi_rx.gth0.cd_rx.clk)
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=decklink_quad_hdmi_recorder.Platform, description="LiteX SoC on Blackmagic Decklink Quad HDMI Recorder.")
-    parser.add_target_argument("--sys-clk-freq", default=200e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",      default=200e6, type=float,  help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",         action="store_true",        help="Enable PCIe support.")
+    parser.add_target_argument("--with-hdmi-capture", action="store_true",        help="Enable 4x HDMI Capture to DDR3/PCIe DMA (experimental, requires --with-pcie).")
+    parser.add_target_argument("--hdmi-linerate",     default=1.25e9, type=float, help="HDMI TMDS linerate (10x pixel clock, must be reachable from the 100MHz PCIe refclk: standard video modes are not).")
+    parser.add_target_argument("--hdmi-slots",        default=4, type=int,        help="HDMI Capture ring buffer slots (frames) per input.")
+    parser.add_target_argument("--driver",            action="store_true",        help="Generate PCIe driver.")
+    parser.add_target_argument("--fast-config",       action="store_true",        help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
+        sys_clk_freq      = args.sys_clk_freq,
+        with_pcie         = args.with_pcie,
+        with_hdmi_capture = args.with_hdmi_capture,
+        hdmi_linerate     = args.hdmi_linerate,
+        hdmi_slots        = args.hdmi_slots,
         **parser.soc_argdict
 	)
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
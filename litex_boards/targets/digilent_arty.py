@@ -17,6 +17,12 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_arty
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.tftp import add_tftp_receiver
+from litex_boards.lib.sim import add_sim_args, run_sim, get_sim_sdram_args
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -34,56 +40,39 @@ from liteeth.phy.mii import LiteEthPHYMII
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq, with_dram=True, with_rst=True):
-        self.rst    = Signal()
-        self.cd_sys = ClockDomain()
-        self.cd_eth = ClockDomain()
-        if with_dram:
-            self.cd_sys4x     = ClockDomain()
-            self.cd_sys4x_dqs = ClockDomain()
-            self.cd_idelay    = ClockDomain()
-
-        # # #
-
-        # Clk/Rst.
-        clk100 = platform.request("clk100")
-        rst    = ~platform.request("cpu_reset") if with_rst else 0
-
-        # PLL.
-        self.pll = pll = S7PLL(speedgrade=-1)
-        self.comb += pll.reset.eq(rst | self.rst)
-        pll.register_clkin(clk100, 100e6)
-        pll.create_clkout(self.cd_sys, sys_clk_freq)
-        pll.create_clkout(self.cd_eth, 25e6)
+        BoardCRG.__init__(self, platform,
+            pll        = S7PLL(speedgrade=-1),
+            clkin      = platform.request("clk100"),
+            clkin_freq = 100e6,
+            rst        = ~platform.request("cpu_reset") if with_rst else 0,
+        )
+        self.add_sys(sys_clk_freq, with_dram=with_dram, domains={"eth": 25e6})
         self.comb += platform.request("eth_ref_clk").eq(self.cd_eth.clk)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-        if with_dram:
-            pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-            pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
-            pll.create_clkout(self.cd_idelay,    200e6)
-
-        # IdelayCtrl.
-        if with_dram:
-            self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
+    sdram_module = MT41K128M16 # DRAM module (hardware and --sim).
+
     def __init__(self, variant="a7-35", toolchain="vivado", sys_clk_freq=100e6,
-        with_xadc       = False,
-        with_dna        = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_usb        = False,
-        with_led_chaser = True,
-        with_spi_flash  = False,
-        with_buttons    = False,
-        with_pmod_gpio  = False,
-        with_can        = False,
+        with_xadc              = False,
+        with_dna               = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        with_tftp_dma          = False,
+        eth_data_width         = 8,
+        eth_ip                 = "192.168.1.50",
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_usb               = False,
+        with_led_chaser        = True,
+        with_spi_flash         = False,
+        with_buttons           = False,
+        with_pmod_gpio         = False,
+        with_can               = False,
         **kwargs):
         platform = digilent_arty.Platform(variant=variant, toolchain=toolchain)
 
@@ -111,7 +100,7 @@ class BaseSoC(SoCCore):
                 sys_clk_freq   = sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
-                module        = MT41K128M16(sys_clk_freq, "1:4"),
+                module        = self.sdram_module(sys_clk_freq, "1:4"),
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
@@ -120,10 +109,14 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
             elif with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, data_width=eth_data_width)
+            if with_tftp_dma:
+                assert with_etherbone
+                add_tftp_receiver(self, cd={32: "sys", 8: "etherbone"}[eth_data_width])
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -196,43 +189,62 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=digilent_arty.Platform, description="LiteX SoC on Arty A7.")
-    parser.add_target_argument("--flash",          action="store_true",       help="Flash bitstream.")
-    parser.add_target_argument("--variant",        default="a7-35",           help="Board variant (a7-35 or a7-100).")
-    parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-xadc",      action="store_true",       help="Enable 7-Series XADC.")
-    parser.add_target_argument("--with-dna",       action="store_true",       help="Enable 7-Series DNA.")
-    parser.add_target_argument("--with-usb",       action="store_true",       help="Enable USB Host.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--flash",                  action="store_true",       help="Flash bitstream.")
+    parser.add_target_argument("--variant",                default="a7-35",           help="Board variant (a7-35 or a7-100).")
+    parser.add_target_argument("--sys-clk-freq",           default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-xadc",              action="store_true",       help="Enable 7-Series XADC.")
+    parser.add_target_argument("--with-dna",               action="store_true",       help="Enable 7-Series DNA.")
+    parser.add_target_argument("--with-usb",               action="store_true",       help="Enable USB Host.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,      help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--with-tftp-dma",          action="store_true",       help="Enable Hardware TFTP Receiver (Netboot images loaded to memory over Etherbone's UDP/IP stack).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",   help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",       action="store_true",       help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",           action="store_true",       help="Enable SDCard support.")
-    parser.add_target_argument("--sdcard-adapter",                            help="SDCard PMOD adapter (digilent or numato).")
-    parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI Flash (MMAPed).")
-    parser.add_target_argument("--with-pmod-gpio", action="store_true",       help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
-    parser.add_target_argument("--with-can",       action="store_true",       help="Enable CAN support (Through CTU-CAN-FD Core and SN65HVD230 'PMOD'.")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true",       help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true",       help="Enable SDCard support.")
+    parser.add_target_argument("--sdcard-adapter",                                    help="SDCard PMOD adapter (digilent or numato).")
+    parser.add_target_argument("--with-spi-flash",         action="store_true",       help="Enable SPI Flash (MMAPed).")
+    parser.add_target_argument("--with-pmod-gpio",         action="store_true",       help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
+    parser.add_target_argument("--with-can",               action="store_true",       help="Enable CAN support (Through CTU-CAN-FD Core and SN65HVD230 'PMOD'.")
+    parser.add_target_argument("--fast-config",            action="store_true",       help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
+    add_sim_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
+    if args.sim:
+        run_sim(args, parser, args.sys_clk_freq,
+            ident            = "LiteX SoC on Arty A7",
+            **get_sim_sdram_args(BaseSoC, digilent_arty.Platform(variant=args.variant)),
+            with_ethernet    = args.with_ethernet,
+            with_etherbone   = args.with_etherbone,
+            eth_ip           = args.eth_ip,
+            remote_ip        = args.remote_ip,
+        )
+        return
+
     soc = BaseSoC(
-        variant        = args.variant,
-        toolchain      = args.toolchain,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_xadc      = args.with_xadc,
-        with_dna       = args.with_dna,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_usb       = args.with_usb,
-        with_spi_flash = args.with_spi_flash,
-        with_pmod_gpio = args.with_pmod_gpio,
-        with_can       = args.with_can,
+        variant                = args.variant,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_xadc              = args.with_xadc,
+        with_dna               = args.with_dna,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        with_tftp_dma          = args.with_tftp_dma,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_usb               = args.with_usb,
+        with_spi_flash         = args.with_spi_flash,
+        with_pmod_gpio         = args.with_pmod_gpio,
+        with_can               = args.with_can,
         **parser.soc_argdict
     )
 
@@ -243,7 +255,10 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
+
+    if args.fast_config:
+        apply_fast_config(soc.platform)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -12,6 +12,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_arty_s7
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -23,28 +25,15 @@ from litedram.phy import s7ddrphy
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst          = Signal()
-        self.cd_sys       = ClockDomain()
-        self.cd_sys2x     = ClockDomain()
-        self.cd_sys4x     = ClockDomain()
-        self.cd_sys4x_dqs = ClockDomain()
-        self.cd_idelay    = ClockDomain()
-
-        # # #
-
-        self.pll = pll = S7PLL(speedgrade=-1)
-        self.comb += pll.reset.eq(~platform.request("cpu_reset") | self.rst)
-        pll.register_clkin(platform.request("clk100"), 100e6)
-        pll.create_clkout(self.cd_sys,       sys_clk_freq)
-        pll.create_clkout(self.cd_sys2x,     2*sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
-        pll.create_clkout(self.cd_idelay,    200e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
+        BoardCRG.__init__(self, platform,
+            pll        = S7PLL(speedgrade=-1),
+            clkin      = platform.request("clk100"),
+            clkin_freq = 100e6,
+            rst        = ~platform.request("cpu_reset"),
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, with_sys2x=True)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -93,6 +82,7 @@ def main():
     parser.add_target_argument("--variant",        default="s7-50",           help="Board variant (s7-50 or s7-25).")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI Flash (MMAPed).")
+    parser.add_target_argument("--fast-config",    action="store_true",       help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -101,6 +91,9 @@ def main():
         with_spi_flash = args.with_spi_flash,
         **parser.soc_argdict
     )
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -31,6 +31,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_arty_z7
+from litex_boards.lib.zynq_dma import add_ps_dma, ps_dma_ports
 from litex.build import tools
 from litex.build.xilinx import common as xil_common
 from litex.build.tools import write_to_file
@@ -75,6 +76,8 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, variant="z7-20", toolchain="vivado", sys_clk_freq=125e6,
             with_led_chaser = True,
+            with_ps_dma     = False,
+            ps_dma_port     = "hp",
             **kwargs):
         platform = digilent_arty_z7.Platform(variant=variant, toolchain=toolchain)
 
@@ -113,6 +116,10 @@ class BaseSoC(SoCCore):
             self.constants["CONFIG_CLOCK_FREQUENCY"] = 666666687
             self.bus.add_region("flash",  SoCRegion(origin=0xFC00_0000, size=0x4_0000, mode="rwx"))
 
+        # PS DMA -----------------------------------------------------------------------------------
+        if with_ps_dma:
+            add_ps_dma(self, port=ps_dma_port)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -173,6 +180,8 @@ def main():
     parser = LiteXArgumentParser(platform=digilent_arty_z7.Platform, description="LiteX SoC on Arty Z7")
     parser.add_target_argument("--variant",      default="z7-20",           help="Board variant (z7-20 or z7-10).")
     parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ps-dma",  action="store_true",       help="Enable PL-to-PS DDR DMA (through a PS HP/ACP slave port).")
+    parser.add_target_argument("--ps-dma-port",  default="hp", choices=ps_dma_ports, help="PS DMA slave port.")
     parser.set_defaults(cpu_type="zynq7000")
     parser.set_defaults(no_uart=True)
     args = parser.parse_args()
@@ -180,6 +189,8 @@ def main():
     soc = BaseSoC(
         variant      = args.variant,
         toolchain    = args.toolchain,
+        with_ps_dma  = args.with_ps_dma,
+        ps_dma_port  = args.ps_dma_port,
         sys_clk_freq = args.sys_clk_freq,
         **parser.soc_argdict
     )
@@ -18,6 +18,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import digilent_atlys
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.ethernet import check_eth_data_width
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
@@ -150,9 +152,11 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6,
-        with_ethernet  = True,
-        with_etherbone = False,
-        eth_phy        = 0,
+        with_ethernet          = True,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        eth_phy                = 0,
         **kwargs):
         platform = digilent_atlys.Platform()
 
@@ -186,10 +190,11 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 clk_freq   = int(self.sys_clk_freq))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
             self.ethphy.crg.cd_eth_rx.clk.attr.add("keep")
             self.ethphy.crg.cd_eth_tx.clk.attr.add("keep")
             self.platform.add_platform_command("""
@@ -210,15 +215,23 @@ NET "{eth_clocks_tx}" CLOCK_DEDICATED_ROUTE = FALSE;
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=digilent_atlys.Platform, description="LiteX SoC on Atlys.")
-    parser.add_target_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    parser.add_target_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",  help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",  help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
 
+    parser.add_target_argument("--fast-config",            action="store_true", help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         **parser.soc_argdict)
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
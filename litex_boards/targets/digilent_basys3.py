@@ -11,6 +11,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_basys3
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -71,6 +73,7 @@ def main():
     parser.add_target_argument("--sdcard-adapter",                      help="SDCard PMOD adapter (digilent or numato).")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal", action="store_true", help="Enable Video Terminal (VGA).")
+    parser.add_target_argument("--fast-config", action="store_true",  help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -82,7 +85,10 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -13,6 +13,7 @@ from litex.gen import *
 from litex.build.io import CRG
 
 from litex_boards.platforms import digilent_cmod_a7
+from litex_boards.lib.xilinx_config import apply_fast_config
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -144,6 +145,7 @@ def main():
     parser.add_target_argument("--with-spi-flash", action="store_true",      help="Enable SPI Flash (MMAPed).")
 
 
+    parser.add_target_argument("--fast-config",    action="store_true", help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -156,6 +158,9 @@ def main():
 
     builder_argd = parser.builder_argdict
 
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **builder_argd)
     if args.build:
         builder.build(**parser.toolchain_argdict)
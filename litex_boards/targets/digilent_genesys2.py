@@ -11,6 +11,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_genesys2
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -48,10 +51,12 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        with_led_chaser = True,
-        with_can        = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        with_led_chaser        = True,
+        with_can               = False,
         **kwargs):
         platform = digilent_genesys2.Platform()
 
@@ -78,10 +83,11 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -105,26 +111,34 @@ def main():
     parser = LiteXArgumentParser(platform=digilent_genesys2.Platform, description="LiteX SoC on Genesys2.")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",  help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",  help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
-    parser.add_target_argument("--with-can", action="store_true", help="Enable CAN support (Through CTU-CAN-FD Core and SN65HVD230 'PMOD'.")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true",  help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true",  help="Enable SDCard support.")
+    parser.add_target_argument("--with-can",               action="store_true",  help="Enable CAN support (Through CTU-CAN-FD Core and SN65HVD230 'PMOD'.")
+    parser.add_target_argument("--fast-config",            action="store_true",  help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        with_can       = args.with_can,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        with_can               = args.with_can,
         **parser.soc_argdict
     )
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc, hs_clk_freq=50e6)
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
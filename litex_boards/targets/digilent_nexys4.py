@@ -15,6 +15,10 @@ from litex.gen import *
 from litex.build.io import CRG
 
 from litex_boards.platforms import digilent_nexys4
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -31,7 +35,7 @@ from liteeth.phy.rmii import LiteEthPHYRMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, pix_clk=40e6):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys2x     = ClockDomain()
@@ -49,7 +53,7 @@ class _CRG(LiteXModule):
         pll.create_clkout(self.cd_sys2x_dqs, 2*sys_clk_freq, phase=90)
         pll.create_clkout(self.cd_idelay,    200e6)
         pll.create_clkout(self.cd_eth,       50e6)
-        pll.create_clkout(self.cd_vga,       40e6)
+        pll.create_clkout(self.cd_vga,       pix_clk)
         platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
 
         self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
@@ -170,13 +174,22 @@ class BaseSoC(SoCCore):
         with_led_chaser        = True,
         with_ethernet          = False,
         with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timings          = None,
         **kwargs):
         platform = digilent_nexys4.Platform()
 
+        # Video Timings (CellularRAM: 16-bit asynchronous accesses, 70ns + FSM overhead) -----------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoVGAPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = 16/(math.ceil(70e-9*sys_clk_freq) + 4))
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------_-----------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Nexys4", **kwargs)
@@ -189,10 +202,11 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
@@ -200,7 +214,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="vga")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -215,28 +229,38 @@ def main():
     parser = LiteXArgumentParser(platform=digilent_nexys4.Platform, description="LiteX SoC on Nexys4.")
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",         action="store_true", help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",        action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",  help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",  help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",        action="store_true", help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",            action="store_true", help="Enable SDCard support.")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true",  help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true",  help="Enable SDCard support.")
     viopts = parser.target_group.add_mutually_exclusive_group()
-    viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (VGA).")
-    viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
+    viopts.add_argument("--with-video-terminal",           action="store_true",  help="Enable Video Terminal (VGA).")
+    viopts.add_argument("--with-video-framebuffer",        action="store_true",  help="Enable Video Framebuffer (VGA).")
+    parser.add_target_argument("--video-timings",          default=None,         help="Video Framebuffer timings (default: largest feasible).")
+    parser.add_target_argument("--fast-config",            action="store_true", help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -11,6 +11,10 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_nexys4ddr
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -27,7 +31,7 @@ from liteeth.phy.rmii import LiteEthPHYRMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, pix_clk=40e6):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys2x     = ClockDomain()
@@ -37,17 +41,24 @@ class _CRG(LiteXModule):
         self.cd_vga       = ClockDomain()
         # # #
 
+        clk100 = platform.request("clk100")
+        rst_n  = platform.request("cpu_reset")
+
         self.pll = pll = S7MMCM(speedgrade=-1)
-        self.comb += pll.reset.eq(~platform.request("cpu_reset") | self.rst)
-        pll.register_clkin(platform.request("clk100"), 100e6)
+        self.comb += pll.reset.eq(~rst_n | self.rst)
+        pll.register_clkin(clk100, 100e6)
         pll.create_clkout(self.cd_sys,       sys_clk_freq)
         pll.create_clkout(self.cd_sys2x,     2*sys_clk_freq)
         pll.create_clkout(self.cd_sys2x_dqs, 2*sys_clk_freq, phase=90)
         pll.create_clkout(self.cd_idelay,    200e6)
         pll.create_clkout(self.cd_eth,       50e6)
-        pll.create_clkout(self.cd_vga,       40e6)
         platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
 
+        self.video_pll = video_pll = S7PLL(speedgrade=-1)
+        self.comb += video_pll.reset.eq(~rst_n | self.rst)
+        video_pll.register_clkin(clk100, 100e6)
+        video_pll.create_clkout(self.cd_vga, pix_clk)
+
         self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
 
 # BaseSoC ------------------------------------------------------------------------------------------
@@ -56,14 +67,25 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6,
         with_ethernet          = False,
         with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timings          = None,
         **kwargs):
         platform = digilent_nexys4ddr.Platform()
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoVGAPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:2", memtype="DDR"),
+            pll             = lambda: S7PLL(speedgrade=-1),
+            clkin_freq      = 100e6)
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------_-----------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Nexys4DDR", **kwargs)
@@ -85,10 +107,11 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
@@ -96,7 +119,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="vga")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -111,28 +134,38 @@ def main():
     parser = LiteXArgumentParser(platform=digilent_nexys4ddr.Platform, description="LiteX SoC on Nexys4DDR.")
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",         action="store_true", help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",        action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",  help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",  help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",        action="store_true", help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",            action="store_true", help="Enable SDCard support.")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true",  help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true",  help="Enable SDCard support.")
     viopts = parser.target_group.add_mutually_exclusive_group()
-    viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (VGA).")
-    viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
+    viopts.add_argument("--with-video-terminal",           action="store_true",  help="Enable Video Terminal (VGA).")
+    viopts.add_argument("--with-video-framebuffer",        action="store_true",  help="Enable Video Framebuffer (VGA).")
+    parser.add_target_argument("--video-timings",          default=None,         help="Video Framebuffer timings (default: largest feasible).")
+    parser.add_target_argument("--fast-config",            action="store_true", help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc, hs_clk_freq=50e6)
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
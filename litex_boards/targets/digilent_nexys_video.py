@@ -11,6 +11,11 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_nexys_video
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.video import add_video_page_flip_framebuffer
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -26,7 +31,7 @@ from liteeth.phy.s7rgmii import LiteEthPHYRGMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, toolchain="vivado", with_video_pll=False):
+    def __init__(self, platform, sys_clk_freq, toolchain="vivado", with_video_pll=False, pix_clk=40e6):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys4x     = ClockDomain()
@@ -63,26 +68,40 @@ class _CRG(LiteXModule):
             self.video_pll = video_pll = S7MMCM(speedgrade=-1)
             video_pll.reset.eq(~rst_n | self.rst)
             video_pll.register_clkin(clk100, 100e6)
-            video_pll.create_clkout(self.cd_hdmi,   40e6)
-            video_pll.create_clkout(self.cd_hdmi5x, 5*40e6)
+            video_pll.create_clkout(self.cd_hdmi,   pix_clk)
+            video_pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, toolchain="vivado", sys_clk_freq=100e6,
         with_ethernet          = False,
+        eth_data_width         = 8,
         with_led_chaser        = True,
         with_sata              = False, sata_gen="gen2",
         vadj                   = "1.2V",
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timings          = None,
+        video_buffers          = 1,
+        with_video_blitter     = False,
         **kwargs):
         platform = digilent_nexys_video.Platform(toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoS7HDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:4", memtype="DDR"),
+            other_masters   = 1 + int(with_video_blitter),
+            pll             = lambda: S7MMCM(speedgrade=-1),
+            clkin_freq      = 100e6)
+
         # CRG --------------------------------------------------------------------------------------
         with_video_pll = (with_video_terminal or with_video_framebuffer)
         self.crg = _CRG(platform, sys_clk_freq, toolchain,
-            with_video_pll       = with_video_pll
+            with_video_pll       = with_video_pll,
+            pix_clk              = get_video_pix_clk(video_timings),
         )
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -105,7 +124,8 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -149,7 +169,13 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                if (video_buffers > 1) or with_video_blitter:
+                    add_video_page_flip_framebuffer(self, phy=self.videophy, timings=video_timings, clock_domain="hdmi",
+                        nbuffers     = max(video_buffers, 2),
+                        with_blitter = with_video_blitter,
+                    )
+                else:
+                    self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -166,8 +192,9 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=digilent_nexys_video.Platform, description="LiteX SoC on Nexys Video.")
-    parser.add_target_argument("--sys-clk-freq",  default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet", action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
@@ -177,23 +204,34 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-timings",      default=None,         help="Video Framebuffer timings (default: largest feasible).")
+    parser.add_target_argument("--video-buffers",      default=1, type=int,  help="Video Framebuffer pages (>1: page flipping on VSync).")
+    parser.add_target_argument("--with-video-blitter", action="store_true",  help="Enable Video Blitter (DMA Fill/Copy, with Video Framebuffer).")
+    parser.add_target_argument("--fast-config",        action="store_true",  help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
         toolchain              = args.toolchain,
         sys_clk_freq           = args.sys_clk_freq,
         with_ethernet          = args.with_ethernet,
+        eth_data_width         = args.eth_data_width,
         with_sata              = args.with_sata,
         sata_gen               = "gen" + args.sata_gen,
         vadj                   = args.vadj,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
+        video_buffers          = args.video_buffers,
+        with_video_blitter     = args.with_video_blitter,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc, hs_clk_freq=50e6)
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
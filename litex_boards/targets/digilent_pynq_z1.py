@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_pynq_z1
+from litex_boards.lib.zynq_dma import add_ps_dma, ps_dma_ports
 
 from litex.soc.interconnect import axi
 from litex.soc.interconnect import wishbone
@@ -62,6 +63,8 @@ class BaseSoC(SoCCore):
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        with_ps_dma            = False,
+        ps_dma_port            = "hp",
         **kwargs):
         platform = digilent_pynq_z1.Platform()
 
@@ -79,6 +82,10 @@ class BaseSoC(SoCCore):
             os.system("mv zybo_z7_ps7.txt xci/zybo_z7_ps7.xci")
             self.cpu.set_ps7_xci("xci/zybo_z7_ps7.xci")
 
+        # PS DMA -----------------------------------------------------------------------------------
+        if with_ps_dma:
+            add_ps_dma(self, port=ps_dma_port)
+
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
             self.videophy = VideoS7HDMIPHY(platform.request("hdmi_tx"), clock_domain="hdmi")
@@ -97,12 +104,16 @@ def main():
     parser = LiteXArgumentParser(platform=digilent_pynq_z1.Platform, description="LiteX SoC on PYNQ Z1.")
     parser.add_target_argument("--sys-clk-freq",        default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-video-terminal", action="store_true",       help="Enable Video Terminal (HDMI).")
+    parser.add_target_argument("--with-ps-dma",         action="store_true",       help="Enable PL-to-PS DDR DMA (through a PS HP/ACP slave port).")
+    parser.add_target_argument("--ps-dma-port",         default="hp", choices=ps_dma_ports, help="PS DMA slave port.")
 
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq        = args.sys_clk_freq,
         with_video_terminal = args.with_video_terminal,
+        with_ps_dma         = args.with_ps_dma,
+        ps_dma_port         = args.ps_dma_port,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
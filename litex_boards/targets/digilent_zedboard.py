@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_zedboard
+from litex_boards.lib.zynq_dma import add_ps_dma, ps_dma_ports
 from litex.build.tools import write_to_file
 
 from litex.soc.interconnect import axi
@@ -51,7 +52,7 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
 
-    def __init__(self, sys_clk_freq=100e6, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=100e6, with_led_chaser=True, with_ps_dma=False, ps_dma_port="hp", **kwargs):
         platform = digilent_zedboard.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -80,6 +81,10 @@ class BaseSoC(SoCCore):
             )
             self.constants["CONFIG_CLOCK_FREQUENCY"] = 666666687
 
+        # PS DMA -----------------------------------------------------------------------------------
+        if with_ps_dma:
+            add_ps_dma(self, port=ps_dma_port)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -139,12 +144,16 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=digilent_zedboard.Platform, description="LiteX SoC on Zedboard.")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ps-dma",  action="store_true",       help="Enable PL-to-PS DDR DMA (through a PS HP/ACP slave port).")
+    parser.add_target_argument("--ps-dma-port",  default="hp", choices=ps_dma_ports, help="PS DMA slave port.")
     parser.set_defaults(cpu_type="zynq7000")
     parser.set_defaults(no_uart=True)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
+        with_ps_dma  = args.with_ps_dma,
+        ps_dma_port  = args.ps_dma_port,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
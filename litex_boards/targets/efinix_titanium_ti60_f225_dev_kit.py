@@ -12,6 +12,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import efinix_titanium_ti60_f225_dev_kit
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -50,12 +52,14 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=200e6,
-        with_spi_flash = False,
-        with_hyperram  = False,
-        with_ethernet  = False,
-        with_etherbone = False,
-        eth_phy        = 0,
-        eth_ip         = "192.168.1.50",
+        with_spi_flash         = False,
+        with_hyperram          = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        eth_phy                = 0,
+        eth_ip                 = "192.168.1.50",
         **kwargs):
         platform = efinix_titanium_ti60_f225_dev_kit.Platform()
 
@@ -105,10 +109,11 @@ class BaseSoC(SoCCore):
                 clock_pads         = platform.request("eth_clocks", eth_phy),
                 pads               = pads,
                 with_hw_init_reset = False)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, software_debug=True)
+                self.add_ethernet(phy=self.ethphy, software_debug=True, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -123,25 +128,29 @@ def main():
     sdopts.add_argument("--with-spi-sdcard",      action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",          action="store_true", help="Enable SDCard support.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true",    help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true",    help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",   default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-phy",  default=0, type=int,    help="Ethernet PHY: 0 (default) or 1.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",    help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",    help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,   help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-phy",                default=0, type=int,    help="Ethernet PHY: 0 (default) or 1.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_spi_flash = args.with_spi_flash,
-        with_hyperram  = args.with_hyperram,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_phy        = args.eth_phy,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_spi_flash         = args.with_spi_flash,
+        with_hyperram          = args.with_hyperram,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        eth_phy                = args.eth_phy,
          **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -12,6 +12,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import enclustra_mercury_xu8_pe3
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -26,38 +27,14 @@ from litepcie.software import generate_litepcie_software
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys4x  = ClockDomain()
-        self.cd_pll4x  = ClockDomain()
-        self.cd_idelay = ClockDomain()
-
-        # # #
-
-        self.pll = pll = USMMCM(speedgrade=-1)
-        self.comb += pll.reset.eq(self.rst)
-        pll.register_clkin(platform.request("clk100"), 100e6)
-        pll.create_clkout(self.cd_pll4x, sys_clk_freq*4, buf=None, with_reset=False)
-        pll.create_clkout(self.cd_idelay, 500e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.specials += [
-            Instance("BUFGCE_DIV",
-                p_BUFGCE_DIVIDE = 4,
-                i_CE = 1,
-                i_I  = self.cd_pll4x.clk,
-                o_O  = self.cd_sys.clk,
-            ),
-            Instance("BUFGCE",
-                i_CE = 1,
-                i_I  = self.cd_pll4x.clk,
-                o_O  = self.cd_sys4x.clk,
-            ),
-        ]
-
-        self.idelayctrl = USIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
+        BoardCRG.__init__(self, platform,
+            pll        = USMMCM(speedgrade=-1),
+            clkin      = platform.request("clk100"),
+            clkin_freq = 100e6,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, idelay_clk_freq=500e6)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
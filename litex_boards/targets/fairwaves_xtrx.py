@@ -22,6 +22,10 @@
 # ./litepcie_util scratch_test
 # ./litepcie_util dma_test
 # ./litepcie_util uart_test
+#
+# LMS7002M IQ Streaming (RX/TX samples over PCIe DMA):
+# ./fairwaves_xtrx.py --uart-name=crossover --with-pcie --with-lms7002m --csr-csv=csr.csv --build --driver --flash
+# ./bench/lms7002m_stream.py --csr-csv=csr.csv --rates=1e6,10e6,30.72e6,61.44e6
 
 import os
 
@@ -41,6 +45,8 @@ from litex.soc.cores.clock import *
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.lib.lms7002m import LMS7002M
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -65,8 +71,13 @@ class CRG(LiteXModule):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=125e6, with_pcie=False, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=125e6, with_pcie=False, with_led_chaser=True,
+        with_lms7002m       = False,
+        lms7002m_fifo_depth = 8192,
+        **kwargs):
         platform = fairwaves_xtrx.Platform()
+        if with_lms7002m and not with_pcie:
+            raise ValueError("LMS7002M streaming requires PCIe (--with-pcie).")
 
         # CRG --------------------------------------------------------------------------------------
         self.crg = CRG(platform, sys_clk_freq, with_pcie)
@@ -95,6 +106,22 @@ class BaseSoC(SoCCore):
             self.flash_cs_n = GPIOOut(platform.request("flash_cs_n"))
             self.flash      = S7SPIFlash(platform.request("flash"), sys_clk_freq, 25e6)
 
+        # LMS7002M ---------------------------------------------------------------------------------
+        # RX/TX samples are packetized with timestamps in packets of one DMA buffer (8KB) and
+        # buffered in FIFOs (lms7002m_fifo_depth 64-bit words per direction) to absorb the host's
+        # scheduling latencies.
+        if with_lms7002m:
+            self.lms7002m = LMS7002M(platform.request("lms7002m"), sys_clk_freq,
+                fifo_depth   = lms7002m_fifo_depth,
+                packet_words = 8192//8)
+            self.comb += self.lms7002m.source.connect(self.pcie_dma0.sink)
+            self.comb += self.pcie_dma0.source.connect(self.lms7002m.sink)
+            platform.add_period_constraint(self.lms7002m.rx_phy.cd_lms_rx.clk, 1e9/125e6)
+            platform.add_period_constraint(self.lms7002m.tx_phy.cd_lms_tx.clk, 1e9/125e6)
+            platform.add_false_path_constraints(
+                self.crg.cd_sys.clk,
+                self.lms7002m.rx_phy.cd_lms_rx.clk,
+                self.lms7002m.tx_phy.cd_lms_tx.clk)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -107,15 +134,19 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=fairwaves_xtrx.Platform, description="LiteX SoC on Fairwaves XTRX.")
-    parser.add_target_argument("--flash",           action="store_true",       help="Flash bitstream.")
-    parser.add_target_argument("--sys-clk-freq",    default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",       action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",          action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--flash",               action="store_true",       help="Flash bitstream.")
+    parser.add_target_argument("--sys-clk-freq",        default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",           action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--with-lms7002m",       action="store_true",       help="Enable LMS7002M IQ streaming over PCIe DMA (requires --with-pcie).")
+    parser.add_target_argument("--lms7002m-fifo-depth", default=8192, type=int,    help="LMS7002M RX/TX FIFOs depth (in 64-bit words).")
+    parser.add_target_argument("--driver",              action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
+        sys_clk_freq        = args.sys_clk_freq,
+        with_pcie           = args.with_pcie,
+        with_lms7002m       = args.with_lms7002m,
+        lms7002m_fifo_depth = args.lms7002m_fifo_depth,
         **parser.soc_argdict
     )
     builder  = Builder(soc, **parser.builder_argdict)
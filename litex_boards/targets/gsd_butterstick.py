@@ -18,6 +18,9 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import gsd_butterstick
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -32,63 +35,31 @@ from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
 # CRG ---------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst        = Signal()
-        self.cd_init    = ClockDomain()
-        self.cd_por     = ClockDomain()
-        self.cd_sys     = ClockDomain()
-        self.cd_sys2x   = ClockDomain()
-        self.cd_sys2x_i = ClockDomain()
-
-        # # #
-
-        self.stop  = Signal()
-        self.reset = Signal()
-
-        # Clk / Rst
-        clk30 = platform.request("clk30")
-        rst_n = platform.request("user_btn", 0)
-
-        # Power on reset
-        por_count = Signal(16, reset=2**16-1)
-        por_done  = Signal()
-        self.comb += self.cd_por.clk.eq(clk30)
-        self.comb += por_done.eq(por_count == 0)
-        self.sync.por += If(~por_done, por_count.eq(por_count - 1))
-
-        # PLL
-        self.pll = pll = ECP5PLL()
-        self.comb += pll.reset.eq(~por_done | ~rst_n | self.rst)
-        pll.register_clkin(clk30, 30e6)
-        pll.create_clkout(self.cd_sys2x_i, 2*sys_clk_freq)
-        pll.create_clkout(self.cd_init,   25e6)
-        self.specials += [
-            Instance("ECLKSYNCB",
-                i_ECLKI = self.cd_sys2x_i.clk,
-                i_STOP  = self.stop,
-                o_ECLKO = self.cd_sys2x.clk),
-            Instance("CLKDIVF",
-                p_DIV     = "2.0",
-                i_ALIGNWD = 0,
-                i_CLKI    = self.cd_sys2x.clk,
-                i_RST     = self.reset,
-                o_CDIVX   = self.cd_sys.clk),
-            AsyncResetSynchronizer(self.cd_sys, ~pll.locked | self.reset),
-        ]
+        BoardCRG.__init__(self, platform,
+            pll        = ECP5PLL(),
+            clkin      = platform.request("clk30"),
+            clkin_freq = 30e6,
+            rst        = ~platform.request("user_btn", 0),
+            with_por   = True,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, revision="1.0", device="85F", sys_clk_freq=60e6, toolchain="trellis",
-        sdram_device     = "MT41K64M16",
-        with_ethernet    = False,
-        with_etherbone   = False,
-        eth_ip           = "192.168.1.50",
-        eth_dynamic_ip   = False,
-        with_spi_flash   = False,
-        with_led_chaser  = True,
-        with_syzygy_gpio = True,
+        sdram_device           = "MT41K64M16",
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        eth_ip                 = "192.168.1.50",
+        eth_dynamic_ip         = False,
+        with_spi_flash         = False,
+        with_led_chaser        = True,
+        with_syzygy_gpio       = True,
         **kwargs)       :
         platform = gsd_butterstick.Platform(revision=revision, device=device ,toolchain=toolchain)
 
@@ -128,10 +99,11 @@ class BaseSoC(SoCCore):
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9, # KSZ9031RNX phy adds a 1.2ns RX delay
                 )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -162,36 +134,40 @@ def main():
     parser.add_target_argument("--device",       default="85F",            help="ECP5 device (25F, 45F, 85F).")
     parser.add_target_argument("--sdram-device", default="MT41K64M16",     help="SDRAM device (MT41K64M16, MT41K128M16, MT41K256M16 or MT41K512M16).")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true",    help="Add Ethernet.")
-    ethopts.add_argument("--with-etherbone", action="store_true",    help="Add EtherBone.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",    help="Add Ethernet.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",    help="Add EtherBone.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,   help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--with-spi-flash", action="store_true",    help="Enable SPI Flash (MMAPed).")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true", help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--with-syzygy-gpio",action="store_true", help="Enable GPIOs through SYZYGY Breakout on Port-A.")
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        toolchain        = args.toolchain,
-        revision         = args.revision,
-        device           = args.device,
-        sdram_device     = args.sdram_device,
-        sys_clk_freq     = args.sys_clk_freq,
-        with_ethernet    = args.with_ethernet,
-        with_etherbone   = args.with_etherbone,
-        eth_ip           = args.eth_ip,
-        eth_dynamic_ip   = args.eth_dynamic_ip,
-        with_spi_flash   = args.with_spi_flash,
-        with_syzygy_gpio = args.with_syzygy_gpio,
+        toolchain              = args.toolchain,
+        revision               = args.revision,
+        device                 = args.device,
+        sdram_device           = args.sdram_device,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_spi_flash         = args.with_spi_flash,
+        with_syzygy_gpio       = args.with_syzygy_gpio,
         **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
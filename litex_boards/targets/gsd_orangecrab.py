@@ -16,6 +16,7 @@ from litex.gen import *
 from litex.gen.genlib.misc import WaitTimer
 
 from litex_boards.platforms import gsd_orangecrab
+from litex_boards.lib.fmax import get_sys_clk_freq_type, get_sys_clk_freq_help
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -201,7 +202,7 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=gsd_orangecrab.Platform, description="LiteX SoC on OrangeCrab.")
-    parser.add_target_argument("--sys-clk-freq",    default=48e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sys-clk-freq",    default=48e6, type=get_sys_clk_freq_type("gsd_orangecrab"), help=get_sys_clk_freq_help("gsd_orangecrab"))
     parser.add_target_argument("--revision",        default="0.2",            help="Board Revision (0.1 or 0.2).")
     parser.add_target_argument("--device",          default="25F",            help="ECP5 device (25F, 45F or 85F).")
     parser.add_target_argument("--sdram-device",    default="MT41K64M16",     help="SDRAM device (MT41K64M16, MT41K128M16, MT41K256M16 or MT41K512M16).")
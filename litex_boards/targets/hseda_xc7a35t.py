@@ -13,6 +13,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import hseda_xc7a35t
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -26,32 +29,16 @@ from litedram.phy import s7ddrphy
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst          = Signal()
-        self.cd_sys       = ClockDomain()
-        self.cd_sys4x     = ClockDomain()
-        self.cd_sys4x_dqs = ClockDomain()
-        self.cd_idelay    = ClockDomain()
-
-        # # #
-
-        self.pll = pll = S7PLL(speedgrade=-1)
-        try:
-            reset_button = platform.request("cpu_reset")
-            self.comb += pll.reset.eq(~reset_button | self.rst)
-        except:
-            self.comb += pll.reset.eq(self.rst)
-
-        pll.register_clkin(platform.request("clk50"), 50e6)
-        pll.create_clkout(self.cd_sys,       sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
-        pll.create_clkout(self.cd_idelay,    200e6)
-
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
+        cpu_reset = platform.request("cpu_reset", loose=True)
+        BoardCRG.__init__(self, platform,
+            pll        = S7PLL(speedgrade=-1),
+            clkin      = platform.request("clk50"),
+            clkin_freq = 50e6,
+            rst        = 0 if cpu_reset is None else ~cpu_reset,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -89,7 +76,7 @@ class BaseSoC(SoCCore):
 
         # SD Card ----------------------------------------------------------------------------------
         if with_sdcard:
-            self.add_sdcard()
+            add_sdcard_hs(self)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -106,6 +93,7 @@ def main():
     parser.add_target_argument("--sys-clk-freq",   default=50e6, type=float,  help="System clock frequency.")
     parser.add_target_argument("--with-sdcard",    action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--with-spi-flash", action="store_true", help="Enable SPI Flash support.")
+    parser.add_target_argument("--fast-config",    action="store_true", help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -116,6 +104,9 @@ def main():
         **parser.soc_argdict
     )
 
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -23,6 +23,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import icebreaker
+from litex_boards.lib.spi_flash import add_spi_flash_xip
+from litex_boards.lib.fmax import get_sys_clk_freq_type, get_sys_clk_freq_help
 
 from litex.soc.cores.ram import Up5kSPRAM
 from litex.soc.cores.clock import iCE40PLL
@@ -67,6 +69,8 @@ class BaseSoC(SoCCore):
     def __init__(self, bios_flash_offset, sys_clk_freq=24e6,
         with_led_chaser     = True,
         with_video_terminal = False,
+        with_xip_cache      = False,
+        xip_cache_size      = 4096,
         **kwargs):
         platform = icebreaker.Platform()
         platform.add_extension(icebreaker.break_off_pmod)
@@ -98,7 +102,10 @@ class BaseSoC(SoCCore):
         # SPI Flash --------------------------------------------------------------------------------
         from litespi.modules import W25Q128JV
         from litespi.opcodes import SpiNorFlashOpCodes as Codes
-        self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=False)
+        if with_xip_cache:
+            add_spi_flash_xip(self, mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=False, cache_size=xip_cache_size)
+        else:
+            self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=False)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -134,15 +141,19 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=icebreaker.Platform, description="LiteX SoC on iCEBreaker.")
     parser.add_target_argument("--flash",               action="store_true",      help="Flash Bitstream and BIOS.")
-    parser.add_target_argument("--sys-clk-freq",        default=24e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sys-clk-freq",        default=24e6, type=get_sys_clk_freq_type("icebreaker"), help=get_sys_clk_freq_help("icebreaker"))
     parser.add_target_argument("--bios-flash-offset",   default="0x40000",        help="BIOS offset in SPI Flash.")
     parser.add_target_argument("--with-video-terminal", action="store_true",      help="Enable Video Terminal (with DVI PMOD).")
+    parser.add_target_argument("--with-xip-cache",      action="store_true",      help="Enable SPI Flash XIP Cache.")
+    parser.add_target_argument("--xip-cache-size",      default=4096, type=int,   help="SPI Flash XIP Cache size (in bytes, EBR).")
     args = parser.parse_args()
 
     soc = BaseSoC(
         bios_flash_offset   = int(args.bios_flash_offset, 0),
         sys_clk_freq        = args.sys_clk_freq,
         with_video_terminal = args.with_video_terminal,
+        with_xip_cache      = args.with_xip_cache,
+        xip_cache_size      = args.xip_cache_size,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
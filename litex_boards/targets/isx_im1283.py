@@ -14,6 +14,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import isx_im1283
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -26,27 +28,16 @@ from litedram.phy import s7ddrphy
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq, with_video_pll=False, pix_clk=25.175e6):
-        self.rst          = Signal()
-        self.cd_sys       = ClockDomain()
-        self.cd_sys4x     = ClockDomain(reset_less=True)
-        self.cd_sys4x_dqs = ClockDomain(reset_less=True)
-        self.cd_idelay    = ClockDomain()
-        self.cd_hdmi      = ClockDomain()
-        self.cd_hdmi5x    = ClockDomain()
-
-        # # #
-        self.pll = pll = S7PLL(speedgrade=-2)
-        pll.register_clkin(platform.request("clk200"), 200e6)
-        self.comb += pll.reset.eq(self.rst)
-        pll.create_clkout(self.cd_sys,       sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
-        pll.create_clkout(self.cd_idelay,    200e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
+        BoardCRG.__init__(self, platform,
+            pll        = S7PLL(speedgrade=-2),
+            clkin      = platform.request("clk200"),
+            clkin_freq = 200e6,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True)
+        self.add_domain("hdmi",   None)
+        self.add_domain("hdmi5x", None)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -98,7 +89,7 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -17,6 +17,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import kosagi_fomu_pvt
+from litex_boards.lib.spi_flash import add_spi_flash_xip
 
 from litex.soc.cores.ram import Up5kSPRAM
 from litex.soc.cores.clock import iCE40PLL
@@ -69,6 +70,8 @@ class BaseSoC(SoCCore):
     def __init__(self, bios_flash_offset, sys_clk_freq=12e6,
         spi_flash_module = "AT25SF161",
         with_led_chaser  = True,
+        with_xip_cache   = False,
+        xip_cache_size   = 4096,
         **kwargs):
         platform = kosagi_fomu_pvt.Platform()
 
@@ -109,7 +112,10 @@ class BaseSoC(SoCCore):
             "MX25R1635F": lambda: MX25R1635F(Codes.READ_1_1_4),
             "W25Q128JV":  lambda: W25Q128JV( Codes.READ_1_1_4),
         }
-        self.add_spi_flash(mode="4x", module=spi_flash_modules[spi_flash_module](), with_master=False)
+        if with_xip_cache:
+            add_spi_flash_xip(self, mode="4x", module=spi_flash_modules[spi_flash_module](), with_master=False, cache_size=xip_cache_size)
+        else:
+            self.add_spi_flash(mode="4x", module=spi_flash_modules[spi_flash_module](), with_master=False)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -161,6 +167,8 @@ def main():
     parser.add_target_argument("--sys-clk-freq",      default=12e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--bios-flash-offset", default="0x20000",        help="BIOS offset in SPI Flash.")
     parser.add_target_argument("--flash",             action="store_true",      help="Flash Bitstream.")
+    parser.add_target_argument("--with-xip-cache",    action="store_true",      help="Enable SPI Flash XIP Cache.")
+    parser.add_target_argument("--xip-cache-size",    default=4096, type=int,   help="SPI Flash XIP Cache size (in bytes, EBR).")
     args = parser.parse_args()
 
     dfu_flash_offset = 0x40000
@@ -168,6 +176,8 @@ def main():
     soc = BaseSoC(
         bios_flash_offset = dfu_flash_offset + int(args.bios_flash_offset, 0),
         sys_clk_freq      = args.sys_clk_freq,
+        with_xip_cache    = args.with_xip_cache,
+        xip_cache_size    = args.xip_cache_size,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
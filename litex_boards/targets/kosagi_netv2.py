@@ -13,6 +13,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import kosagi_netv2
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
@@ -31,32 +34,16 @@ from litepcie.software import generate_litepcie_software
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst          = Signal()
-        self.cd_sys       = ClockDomain()
-        self.cd_sys4x     = ClockDomain()
-        self.cd_sys4x_dqs = ClockDomain()
-        self.cd_idelay    = ClockDomain()
-        self.cd_clk100    = ClockDomain()
-        self.cd_eth       = ClockDomain()
-
-        # Clk/Rst
-        clk50 = platform.request("clk50")
-
-        # PLL
-        self.pll = pll = S7PLL(speedgrade=-1)
-        self.comb += pll.reset.eq(self.rst)
-        pll.register_clkin(clk50, 50e6)
-        pll.create_clkout(self.cd_sys,       sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
-        pll.create_clkout(self.cd_idelay,    200e6)
-        pll.create_clkout(self.cd_clk100,    100e6)
-        pll.create_clkout(self.cd_eth,       50e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
+        BoardCRG.__init__(self, platform,
+            pll        = S7PLL(speedgrade=-1),
+            clkin      = platform.request("clk50"),
+            clkin_freq = 50e6,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True)
+        self.add_domain("clk100", 100e6)
+        self.add_domain("eth",    50e6)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -64,6 +51,7 @@ class BaseSoC(SoCCore):
     def __init__(self, variant="a7-35", sys_clk_freq=100e6,
         with_pcie       = False,
         with_ethernet   = False,
+        eth_data_width  = 8,
         with_led_chaser = True,
         **kwargs):
         platform = kosagi_netv2.Platform(variant=variant)
@@ -91,7 +79,8 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
@@ -111,27 +100,29 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=kosagi_netv2.Platform, description="LiteX SoC on NeTV2.")
-    parser.add_target_argument("--variant",       default="a7-35",           help="Board variant (a7-35 or a7-100).")
-    parser.add_target_argument("--sys-clk-freq",  default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet", action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--with-pcie",     action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",        action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--variant",        default="a7-35",           help="Board variant (a7-35 or a7-100).")
+    parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--with-pcie",      action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--driver",         action="store_true",       help="Generate PCIe driver.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        variant       = args.variant,
-        sys_clk_freq  = args.sys_clk_freq,
-        with_ethernet = args.with_ethernet,
-        with_pcie     = args.with_pcie,
+        variant        = args.variant,
+        sys_clk_freq   = args.sys_clk_freq,
+        with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
+        with_pcie      = args.with_pcie,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
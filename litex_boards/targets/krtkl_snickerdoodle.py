@@ -14,6 +14,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import krtkl_snickerdoodle
+from litex_boards.lib.zynq_dma import add_ps_dma, ps_dma_ports
 
 from litex.soc.interconnect import axi
 from litex.soc.interconnect import wishbone
@@ -67,6 +68,8 @@ class BaseSoC(SoCCore):
         with_led_chaser = True,
         ext_clk_freq    = None,
         xci_file        = None,
+        with_ps_dma     = False,
+        ps_dma_port     = "hp",
         **kwargs):
         platform = krtkl_snickerdoodle.Platform(variant=variant)
 
@@ -87,6 +90,10 @@ class BaseSoC(SoCCore):
         if kwargs.get("cpu_type", None) == "zynq7000":
             load_ps7(self, xci_file)
 
+        # PS DMA -----------------------------------------------------------------------------------
+        if with_ps_dma:
+            add_ps_dma(self, port=ps_dma_port)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -103,6 +110,8 @@ def main():
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--xci-file",     help="XCI file for PS7 configuration.")
     parser.add_target_argument("--target",       help="Vivado programmer target.")
+    parser.add_target_argument("--with-ps-dma",  action="store_true",       help="Enable PL-to-PS DDR DMA (through a PS HP/ACP slave port).")
+    parser.add_target_argument("--ps-dma-port",  default="hp", choices=ps_dma_ports, help="PS DMA slave port.")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -110,6 +119,8 @@ def main():
         sys_clk_freq = args.sys_clk_freq,
         ext_clk_freq = args.ext_clk_freq,
         xci_file     = args.xci_file,
+        with_ps_dma  = args.with_ps_dma,
+        ps_dma_port  = args.ps_dma_port,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
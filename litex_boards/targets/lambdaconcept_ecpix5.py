@@ -12,6 +12,13 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import lambdaconcept_ecpix5
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.video import add_video_page_flip_framebuffer
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.fmax import get_sys_clk_freq_type, get_sys_clk_freq_help
+from litex_boards.lib.sim import add_sim_args, run_sim, get_sim_sdram_args
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -27,68 +34,58 @@ from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
-        self.rst        = Signal()
-        self.cd_init    = ClockDomain()
-        self.cd_por     = ClockDomain()
-        self.cd_sys     = ClockDomain()
-        self.cd_sys2x   = ClockDomain()
-        self.cd_sys2x_i = ClockDomain()
-
-        # # #
-
-        self.stop  = Signal()
-        self.reset = Signal()
-
-        # Clk / Rst
-        clk100 = platform.request("clk100")
-        rst_n  = platform.request("rst_n")
-
-        # Power on reset
-        por_count = Signal(16, reset=2**16-1)
-        por_done  = Signal()
-        self.comb += self.cd_por.clk.eq(clk100)
-        self.comb += por_done.eq(por_count == 0)
-        self.sync.por += If(~por_done, por_count.eq(por_count - 1))
-
-        # PLL
-        self.pll = pll = ECP5PLL()
-        self.comb += pll.reset.eq(~por_done | ~rst_n | self.rst)
-        pll.register_clkin(clk100, 100e6)
-        pll.create_clkout(self.cd_sys2x_i, 2*sys_clk_freq)
-        pll.create_clkout(self.cd_init, 25e6)
-        self.specials += [
-            Instance("ECLKSYNCB",
-                i_ECLKI = self.cd_sys2x_i.clk,
-                i_STOP  = self.stop,
-                o_ECLKO = self.cd_sys2x.clk),
-            Instance("CLKDIVF",
-                p_DIV     = "2.0",
-                i_ALIGNWD = 0,
-                i_CLKI    = self.cd_sys2x.clk,
-                i_RST     = self.reset,
-                o_CDIVX   = self.cd_sys.clk),
-            AsyncResetSynchronizer(self.cd_sys, ~pll.locked | self.reset),
-        ]
+class _CRG(BoardCRG):
+    def __init__(self, platform, sys_clk_freq, with_video_pll=False, pix_clk=31.5e6):
+        BoardCRG.__init__(self, platform,
+            pll        = ECP5PLL(),
+            clkin      = platform.request("clk100"),
+            clkin_freq = 100e6,
+            rst        = ~platform.request("rst_n"),
+            with_por   = True,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True)
+
+        # Video PLL.
+        if with_video_pll:
+            self.add_pll(ECP5PLL(), name="video_pll")
+            self.add_domain("video", pix_clk, pll=self.video_pll)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
+    sdram_module = MT41K256M16 # DRAM module (hardware and --sim).
+
     def __init__(self, device="85F", sys_clk_freq=75e6, toolchain="trellis",
         with_ethernet          = False,
         with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         eth_ip                 = "192.168.1.50",
         remote_ip              = None,
         eth_dynamic_ip         = False,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timings          = None,
+        video_buffers          = 1,
+        with_video_blitter     = False,
         with_led_chaser        = True,
         **kwargs):
         platform = lambdaconcept_ecpix5.Platform(device=device, toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@75Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoDVIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:2", memtype="DDR"),
+            other_masters   = 1 + int(with_video_blitter),
+            pll             = ECP5PLL,
+            clkin_freq      = 100e6)
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq,
+            with_video_pll = with_video_terminal or with_video_framebuffer,
+            pix_clk        = get_video_pix_clk(video_timings),
+        )
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on ECPIX-5", **kwargs)
@@ -102,7 +99,7 @@ class BaseSoC(SoCCore):
             self.comb += self.crg.reset.eq(self.ddrphy.init.reset)
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
-                module        = MT41K256M16(sys_clk_freq, "1:2"),
+                module        = self.sdram_module(sys_clk_freq, "1:2"),
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
@@ -112,16 +109,17 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, data_width=eth_data_width)
 
         # HDMI -------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
             # PHY + IT6613 I2C initialization.
             hdmi_pads = platform.request("hdmi")
-            self.videophy = VideoDVIPHY(hdmi_pads, clock_domain="init")
+            self.videophy = VideoDVIPHY(hdmi_pads, clock_domain="video")
             self.videoi2c = I2CMaster(hdmi_pads)
 
             # I2C initialization adapted from https://github.com/ultraembedded/ecpix-5
@@ -182,6 +180,7 @@ class BaseSoC(SoCCore):
             B_NODEF_PHASE   = (1<<2)
             B_PHASE_RESYNC  = (1<<3)
 
+            pix_clk_high = get_video_pix_clk(video_timings) > 80e6
             self.videoi2c.add_init(addr=0x4c, init=[
                 # Reset.
                 (REG_TX_SW_RST, B_REF_RST | B_VID_RST | B_AUD_RST | B_AREF_RST | B_HDCP_RST),
@@ -190,12 +189,12 @@ class BaseSoC(SoCCore):
                 # Select DVI Mode.
                 (REG_TX_HDMI_MODE, B_TX_DVI_MODE),
 
-                # Configure Clks.
+                # Configure Clks (AFE gain for pixel clocks > 80MHz).
                 (REG_TX_SW_RST,       B_AUD_RST | B_AREF_RST | B_HDCP_RST),
                 (REG_TX_AFE_DRV_CTRL, B_AFE_DRV_RST),
-                (REG_TX_AFE_XP_CTRL,  0x18),
+                (REG_TX_AFE_XP_CTRL,  B_AFE_XP_RESETB | (B_AFE_XP_GAINBIT if pix_clk_high else B_AFE_XP_ER0)),
                 (REG_TX_AFE_ISW_CTRL, 0x10),
-                (REG_TX_AFE_IP_CTRL,  0x0C),
+                (REG_TX_AFE_IP_CTRL,  B_AFE_IP_RESETB | (B_AFE_IP_GAINBIT if pix_clk_high else B_AFE_IP_ER0)),
 
                 # Enable Clks.
                 (REG_TX_AFE_DRV_CTRL, 0),
@@ -205,9 +204,15 @@ class BaseSoC(SoCCore):
             ])
             # Video Terminal/Framebuffer.
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="init")
+                self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="video")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@75Hz", clock_domain="init")
+                if (video_buffers > 1) or with_video_blitter:
+                    add_video_page_flip_framebuffer(self, phy=self.videophy, timings=video_timings, clock_domain="video",
+                        nbuffers     = max(video_buffers, 2),
+                        with_blitter = with_video_blitter,
+                    )
+                else:
+                    self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="video")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -228,35 +233,57 @@ def main():
     parser.add_target_argument("--version",         default="r02",            help="board version r0X (0 < X <= 3).")
     parser.add_target_argument("--flash",           action="store_true",      help="Flash bitstream to SPI Flash.")
     parser.add_target_argument("--device",          default="85F",            help="ECP5 device (45F or 85F).")
-    parser.add_target_argument("--sys-clk-freq",    default=75e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sys-clk-freq",    default=75e6, type=get_sys_clk_freq_type("lambdaconcept_ecpix5"), help=get_sys_clk_freq_help("lambdaconcept_ecpix5"))
     parser.add_target_argument("--with-sdcard",     action="store_true",      help="Enable SDCard support.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",  help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",  help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_target_argument("--eth-ip",          default="192.168.1.50",   help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--remote-ip",       default="192.168.1.100",  help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip",  action="store_true",      help="Enable dynamic Ethernet IP addresses setting.")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-timings",      default=None,         help="Video Framebuffer timings (default: largest feasible).")
+    parser.add_target_argument("--video-buffers",      default=1, type=int,  help="Video Framebuffer pages (>1: page flipping on VSync).")
+    parser.add_target_argument("--with-video-blitter", action="store_true",  help="Enable Video Blitter (DMA Fill/Copy, with Video Framebuffer).")
+    add_sim_args(parser)
 
     args = parser.parse_args()
 
+    if args.sim:
+        run_sim(args, parser, args.sys_clk_freq,
+            ident            = "LiteX SoC on ECPIX-5",
+            **get_sim_sdram_args(BaseSoC, lambdaconcept_ecpix5.Platform(device=args.device)),
+            with_ethernet    = args.with_ethernet,
+            with_etherbone   = args.with_etherbone,
+            eth_ip           = args.eth_ip,
+            remote_ip        = args.remote_ip,
+        )
+        return
+
     soc = BaseSoC(
         device                 = args.device,
         sys_clk_freq           = args.sys_clk_freq,
         toolchain              = args.toolchain,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         eth_ip                 = args.eth_ip,
         remote_ip              = args.remote_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
+        video_buffers          = args.video_buffers,
+        with_video_blitter     = args.with_video_blitter,
         **parser.soc_argdict
     )
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -13,6 +13,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import lattice_crosslink_nx_evn
+from litex_boards.lib.fmax import get_sys_clk_freq_type, get_sys_clk_freq_help
 
 from litex.soc.cores.ram import NXLRAM
 from litex.soc.cores.clock import NXPLL
@@ -107,7 +108,7 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=lattice_crosslink_nx_evn.Platform, description="LiteX SoC on Crosslink-NX Eval Board.")
     parser.add_target_argument("--device",        default="LIFCL-40-9BG400C", help="FPGA device (LIFCL-40-9BG400C, LIFCL-40-8BG400CES, or LIFCL-40-8BG400CES2).")
-    parser.add_target_argument("--sys-clk-freq",  default=75e6, type=float,   help="System clock frequency.")
+    parser.add_target_argument("--sys-clk-freq",  default=75e6, type=get_sys_clk_freq_type("lattice_crosslink_nx_evn"),   help=get_sys_clk_freq_help("lattice_crosslink_nx_evn"))
     parser.add_target_argument("--serial",        default="serial",           help="UART Pins (serial (requires R15 and R17 to be soldered) or serial_pmod[0-2]).")
     parser.add_target_argument("--programmer",    default="radiant",          help="Programmer (radiant or ecpprog or openocd).")
     parser.add_target_argument("--address",       default=0x0,                help="Flash address to program bitstream at.")
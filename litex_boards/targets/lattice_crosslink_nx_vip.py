@@ -9,6 +9,11 @@
 #
 # SPDX-License-Identifier: BSD-2-Clause
 
+# Camera Capture (4x MIPI CSI-2 cameras to HyperRAM, one HyperRAM per camera pair):
+# ./lattice_crosslink_nx_vip.py --with-cameras --camera-dphy-ip=dphy_rx/dphy_rx.ipx --uart-name=crossover+uartbone --csr-csv=csr.csv --build --load
+# litex_server --uart --uart-port=/dev/ttyUSBX
+# ./bench/camera_capture_stats.py --csr-csv=csr.csv --cameras=0,1,2,3
+
 from migen import *
 from migen.genlib.resetsync import AsyncResetSynchronizer
 
@@ -17,6 +22,9 @@ from litex.gen import *
 from litex_boards.platforms import lattice_crosslink_nx_vip
 
 from litex.soc.cores.hyperbus import HyperRAM
+from litex.soc.cores.bitbang import I2CMaster
+from litex.soc.cores.gpio import GPIOOut
+from litex.soc.interconnect import wishbone
 
 from litex.soc.cores.ram import NXLRAM
 from litex.build.io import CRG
@@ -28,6 +36,8 @@ from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
+from litex_boards.lib.mipi_csi2 import CSI2Receiver, WishboneFrameRingBuffer
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -51,6 +61,40 @@ class _CRG(LiteXModule):
         self.specials += AsyncResetSynchronizer(self.cd_por, ~rst_n)
         self.specials += AsyncResetSynchronizer(self.cd_sys, (por_counter != 0) | self.rst)
 
+# Camera D-PHY -------------------------------------------------------------------------------------
+
+class _CameraDPHY(LiteXModule):
+    # Lattice D-PHY Receiver IP (generated with Radiant's IP Catalog as ip_name: CSI-2, RX Gear 8,
+    # nlanes lanes, word aligner/packet parser disabled) providing the HS bytes of each lane in the
+    # byte clock domain.
+    def __init__(self, platform, pads, nlanes=4, clock_domain="cam", ip_name="dphy_rx"):
+        self.cd_cam = ClockDomain(clock_domain)
+        self.data   = [Signal(8) for _ in range(nlanes)]
+        self.valid  = [Signal()  for _ in range(nlanes)]
+
+        # # #
+
+        hs_data  = Signal(8*nlanes)
+        hs_valid = Signal(nlanes)
+        self.specials += Instance(ip_name,
+            io_clk_p_io     = pads.clkp,
+            io_clk_n_io     = pads.clkn,
+            io_d_p_io       = pads.dp[:nlanes],
+            io_d_n_io       = pads.dn[:nlanes],
+            i_sync_clk_i    = ClockSignal("sys"),
+            i_sync_rst_i    = ResetSignal("sys"),
+            i_reset_n_i     = ~ResetSignal("sys"),
+            o_clk_byte_o    = self.cd_cam.clk,
+            o_hs_data_o     = hs_data,
+            o_hs_d_en_o     = hs_valid,
+        )
+        self.specials += AsyncResetSynchronizer(self.cd_cam, ResetSignal("sys"))
+        for n in range(nlanes):
+            self.comb += [
+                self.data[n].eq(hs_data[8*n:8*(n + 1)]),
+                self.valid[n].eq(hs_valid[n]),
+            ]
+
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -58,13 +102,22 @@ class BaseSoC(SoCCore):
     mem_map = {
         "rom":  0x00000000,
         "sram": 0x40000000,
+        "hyperram0": 0x20000000,
+        "hyperram1": 0x30000000,
         "csr":  0xf0000000,
     }
     def __init__(self, sys_clk_freq=75e6, toolchain="radiant",
-        hyperram        = "none",
-        with_led_chaser = True,
+        hyperram         = "none",
+        with_led_chaser  = True,
+        with_cameras     = False,
+        cameras          = [0, 1, 2, 3],
+        camera_lanes     = 4,
+        camera_mclk_freq = 24e6,
+        camera_dphy_ip   = None,
         **kwargs):
         platform = lattice_crosslink_nx_vip.Platform(toolchain=toolchain)
+        if with_cameras and hyperram != "none":
+            raise ValueError("Camera capture uses both HyperRAMs, not available as SRAM (--with-hyperram=none).")
         platform.add_platform_command("ldc_set_sysconfig {{MASTER_SPI_PORT=SERIAL}}")
 
         # CRG --------------------------------------------------------------------------------------
@@ -90,6 +143,70 @@ class BaseSoC(SoCCore):
             self.bus.add_slave("sram", slave=self.hyperram.bus, region=SoCRegion(origin=self.mem_map["sram"],
                 size=size))
 
+        # Cameras ----------------------------------------------------------------------------------
+        # Each camera is received by a CSI-2 Receiver and its frames are written by bursts to a ring
+        # buffer in the HyperRAM of its pair (cameras 0/1: HyperRAM 0, cameras 2/3: HyperRAM 1),
+        # the HyperRAMs are also mapped on the SoC bus for readout (ex over UARTBone/CPU).
+        if with_cameras:
+            if camera_dphy_ip is not None:
+                platform.add_ip(camera_dphy_ip)
+
+            # Sensors Control: I2C, MCLK (sys_clk_freq/2N), shared Reset/Frame Sync.
+            for n in range(4):
+                self.add_module(name=f"camera_i2c{n}", module=I2CMaster(platform.request("i2c", n)))
+            mclk_div = max(1, round(sys_clk_freq/(2*camera_mclk_freq)))
+            mclk     = Signal()
+            mclk_cnt = Signal(max=mclk_div)
+            self.sync += If(mclk_cnt == (mclk_div - 1),
+                mclk_cnt.eq(0),
+                mclk.eq(~mclk)
+            ).Else(
+                mclk_cnt.eq(mclk_cnt + 1)
+            )
+            for n in range(4):
+                self.comb += platform.request("camera_mclk", n).eq(mclk)
+            cam_ctrl = platform.request("cam_ctrl")
+            self.camera_ctrl = GPIOOut(Cat(cam_ctrl.cam_reset, cam_ctrl.cam_frame_sync))
+
+            # HyperRAMs (8MB each, shared between the camera pair and the SoC bus).
+            hyperram_size = 8*MEGABYTE
+            nslots        = 3
+            slot_size     = (hyperram_size//2//nslots) & ~(4*KILOBYTE - 1)
+            hyperram_masters = {0: [], 1: []}
+            for n in cameras:
+                dphy = _CameraDPHY(platform, platform.request("camera", n),
+                    nlanes       = camera_lanes,
+                    clock_domain = f"cam{n}",
+                    ip_name      = "dphy_rx")
+                self.add_module(name=f"camera{n}_dphy", module=dphy)
+                receiver = CSI2Receiver(nlanes=camera_lanes, clock_domain=f"cam{n}")
+                self.add_module(name=f"camera{n}_csi2", module=receiver)
+                for i in range(camera_lanes):
+                    self.comb += [
+                        receiver.data[i].eq(dphy.data[i]),
+                        receiver.valid[i].eq(dphy.valid[i]),
+                    ]
+                bus        = wishbone.Interface(data_width=32)
+                ringbuffer = WishboneFrameRingBuffer(bus,
+                    base         = (n % 2)*(hyperram_size//2),
+                    slot_size    = slot_size,
+                    nslots       = nslots,
+                    burst_length = 64,
+                    sys_clk_freq = sys_clk_freq)
+                self.add_module(name=f"camera{n}_ringbuffer", module=ringbuffer)
+                self.comb += receiver.source.connect(ringbuffer.sink)
+                hyperram_masters[n//2].append(bus)
+                platform.add_false_path_constraints(self.crg.cd_sys.clk, dphy.cd_cam.clk)
+            for k in range(2):
+                if not hyperram_masters[k]:
+                    continue
+                hyperram = HyperRAM(platform.request("hyperram", k), sys_clk_freq=sys_clk_freq)
+                self.add_module(name=f"hyperram{k}", module=hyperram)
+                bus = wishbone.Interface(data_width=32)
+                self.bus.add_slave(f"hyperram{k}", slave=bus, region=SoCRegion(origin=self.mem_map[f"hyperram{k}"],
+                    size=hyperram_size, cached=False))
+                self.add_module(name=f"hyperram{k}_arbiter", module=wishbone.Arbiter(hyperram_masters[k] + [bus], hyperram.bus))
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -101,15 +218,23 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=lattice_crosslink_nx_vip.Platform, description="LiteX SoC on Crosslink-NX VIP Board.")
-    parser.add_target_argument("--sys-clk-freq",  default=75e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-hyperram", default="none",           help="Enable use of HyperRAM chip (none, 0 or 1).")
-    parser.add_target_argument("--prog-target",   default="direct",         help="Programming Target (direct or flash).")
+    parser.add_target_argument("--sys-clk-freq",   default=75e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-hyperram",  default="none",           help="Enable use of HyperRAM chip (none, 0 or 1).")
+    parser.add_target_argument("--prog-target",    default="direct",         help="Programming Target (direct or flash).")
+    parser.add_target_argument("--with-cameras",   action="store_true",      help="Enable MIPI CSI-2 cameras capture to HyperRAMs.")
+    parser.add_target_argument("--cameras",        default="0,1,2,3",        help="Captured cameras.")
+    parser.add_target_argument("--camera-lanes",   default=4, type=int,      help="Cameras MIPI lanes (1, 2 or 4).")
+    parser.add_target_argument("--camera-dphy-ip", default=None,             help="Radiant D-PHY Receiver IP (.ipx) for the cameras.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        hyperram     = args.with_hyperram,
-        toolchain    = args.toolchain,
+        sys_clk_freq   = args.sys_clk_freq,
+        hyperram       = args.with_hyperram,
+        toolchain      = args.toolchain,
+        with_cameras   = args.with_cameras,
+        cameras        = [int(n) for n in args.cameras.split(",")],
+        camera_lanes   = args.camera_lanes,
+        camera_dphy_ip = args.camera_dphy_ip,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -13,6 +13,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import lattice_ecp5_vip
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -29,7 +30,7 @@ from litex.soc.cores.bitbang import I2CMaster
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, pix_clk=40e6):
         self.rst        = Signal()
         self.cd_init    = ClockDomain()
         self.cd_por     = ClockDomain()
@@ -74,10 +75,10 @@ class _CRG(LiteXModule):
 
         # HDMI
         self.cd_hdmi   = ClockDomain()
-        #pll.create_clkout(self.cd_hdmi, 148.5e6) # for terminal "1920x1080@60Hz"
-        #pll.create_clkout(self.cd_hdmi, 160e6) # for terminal "1920x1080@60Hz"
-        #pll.create_clkout(self.cd_hdmi, 80e6) # for terminal "1920x1080@30Hz"
-        pll.create_clkout(self.cd_hdmi, 40e6) # for terminal "800x600@60Hz"
+        self.video_pll = video_pll = ECP5PLL()
+        self.comb += video_pll.reset.eq(~por_done | ~rst_n | self.rst)
+        video_pll.register_clkin(clk100, 100e6)
+        video_pll.create_clkout(self.cd_hdmi, pix_clk)
 
 
 # BaseSoC ------------------------------------------------------------------------------------------
@@ -87,11 +88,20 @@ class BaseSoC(SoCCore):
         with_led_chaser        = True,
         with_video_terminal    = True,
         with_video_framebuffer = False,
+        video_timings          = None,
         **kwargs):
         platform = lattice_ecp5_vip.Platform(toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoVGAPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:2", memtype="DDR"),
+            pll             = ECP5PLL,
+            clkin_freq      = 100e6)
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on ECP5 Evaluation Board", **kwargs)
@@ -114,23 +124,13 @@ class BaseSoC(SoCCore):
             self.videophy = VideoVGAPHY(pads, clock_domain="hdmi")
             self.videoi2c = I2CMaster(pads)
 
-            # # 1920x1080@60Hz
-            # pixel_clock_hz = 160e6
-            # framerate_hz = 60
-            # pixels_horizontal = 2200
-            # pixels_vertical = 1125
-
-            # 800x600@60Hz
-            pixel_clock_hz = 40e6
-            framerate_hz = 60
-            pixels_horizontal = 1056
-            pixels_vertical = 628
-
-            # # 1920x1080@30Hz
-            # pixel_clock_hz = 80e6
-            # framerate_hz = 30
-            # pixels_horizontal = 2640
-            # pixels_vertical = 1125
+            # Video Timings.
+            from litex.soc.cores import video
+            vt = video.video_timings[video_timings]
+            pixel_clock_hz    = vt["pix_clk"]
+            pixels_horizontal = vt["h_active"] + vt["h_blanking"]
+            pixels_vertical   = vt["v_active"] + vt["v_blanking"]
+            framerate_hz      = round(pixel_clock_hz/(pixels_horizontal*pixels_vertical))
 
             self.videoi2c.add_init(addr=0x3B, init=[
                 (0xc7, 0x00), # HDMI configuration
@@ -155,12 +155,9 @@ class BaseSoC(SoCCore):
 
             ])
             if with_video_terminal:
-                #self.add_video_terminal(phy=self.videophy, timings="1920x1080@60Hz", clock_domain="hdmi")
-                #self.add_video_terminal(phy=self.videophy, timings="1920x1080@30Hz", clock_domain="hdmi")
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                #self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
                 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -188,12 +185,17 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=lattice_ecp5_vip.Platform, description="LiteX SoC on ECP5 Evaluation Board.")
-    parser.add_target_argument("--sys-clk-freq", default=60e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sys-clk-freq",           default=60e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-video-framebuffer", action="store_true",      help="Enable Video Framebuffer (HDMI) instead of Video Terminal.")
+    parser.add_target_argument("--video-timings",          default=None,             help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        toolchain    = args.toolchain,
-        sys_clk_freq = args.sys_clk_freq,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_video_terminal    = not args.with_video_framebuffer,
+        with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -16,11 +16,18 @@
 # litex_bare_metal_demo --build-path build/limesdr_mini_v2
 # litex_term jtag --jtag-config=openocd_limesdr_mini_v2.cfg --kernel demo.bin
 
+# LMS7002M IQ streaming over the FT601 USB FIFO
+# ./limesdr_mini_v2.py --with-lms7002m --csr-csv=csr.csv --build --load
+# litex_server --jtag --jtag-config=openocd_limesdr_mini_v2.cfg
+# ./bench/lms7002m_usb_stream.py --csr-csv=csr.csv
+
 from migen import *
 
 from litex.gen import *
 
 from litex_boards.platforms import limesdr_mini_v2
+from litex_boards.lib.usb_fifo import FT245PHYSynchronousTimed
+from litex_boards.lib.lms7002m import LMS7002M
 
 from litex.soc.cores.clock import *
 from litex.soc.interconnect.csr import *
@@ -30,7 +37,6 @@ from litex.soc.interconnect import stream
 
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
-from litex.soc.cores.usb_fifo import FT245PHYSynchronous
 
 from litescope import LiteScopeAnalyzer
 
@@ -74,8 +80,12 @@ class BoardInfo(LiteXModule, AutoCSR):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=80e6, toolchain="trellis",
-        with_usb_fifo   = True, with_usb_fifo_loopback=False,
-        with_led_chaser = True,
+        with_usb_fifo       = True, with_usb_fifo_loopback=False,
+        usb_read_time       = 128,
+        usb_write_time      = 128,
+        with_lms7002m       = False,
+        lms7002m_fifo_depth = 2048,
+        with_led_chaser     = True,
         **kwargs):
         platform = limesdr_mini_v2.Platform(toolchain=toolchain)
 
@@ -97,16 +107,48 @@ class BaseSoC(SoCCore):
         self.i2c = I2CMaster(platform.request("i2c"))
 
         # USB-FIFO ---------------------------------------------------------------------------------
+        if with_lms7002m and not with_usb_fifo:
+            raise ValueError("LMS7002M streaming requires the USB-FIFO.")
         if with_usb_fifo:
             usb_pads = platform.request("usb_fifo")
-            self.usb_phy = usb_phy = FT245PHYSynchronous(
+            self.usb_phy = usb_phy = FT245PHYSynchronousTimed(
                 pads       = usb_pads,
                 clk_freq   = sys_clk_freq,
                 fifo_depth = 8,
-                read_time  = 128,
-                write_time = 128,
+                read_time  = usb_read_time,
+                write_time = usb_write_time,
             )
-            if with_usb_fifo_loopback:
+            if with_lms7002m:
+                # LMS7002M RX/TX samples packets <-> (DRAM-less) FIFOs <-> USB-FIFO, with USB time
+                # slices adapted to the FIFOs levels (the FT601 is half-duplex).
+                # The LMS7002M SPI is on the shared SPI bus (CS0: LMS7002M, CS1: VCTCXO DAC). The
+                # LMS7002M reset is not available (not in the platform's lms7002m resource).
+                spi      = platform.request("spi")
+                spi_pads = Record([("clk", 1), ("cs_n", 2), ("mosi", 1), ("miso", 1)])
+                self.comb += [
+                    spi.clk.eq(spi_pads.clk),
+                    spi.lms_cs_n.eq(spi_pads.cs_n[0]),
+                    spi.dac_cs_n.eq(spi_pads.cs_n[1]),
+                    spi.mosi.eq(spi_pads.mosi),
+                    spi_pads.miso.eq(spi.miso),
+                ]
+                self.lms7002m = LMS7002M(platform.request("lms7002m"), sys_clk_freq,
+                    fifo_depth   = lms7002m_fifo_depth,
+                    packet_words = 512,
+                    spi_pads     = spi_pads)
+                self.usb_rx_conv = usb_rx_conv = stream.Converter(64, 32)
+                self.usb_tx_conv = usb_tx_conv = stream.Converter(32, 64)
+                self.comb += [
+                    self.lms7002m.source.connect(usb_rx_conv.sink),
+                    usb_rx_conv.source.connect(usb_phy.sink),
+                    usb_phy.source.connect(usb_tx_conv.sink),
+                    usb_tx_conv.source.connect(self.lms7002m.sink),
+                    usb_phy.write_urgent.eq(self.lms7002m.rx_urgent),
+                    usb_phy.read_urgent.eq(self.lms7002m.tx_urgent),
+                ]
+                platform.add_period_constraint(self.lms7002m.rx_phy.cd_lms_rx.clk, 1e9/80e6)
+                platform.add_period_constraint(self.lms7002m.tx_phy.cd_lms_tx.clk, 1e9/80e6)
+            elif with_usb_fifo_loopback:
                 usb_loopback = stream.SyncFIFO([("data", 32)], 2048, buffered=True)
                 self.submodules += usb_loopback
                 self.comb += [
@@ -142,12 +184,20 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=limesdr_mini_v2.Platform, description="LiteX SoC on LimeSDR-Mini-V2.")
-    parser.add_target_argument("--sys-clk-freq", default=80e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sys-clk-freq",        default=80e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--usb-read-time",       default=128, type=int,    help="USB-FIFO max read time slice (in usb_clk cycles, 0: unlimited).")
+    parser.add_target_argument("--usb-write-time",      default=128, type=int,    help="USB-FIFO max write time slice (in usb_clk cycles, 0: unlimited).")
+    parser.add_target_argument("--with-lms7002m",       action="store_true",      help="Enable LMS7002M IQ streaming over the USB-FIFO.")
+    parser.add_target_argument("--lms7002m-fifo-depth", default=2048, type=int,   help="LMS7002M RX/TX FIFOs depth (in 64-bit words).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        toolchain    = args.toolchain,
+        sys_clk_freq        = args.sys_clk_freq,
+        toolchain           = args.toolchain,
+        usb_read_time       = args.usb_read_time,
+        usb_write_time      = args.usb_write_time,
+        with_lms7002m       = args.with_lms7002m,
+        lms7002m_fifo_depth = args.lms7002m_fifo_depth,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
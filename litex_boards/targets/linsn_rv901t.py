@@ -13,6 +13,8 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import linsn_rv901t
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.hub75 import HUB75Scanner, HUB75UDPReceiver, parse_hub75_panel
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
@@ -49,25 +51,54 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_phy         = 0,
-        with_led_chaser = True,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        eth_phy                = 0,
+        with_led_chaser        = True,
+        with_hub75             = False,
+        hub75_panel            = "64x32",
+        hub75_chain_length     = 1,
+        hub75_bit_depth        = 8,
+        hub75_gamma            = 2.2,
+        hub75_udp_port         = 7000,
         **kwargs):
         platform     = linsn_rv901t.Platform()
 
+        # HUB75 frames are received over UDP on the Etherbone UDP/IP stack.
+        if with_hub75:
+            if with_ethernet:
+                raise ValueError("HUB75 can't be used with --with-ethernet.")
+            with_etherbone = True
+
         # CRG --------------------------------------------------------------------------------------
         self.crg = _CRG(platform, sys_clk_freq)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Linsn RV901T", **kwargs)
 
+        # HUB75 Framebuffer geometry (framebuffer reserved at the end of the SDRAM) ---------------
+        hub75_fb_size = 0
+        if with_hub75:
+            hub75_nchains = len(linsn_rv901t.hub75e) - 1
+            panel_width, panel_height = parse_hub75_panel(hub75_panel)
+            hub75_width   = panel_width*hub75_chain_length
+            hub75_fb_size = 4*hub75_width*panel_height*hub75_nchains
+
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            self.sdrphy  = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            sdram_module = M12L64322A(sys_clk_freq, "1:1")
+            sdram_size   = 2**(sdram_module.geom_settings.bankbits +
+                               sdram_module.geom_settings.rowbits +
+                               sdram_module.geom_settings.colbits)*self.sdrphy.settings.nranks*self.sdrphy.settings.databits//8
+            if hub75_fb_size >= sdram_size:
+                raise ValueError(f"HUB75 framebuffer ({hub75_fb_size} bytes) too large for the SDRAM ({sdram_size} bytes).")
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = M12L64322A(sys_clk_freq, "1:1"),
+                module        = sdram_module,
+                size          = sdram_size - hub75_fb_size, # main_ram excludes the HUB75 framebuffer.
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
@@ -77,14 +108,47 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 tx_delay   = 0e-9)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, with_timing_constraints=False)
+                self.add_ethernet(phy=self.ethphy, with_timing_constraints=False, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, with_timing_constraints=False)
+                self.add_etherbone(phy=self.ethphy, with_timing_constraints=False, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
             # Timing Constraints.
             platform.add_period_constraint(platform.lookup_request("eth_clocks", eth_phy).rx, 1e9/125e6)
             platform.add_false_path_constraints(self.crg.cd_sys.clk, platform.lookup_request("eth_clocks", eth_phy).rx)
 
+        # HUB75 ------------------------------------------------------------------------------------
+        if with_hub75:
+            assert not self.integrated_main_ram_size
+            platform.add_extension(linsn_rv901t.hub75e)
+            self.comb += platform.request("bufdir").eq(0) # Output buffers.
+            hub75_chains  = [platform.request("hub75_chain", n) for n in range(hub75_nchains)]
+            hub75_fb_base = self.bus.regions["main_ram"].size # At the end of the SDRAM, after main_ram.
+
+            # Scanner: SDRAM Framebuffer -> HUB75.
+            self.hub75 = HUB75Scanner(
+                control_pads = platform.request("hub75_control"),
+                chain_pads   = hub75_chains,
+                port         = self.sdram.crossbar.get_port(mode="read", data_width=32),
+                sys_clk_freq = sys_clk_freq,
+                width        = hub75_width,
+                height       = panel_height,
+                bit_depth    = hub75_bit_depth,
+                gamma        = hub75_gamma,
+                base         = hub75_fb_base,
+            )
+
+            # UDP Receiver: UDP -> SDRAM Framebuffer.
+            self.hub75_rx = HUB75UDPReceiver(
+                udp_port = self.ethcore_etherbone.udp.crossbar.get_port(hub75_udp_port,
+                    dw = 32,
+                    cd = {32: "sys", 8: "etherbone"}[eth_data_width], # Etherbone clock domain runs from sys_clk.
+                ),
+                port     = self.sdram.crossbar.get_port(mode="write", data_width=32),
+                base     = hub75_fb_base,
+                size     = hub75_fb_size,
+            )
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -98,16 +162,32 @@ def main():
     parser = LiteXArgumentParser(platform=linsn_rv901t.Platform, description="LiteX SoC on Linsn RV901T.")
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-phy", default=0, type=int,  help="Ethernet PHY (0 or 1).")
+    ethopts.add_argument("--with-ethernet",                action="store_true",     help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",     help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,    help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,     help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-phy", default=0, type=int,                 help="Ethernet PHY (0 or 1).")
+    parser.add_target_argument("--with-hub75",             action="store_true",     help="Enable HUB75 LED panels driver fed from UDP (implies Etherbone).")
+    parser.add_target_argument("--hub75-panel",            default="64x32",         help="HUB75 panel size (WidthxHeight).")
+    parser.add_target_argument("--hub75-chain-length",     default=1, type=int,     help="HUB75 panels chained on each connector.")
+    parser.add_target_argument("--hub75-bit-depth",        default=8, type=int,     help="HUB75 bit depth per color (after Gamma LUT).")
+    parser.add_target_argument("--hub75-gamma",            default=2.2, type=float, help="HUB75 Gamma LUT initial gamma.")
+    parser.add_target_argument("--hub75-udp-port",         default=7000, type=int,  help="HUB75 frames UDP port.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_phy        = int(args.eth_phy),
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_phy                = int(args.eth_phy),
+        with_hub75             = args.with_hub75,
+        hub75_panel            = args.hub75_panel,
+        hub75_chain_length     = args.hub75_chain_length,
+        hub75_bit_depth        = args.hub75_bit_depth,
+        hub75_gamma            = args.hub75_gamma,
+        hub75_udp_port         = args.hub75_udp_port,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
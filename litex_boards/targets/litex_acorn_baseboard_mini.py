@@ -17,6 +17,7 @@ from litex.build.io import DifferentialInput
 from litex.build.openocd import OpenOCD
 
 from litex_boards.platforms import sqrl_acorn
+from litex_boards.lib.ethernet import check_eth_data_width
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
@@ -104,14 +105,16 @@ class CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="cle-215+", sys_clk_freq=125e6,
-        with_pcie       = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_sata       = False, sata_gen="gen2",
+        with_pcie              = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        eth_ip                 = "192.168.1.50",
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
+        with_sata              = False, sata_gen="gen2",
         **kwargs):
         platform = Platform(variant=variant)
         platform.add_extension(sqrl_acorn._litex_acorn_baseboard_mini_io, prepend=True)
@@ -214,11 +217,12 @@ class BaseSoC(SoCCore):
                 rx_polarity  = 1,  # Inverted on Acorn.
                 tx_polarity  = 0   # Inverted on Acorn and on baseboard.
             )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
 
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
             elif with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, data_width=eth_data_width)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -247,31 +251,35 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=sqrl_acorn.Platform, description="LiteX SoC on Acorn CLE-101/215(+).")
-    parser.add_target_argument("--flash",          action="store_true",          help="Flash bitstream.")
-    parser.add_target_argument("--variant",        default="cle-215+",           help="Board variant (cle-215+, cle-215 or cle-101).")
-    parser.add_target_argument("--sys-clk-freq",   default=125.00e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",      action="store_true",          help="Enable PCIe support.")
-    parser.add_target_argument("--driver",         action="store_true",          help="Generate PCIe driver.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",          help="Enable Ethernet support.")
-    parser.add_target_argument("--with-etherbone", action="store_true",          help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",       help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--remote-ip",      default="192.168.1.100",      help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",          help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--with-sata",      action="store_true",          help="Enable SATA support (over FMCRAID).")
-    parser.add_target_argument("--sata-gen",       default="2",                  help="SATA Gen.", choices=["1", "2"])
+    parser.add_target_argument("--flash",                  action="store_true",          help="Flash bitstream.")
+    parser.add_target_argument("--variant",                default="cle-215+",           help="Board variant (cle-215+, cle-215 or cle-101).")
+    parser.add_target_argument("--sys-clk-freq",           default=125.00e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",              action="store_true",          help="Enable PCIe support.")
+    parser.add_target_argument("--driver",                 action="store_true",          help="Generate PCIe driver.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",          help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",          help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,         help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,          help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",       help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",      help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",          help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--with-sata",              action="store_true",          help="Enable SATA support (over FMCRAID).")
+    parser.add_target_argument("--sata-gen",               default="2",                  help="SATA Gen.", choices=["1", "2"])
     args = parser.parse_args()
 
     soc = BaseSoC(
-        variant        = args.variant,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_pcie      = args.with_pcie,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_sata      = args.with_sata,
-        sata_gen       = "gen" + args.sata_gen,
+        variant                = args.variant,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_pcie              = args.with_pcie,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_sata              = args.with_sata,
+        sata_gen               = "gen" + args.sata_gen,
         **parser.soc_argdict
     )
 
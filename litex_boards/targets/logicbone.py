@@ -15,6 +15,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import logicbone
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -93,6 +95,7 @@ class BaseSoC(SoCCore):
     def __init__(self, revision="rev0", device="45F", sdram_device="MT41K512M16",
         sys_clk_freq    = 75e6,
         with_ethernet   = False,
+        eth_data_width  = 8,
         with_led_chaser = True,
         toolchain       = "trellis",
         **kwargs):
@@ -130,7 +133,8 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
 
         # Leds -------------------------------------------------------------------------------------
@@ -148,19 +152,21 @@ def main():
     parser.add_target_argument("--device",         default="45F",            help="FPGA device (45F or 85F).")
     parser.add_target_argument("--sdram-device",   default="MT41K512M16",    help="SDRAM device (MT41K512M16).")
     parser.add_target_argument("--with-ethernet",  action="store_true",      help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int,      help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_target_argument("--with-sdcard",    action="store_true",      help="Enable SDCard support.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        toolchain     = args.toolchain,
-        device        = args.device,
-        sys_clk_freq  = args.sys_clk_freq,
-        sdram_device  = args.sdram_device,
-        with_ethernet = args.with_ethernet,
+        toolchain      = args.toolchain,
+        device         = args.device,
+        sys_clk_freq   = args.sys_clk_freq,
+        sdram_device   = args.sdram_device,
+        with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
         **parser.soc_argdict
     )
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -18,6 +18,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_kopflos
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.build.lattice.trellis import trellis_args, trellis_argdict
 from litex.build.io import DDROutput
@@ -106,7 +108,7 @@ class BaseSoC(SoCCore):
     mem_map = {**SoCCore.mem_map, **{
         "usb_ohci":     0xc0000000,
     }}
-    def __init__(self, revision="v0", device="12F", sdram_device="MT41K128M16", sdram_rate="1:2", sys_clk_freq=int(40e6), toolchain="trellis", with_led_chaser=True, with_usb_host=False, with_ethernet=False, **kwargs):
+    def __init__(self, revision="v0", device="12F", sdram_device="MT41K128M16", sdram_rate="1:2", sys_clk_freq=int(40e6), toolchain="trellis", with_led_chaser=True, with_usb_host=False, with_ethernet=False, eth_data_width=8, **kwargs):
 
         platform = machdyne_kopflos.Platform(revision=revision, device=device ,toolchain=toolchain)
 
@@ -155,7 +157,8 @@ class BaseSoC(SoCCore):
                 pads = platform.request("eth"),
                 with_hw_init_reset=True,
                 refclk_cd=None)
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -176,6 +179,7 @@ def main():
     parser.add_argument("--with-spi-sdcard", action="store_true",  help="Enable SPI-mode SDCard support.")
     parser.add_argument("--with-usb-host",   action="store_true",  help="Enable USB host support.")
     parser.add_argument("--with-ethernet",   action="store_true",  help="Enable ethernet support.")
+    parser.add_argument("--eth-data-width",  default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_argument("--sdram-device",    default="MT41K128M16", help="SDRAM device.")
 
     args = parser.parse_args()
@@ -186,12 +190,13 @@ def main():
         device       = args.device,
         sys_clk_freq = int(float(args.sys_clk_freq)),
         sdram_device = args.sdram_device,
-        with_usb_host = args.with_usb_host,
-        with_ethernet = args.with_ethernet,
+        with_usb_host  = args.with_usb_host,
+        with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
         **parser.soc_argdict)
 
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -36,10 +36,13 @@ from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
 from litex.soc.integration.soc import SoCRegion
 
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_rate = "1:2"):
+    def __init__(self, platform, sys_clk_freq, sdram_rate = "1:2", pix_clk=25.175e6):
         self.rst        = Signal()
         self.cd_por     = ClockDomain()
         self.cd_sys     = ClockDomain()
@@ -89,8 +92,8 @@ class _CRG(LiteXModule):
         pll2 = ECP5PLL()
         self.pll2 = pll2
         pll2.register_clkin(clk48, 48e6)
-        pll2.create_clkout(self.cd_video, 25e6)
-        pll2.create_clkout(self.cd_video5x, 125e6)
+        pll2.create_clkout(self.cd_video, pix_clk)
+        pll2.create_clkout(self.cd_video5x, 5*pix_clk)
 
         self.cd_usb_12 = ClockDomain()
         self.cd_usb    = ClockDomain()
@@ -106,12 +109,22 @@ class BaseSoC(SoCCore):
     mem_map = {**SoCCore.mem_map, **{
         "usb_ohci":     0xc0000000,
     }}
-    def __init__(self, revision="v0", device="25F", sdram_device="W9825G6KH6", sdram_rate="1:2", sys_clk_freq=int(48e6), toolchain="trellis", with_led_chaser=False, with_video_framebuffer=False, with_usb_host=False, **kwargs):
+    def __init__(self, revision="v0", device="25F", sdram_device="W9825G6KH6", sdram_rate="1:2", sys_clk_freq=int(48e6), toolchain="trellis", with_led_chaser=False, with_video_framebuffer=False, video_timings=None, with_usb_host=False, **kwargs):
 
         platform = machdyne_lakritz.Platform(revision=revision, device=device ,toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy                  = VideoHDMIPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=16, rate=sdram_rate),
+            format               = "rgb565",
+            pll                  = ECP5PLL,
+            clkin_freq           = 48e6,
+            pll_shared_clk_freqs = [48e6, 12e6])
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Lakritz", **kwargs)
@@ -154,7 +167,7 @@ class BaseSoC(SoCCore):
             self.videophy = VideoHDMIPHY(platform.request("ddmi"),
                 clock_domain="video")
             self.add_video_framebuffer(phy=self.videophy,
-                timings="640x480@60Hz",
+                timings=video_timings,
                 clock_domain="video",
                 format="rgb565")
 
@@ -176,6 +189,7 @@ def main():
     parser.add_argument("--with-sdcard",     action="store_true",  help="Enable SDCard support.")
     parser.add_argument("--with-spi-sdcard", action="store_true",  help="Enable SPI-mode SDCard support.")
     parser.add_argument("--with-video-framebuffer",   action="store_true",  help="Enable DDMI framebuffer.")
+    parser.add_argument("--video-timings",   default=None,         help="Video Framebuffer timings (default: largest feasible).")
     parser.add_argument("--with-usb-host",   action="store_true",  help="Enable USB host support.")
     parser.add_argument("--sdram-device",    default="W9825G6KH6", help="SDRAM device (W9825G6KH6 or IS42S16320).")
 
@@ -187,10 +201,12 @@ def main():
         sys_clk_freq = int(float(args.sys_clk_freq)),
         sdram_device = args.sdram_device,
         with_usb_host = args.with_usb_host,
+        with_video_framebuffer = args.with_video_framebuffer,
+        video_timings = args.video_timings,
         **parser.soc_argdict)
 
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
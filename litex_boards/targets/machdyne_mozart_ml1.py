@@ -17,6 +17,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_mozart_ml1
+from litex_boards.lib.ethernet import check_eth_data_width
 
 from litex.build.io import DDROutput
 
@@ -35,10 +36,13 @@ from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
 from litex.soc.integration.soc import SoCRegion
 
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_rate):
+    def __init__(self, platform, sys_clk_freq, sdram_rate, pix_clk=25.175e6):
         self.rst        = Signal()
         self.cd_por     = ClockDomain()
         self.cd_sys     = ClockDomain()
@@ -96,8 +100,8 @@ class _CRG(LiteXModule):
         self.pll2 = pll2
         pll2.register_clkin(clk50, 50e6)
         pll2.create_clkout(self.cd_eth, 50e6)
-        pll2.create_clkout(self.cd_video, 25e6)
-        pll2.create_clkout(self.cd_video5x, 125e6)
+        pll2.create_clkout(self.cd_video, pix_clk)
+        pll2.create_clkout(self.cd_video5x, 5*pix_clk)
         self.comb += pll2.reset.eq(~por_done)
 
         pll3 = ECP5PLL()
@@ -117,12 +121,22 @@ class BaseSoC(SoCCore):
     mem_map = {**SoCCore.mem_map, **{
         "usb_ohci":     0xc0000000,
     }}
-    def __init__(self, revision="v2", device="45F", sdram_rate="1:2", sys_clk_freq=int(48e6), toolchain="trellis", with_usb_host=False, with_ethernet=False, **kwargs):
+    def __init__(self, revision="v2", device="45F", sdram_rate="1:2", sys_clk_freq=int(48e6), toolchain="trellis", with_usb_host=False, with_ethernet=False, eth_data_width=8, video_timings=None, **kwargs):
 
         platform = machdyne_mozart_ml1.Platform(revision=revision, device=device ,toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = get_video_timings(video_timings,
+            phy                  = VideoHDMIPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=16, rate=sdram_rate),
+            format               = "rgb565",
+            pll                  = ECP5PLL,
+            clkin_freq           = 50e6,
+            pll_shared_clk_freqs = [50e6])
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Mozart ML1", **kwargs)
@@ -146,7 +160,7 @@ class BaseSoC(SoCCore):
         # DDMI Framebuffer -------------------------------------------------------------------------------------
         self.videophy = VideoHDMIPHY(platform.request("ddmi"),
             clock_domain="video")
-        self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz",
+        self.add_video_framebuffer(phy=self.videophy, timings=video_timings,
             clock_domain="video", format="rgb565")
 
         # USB Host ---------------------------------------------------------------------------------
@@ -166,7 +180,8 @@ class BaseSoC(SoCCore):
                 with_hw_init_reset=True,
                 refclk_cd="eth")
                 #refclk_cd=None)
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -174,6 +189,7 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=machdyne_mozart_ml1.Platform, description="LiteX SoC on Mozart ML1")
     parser.add_argument("--sys-clk-freq",    default=48e6,         help="System clock frequency.")
+    parser.add_argument("--video-timings",   default=None,         help="Video Framebuffer timings (default: largest feasible).")
     parser.add_argument("--revision",        default="v2",         help="Board Revision (v0, v1, v2).")
     parser.add_argument("--device",          default="45F",        help="ECP5 device (12F, 25F, 45F or 85F).")
     parser.add_argument("--cable",           default="usb-blaster", help="Specify an openFPGALoader cable.")
@@ -181,6 +197,7 @@ def main():
     parser.add_argument("--with-spi-sdcard", action="store_true",  help="Enable SPI-mode SDCard support.")
     parser.add_argument("--with-usb-host",   action="store_true",  help="Enable USB host support.")
     parser.add_argument("--with-ethernet",   action="store_true",  help="Enable ethernet support.")
+    parser.add_argument("--eth-data-width",  default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_argument("--boot-from-flash", action="store_true",  help="Boot from flash MMOD.")
 
     args = parser.parse_args()
@@ -190,12 +207,14 @@ def main():
         revision     = args.revision,
         device       = args.device,
         sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_usb_host = args.with_usb_host,
-        with_ethernet = args.with_ethernet,
+        with_usb_host  = args.with_usb_host,
+        with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
+        video_timings = args.video_timings,
         **parser.soc_argdict)
 
     if args.with_sdcard:
-        soc.add_sdcard(software_debug=False)
+        add_sdcard_hs(soc, software_debug=False)
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -18,6 +18,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_mozart_ml2
+from litex_boards.lib.ethernet import check_eth_data_width
 
 from litex.build.io import DDROutput
 
@@ -36,10 +37,13 @@ from litedram.phy import ECP5DDRPHY
 
 from litex.soc.integration.soc import SoCRegion
 
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_rate):
+    def __init__(self, platform, sys_clk_freq, sdram_rate, pix_clk=25.175e6):
         self.rst        = Signal()
         self.cd_por     = ClockDomain()
         self.cd_sys     = ClockDomain()
@@ -90,8 +94,8 @@ class _CRG(LiteXModule):
         pll2 = ECP5PLL()
         self.pll2 = pll2
         pll2.register_clkin(clk48, 48e6)
-        pll2.create_clkout(self.cd_video, 25e6)
-        pll2.create_clkout(self.cd_video5x, 125e6)
+        pll2.create_clkout(self.cd_video, pix_clk)
+        pll2.create_clkout(self.cd_video5x, 5*pix_clk)
 
         pll3 = ECP5PLL()
         self.pll3 = pll3
@@ -116,12 +120,21 @@ class BaseSoC(SoCCore):
     mem_map = {**SoCCore.mem_map, **{
         "usb_ohci":     0xc0000000,
     }}
-    def __init__(self, revision="v0", device="45F", sdram_rate="1:2", sys_clk_freq=int(48e6), toolchain="trellis", with_usb_host=False, with_ethernet=False, sdram_device="MT41K256M16", **kwargs):
+    def __init__(self, revision="v0", device="45F", sdram_rate="1:2", sys_clk_freq=int(48e6), toolchain="trellis", with_usb_host=False, with_ethernet=False, eth_data_width=8, sdram_device="MT41K256M16", video_timings=None, **kwargs):
 
         platform = machdyne_mozart_ml2.Platform(revision=revision, device=device ,toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = get_video_timings(video_timings,
+            phy             = VideoHDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:2", memtype="DDR"),
+            format          = "rgb565",
+            pll             = ECP5PLL,
+            clkin_freq      = 48e6)
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Mozart ML2", **kwargs)
@@ -153,7 +166,7 @@ class BaseSoC(SoCCore):
         # DDMI Framebuffer -------------------------------------------------------------------------------------
         self.videophy = VideoHDMIPHY(platform.request("ddmi"),
             clock_domain="video")
-        self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz",
+        self.add_video_framebuffer(phy=self.videophy, timings=video_timings,
             clock_domain="video", format="rgb565")
 
         # USB Host ---------------------------------------------------------------------------------
@@ -171,7 +184,8 @@ class BaseSoC(SoCCore):
                 pads = platform.request("eth"),
                 with_hw_init_reset=True,
                 refclk_cd=None)
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -179,6 +193,7 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=machdyne_mozart_ml2.Platform, description="LiteX SoC on Mozart ML2")
     parser.add_argument("--sys-clk-freq",    default=48e6,         help="System clock frequency.")
+    parser.add_argument("--video-timings",   default=None,         help="Video Framebuffer timings (default: largest feasible).")
     parser.add_argument("--revision",        default="v0",         help="Board Revision (v0).")
     parser.add_argument("--device",          default="45F",        help="ECP5 device (12F, 25F, 45F or 85F).")
     parser.add_argument("--cable",           default="usb-blaster", help="Specify an openFPGALoader cable.")
@@ -186,6 +201,7 @@ def main():
     parser.add_argument("--with-spi-sdcard", action="store_true",  help="Enable SPI-mode SDCard support.")
     parser.add_argument("--with-usb-host",   action="store_true",  help="Enable USB host support.")
     parser.add_argument("--with-ethernet",   action="store_true",  help="Enable ethernet support.")
+    parser.add_argument("--eth-data-width",  default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_argument("--boot-from-flash", action="store_true",  help="Boot from flash MMOD.")
     parser.add_argument("--sdram-device",    default="MT41K256M16", help="SDRAM device.")
 
@@ -196,13 +212,15 @@ def main():
         revision     = args.revision,
         device       = args.device,
         sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_usb_host = args.with_usb_host,
-        with_ethernet = args.with_ethernet,
-        sdram_device  = args.sdram_device,
+        with_usb_host  = args.with_usb_host,
+        with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
+        sdram_device   = args.sdram_device,
+        video_timings = args.video_timings,
         **parser.soc_argdict)
 
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
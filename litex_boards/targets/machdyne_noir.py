@@ -37,10 +37,13 @@ from litedram.phy import ECP5DDRPHY
 
 from litex.soc.integration.soc import SoCRegion
 
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, pix_clk=25.175e6):
         self.rst        = Signal()
         self.cd_por     = ClockDomain()
         self.cd_sys     = ClockDomain()
@@ -91,8 +94,8 @@ class _CRG(LiteXModule):
         pll2 = ECP5PLL()
         self.pll2 = pll2
         pll2.register_clkin(clk48, 48e6)
-        pll2.create_clkout(self.cd_video, 25e6)
-        pll2.create_clkout(self.cd_video5x, 125e6)
+        pll2.create_clkout(self.cd_video, pix_clk)
+        pll2.create_clkout(self.cd_video5x, 5*pix_clk)
 
         self.cd_usb_12 = ClockDomain()
         self.cd_usb    = ClockDomain()
@@ -108,12 +111,22 @@ class BaseSoC(SoCCore):
     mem_map = {**SoCCore.mem_map, **{
         "usb_ohci":     0xc0000000,
     }}
-    def __init__(self, revision="v0", device="45F", sdram_device="MT41K128M16", sys_clk_freq=int(50e6), toolchain="trellis", with_led_chaser=True, with_usb_host=False, with_ethernet=False, **kwargs):
+    def __init__(self, revision="v0", device="45F", sdram_device="MT41K128M16", sys_clk_freq=int(50e6), toolchain="trellis", with_led_chaser=True, with_usb_host=False, with_ethernet=False, video_timings=None, **kwargs):
 
         platform = machdyne_noir.Platform(revision=revision, device=device, toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = get_video_timings(video_timings,
+            phy                  = VideoHDMIPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=16, rate="1:2", memtype="DDR"),
+            format               = "rgb565",
+            pll                  = ECP5PLL,
+            clkin_freq           = 48e6,
+            pll_shared_clk_freqs = [48e6, 12e6])
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Noir", **kwargs)
@@ -153,7 +166,7 @@ class BaseSoC(SoCCore):
         # DDMI Framebuffer -------------------------------------------------------------------------------------
         self.videophy = VideoHDMIPHY(platform.request("ddmi"),
             clock_domain="video")
-        self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz",
+        self.add_video_framebuffer(phy=self.videophy, timings=video_timings,
             clock_domain="video", format="rgb565")
 
         # Leds -------------------------------------------------------------------------------------
@@ -168,6 +181,7 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=machdyne_noir.Platform, description="LiteX SoC on Noir")
     parser.add_argument("--sys-clk-freq",    default=50e6,         help="System clock frequency.")
+    parser.add_argument("--video-timings",   default=None,         help="Video Framebuffer timings (default: largest feasible).")
     parser.add_argument("--revision",        default="v0",         help="Board Revision (v0).")
     parser.add_argument("--device",          default="45F",        help="ECP5 device (25F, 45F or 85F).")
     parser.add_argument("--cable",           default="usb-blaster", help="Specify an openFPGALoader cable.")
@@ -187,10 +201,11 @@ def main():
         sdram_device = args.sdram_device,
         with_usb_host = args.with_usb_host,
         with_ethernet = args.with_ethernet,
+        video_timings = args.video_timings,
         **parser.soc_argdict)
 
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
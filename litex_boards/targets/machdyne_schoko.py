@@ -35,10 +35,13 @@ from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
 from litex.soc.integration.soc import SoCRegion
 
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_rate):
+    def __init__(self, platform, sys_clk_freq, sdram_rate, pix_clk=25.175e6):
         self.rst        = Signal()
         self.cd_por     = ClockDomain()
         self.cd_sys     = ClockDomain()
@@ -88,8 +91,8 @@ class _CRG(LiteXModule):
         pll2 = ECP5PLL()
         self.pll2 = pll2
         pll2.register_clkin(clk48, 48e6)
-        pll2.create_clkout(self.cd_video, 25e6)
-        pll2.create_clkout(self.cd_video5x, 125e6)
+        pll2.create_clkout(self.cd_video, pix_clk)
+        pll2.create_clkout(self.cd_video5x, 5*pix_clk)
 
         self.cd_usb_12 = ClockDomain()
         self.cd_usb = ClockDomain()
@@ -109,11 +112,22 @@ class BaseSoC(SoCCore):
         sdram_rate      = "1:2",
         with_led_chaser = True,
         with_usb_host   = False,
+        video_timings   = None,
         **kwargs):
         platform = machdyne_schoko.Platform(revision=revision, device=device ,toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = get_video_timings(video_timings,
+            phy                  = VideoHDMIPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=16, rate=sdram_rate),
+            format               = "rgb565",
+            pll                  = ECP5PLL,
+            clkin_freq           = 48e6,
+            pll_shared_clk_freqs = [48e6, 12e6])
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Schoko", **kwargs)
@@ -156,7 +170,7 @@ class BaseSoC(SoCCore):
         # DDMI Framebuffer -------------------------------------------------------------------------------------
         self.videophy = VideoHDMIPHY(platform.request("ddmi"),
             clock_domain="video")
-        self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz",
+        self.add_video_framebuffer(phy=self.videophy, timings=video_timings,
             clock_domain="video", format="rgb565")
 
         # DDMI Terminal -------------------------------------------------------------------------------------
@@ -178,6 +192,7 @@ def main():
     parser = LiteXArgumentParser(platform=machdyne_schoko.Platform, description="LiteX SoC on Schoko.")
     parser.add_target_argument("--flash",           action="store_true",       help="Flash bitstream to MMOD.")
     parser.add_target_argument("--sys-clk-freq",    default=40e6,  type=float, help="System clock frequency.")
+    parser.add_target_argument("--video-timings",   default=None,              help="Video Framebuffer timings (default: largest feasible).")
     parser.add_target_argument("--revision",        default="v1",              help="Board Revision (v1, v2).")
     parser.add_target_argument("--device",          default="45F",             help="ECP5 device (25F, 45F or 85F).")
     parser.add_target_argument("--cable",           default="usb-blaster",     help="Specify an openFPGALoader cable.")
@@ -187,14 +202,15 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        toolchain    = args.toolchain,
-        revision     = args.revision,
-        device       = args.device,
-        sys_clk_freq = args.sys_clk_freq,
+        toolchain     = args.toolchain,
+        revision      = args.revision,
+        device        = args.device,
+        sys_clk_freq  = args.sys_clk_freq,
+        video_timings = args.video_timings,
         **parser.soc_argdict)
 
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
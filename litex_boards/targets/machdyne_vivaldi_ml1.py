@@ -17,6 +17,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_vivaldi_ml1
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.build.io import DDROutput
 
@@ -116,7 +118,7 @@ class BaseSoC(SoCCore):
     mem_map = {**SoCCore.mem_map, **{
         "usb_ohci":     0xc0000000,
     }}
-    def __init__(self, revision="v2", device="45F", sdram_rate="1:2", sys_clk_freq=int(48e6), toolchain="trellis", with_usb_host=False, with_ethernet=False, **kwargs):
+    def __init__(self, revision="v2", device="45F", sdram_rate="1:2", sys_clk_freq=int(48e6), toolchain="trellis", with_usb_host=False, with_ethernet=False, eth_data_width=8, **kwargs):
 
         platform = machdyne_vivaldi_ml1.Platform(revision=revision, device=device ,toolchain=toolchain)
 
@@ -158,8 +160,9 @@ class BaseSoC(SoCCore):
                 with_hw_init_reset=True,
                 refclk_cd="eth")
             self.add_csr("ethphy")
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             self.add_ethernet(name="ethmac", phy=self.ethphy,
-                phy_cd="ethphy_eth")
+                phy_cd="ethphy_eth", data_width=eth_data_width)
 
             self.ethphy1 = LiteEthPHYRMII(
                 clock_pads=None,
@@ -167,8 +170,9 @@ class BaseSoC(SoCCore):
                 with_hw_init_reset=True,
                 refclk_cd="eth")
             self.add_csr("ethphy1")
+            check_eth_data_width(self.ethphy1, self.sys_clk_freq, eth_data_width)
             self.add_ethernet(name="ethmac1", phy=self.ethphy1,
-                phy_cd="ethphy1_eth")
+                phy_cd="ethphy1_eth", data_width=eth_data_width)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -183,6 +187,7 @@ def main():
     parser.add_argument("--with-spi-sdcard", action="store_true",  help="Enable SPI-mode SDCard support.")
     parser.add_argument("--with-usb-host",   action="store_true",  help="Enable USB host support.")
     parser.add_argument("--with-ethernet",   action="store_true",  help="Enable ethernet support.")
+    parser.add_argument("--eth-data-width",  default=8, type=int,  help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_argument("--boot-from-flash", action="store_true",  help="Boot from flash MMOD.")
 
     args = parser.parse_args()
@@ -192,12 +197,13 @@ def main():
         revision     = args.revision,
         device       = args.device,
         sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_usb_host = args.with_usb_host,
-        with_ethernet = args.with_ethernet,
+        with_usb_host  = args.with_usb_host,
+        with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
         **parser.soc_argdict)
 
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
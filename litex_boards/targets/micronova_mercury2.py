@@ -13,6 +13,7 @@ from litex.gen import *
 from litex.build.io import CRG
 
 from litex_boards.platforms import micronova_mercury2
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -25,25 +26,14 @@ from litex.soc.integration.soc import colorer
 
 # _CRG ---------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst          = Signal()
-        self.cd_sys       = ClockDomain()
-        self.cd_sys4x     = ClockDomain()
-        self.cd_sys4x_dqs = ClockDomain()
-
-        # # #
-
-        pll_clk50 = platform.request("clk50")
-
-        self.pll = pll = S7MMCM(speedgrade=-1)
-        self.comb += pll.reset.eq(self.rst)
-        pll.register_clkin(pll_clk50, 50e6)
-        pll.create_clkout(self.cd_sys,       sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
-
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
+        BoardCRG.__init__(self, platform,
+            pll        = S7MMCM(speedgrade=-1),
+            clkin      = platform.request("clk50"),
+            clkin_freq = 50e6,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, idelay_clk_freq=None)
 
 # AsyncSRAM ------------------------------------------------------------------------------------------
 
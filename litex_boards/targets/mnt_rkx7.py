@@ -13,6 +13,8 @@ from migen.fhdl.specials import Tristate
 from litex.gen import *
 
 from litex_boards.platforms import mnt_rkx7
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 
 from litex.soc.integration.soc_core import *
@@ -82,11 +84,13 @@ class BaseSoC(SoCCore):
     }}
 
     def __init__(self, sys_clk_freq=100e6,
-        with_ethernet  = True,
-        with_etherbone = False,
-        with_spi_flash = True,
-        with_usb_host  = True,
-        with_analyzer  = False,
+        with_ethernet          = True,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        with_spi_flash         = True,
+        with_usb_host          = True,
+        with_analyzer          = False,
         **kwargs):
         platform = mnt_rkx7.Platform()
 
@@ -121,12 +125,13 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets {{main_ethphy_eth_rx_clk_ibuf}}]")
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets {{soclinux_ethphy_eth_rx_clk_ibuf}}]")
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=True, software_debug=False)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=True, software_debug=False, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # GPIO -------------------------------------------------------------------------------------
         # Controllable as faux "leds"
@@ -214,22 +219,26 @@ def main():
     sdopts.add_argument("--with-spi-sdcard",     action="store_true",               help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",         action="store_true", default=True, help="Enable SDCard support.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true", default=True, help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true",               help="Enable Etherbone support.")
+    ethopts.add_argument("--with-ethernet",                action="store_true", default=True, help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",               help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,              help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,               help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        with_spi_flash = args.with_spi_flash,
-        with_usb_host  = args.with_usb_host,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        with_spi_flash         = args.with_spi_flash,
+        with_usb_host          = args.with_usb_host,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     args.csr_csv="csr.csv"
 
@@ -22,6 +22,17 @@
 # ./litepcie_util scratch_test
 # ./litepcie_util dma_test
 # ./litepcie_util uart_test
+#
+# With Timestamping:
+# ./ocp_tap_timecard.py --uart-name=crossover --with-pcie --with-timestamping --build --driver --load
+# Time is maintained in hardware (time_* CSRs: set/adjust/increment for the servo), the PPS output
+# is generated from it on the SMAs configured as outputs and the edges of the SMAs configured as
+# inputs, of the GNSS timepulse and of the PPS output are timestamped (1/8 sys_clk resolution) and
+# streamed to the host over PCIe DMA as 64-bit events:
+# - [29: 0]: Nanoseconds.
+# - [32:30]: Sub-cycle position of the edge (in 1/8 of sys_clk period, to add to nanoseconds).
+# - [35:33]: Channel (0-3: SMA inputs, 4: GNSS timepulse, 5: PPS output).
+# - [63:36]: Seconds (28 LSBs).
 
 import os
 
@@ -30,6 +41,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import ocp_tap_timecard
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.timestamper import TimeCounter, Timestamper
 
 from litex.soc.interconnect.csr import *
 from litex.soc.interconnect import stream
@@ -76,9 +89,10 @@ class CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_smas       = False,
+        with_led_chaser   = True,
+        with_pcie         = False,
+        with_smas         = False,
+        with_timestamping = False,
         **kwargs):
         platform = ocp_tap_timecard.Platform()
 
@@ -187,6 +201,17 @@ class BaseSoC(SoCCore):
             self.comb += self.pcie_dma0.source.connect(self.smas.sink)
             self.comb += self.smas.source.connect(self.pcie_dma0.sink)
 
+        # Timestamping -----------------------------------------------------------------------------
+        if with_timestamping:
+            if not with_pcie:
+                raise ValueError("Timestamping requires PCIe (--with-pcie).")
+            self.time        = TimeCounter(sys_clk_freq)
+            self.timestamper = Timestamper(self.time,
+                sma_pads = [platform.request("sma", i) for i in range(4)],
+                gnss_tp  = platform.request("gps", 0).tp[0],
+            )
+            self.comb += self.timestamper.source.connect(self.pcie_dma0.sink)
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
@@ -195,17 +220,24 @@ def main():
     parser.add_target_argument("--flash",        action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true", help="Enable PCIe support.")
-    parser.add_target_argument("--with-smas",    action="store_true", help="Enable SMAs support.")
+    smaopts = parser.target_group.add_mutually_exclusive_group()
+    smaopts.add_argument("--with-smas",          action="store_true",       help="Enable SMAs support.")
+    smaopts.add_argument("--with-timestamping",  action="store_true",       help="Enable Time counter, PPS Output and Timestamping (on SMAs/GNSS).")
     parser.add_target_argument("--driver",       action="store_true", help="Generate PCIe driver.")
+    parser.add_target_argument("--fast-config",  action="store_true", help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
-        with_smas    = args.with_smas,
+        sys_clk_freq      = args.sys_clk_freq,
+        with_pcie         = args.with_pcie,
+        with_smas         = args.with_smas,
+        with_timestamping = args.with_timestamping,
         **parser.soc_argdict
     )
 
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder  = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -14,6 +14,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import opalkelly_xem8320
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -27,7 +28,7 @@ from litedram.phy import usddrphy
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, with_video_pll=False):
+    def __init__(self, platform, sys_clk_freq, with_video_pll=False, pix_clk=31.5e6):
         self.rst = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_sys4x  = ClockDomain()
@@ -55,8 +56,8 @@ class _CRG(LiteXModule):
             self.video_pll = video_pll = USMMCM(speedgrade=-2)
             video_pll.reset.eq(self.rst)
             video_pll.register_clkin(self.cd_sys.clk, sys_clk_freq)
-            video_pll.create_clkout(self.cd_hdmi,   25e6)
-            video_pll.create_clkout(self.cd_hdmi5x, 5*25e6)
+            video_pll.create_clkout(self.cd_hdmi,   pix_clk)
+            video_pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -67,13 +68,25 @@ class BaseSoC(SoCCore):
         eth_ip                 = "192.168.1.50",
         with_led_chaser        = True,
         with_video_framebuffer = False,
+        video_timings          = None,
         **kwargs):
         platform = opalkelly_xem8320.Platform()
 
         # TODO: add okHost FrontPanel API for UART, Data streaing, and Debug
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@75Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoDVIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:4", memtype="DDR"),
+            pll             = lambda: USMMCM(speedgrade=-2),
+            clkin_freq      = sys_clk_freq)
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, with_video_pll=with_video_framebuffer)
+        self.crg = _CRG(platform, sys_clk_freq,
+            with_video_pll = with_video_framebuffer,
+            pix_clk        = get_video_pix_clk(video_timings),
+        )
 
         # SoCCore ----------------------------------------------------------------------------------
         kwargs["uart_name"] = "jtag_uart"
@@ -109,7 +122,7 @@ class BaseSoC(SoCCore):
         if with_video_framebuffer:
             platform.add_extension(opalkelly_xem8320._dvi_pmod_io)
             self.videophy = VideoDVIPHY(platform.request("dvi"), clock_domain="hdmi")
-            self.add_video_framebuffer(phy=self.videophy, timings="640x480@75Hz", clock_domain="hdmi")
+            self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -131,6 +144,7 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-timings",   default=None,        help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     #assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -143,6 +157,7 @@ def main():
         #eth_dynamic_ip        = args.eth_dynamic_ip,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
 	)
 
@@ -14,6 +14,7 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import qmtech_10cl006
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import Cyclone10LPPLL
 from litex.soc.integration.soc_core import *
@@ -131,7 +132,7 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -15,6 +15,9 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import qmtech_5cefa2
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import CycloneVPLL
 from litex.soc.integration.soc_core import *
@@ -30,7 +33,7 @@ from liteeth.phy.mii import LiteEthPHYMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, with_ethernet, with_vga, sdram_rate="1:1"):
+    def __init__(self, platform, sys_clk_freq, with_ethernet, with_vga, sdram_rate="1:1", pix_clk=40e6):
         self.rst    = Signal()
         self.cd_sys = ClockDomain()
 
@@ -67,7 +70,7 @@ class _CRG(LiteXModule):
         if with_ethernet:
             pll.create_clkout(self.cd_eth,   25e6)
         if with_vga:
-            pll.create_clkout(self.cd_vga,   40e6)
+            pll.create_clkout(self.cd_vga,   pix_clk)
 
         # SDRAM clock
         sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
@@ -79,20 +82,34 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=105e6, with_daughterboard=False,
         with_ethernet          = False,
         with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         eth_ip                 = "192.168.1.50",
         eth_dynamic_ip         = False,
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
         sdram_rate             = "1:1",
+        video_timings          = None,
         **kwargs):
         platform = qmtech_5cefa2.Platform(with_daughterboard=with_daughterboard)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy                  = VideoVGAPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=16, rate=sdram_rate),
+            pll                  = lambda: CycloneVPLL(speedgrade="-C8"),
+            clkin_freq           = 50e6,
+            pll_shared_clk_freqs = {"1:1": 2*[sys_clk_freq], "1:2": [sys_clk_freq] + 2*[2*sys_clk_freq]}[sdram_rate] +
+                                   ([25e6] if (with_ethernet or with_etherbone) else []))
+
         # CRG --------------------------------------------------------------------------------------
         self.crg = _CRG(platform, sys_clk_freq,
             with_ethernet = with_ethernet or with_etherbone,
             with_vga      = with_video_terminal or with_video_framebuffer,
-            sdram_rate    = sdram_rate
+            sdram_rate    = sdram_rate,
+            pix_clk       = get_video_pix_clk(video_timings),
         )
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -115,10 +132,11 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
@@ -126,7 +144,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="vga")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -139,21 +157,24 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=qmtech_5cefa2.Platform, description="LiteX SoC on QMTECH 5CEFA2.")
-    parser.add_target_argument("--sys-clk-freq", default=105e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--sdram-rate",   default="1:1",             help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    parser.add_target_argument("--sys-clk-freq",           default=105e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",             default="1:1",             help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-daughterboard",  action="store_true",              help="Board plugged into the QMTech daughterboard.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",      action="store_true",              help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",     action="store_true",              help="Enable Etherbone support")
+    ethopts.add_argument("--with-ethernet",                action="store_true",              help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",              help="Enable Etherbone support")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,             help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,              help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_target_argument("--eth-ip",              default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--eth-dynamic-ip",      action="store_true",              help="Enable dynamic Ethernet IP addresses setting.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",     action="store_true",              help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",         action="store_true",              help="Enable SDCard support.")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true",              help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true",              help="Enable SDCard support.")
     parser.add_target_argument("--with-spi-flash",      action="store_true",              help="Enable SPI Flash (MMAPed).")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (VGA).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
+    parser.add_target_argument("--video-timings",          default=None,                     help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -161,10 +182,13 @@ def main():
         with_daughterboard     = args.with_daughterboard,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         with_spi_flash         = args.with_spi_flash,
         sdram_rate             = args.sdram_rate,
         **parser.soc_argdict
@@ -173,7 +197,7 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
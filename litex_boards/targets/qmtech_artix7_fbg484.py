@@ -13,6 +13,10 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import qmtech_artix7_fbg484
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -28,41 +32,19 @@ from liteeth.phy.mii import LiteEthPHYMII
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, with_ethernet, with_vga):
-        self.rst          = Signal()
-        self.cd_sys       = ClockDomain()
-        self.cd_sys4x     = ClockDomain()
-        self.cd_sys4x_dqs = ClockDomain()
-        self.cd_idelay    = ClockDomain()
-        self.cd_eth       = ClockDomain()
-        if with_ethernet:
-            self.cd_eth   = ClockDomain()
-        if with_vga:
-            self.cd_vga   = ClockDomain()
-
-        # # #
-
-        self.pll = pll = S7PLL(speedgrade=-1)
-        try:
-            reset_button = platform.request("cpu_reset")
-            self.comb += pll.reset.eq(~reset_button | self.rst)
-        except:
-            self.comb += pll.reset.eq(self.rst)
-
-        pll.register_clkin(platform.request("clk50"), 50e6)
-        pll.create_clkout(self.cd_sys,       sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
-        pll.create_clkout(self.cd_idelay,    200e6)
-        if with_ethernet:
-            pll.create_clkout(self.cd_eth,   25e6)
+class _CRG(BoardCRG):
+    def __init__(self, platform, sys_clk_freq, with_ethernet, with_vga, pix_clk=40e6):
+        cpu_reset = platform.request("cpu_reset", loose=True)
+        BoardCRG.__init__(self, platform,
+            pll        = S7PLL(speedgrade=-1),
+            clkin      = platform.request("clk50"),
+            clkin_freq = 50e6,
+            rst        = 0 if cpu_reset is None else ~cpu_reset,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True)
+        self.add_domain("eth", 25e6 if with_ethernet else None)
         if with_vga:
-            pll.create_clkout(self.cd_vga,   40e6)
-
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
+            self.add_domain("vga", pix_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -70,19 +52,33 @@ class BaseSoC(SoCCore):
     def __init__(self, toolchain="vivado", kgates=200, sys_clk_freq=100e6, with_daughterboard=False,
         with_ethernet          = False,
         with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         eth_ip                 = "192.168.1.50",
         eth_dynamic_ip         = False,
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
         with_spi_flash         = False,
+        video_timings          = None,
         **kwargs):
         platform = qmtech_artix7_fbg484.Platform(kgates=kgates, toolchain=toolchain, with_daughterboard=with_daughterboard)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy                  = VideoVGAPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=16, rate="1:4", memtype="DDR"),
+            pll                  = lambda: S7PLL(speedgrade=-1),
+            clkin_freq           = 50e6,
+            pll_shared_clk_freqs = [sys_clk_freq, 4*sys_clk_freq, 4*sys_clk_freq, 200e6] +
+                                   ([25e6] if (with_ethernet or with_etherbone) else []))
+
         # CRG --------------------------------------------------------------------------------------
         self.crg = _CRG(platform, sys_clk_freq,
             with_ethernet = (with_ethernet or with_etherbone),
-            with_vga      = (with_video_terminal or with_video_framebuffer)
+            with_vga      = (with_video_terminal or with_video_framebuffer),
+            pix_clk       = get_video_pix_clk(video_timings),
         )
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -109,10 +105,11 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
             # The daughterboard has the tx clock wired to a non-clock pin, so we can't help it
             self.platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets eth_clocks_tx_IBUF]")
 
@@ -128,7 +125,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="vga")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -148,17 +145,20 @@ def main():
     parser.add_target_argument("--sys-clk-freq",        default=100e6, type=float,  help="System clock frequency.")
     parser.add_target_argument("--with-daughterboard",  action="store_true",        help="Board plugged into the QMTech daughterboard.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",        action="store_true",    help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",       action="store_true",    help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",    help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",    help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,   help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",       action="store_true", help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",           action="store_true", help="Enable SDCard support.")
-    parser.add_target_argument("--with-spi-flash", action="store_true", help="Enable SPI Flash (MMAPed).")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true", help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true", help="Enable SDCard support.")
+    parser.add_target_argument("--with-spi-flash",         action="store_true", help="Enable SPI Flash (MMAPed).")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (VGA).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
+    parser.add_target_argument("--video-timings",   default=None,        help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -168,18 +168,21 @@ def main():
         with_daughterboard     = args.with_daughterboard,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_spi_flash         = args.with_spi_flash,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -14,6 +14,10 @@ import argparse
 from migen import *
 
 from litex_boards.platforms import qmtech_kintex7_devboard
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.sdcard import add_sdcard_hs
 from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 
 from litex.soc.cores.clock import *
@@ -31,7 +35,7 @@ from liteeth.phy.mii import LiteEthPHYMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
-    def __init__(self, platform, sys_clk_freq, with_ethernet, with_vga):
+    def __init__(self, platform, sys_clk_freq, with_ethernet, with_vga, pix_clk=40e6):
         self.rst = Signal()
         self.clock_domains.cd_sys       = ClockDomain()
         self.clock_domains.cd_sys4x     = ClockDomain(reset_less=True)
@@ -57,7 +61,7 @@ class _CRG(Module):
         if with_ethernet:
             pll.create_clkout(self.cd_eth,   25e6)
         if with_vga:
-            pll.create_clkout(self.cd_vga,   40e6)
+            pll.create_clkout(self.cd_vga,   pix_clk)
 
         platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
 
@@ -67,10 +71,10 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, toolchain="vivado", sys_clk_freq=int(100e6),
-                 with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50", eth_dynamic_ip=False,
+                 with_ethernet=False, with_etherbone=False, etherbone_buffer_depth=16, eth_data_width=8, eth_ip="192.168.1.50", eth_dynamic_ip=False,
                  local_ip="", remote_ip="",
                  with_led_chaser=True, with_video_terminal=False, with_video_framebuffer=False, with_video_colorbars=False,
-                 with_spi_flash=False, **kwargs):
+                 with_spi_flash=False, video_timings=None, **kwargs):
         platform = qmtech_kintex7_devboard.Platform(toolchain=toolchain)
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -82,8 +86,20 @@ class BaseSoC(SoCCore):
             ident = "LiteX SoC on QMTech Kintex 7 Development board",
             **kwargs)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy                  = VideoVGAPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=16, rate="1:4", memtype="DDR"),
+            format               = "rgb565",
+            pll                  = lambda: S7PLL(speedgrade=-1),
+            clkin_freq           = 50e6,
+            pll_shared_clk_freqs = [sys_clk_freq, 4*sys_clk_freq, 4*sys_clk_freq, 200e6] +
+                                   ([25e6] if (with_ethernet or with_etherbone) else []))
+
         # CRG --------------------------------------------------------------------------------------
-        self.submodules.crg = _CRG(platform, sys_clk_freq, with_ethernet or with_etherbone, with_video_terminal or with_video_framebuffer or with_video_colorbars)
+        self.submodules.crg = _CRG(platform, sys_clk_freq, with_ethernet or with_etherbone, with_video_terminal or with_video_framebuffer or with_video_colorbars,
+            pix_clk = get_video_pix_clk(video_timings))
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
@@ -104,10 +120,11 @@ class BaseSoC(SoCCore):
             self.submodules.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
             # The daughterboard has the tx clock wired to a non-clock pin, so we can't help it
             #self.platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets eth_clocks_tx_IBUF]")
             self.add_constant("TARGET_BIOS_INIT", 1)
@@ -138,7 +155,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga", format="rgb565")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="vga", format="rgb565")
             if with_video_colorbars:
                 self.add_video_colorbars(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
 
@@ -155,30 +172,34 @@ class BaseSoC(SoCCore):
 
 def main():
     parser = argparse.ArgumentParser(description="LiteX SoC on QMTech XC7K325T")
-    parser.add_argument("--toolchain",           default="vivado",                 help="FPGA toolchain (vivado, symbiflow or yosys+nextpnr).")
-    parser.add_argument("--build",               action="store_true",              help="Build bitstream.")
-    parser.add_argument("--load",                action="store_true",              help="Load bitstream.")
-    parser.add_argument("--sys-clk-freq",        default=100e6,                    help="System clock frequency.")
+    parser.add_argument("--toolchain",              default="vivado",                 help="FPGA toolchain (vivado, symbiflow or yosys+nextpnr).")
+    parser.add_argument("--build",                  action="store_true",              help="Build bitstream.")
+    parser.add_argument("--load",                   action="store_true",              help="Load bitstream.")
+    parser.add_argument("--sys-clk-freq",           default=100e6,                    help="System clock frequency.")
     ethopts = parser.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",      action="store_true",              help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",     action="store_true",              help="Enable Etherbone support.")
-    parser.add_argument("--eth-ip",              default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
-    parser.add_argument("--eth-dynamic-ip",      action="store_true",              help="Enable dynamic Ethernet IP addresses setting.")
+    ethopts.add_argument("--with-ethernet",         action="store_true",              help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",        action="store_true",              help="Enable Etherbone support.")
+    parser.add_argument("--etherbone-buffer-depth", default=16, type=int,             help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_argument("--eth-data-width",         default=8, type=int,              help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_argument("--eth-ip",                 default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
+    parser.add_argument("--eth-dynamic-ip",         action="store_true",              help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_argument("--remote-ip",           default="192.168.1.100",
    help="Remote IP address of TFTP server.")
     parser.add_argument("--local-ip",            default="192.168.1.50",
    help="Local IP address.")
     sdopts = parser.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",     action="store_true",              help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",         action="store_true",              help="Enable SDCard support.")
-    parser.add_argument("--with-spi-flash",      action="store_true",              help="Enable SPI Flash (MMAPed).")
+    sdopts.add_argument("--with-spi-sdcard",        action="store_true",              help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",            action="store_true",              help="Enable SDCard support.")
+    parser.add_argument("--with-spi-flash",         action="store_true",              help="Enable SPI Flash (MMAPed).")
     viopts = parser.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (VGA).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
     viopts.add_argument("--with-video-colorbars", action="store_true", help="Enable Video Colorbars (VGA).")
+    parser.add_argument("--video-timings",          default=None,                     help="Video Framebuffer timings (default: largest feasible).")
     builder_args(parser)
     soc_core_args(parser)
     vivado_build_args(parser)
+    parser.add_argument("--fast-config", action="store_true", help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -186,6 +207,8 @@ def main():
         sys_clk_freq           = int(float(args.sys_clk_freq)),
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         local_ip               = args.local_ip,
@@ -194,13 +217,17 @@ def main():
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_colorbars = args.with_video_colorbars,
+        video_timings          = args.video_timings,
         **soc_core_argdict(args)
     )
 
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
+
+    if args.fast_config:
+        apply_fast_config(soc.platform)
 
     builder = Builder(soc, **builder_argdict(args))
     if args.with_ethernet or args.with_etherbone:
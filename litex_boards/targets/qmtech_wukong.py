@@ -11,12 +11,14 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import qmtech_wukong
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoS7HDMIPHY
-from litex.soc.cores.video import video_timings
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import GPIOIn
 
@@ -76,20 +78,30 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6, revision=1, speedgrade=-2,
         with_ethernet          = False,
         with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         eth_ip                 = "192.168.1.50",
         remote_ip              = None,
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
-        video_timing           = "640x480@60Hz",
+        video_timings          = None,
         **kwargs):
         platform = qmtech_wukong.Platform(revision=revision,speedgrade=speedgrade)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoS7HDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=16, rate="1:4", memtype="DDR"),
+            pll             = lambda: S7MMCM(speedgrade=speedgrade),
+            clkin_freq      = 50e6)
+
         # CRG --------------------------------------------------------------------------------------
         with_video_pll = (with_video_terminal or with_video_framebuffer)
         self.crg = _CRG(platform, speedgrade, sys_clk_freq,
             with_video_pll = with_video_pll,
-            pix_clk        = video_timings[video_timing]["pix_clk"]
+            pix_clk        = get_video_pix_clk(video_timings)
         )
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -112,10 +124,11 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, nrxslots=2, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, nrxslots=2, local_ip=eth_ip, remote_ip=remote_ip, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -127,29 +140,32 @@ class BaseSoC(SoCCore):
         if with_video_terminal or with_video_framebuffer:
             self.videophy = VideoS7HDMIPHY(platform.request("hdmi_out"), clock_domain="hdmi")
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings=video_timing, clock_domain="hdmi")
+                self.add_video_terminal(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings=video_timing, clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=qmtech_wukong.Platform, description="LiteX SoC on QMTECH Wukong Board.")
-    parser.add_target_argument("--sys-clk-freq",    default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--revision",        default=1,                 help="Board version (1 , 2 or 3).")
-    parser.add_target_argument("--speedgrade",      default=-1,    type=int,   help="FPGA speedgrade (-1 or -2).")
+    parser.add_target_argument("--sys-clk-freq",           default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--revision",               default=1,                 help="Board version (1 , 2 or 3).")
+    parser.add_target_argument("--speedgrade",             default=-1,    type=int,   help="FPGA speedgrade (-1 or -2).")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",         action="store_true",       help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",        action="store_true",       help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",          default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--remote-ip",       default="192.168.1.100",   help="Remote IP address of TFTP server.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",       help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,      help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",   help="Remote IP address of TFTP server.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard",        action="store_true",       help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",            action="store_true",       help="Enable SDCard support.")
+    sdopts.add_argument("--with-spi-sdcard",               action="store_true",       help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",                   action="store_true",       help="Enable SDCard support.")
     viopts = parser.target_group.add_mutually_exclusive_group()
-    viopts.add_argument("--with-video-terminal",    action="store_true",       help="Enable Video Terminal (HDMI).")
-    viopts.add_argument("--with-video-framebuffer", action="store_true",       help="Enable Video Framebuffer (HDMI).")
+    viopts.add_argument("--with-video-terminal",           action="store_true",       help="Enable Video Terminal (HDMI).")
+    viopts.add_argument("--with-video-framebuffer",        action="store_true",       help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-timings",          default=None,              help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -158,10 +174,13 @@ def main():
         speedgrade             = args.speedgrade,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         eth_ip                 = args.eth_ip,
         remote_ip              = args.remote_ip,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
@@ -170,7 +189,7 @@ def main():
     if args.with_sdcard:
         if int(args.revision) == 1:
             soc.platform.add_extension(qmtech_wukong._sdcard_pmod_io)
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -14,6 +14,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import rcs_arctic_tern_bmc_card
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -28,7 +30,7 @@ from litex.soc.cores.video import VideoGenericPHY
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, pix_clk=40e6):
         self.rst         = Signal()
         self.cd_init     = ClockDomain()
         self.cd_por      = ClockDomain()
@@ -85,9 +87,7 @@ class _CRG(LiteXModule):
         ]
 
         # Generate DVO clock
-        pll.create_clkout(self.cd_dvo, 40e6)            # 800x600@60
-        #pll.create_clkout(self.cd_dvo, 148.35e6)       # 1920x1080@60
-        #pll.create_clkout(self.cd_dvo, 148.2e6)        # 1920x1200@60
+        pll.create_clkout(self.cd_dvo, pix_clk)
 
 
 # BaseSoC ------------------------------------------------------------------------------------------
@@ -97,14 +97,26 @@ class BaseSoC(SoCCore):
         with_video_colorbars   = False,
         with_video_terminal    = True,
         with_video_framebuffer = False,
+        video_timings          = None,
         with_ethernet          = False,
         with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         eth_ip                 = "192.168.1.50",
         **kwargs):
         platform = rcs_arctic_tern_bmc_card.Platform(toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "800x600@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy                  = VideoGenericPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=32, rate="1:2", memtype="DDR"),
+            pll                  = ECP5PLL,
+            clkin_freq           = 125e6,
+            pll_shared_clk_freqs = [2*sys_clk_freq, 24e6])
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, irq_n_irqs=16, clk_freq=sys_clk_freq,
@@ -131,23 +143,20 @@ class BaseSoC(SoCCore):
                 pads       = self.platform.request("eth", 0),
                 tx_delay   = 0e-9,
                 rx_delay   = 0e-9)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Video Output -----------------------------------------------------------------------------
         if with_video_colorbars or with_video_terminal or with_video_framebuffer:
             dvo_pads = platform.request("dvo")
             self.videophy = VideoGenericPHY(dvo_pads, clock_domain="dvo", with_clk_ddr_output=False)
             if with_video_terminal:
-                #self.add_video_terminal(phy=self.videophy, timings="1920x1080@60Hz", clock_domain="dvo")
-                #self.add_video_terminal(phy=self.videophy, timings="1920x1200@60Hz", clock_domain="dvo")
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="dvo")
             elif with_video_framebuffer:
-                #self.add_video_framebuffer(phy=self.videophy, timings="1920x1080@60Hz", clock_domain="dvo")
-                #self.add_video_framebuffer(phy=self.videophy, timings="1920x1200@60Hz", clock_domain="dvo")
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="dvo")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="dvo")
             else:
                 self.add_video_colorbars(phy=self.videophy, timings="800x600@60Hz", clock_domain="dvo")
 
@@ -156,19 +165,28 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=rcs_arctic_tern_bmc_card.Platform, description="LiteX SoC on Arctic Tern (BMC card carrier).")
-    parser.add_target_argument("--sys-clk-freq", default=60e6, type=float, help="System clock frequency (default: 60MHz).")
+    parser.add_target_argument("--sys-clk-freq",           default=60e6, type=float, help="System clock frequency (default: 60MHz).")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true",    help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true",    help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",   default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",    help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",    help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,   help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--with-video-framebuffer", action="store_true",    help="Enable Video Framebuffer (DVO) instead of Video Terminal.")
+    parser.add_target_argument("--video-timings",          default=None,           help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        toolchain      = args.toolchain,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
+        with_video_terminal    = not args.with_video_framebuffer,
+        with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -9,13 +9,20 @@
 import os
 
 from migen import *
+from migen.genlib.cdc import MultiReg, BusSynchronizer
 
 from litex.gen import *
 
 from litex_boards.platforms import redpitaya
+from litex_boards.lib.zynq_dma import add_ps_slave_port, add_ps_dma, ps_dma_ports
+from litex_boards.lib.axi_dma import AXIRingBufferWriter, AXIRingBufferReader
+
+from litex.build.io import DDROutput
 
 from litex.soc.interconnect import axi
+from litex.soc.interconnect import stream
 from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -27,7 +34,7 @@ from litex.soc.cores.led import LedChaser
 
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, use_ps7_clk=False):
+    def __init__(self, platform, sys_clk_freq, use_ps7_clk=False, with_adc_dac=False):
         self.rst    = Signal()
         self.cd_sys = ClockDomain()
 
@@ -37,6 +44,20 @@ class _CRG(LiteXModule):
             assert sys_clk_freq == 125e6
             self.comb += ClockSignal("sys").eq(ClockSignal("ps7"))
             self.comb += ResetSignal("sys").eq(ResetSignal("ps7") | self.rst)
+
+            # ADC/DAC clocks (from the ADC clock, DAC data at 1x, DAC write/clock at 2x).
+            if with_adc_dac:
+                adc_clk_freq     = platform.default_clk_freq
+                self.cd_adc      = ClockDomain()
+                self.cd_dac_2x   = ClockDomain()
+                self.cd_dac_2x_p = ClockDomain()
+                self.adc_pll = pll = S7PLL(speedgrade=-1)
+                self.comb += pll.reset.eq(self.rst)
+                pll.register_clkin(platform.request(platform.default_clk_name), adc_clk_freq)
+                pll.create_clkout(self.cd_adc,      adc_clk_freq)
+                pll.create_clkout(self.cd_dac_2x,   2*adc_clk_freq)
+                pll.create_clkout(self.cd_dac_2x_p, 2*adc_clk_freq, phase=315)
+                platform.add_false_path_constraints(self.cd_sys.clk, self.cd_adc.clk)
         else:
             self.pll = pll = S7PLL(speedgrade=-1)
             self.comb += pll.reset.eq(self.rst)
@@ -44,17 +65,123 @@ class _CRG(LiteXModule):
             pll.create_clkout(self.cd_sys,      sys_clk_freq)
             platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
 
+# ADC ----------------------------------------------------------------------------------------------
+
+class _ADC(LiteXModule):
+    def __init__(self, pads):
+        self.source     = source = stream.Endpoint([("data", 32)]) # adc clock domain: A (15:0) / B (31:16).
+        self.enable     = Signal()
+        self.decimation = CSRStorage(16, description="ADC decimation (keep 1 sample every decimation + 1).")
+        self.overruns   = CSRStatus(32,  description="ADC overruns (samples dropped on CDC backpressure).")
+
+        # # #
+
+        # ADC Clock Duty Cycle Stabilizer.
+        self.comb += pads.cdcs.eq(1)
+
+        # Samples (offset binary, inverted front-end) to signed 16-bit (MSB-aligned).
+        data_a = Signal(len(pads.data_a))
+        data_b = Signal(len(pads.data_b))
+        self.sync.adc += [
+            data_a.eq(pads.data_a),
+            data_b.eq(pads.data_b),
+        ]
+        sample_a = Signal(16)
+        sample_b = Signal(16)
+        self.comb += [
+            sample_a.eq(Cat(Replicate(0, 16 - len(data_a)), ~data_a[:-1], data_a[-1])),
+            sample_b.eq(Cat(Replicate(0, 16 - len(data_b)), ~data_b[:-1], data_b[-1])),
+        ]
+
+        # Decimation.
+        enable     = Signal()
+        decimation = Signal(16)
+        count      = Signal(16)
+        self.specials += [
+            MultiReg(self.enable,             enable,     "adc"),
+            MultiReg(self.decimation.storage, decimation, "adc"),
+        ]
+        self.sync.adc += [
+            count.eq(count + 1),
+            If(count >= decimation,
+                count.eq(0)
+            ),
+            source.valid.eq(enable & (count == 0)),
+            source.data.eq(Cat(sample_a, sample_b)),
+        ]
+
+        # Overruns (samples are not held: a sample not accepted by the sink is dropped).
+        overruns = Signal(32)
+        self.sync.adc += If(source.valid & ~source.ready, overruns.eq(overruns + 1))
+        self.overruns_sync = BusSynchronizer(32, "adc", "sys")
+        self.comb += [
+            self.overruns_sync.i.eq(overruns),
+            self.overruns.status.eq(self.overruns_sync.o),
+        ]
+
+# DAC ----------------------------------------------------------------------------------------------
+
+class _DAC(LiteXModule):
+    def __init__(self, pads):
+        self.sink      = sink = stream.Endpoint([("data", 32)]) # adc clock domain: A (15:0) / B (31:16).
+        self.enable    = Signal()
+        self.underruns = CSRStatus(32, description="DAC underruns (samples).")
+
+        # # #
+
+        # Samples (signed, 14-bit MSBs) to DAC (offset binary, inverted front-end); hold on underruns.
+        enable = Signal()
+        dac_a  = Signal(14)
+        dac_b  = Signal(14)
+        self.specials += MultiReg(self.enable, enable, "adc")
+        self.comb += sink.ready.eq(1)
+        self.sync.adc += [
+            If(sink.valid,
+                dac_a.eq(Cat(~sink.data[2:15],  sink.data[15])),
+                dac_b.eq(Cat(~sink.data[18:31], sink.data[31])),
+            ).Elif(~enable,
+                dac_a.eq(Cat(Replicate(1, 13), 0)),
+                dac_b.eq(Cat(Replicate(1, 13), 0)),
+            )
+        ]
+
+        # Underruns.
+        underruns = Signal(32)
+        self.sync.adc += If(enable & ~sink.valid, underruns.eq(underruns + 1))
+        self.underruns_sync = BusSynchronizer(32, "adc", "sys")
+        self.comb += [
+            self.underruns_sync.i.eq(underruns),
+            self.underruns.status.eq(self.underruns_sync.o),
+        ]
+
+        # DAC interface (interleaved: B/A data at 1x, sel at 1x, wrt/clk at 2x).
+        for i in range(14):
+            self.specials += DDROutput(i1=dac_b[i], i2=dac_a[i], o=pads.data[i], clk=ClockSignal("adc"))
+        self.specials += [
+            DDROutput(i1=1, i2=0, o=pads.sel, clk=ClockSignal("adc")),
+            DDROutput(i1=0, i2=0, o=pads.rst, clk=ClockSignal("adc")),
+            DDROutput(i1=0, i2=1, o=pads.wrt, clk=ClockSignal("dac_2x")),
+            DDROutput(i1=0, i2=1, o=pads.clk, clk=ClockSignal("dac_2x_p")),
+        ]
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 
 class BaseSoC(SoCCore):
-    def __init__(self, board, sys_clk_freq=100e6, with_led_chaser=True, **kwargs):
+    def __init__(self, board, sys_clk_freq=100e6, with_led_chaser=True,
+        with_adc_dac_dma   = False,
+        adc_dac_fifo_depth = 1024,
+        with_ps_dma        = False,
+        ps_dma_port        = "hp",
+        **kwargs):
         platform = redpitaya.Platform(board)
 
         # CRG --------------------------------------------------------------------------------------
         use_ps7_clk  = (kwargs.get("cpu_type", None) == "zynq7000")
         sys_clk_freq = 125e6 if use_ps7_clk else sys_clk_freq
-        self.crg = _CRG(platform, sys_clk_freq, use_ps7_clk)
+        if with_adc_dac_dma and not use_ps7_clk:
+            raise ValueError("ADC/DAC DMA requires --cpu-type=zynq7000 (PS DDR).")
+        self.crg = _CRG(platform, sys_clk_freq, use_ps7_clk, with_adc_dac=with_adc_dac_dma)
 
         # SoCCore ----------------------------------------------------------------------------------
         if kwargs["uart_name"] == "serial":
@@ -74,6 +201,39 @@ class BaseSoC(SoCCore):
 
             self.bus.add_region("flash",  SoCRegion(origin=0xFC00_0000, size=0x4_0000, mode="rwx"))
 
+        # ADC/DAC DMA (PS DDR through AXI HP0/HP1) -------------------------------------------------
+        if with_adc_dac_dma:
+            adc_axi = add_ps_slave_port(self, port="hp")
+            dac_axi = add_ps_slave_port(self, port="hp")
+
+            # ADC -> AXI Ring-Buffer Writer.
+            self.adc      = _ADC(platform.request("adc"))
+            self.adc_cdc  = stream.ClockDomainCrossing([("data", 32)], cd_from="adc", cd_to="sys")
+            self.adc_conv = stream.Converter(32, 64)
+            self.adc_dma  = AXIRingBufferWriter(adc_axi, fifo_depth=adc_dac_fifo_depth)
+            self.comb += [
+                self.adc.enable.eq(self.adc_dma.control.fields.enable),
+                self.adc.source.connect(self.adc_cdc.sink),
+                self.adc_cdc.source.connect(self.adc_conv.sink),
+                self.adc_conv.source.connect(self.adc_dma.sink),
+            ]
+
+            # AXI Ring-Buffer Reader -> DAC.
+            self.dac_dma  = AXIRingBufferReader(dac_axi, fifo_depth=adc_dac_fifo_depth)
+            self.dac_conv = stream.Converter(64, 32)
+            self.dac_cdc  = stream.ClockDomainCrossing([("data", 32)], cd_from="sys", cd_to="adc")
+            self.dac      = _DAC(platform.request("dac"))
+            self.comb += [
+                self.dac.enable.eq(self.dac_dma.control.fields.enable),
+                self.dac_dma.source.connect(self.dac_conv.sink),
+                self.dac_conv.source.connect(self.dac_cdc.sink),
+                self.dac_cdc.source.connect(self.dac.sink),
+            ]
+
+        # PS DMA -----------------------------------------------------------------------------------
+        if with_ps_dma:
+            add_ps_dma(self, port=ps_dma_port)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -86,13 +246,21 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=redpitaya.Platform, description="LiteX SoC on Zedboard.")
-    parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--board",        default="redpitaya14",     help="Board type (redpitaya14 or redpitaya16).")
+    parser.add_target_argument("--sys-clk-freq",       default=100e6, type=float,  help="System clock frequency.")
+    parser.add_target_argument("--board",              default="redpitaya14",      help="Board type (redpitaya14 or redpitaya16).")
+    parser.add_target_argument("--with-adc-dac-dma",   action="store_true",        help="Enable ADC capture/DAC playback to/from PS DDR (requires zynq7000).")
+    parser.add_target_argument("--adc-dac-fifo-depth", default=1024,  type=int,    help="ADC/DAC DMA FIFOs depth (in 64-bit words).")
+    parser.add_target_argument("--with-ps-dma",        action="store_true",        help="Enable PL-to-PS DDR DMA (through a PS HP/ACP slave port).")
+    parser.add_target_argument("--ps-dma-port",        default="hp", choices=ps_dma_ports, help="PS DMA slave port.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        board        = args.board,
-        sys_clk_freq = args.sys_clk_freq,
+        board              = args.board,
+        sys_clk_freq       = args.sys_clk_freq,
+        with_adc_dac_dma   = args.with_adc_dac_dma,
+        adc_dac_fifo_depth = args.adc_dac_fifo_depth,
+        with_ps_dma        = args.with_ps_dma,
+        ps_dma_port        = args.ps_dma_port,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
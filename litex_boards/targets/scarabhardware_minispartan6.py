@@ -16,6 +16,7 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import scarabhardware_minispartan6
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
 
 from litex.soc.cores.clock import S6PLL
 from litex.soc.integration.soc_core import *
@@ -29,7 +30,7 @@ from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1", pix_clk=24e6):
         self.rst    = Signal()
         self.cd_sys = ClockDomain()
         if sdram_rate == "1:2":
@@ -56,8 +57,8 @@ class _CRG(LiteXModule):
         else:
             pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
         #platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-        pll.create_clkout(self.cd_hdmi,   1*24e6, margin=0)
-        pll.create_clkout(self.cd_hdmi5x, 5*24e6, margin=0)
+        pll.create_clkout(self.cd_hdmi,   1*pix_clk)
+        pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
         # SDRAM clock
         sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
@@ -70,11 +71,23 @@ class BaseSoC(SoCCore):
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timings          = None,
         **kwargs):
         platform = scarabhardware_minispartan6.Platform()
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@75Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy                  = VideoS6HDMIPHY,
+            sys_clk_freq         = sys_clk_freq,
+            dram_data_width      = get_dram_data_width(databits=16, rate=sdram_rate),
+            pll                  = lambda: S6PLL(speedgrade=-1),
+            clkin_freq           = 32e6,
+            pll_shared_clk_freqs = {"1:1": 2*[sys_clk_freq], "1:2": [sys_clk_freq] + 2*[2*sys_clk_freq]}[sdram_rate])
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate,
+            # Video Terminal: 640x480@75Hz underclocked to 24MHz (exact from 32MHz along sys_clk).
+            pix_clk = get_video_pix_clk(video_timings) if with_video_framebuffer else 24e6)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on MiniSpartan6", **kwargs)
@@ -95,7 +108,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@75Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -113,6 +126,7 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-timings",          default=None,              help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -120,6 +134,7 @@ def main():
         sdram_rate             = args.sdram_rate,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
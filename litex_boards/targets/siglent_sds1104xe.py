@@ -37,6 +37,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import siglent_sds1104xe
+from litex_boards.lib.ethernet import check_eth_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -82,6 +83,8 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
         with_etherbone         = True,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         eth_ip                 = "192.168.1.50",
         with_video_terminal    = False,
         with_video_framebuffer = False,
@@ -116,14 +119,16 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
             )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
 
             # Etherbone.
             self.add_etherbone(
-                phy         = self.ethphy,
-                ip_address  = "192.168.1.50",
-                mac_address = 0x10e2d5000000,
-                data_width  = 8,
-                with_ethmac = True,
+                phy          = self.ethphy,
+                ip_address   = "192.168.1.50",
+                mac_address  = 0x10e2d5000000,
+                data_width   = eth_data_width,
+                with_ethmac  = True,
+                buffer_depth = etherbone_buffer_depth,
             )
 
         # Video ------------------------------------------------------------------------------------
@@ -150,18 +155,22 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=siglent_sds1104xe.Platform, description="LiteX SoC on SDS1104X-E.")
-    parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",     help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--sys-clk-freq",           default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,      help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",     help="Ethernet/Etherbone IP address.")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.eth_ip,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         **parser.soc_argdict
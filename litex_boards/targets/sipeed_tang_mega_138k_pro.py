@@ -28,6 +28,9 @@ from litedram.phy import GW5DDRPHY
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import sipeed_tang_mega_138k_pro
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import add_video_page_flip_framebuffer
+from litex_boards.lib.pll_cache import use_pll_cache
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -64,7 +67,7 @@ class _CRG(LiteXModule):
         self.sync.por += If(~por_done, por_count.eq(por_count - 1))
 
         # PLL
-        self.pll = pll = GW5APLL(devicename=platform.devicename, device=platform.device)
+        self.pll = pll = use_pll_cache(GW5APLL(devicename=platform.devicename, device=platform.device))
         self.comb += pll.reset.eq(~por_done | rst)
         pll.register_clkin(clk50, 50e6)
         pll.create_clkout(self.cd_sys, sys_clk_freq, with_reset=not with_ddr3)
@@ -114,18 +117,23 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=50e6,
-        with_ethernet       = True,
-        with_etherbone      = False,
-        local_ip            = "192.168.1.50",
-        remote_ip           = "",
-        eth_dynamic_ip      = False,
-        with_video_terminal = False,
-        with_ddr3           = False,
-        with_sdram          = False,
-        sdram_rate          = "1:2",
-        with_led_chaser     = True,
-        with_rgb_led        = False,
-        with_buttons        = True,
+        with_ethernet          = True,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 32,
+        local_ip               = "192.168.1.50",
+        remote_ip              = "",
+        eth_dynamic_ip         = False,
+        with_video_terminal    = False,
+        with_video_framebuffer = False,
+        video_buffers          = 2,
+        with_video_blitter     = False,
+        with_ddr3              = False,
+        with_sdram             = False,
+        sdram_rate             = "1:2",
+        with_led_chaser        = True,
+        with_rgb_led           = False,
+        with_buttons           = True,
         **kwargs):
         platform = sipeed_tang_mega_138k_pro.Platform(toolchain="gowin")
 
@@ -134,7 +142,7 @@ class BaseSoC(SoCCore):
         self.crg = _CRG(platform, sys_clk_freq, cpu_clk_freq,
             with_sdram     = with_sdram,
             with_ddr3      = with_ddr3,
-            with_video_pll = with_video_terminal,
+            with_video_pll = with_video_terminal or with_video_framebuffer,
         )
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Tang Mega 138K Pro", **kwargs)
@@ -157,12 +165,13 @@ class BaseSoC(SoCCore):
             )
 
         # Video ------------------------------------------------------------------------------------
-        if with_video_terminal:
+        if with_video_terminal or with_video_framebuffer:
             hdmi_pads = platform.request("hdmi_in") # yes DVI_RX because DVI_TX seems not working
             self.comb += hdmi_pads.hdp.eq(1)
             self.videophy = VideoGowinHDMIPHY(hdmi_pads, clock_domain="hdmi")
             #self.add_video_colorbars(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
-            self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="hdmi")
+            if with_video_terminal:
+                self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="hdmi")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -178,6 +187,7 @@ class BaseSoC(SoCCore):
                 pads       = self.platform.request("eth"),
                 tx_delay   = 2e-9,
                 rx_delay   = 2e-9)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             clk50_half = Signal()
             self.specials += Instance("CLKDIV",
                 p_DIV_MODE = "2",
@@ -187,9 +197,9 @@ class BaseSoC(SoCCore):
                 o_CLKOUT   = clk50_half)
             self.specials += DDROutput(1, 0, platform.request("ephy_clk"), clk50_half)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=32, software_debug=True)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=eth_data_width, software_debug=True)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, data_width=32)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, buffer_depth=etherbone_buffer_depth)
 
             if local_ip:
                 local_ip = local_ip.split(".")
@@ -218,36 +228,55 @@ class BaseSoC(SoCCore):
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
+        # Video FrameBuffer (after SDRAM) ----------------------------------------------------------
+        if with_video_framebuffer:
+            assert hasattr(self, "sdram"), "Video FrameBuffer requires --with-ddr3 or --with-sdram."
+            add_video_page_flip_framebuffer(self, phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi",
+                nbuffers     = video_buffers,
+                with_blitter = with_video_blitter,
+            )
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=sipeed_tang_mega_138k_pro.Platform, description="LiteX SoC on Tang Mega 138K Pro.")
-    parser.add_target_argument("--flash",           action="store_true",      help="Flash Bitstream.")
-    parser.add_target_argument("--sys-clk-freq",    default=50e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-sdram",      action="store_true",      help="Enable optional SDRAM module.")
-    parser.add_target_argument("--with-ddr3",       action="store_true",      help="Enable optional DDR3 module.")
-    parser.add_target_argument("--with-video-terminal", action="store_true",  help="Enable Video Terminal (HDMI).")
+    parser.add_target_argument("--flash",                  action="store_true",      help="Flash Bitstream.")
+    parser.add_target_argument("--sys-clk-freq",           default=50e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-sdram",             action="store_true",      help="Enable optional SDRAM module.")
+    parser.add_target_argument("--with-ddr3",              action="store_true",      help="Enable optional DDR3 module.")
+    viopts = parser.target_group.add_mutually_exclusive_group()
+    viopts.add_argument("--with-video-terminal",           action="store_true",      help="Enable Video Terminal (HDMI).")
+    viopts.add_argument("--with-video-framebuffer",        action="store_true",      help="Enable Video Framebuffer (HDMI, 640x480@60Hz, with DDR3/SDRAM).")
+    parser.add_target_argument("--video-buffers",          default=2, type=int,      help="Video Framebuffer pages (flipped on VSync).")
+    parser.add_target_argument("--with-video-blitter",     action="store_true",      help="Enable Video Blitter (DMA Fill/Copy, with Video Framebuffer).")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",         action="store_true",      help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",        action="store_true",      help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-dynamic-ip",  action="store_true",      help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--remote-ip",       default="192.168.1.100",  help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--local-ip",        default="192.168.1.50",   help="Local IP address.")
+    ethopts.add_argument("--with-ethernet",                action="store_true",      help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",               action="store_true",      help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,     help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=32, type=int,     help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",      help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",  help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--local-ip",               default="192.168.1.50",   help="Local IP address.")
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq        = args.sys_clk_freq,
-        with_video_terminal = args.with_video_terminal,
-        with_ddr3           = args.with_ddr3,
-        with_sdram          = args.with_sdram,
-        with_ethernet       = args.with_ethernet,
-        with_etherbone      = args.with_etherbone,
-        local_ip            = args.local_ip,
-        remote_ip           = args.remote_ip,
-        eth_dynamic_ip      = args.eth_dynamic_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_video_terminal    = args.with_video_terminal,
+        with_video_framebuffer = args.with_video_framebuffer,
+        video_buffers          = args.video_buffers,
+        with_video_blitter     = args.with_video_blitter,
+        with_ddr3              = args.with_ddr3,
+        with_sdram             = args.with_sdram,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        local_ip               = args.local_ip,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
         **parser.soc_argdict
     )
 
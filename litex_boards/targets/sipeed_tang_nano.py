@@ -62,8 +62,8 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCMini):
-    def __init__(self, sys_clk_freq=48e6, with_led_chaser=True, **kwargs):
-        platform = sipeed_tang_nano.Platform()
+    def __init__(self, sys_clk_freq=48e6, toolchain="gowin", with_led_chaser=True, **kwargs):
+        platform = sipeed_tang_nano.Platform(toolchain=toolchain)
 
         # CRG --------------------------------------------------------------------------------------
         self.crg = _CRG(platform, sys_clk_freq)
@@ -91,6 +91,7 @@ def main():
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
+        toolchain    = args.toolchain,
         **parser.soc_argdict
     )
 
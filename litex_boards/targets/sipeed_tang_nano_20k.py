@@ -25,6 +25,7 @@ from litedram.modules import M12L64322A  # FIXME: use the real model number
 from litedram.phy import GENSDRPHY
 
 from litex_boards.platforms import sipeed_tang_nano_20k
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -137,7 +138,7 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -17,6 +17,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import sitlinv_stlv7325_v2
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -36,7 +39,7 @@ from litepcie.software import generate_litepcie_software
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, pix_clk=25e6):
         self.rst       = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_sys4x  = ClockDomain()
@@ -63,8 +66,8 @@ class _CRG(LiteXModule):
         self.submodules.pll2 = pll2 = S7PLL(speedgrade=-2)
         self.comb += pll2.reset.eq(~rst_n | self.rst)
         pll2.register_clkin(clk50, 50e6)
-        pll2.create_clkout(self.cd_hdmi,   25e6,  margin=0)
-        pll2.create_clkout(self.cd_hdmi5x, 125e6, margin=0)
+        pll2.create_clkout(self.cd_hdmi,   pix_clk)
+        pll2.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
         self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
 
@@ -74,17 +77,27 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
         vccio                  = "3.3V",
         with_ethernet          = False,
+        eth_data_width         = 8,
         with_led_chaser        = True,
         with_pcie              = False,
         with_sata              = False, sata_gen="gen2",
         with_video_colorbars   = False,
         with_video_framebuffer = False,
         with_video_terminal    = False,
+        video_timings          = None,
         **kwargs):
         platform = sitlinv_stlv7325_v2.Platform(vccio)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@60Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoS7HDMIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=64, rate="1:4", memtype="DDR"),
+            pll             = lambda: S7PLL(speedgrade=-2),
+            clkin_freq      = 50e6)
+
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, pix_clk=get_video_pix_clk(video_timings))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Sitlinv STLV7325-v2", **kwargs)
@@ -110,7 +123,8 @@ class BaseSoC(SoCCore):
                 tx_delay = 1.417e-9,
                 rx_delay = 1.417e-9,
             )
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
@@ -150,7 +164,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="hdmi")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -171,6 +185,7 @@ def main():
     parser.add_target_argument("--with-pcie",       action="store_true",    help="Enable PCIe support.")
     parser.add_target_argument("--driver",          action="store_true",    help="Generate PCIe driver.")
     parser.add_target_argument("--with-ethernet",   action="store_true",    help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-data-width",  default=8, type=int,    help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_target_argument("--with-sata",       action="store_true",    help="Enable SATA support.")
     parser.add_target_argument("--sata-gen",        default="2",    help="SATA Gen..", choices=["1", "2", "3"])
     sdopts = parser.target_group.add_mutually_exclusive_group()
@@ -180,24 +195,27 @@ def main():
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
+    parser.add_target_argument("--video-timings",   default=None,        help="Video Framebuffer timings (default: largest feasible).")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         vccio                  = args.vccio,
         with_ethernet          = args.with_ethernet,
+        eth_data_width         = args.eth_data_width,
         with_pcie              = args.with_pcie,
         with_sata              = args.with_sata,
         sata_gen               = "gen" + args.sata_gen,
         with_video_colorbars   = args.with_video_colorbars,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_terminal    = args.with_video_terminal,
+        video_timings          = args.video_timings,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
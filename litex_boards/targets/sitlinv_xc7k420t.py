@@ -20,6 +20,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import sitlinv_xc7k420t
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -36,31 +37,15 @@ from litepcie.software import generate_litepcie_software
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst          = Signal()
-        self.cd_sys       = ClockDomain()
-        self.cd_sys4x     = ClockDomain()
-        self.cd_sys4x_dqs = ClockDomain()
-        self.cd_idelay    = ClockDomain()
-
-        # # #
-
-        # Clk/Rst.
-        clk100 = platform.request("clk100")
-        rst_n  = platform.request("cpu_reset_n")
-
-        # PLL.
-        self.pll = pll = S7PLL(speedgrade=-2)
-        self.comb += pll.reset.eq(~rst_n | self.rst)
-        pll.register_clkin(clk100, 100e6)
-        pll.create_clkout(self.cd_sys,       sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=120)
-        pll.create_clkout(self.cd_idelay,    200e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
+        BoardCRG.__init__(self, platform,
+            pll        = S7PLL(speedgrade=-2),
+            clkin      = platform.request("clk100"),
+            clkin_freq = 100e6,
+            rst        = ~platform.request("cpu_reset_n"),
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, dqs_phase=120)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
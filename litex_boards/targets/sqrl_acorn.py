@@ -30,6 +30,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import sqrl_acorn
+from litex_boards.lib.xilinx_config import apply_fast_config
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
@@ -181,6 +182,7 @@ def main():
     parser.add_target_argument("--driver",          action="store_true", help="Generate PCIe driver.")
     parser.add_target_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support (requires SDCard adapter on P2).")
     pcieopts.add_argument("--with-sata",            action="store_true", help="Enable SATA support (over PCIe2SATA).")
+    parser.add_target_argument("--fast-config", action="store_true",     help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -193,6 +195,9 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
 
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder  = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -14,6 +14,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import sqrl_xcu1525
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -28,32 +30,14 @@ from litepcie.software import generate_litepcie_software
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq, ddram_channel):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys4x  = ClockDomain()
-        self.cd_pll4x  = ClockDomain()
-        self.cd_idelay = ClockDomain()
-
-        # # #
-
-        self.pll = pll = USPMMCM(speedgrade=-2)
-        self.comb += pll.reset.eq(self.rst)
-        pll.register_clkin(platform.request("clk300", ddram_channel), 300e6)
-        pll.create_clkout(self.cd_pll4x, sys_clk_freq*4, buf=None, with_reset=False)
-        pll.create_clkout(self.cd_idelay, 500e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        self.specials += [
-            Instance("BUFGCE_DIV",
-                p_BUFGCE_DIVIDE=4,
-                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys.clk),
-            Instance("BUFGCE",
-                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys4x.clk),
-        ]
-
-        self.idelayctrl = USPIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
+        BoardCRG.__init__(self, platform,
+            pll        = USPMMCM(speedgrade=-2),
+            clkin      = platform.request("clk300", ddram_channel),
+            clkin_freq = 300e6,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, idelay_clk_freq=500e6)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -143,6 +127,7 @@ def main():
     parser.add_target_argument("--with-pcie",     action="store_true",       help="Enable PCIe support.")
     parser.add_target_argument("--driver",        action="store_true",       help="Generate PCIe driver.")
     parser.add_target_argument("--with-sata",     action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    parser.add_target_argument("--fast-config",   action="store_true",       help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -152,6 +137,9 @@ def main():
         with_sata     = args.with_sata,
         **parser.soc_argdict
 	)
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -14,6 +14,8 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import terasic_de2_115
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
 
 from litex.soc.cores.clock import CycloneIVPLL
 from litex.soc.cores.led import LedChaser
@@ -52,13 +54,15 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=50e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        with_sdcard     = False,
-        with_led_chaser = True,
-        ethernet_phy    = 0,
-        etherbone_ip    = "192.168.1.50",
-        etherbone_phy   = 1,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
+        with_sdcard            = False,
+        with_led_chaser        = True,
+        ethernet_phy           = 0,
+        etherbone_ip           = "192.168.1.50",
+        etherbone_phy          = 1,
         **kwargs,
     ):
         platform = terasic_de2_115.Platform()
@@ -96,7 +100,7 @@ class BaseSoC(SoCCore):
 
         # SD Card ----------------------------------------------------------------------------------
         if with_sdcard:
-            self.add_sdcard()
+            add_sdcard_hs(self)
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
@@ -105,10 +109,12 @@ class BaseSoC(SoCCore):
                 clock_pads = platform.request("eth_clocks", ethernet_phy),
                 pads       = platform.request("eth", ethernet_phy),
             )
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             self.add_ethernet(
                 phy        = self.ethphy,
                 phy_cd     = "ethphy_eth" if with_etherbone else "eth",
                 dynamic_ip = True,
+                data_width = eth_data_width,
             )
         if with_etherbone:
             # Ethernet PHY
@@ -116,10 +122,13 @@ class BaseSoC(SoCCore):
                 clock_pads = platform.request("eth_clocks", etherbone_phy),
                 pads       = platform.request("eth", etherbone_phy),
             )
+            check_eth_data_width(self.ethbphy, self.sys_clk_freq, eth_data_width)
             self.add_etherbone(
-                phy        = self.ethbphy,
-                phy_cd     = "ethbphy_eth" if with_ethernet else "eth",
-                ip_address = etherbone_ip,
+                phy          = self.ethbphy,
+                phy_cd       = "ethbphy_eth" if with_ethernet else "eth",
+                ip_address   = etherbone_ip,
+                buffer_depth = etherbone_buffer_depth,
+                data_width   = eth_data_width,
             )
 
 # Build --------------------------------------------------------------------------------------------
@@ -128,25 +137,29 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=terasic_de2_115.Platform, description="LiteX SoC on DE2-115.")
 
-    parser.add_target_argument("--sys-clk-freq",    default=50e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-led-chaser", action="store_true",      help="Enable LED chaser.")
-    parser.add_target_argument("--with-sdcard",     action="store_true",      help="Enable SD card support.")
-    parser.add_target_argument("--with-ethernet",   action="store_true",      help="Enable Ethernet support.")
-    parser.add_target_argument("--with-etherbone",  action="store_true",      help="Enable Etherbone support.")
-    parser.add_target_argument("--etherbone-ip",    default="192.168.48.100", help="Etherbone IP address.")
-    parser.add_target_argument("--etherbone-phy",   default=1, type=int,      help="Etherbone PHY (0 or 1).")
-    parser.add_target_argument("--ethernet-phy",    default=0, type=int,      help="Ethernet  PHY (0 or 1).")
+    parser.add_target_argument("--sys-clk-freq",           default=50e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-led-chaser",        action="store_true",      help="Enable LED chaser.")
+    parser.add_target_argument("--with-sdcard",            action="store_true",      help="Enable SD card support.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",      help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",      help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,     help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,      help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
+    parser.add_target_argument("--etherbone-ip",           default="192.168.48.100", help="Etherbone IP address.")
+    parser.add_target_argument("--etherbone-phy",          default=1, type=int,      help="Etherbone PHY (0 or 1).")
+    parser.add_target_argument("--ethernet-phy",           default=0, type=int,      help="Ethernet  PHY (0 or 1).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq    = args.sys_clk_freq,
-        with_sdcard     = args.with_sdcard,
-        with_ethernet   = args.with_ethernet,
-        with_etherbone  = args.with_etherbone,
-        with_led_chaser = args.with_led_chaser,
-        etherbone_ip    = args.etherbone_ip,
-        etherbone_phy   = args.etherbone_phy,
-        ethernet_phy    = args.ethernet_phy,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_sdcard            = args.with_sdcard,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
+        with_led_chaser        = args.with_led_chaser,
+        etherbone_ip           = args.etherbone_ip,
+        etherbone_phy          = args.etherbone_phy,
+        ethernet_phy           = args.ethernet_phy,
         **parser.soc_argdict,
     )
 
@@ -12,6 +12,10 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import trellisboard
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.video import get_video_timings, get_video_pix_clk, get_dram_data_width
+from litex_boards.lib.sdcard import add_sdcard_hs
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -28,82 +32,33 @@ from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst    = Signal()
-        self.cd_por = ClockDomain()
-        self.cd_sys = ClockDomain()
-
-        # # #
-
-        # Clk / Rst
-        clk12 = platform.request("clk12")
-        rst   = platform.request("user_btn", 0)
-
-        # Power on reset
-        por_count = Signal(16, reset=2**16-1)
-        por_done  = Signal()
-        self.comb += self.cd_por.clk.eq(clk12)
-        self.comb += por_done.eq(por_count == 0)
-        self.sync.por += If(~por_done, por_count.eq(por_count - 1))
-
-        # PLL
-        self.pll = pll = ECP5PLL()
-        self.comb += pll.reset.eq(~por_done | rst | self.rst)
-        pll.register_clkin(clk12, 12e6)
-        pll.create_clkout(self.cd_sys, sys_clk_freq)
-
-
-class _CRGSDRAM(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
-        self.rst        = Signal()
-        self.cd_init    = ClockDomain()
-        self.cd_por     = ClockDomain()
-        self.cd_sys     = ClockDomain()
-        self.cd_sys2x   = ClockDomain()
-        self.cd_sys2x_i = ClockDomain()
-
-        # # #
-
-        self.stop  = Signal()
-        self.reset = Signal()
-
-        # Clk / Rst
-        clk12 = platform.request("clk12")
-        rst   = platform.request("user_btn", 0)
-
-        # Power on reset
-        por_count = Signal(16, reset=2**16-1)
-        por_done  = Signal()
-        self.comb += self.cd_por.clk.eq(clk12)
-        self.comb += por_done.eq(por_count == 0)
-        self.sync.por += If(~por_done, por_count.eq(por_count - 1))
-
-        # PLL
-        sys2x_clk_ecsout = Signal()
-        self.pll = pll = ECP5PLL()
-        self.comb += pll.reset.eq(~por_done | rst | self.rst)
-        pll.register_clkin(clk12, 12e6)
-        pll.create_clkout(self.cd_sys2x_i, 2*sys_clk_freq)
-        pll.create_clkout(self.cd_init,   25e6)
-        self.specials += [
-            Instance("ECLKBRIDGECS",
-                i_CLK0   = self.cd_sys2x_i.clk,
-                i_SEL    = 0,
-                o_ECSOUT = sys2x_clk_ecsout,
-            ),
-            Instance("ECLKSYNCB",
-                i_ECLKI = sys2x_clk_ecsout,
-                i_STOP  = self.stop,
-                o_ECLKO = self.cd_sys2x.clk),
-            Instance("CLKDIVF",
-                p_DIV     = "2.0",
-                i_ALIGNWD = 0,
-                i_CLKI    = self.cd_sys2x.clk,
-                i_RST     = self.reset,
-                o_CDIVX   = self.cd_sys.clk),
-            AsyncResetSynchronizer(self.cd_sys, ~pll.locked | self.reset),
-        ]
+        BoardCRG.__init__(self, platform,
+            pll        = ECP5PLL(),
+            clkin      = platform.request("clk12"),
+            clkin_freq = 12e6,
+            rst        = platform.request("user_btn", 0),
+            with_por   = True,
+        )
+        self.add_sys(sys_clk_freq)
+
+
+class _CRGSDRAM(BoardCRG):
+    def __init__(self, platform, sys_clk_freq, with_video_pll=False, pix_clk=31.5e6):
+        BoardCRG.__init__(self, platform,
+            pll        = ECP5PLL(),
+            clkin      = platform.request("clk12"),
+            clkin_freq = 12e6,
+            rst        = platform.request("user_btn", 0),
+            with_por   = True,
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, with_eclkbridge=True)
+
+        # Video PLL.
+        if with_video_pll:
+            self.add_pll(ECP5PLL(), name="video_pll")
+            self.add_domain("video", pix_clk, pll=self.video_pll)
 
         self.comb += platform.request("dram_vtt_en").eq(1)
 
@@ -112,16 +67,31 @@ class _CRGSDRAM(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6, toolchain="trellis",
         with_ethernet          = False,
+        eth_data_width         = 8,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timings          = None,
         with_led_chaser        = True,
         with_pmod_gpio         = False,
         **kwargs):
         platform = trellisboard.Platform(toolchain=toolchain)
 
+        # Video Timings ----------------------------------------------------------------------------
+        video_timings = "640x480@75Hz" if not with_video_framebuffer else get_video_timings(video_timings,
+            phy             = VideoDVIPHY,
+            sys_clk_freq    = sys_clk_freq,
+            dram_data_width = get_dram_data_width(databits=32, rate="1:2", memtype="DDR"),
+            pll             = ECP5PLL,
+            clkin_freq      = 12e6)
+
         # CRG --------------------------------------------------------------------------------------
-        crg_cls = _CRGSDRAM if kwargs.get("integrated_main_ram_size", 0) == 0 else _CRG
-        self.crg = crg_cls(platform, sys_clk_freq)
+        if kwargs.get("integrated_main_ram_size", 0) == 0:
+            self.crg = _CRGSDRAM(platform, sys_clk_freq,
+                with_video_pll = with_video_terminal or with_video_framebuffer,
+                pix_clk        = get_video_pix_clk(video_timings),
+            )
+        else:
+            self.crg = _CRG(platform, sys_clk_freq)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Trellis Board", **kwargs)
@@ -144,13 +114,14 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # HDMI -------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
             # PHY + TP410 I2C initialization.
             hdmi_pads = platform.request("hdmi")
-            self.videophy = VideoDVIPHY(hdmi_pads, clock_domain="init")
+            self.videophy = VideoDVIPHY(hdmi_pads, clock_domain="video")
             self.videoi2c = I2CMaster(hdmi_pads)
             self.videoi2c.add_init(addr=0x38, init=[
                 (0x08, 0x35) # CTL_1_MODE: Normal operation, 24-bit, HSYNC/VSYNC.
@@ -158,9 +129,9 @@ class BaseSoC(SoCCore):
 
             # Video Terminal/Framebuffer.
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="init")
+                self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="video")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@75Hz", clock_domain="init")
+                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="video")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -180,9 +151,11 @@ def main():
     parser = LiteXArgumentParser(platform=trellisboard.Platform, description="LiteX SoC on Trellis Board.")
     parser.add_target_argument("--sys-clk-freq",    default=75e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-ethernet",   action="store_true",      help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-data-width",  default=8, type=int,      help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-timings",   default=None,        help="Video Framebuffer timings (default: largest feasible).")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",       action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",           action="store_true", help="Enable SDCard support.")
@@ -193,15 +166,17 @@ def main():
         sys_clk_freq           = args.sys_clk_freq,
         toolchain              = args.toolchain,
         with_ethernet          = args.with_ethernet,
+        eth_data_width         = args.eth_data_width,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timings          = args.video_timings,
         with_pmod_gpio         = args.with_pmod_gpio,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
-        soc.add_sdcard()
+        add_sdcard_hs(soc)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -13,6 +13,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import trenz_c10lprefkit
+from litex_boards.lib.ethernet import check_eth_data_width
 
 from litex.soc.cores.clock import Cyclone10LPPLL
 from litex.soc.integration.soc_core import *
@@ -59,9 +60,11 @@ class BaseSoC(SoCCore):
     mem_map.update(SoCCore.mem_map)
 
     def __init__(self, sys_clk_freq=50e6,
-        with_led_chaser = True,
-        with_ethernet   = False,
-        with_etherbone  = False,
+        with_led_chaser        = True,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        etherbone_buffer_depth = 16,
+        eth_data_width         = 8,
         **kwargs):
         platform = trenz_c10lprefkit.Platform()
 
@@ -89,10 +92,11 @@ class BaseSoC(SoCCore):
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, buffer_depth=etherbone_buffer_depth, data_width=eth_data_width)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -105,15 +109,19 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=trenz_c10lprefkit.Platform, description="LiteX SoC on C10 LP RefKit.")
-    parser.add_target_argument("--sys-clk-freq",   default=50e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",      help="Enable Ethernet support.")
-    parser.add_target_argument("--with-etherbone", action="store_true",      help="Enable Etherbone support.")
+    parser.add_target_argument("--sys-clk-freq",           default=50e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",      help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",      help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int,     help="Etherbone buffer depth (max burst length in 32-bit words, up to 255).")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int,      help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_data_width         = args.eth_data_width,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -15,6 +15,10 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import xilinx_kc705
+from litex_boards.lib.xilinx_config import apply_fast_config
+from litex_boards.lib.ethernet import check_eth_data_width
+from litex_boards.lib.sim import add_sim_args, run_sim, get_sim_sdram_args
+from litex_boards.lib.crg import BoardCRG
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -31,36 +35,24 @@ from litepcie.software import generate_litepcie_software
 
 # CRG ----------------------------------------------------------------------------------------------
 
-class _CRG(LiteXModule):
+class _CRG(BoardCRG):
     def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys4x  = ClockDomain()
-        self.cd_idelay = ClockDomain()
-
-        # # #
-
-        # Clk/Rst.
-        clk200 = platform.request("clk200")
-        rst    = platform.request("cpu_reset")
-
-        # PLL.
-        self.pll = pll = S7MMCM(speedgrade=-2)
-        self.comb += pll.reset.eq(rst | self.rst)
-        pll.register_clkin(clk200, 200e6)
-        pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_sys4x,  4*sys_clk_freq)
-        pll.create_clkout(self.cd_idelay, 200e6)
-        platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
-
-        # IDelayCtrl.
-        self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
+        BoardCRG.__init__(self, platform,
+            pll        = S7MMCM(speedgrade=-2),
+            clkin      = platform.request("clk200"),
+            clkin_freq = 200e6,
+            rst        = platform.request("cpu_reset"),
+        )
+        self.add_sys(sys_clk_freq, with_dram=True, dqs_phase=None)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
+    sdram_module = MT8JTF12864 # DRAM module (hardware and --sim).
+
     def __init__(self, sys_clk_freq=125e6,
         with_ethernet   = False,
+        eth_data_width  = 8,
         with_led_chaser = True,
         with_spi_flash  = False,
         with_pcie       = False,
@@ -82,7 +74,7 @@ class BaseSoC(SoCCore):
                 sys_clk_freq = sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
-                module        = MT8JTF12864(sys_clk_freq, "1:4"),
+                module        = self.sdram_module(sys_clk_freq, "1:4"),
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
@@ -92,7 +84,8 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 clk_freq   = self.clk_freq)
-            self.add_ethernet(phy=self.ethphy)
+            check_eth_data_width(self.ethphy, self.sys_clk_freq, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -154,20 +147,35 @@ def main():
     parser = LiteXArgumentParser(platform=xilinx_kc705.Platform, description="LiteX SoC on KC705.")
     parser.add_target_argument("--sys-clk-freq",   default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int,       help="Ethernet/Etherbone datapath width (8: in PHY clock domains, 32: in sys clock domain).")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI Flash (MMAPed).")
     parser.add_target_argument("--with-pcie",      action="store_true",       help="Enable PCIe support.")
     parser.add_target_argument("--driver",         action="store_true",       help="Generate PCIe driver.")
     parser.add_target_argument("--with-sata",      action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    parser.add_target_argument("--fast-config",    action="store_true",       help="Use the fastest safe SPI Flash configuration settings (compression/bus width/rate).")
+    add_sim_args(parser)
     args = parser.parse_args()
 
+    if args.sim:
+        run_sim(args, parser, args.sys_clk_freq,
+            ident            = "LiteX SoC on KC705",
+            **get_sim_sdram_args(BaseSoC, xilinx_kc705.Platform()),
+            with_ethernet    = args.with_ethernet,
+        )
+        return
+
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
         with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
         with_spi_flash = args.with_spi_flash,
         with_pcie      = args.with_pcie,
         with_sata      = args.with_sata,
         **parser.soc_argdict
     )
+    if args.fast_config:
+        apply_fast_config(soc.platform)
+
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
@@ -23,6 +23,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import xilinx_kv260
+from litex_boards.lib.zynq_dma import add_ps_dma, ps_dma_ports
 from litex.build.tools import write_to_file
 
 from litex.soc.interconnect import axi
@@ -56,7 +57,7 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=100e6, **kwargs):
+    def __init__(self, sys_clk_freq=100e6, with_ps_dma=False, ps_dma_port="hp", **kwargs):
         platform = xilinx_kv260.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -136,6 +137,10 @@ class BaseSoC(SoCCore):
             )
             self.constants["CONFIG_CLOCK_FREQUENCY"] = 1333333008
 
+        # PS DMA -----------------------------------------------------------------------------------
+        if with_ps_dma:
+            add_ps_dma(self, port=ps_dma_port)
+
     def finalize(self, *args, **kwargs):
         super(BaseSoC, self).finalize(*args, **kwargs)
         if self.cpu_type != "zynqmp":
@@ -200,12 +205,16 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_kv260.Platform, description="LiteX SoC on KV260.")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ps-dma",  action="store_true",       help="Enable PL-to-PS DDR DMA (through a PS HP/HPC/ACP slave port).")
+    parser.add_target_argument("--ps-dma-port",  default="hp", choices=ps_dma_ports, help="PS DMA slave port.")
     parser.set_defaults(cpu_type="zynqmp")
     parser.set_defaults(no_uart=True)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
+        with_ps_dma  = args.with_ps_dma,
+        ps_dma_port  = args.ps_dma_port,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
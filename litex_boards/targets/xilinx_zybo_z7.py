@@ -12,6 +12,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_zybo_z7
+from litex_boards.lib.zynq_dma import add_ps_dma, ps_dma_ports
 
 from litex.soc.interconnect import axi
 from litex.soc.interconnect import wishbone
@@ -44,7 +45,10 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=100e6, variant="z7-10", with_ps7=False, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=100e6, variant="z7-10", with_ps7=False, with_led_chaser=True,
+        with_ps_dma = False,
+        ps_dma_port = "hp",
+        **kwargs):
         platform = digilent_zybo_z7.Platform(variant=variant)
         self.builder    = None
         # CRG --------------------------------------------------------------------------------------
@@ -108,6 +112,10 @@ class BaseSoC(SoCCore):
                 #TODO: make config for zybo-z7-10
                 raise NotImplementedError
 
+        # PS DMA -----------------------------------------------------------------------------------
+        if with_ps_dma:
+            add_ps_dma(self, port=ps_dma_port)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -165,12 +173,16 @@ def main():
     parser.add_target_argument("--sys-clk-freq",    default=125e6, type=float,  help="System clock frequency.")
     parser.add_target_argument("--variant",         default="z7-10",            help="Board variant (z7-10, z7-20 or original).")
     parser.add_target_argument("--with-ps7",        action="store_true",        help="Add the PS7 as slave for soft CPUs.")
+    parser.add_target_argument("--with-ps-dma",     action="store_true",        help="Enable PL-to-PS DDR DMA (through a PS HP/ACP slave port).")
+    parser.add_target_argument("--ps-dma-port",     default="hp", choices=ps_dma_ports, help="PS DMA slave port.")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
         variant = args.variant,
         with_ps7 = args.with_ps7,
+        with_ps_dma = args.with_ps_dma,
+        ps_dma_port = args.ps_dma_port,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -23,6 +23,7 @@ setup(
     python_requires               = "~=3.7",
     install_requires              = ["litex"],
     include_package_data          = True,
+    package_data                  = {"litex_boards.lib": ["*.json"]},
     keywords                      = "HDL ASIC FPGA hardware design",
     classifiers                   = [
         "Topic :: Scientific/Engineering :: Electronic Design Automation (EDA)",
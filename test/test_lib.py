@@ -0,0 +1,1396 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+import random
+import itertools
+
+from migen import *
+
+from litex.soc.cores.code_tmds import TMDSEncoder
+from litex.soc.cores.code_8b10b import Encoder, Decoder
+from litex.soc.interconnect import stream
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect import axi
+from litex.build.io import SDRTristate
+
+from liteeth.phy.s7rgmii import LiteEthPHYRGMII
+from liteeth.phy.rmii import LiteEthPHYRMII
+
+from litex_boards.lib.ethernet import check_eth_data_width, get_eth_line_rate, EthUDPRelay
+from litex_boards.lib.hub75 import parse_hub75_panel, get_hub75_gamma_lut, HUB75Scanner, HUB75UDPReceiver
+from litex.soc.cores.clock import ECP5PLL, S7PLL
+
+from litex_boards.lib.video import TMDSDecoder
+from litex_boards.lib.video import get_video_timings, get_video_timings_2ppc, get_dram_data_width
+from litex_boards.lib.video import VideoBlitter, VideoFrameBufferPageFlipper
+from litex_boards.lib.video import TMDSEncoder2PPC
+from litex_boards.lib.jesd204b import JESD204BSettings, JESD204BCore
+from litex_boards.lib.mipi_csi2 import CSI2Receiver, WishboneFrameRingBuffer, csi2_packet_header
+from litex_boards.lib.mipi_csi2 import CSI2_DT_FRAME_START, CSI2_DT_FRAME_END, CSI2_DT_RAW10
+from litex_boards.lib.xilinx_config import get_fast_config, get_platform_config, apply_fast_config
+from litex_boards.lib.spi_flash import SPIFlashXIPCache
+from litex_boards.lib.sdcard import SDCardDMAStats, SDCardHSSwitch, SD_SWITCH_SDR25_ARG, get_sdcard_clk_freq
+from litex_boards.lib.tftp import TFTPReceiver, tftp_request
+from litex_boards.lib.pll_cache import PLLConfigCache, get_pll_key, use_pll_cache
+from litex_boards.lib.nextpnr import parse_nextpnr_fmax, get_nextpnr_timing_pass
+from litex_boards.lib.nextpnr import parse_nextpnr_utilization, get_nextpnr_resources, parse_yosys_cells, get_yosys_ff_count
+from litex_boards.lib.utilization import check_utilization
+from litex_boards.lib.fmax import FmaxDatabase, get_max_sys_clk_freq, get_sys_clk_freq_type
+from litex_boards.lib.sim import SimBaseSoC, get_sim_sdram_args
+from litex_boards.lib.crg import BoardCRG, get_crg_family
+from litex_boards.lib.axi_dma import AXIRingBufferWriter, AXIRingBufferReader
+from litex_boards.lib.zynq_dma import PSDMA
+from litex_boards.lib.timestamper import TimeCounter, TimestamperCore
+from litex_boards.lib.lms7002m import LMS7002MRXPacketizer, LMS7002MTXDepacketizer, LMS7002M_SYNC
+from litex_boards.lib.usb_fifo import FT245PHYSynchronousTimed
+
+class _GigabitPHY(LiteEthPHYRGMII):
+    # LiteEth PHYs (without pads, only used for their line rate).
+    def __init__(self):
+        pass
+
+class _FastEthernetPHY(LiteEthPHYRMII):
+    def __init__(self):
+        pass
+
+class _UnknownPHY:
+    dw          = 8
+    tx_clk_freq = 125e6
+
+@passive
+def _native_port_model(port, mem, latency=2):
+    # Simple LiteDRAM Native Port model (always ready, reads returned after latency cycles).
+    reads  = []
+    writes = []
+    yield port.cmd.ready.eq(1)
+    yield port.wdata.ready.eq(1)
+    while True:
+        if (yield port.cmd.valid):
+            addr = (yield port.cmd.addr)
+            if (yield port.cmd.we):
+                writes.append(addr)
+            else:
+                reads.append([latency, addr])
+        if (yield port.wdata.valid):
+            mem[writes.pop(0)] = (yield port.wdata.data)
+        if (yield port.rdata.valid) and (yield port.rdata.ready):
+            reads.pop(0)
+        for read in reads:
+            read[0] -= 1
+        if reads and reads[0][0] <= 0:
+            yield port.rdata.valid.eq(1)
+            yield port.rdata.data.eq(mem.get(reads[0][1], 0))
+        else:
+            yield port.rdata.valid.eq(0)
+        yield
+
+@passive
+def _wishbone_flash_model(bus, accesses, latency=4):
+    # Simple read-only Wishbone Flash model (data = ~address, acks after latency cycles).
+    while True:
+        if (yield bus.cyc) and (yield bus.stb):
+            adr = (yield bus.adr)
+            accesses.append(adr)
+            for _ in range(latency):
+                yield
+            yield bus.dat_r.eq(~adr & 0xffffffff)
+            yield bus.ack.eq(1)
+            yield
+            yield bus.ack.eq(0)
+        yield
+
+class _UDPPort:
+    # LiteEth UDP user port (32-bit).
+    def __init__(self):
+        from liteeth.common import eth_udp_user_description
+        self.sink   = stream.Endpoint(eth_udp_user_description(32))
+        self.source = stream.Endpoint(eth_udp_user_description(32))
+
+def _udp_send(endpoint, ip_address, src_port, payload, gap=0):
+    # Send an UDP payload (bytes in wire order from LSBs), with gap idle cycles between words.
+    words = [payload[n:n + 4] for n in range(0, len(payload), 4)]
+    for n, word in enumerate(words):
+        yield endpoint.valid.eq(1)
+        yield endpoint.ip_address.eq(ip_address)
+        yield endpoint.src_port.eq(src_port)
+        yield endpoint.length.eq(len(payload))
+        yield endpoint.data.eq(int.from_bytes(word, "little"))
+        yield endpoint.last.eq(n == len(words) - 1)
+        yield endpoint.last_be.eq(1 << (len(word) - 1))
+        yield
+        while not (yield endpoint.ready):
+            yield
+        for _ in range(gap):
+            yield endpoint.valid.eq(0)
+            yield
+    yield endpoint.valid.eq(0)
+    yield endpoint.last.eq(0)
+
+@passive
+def _udp_receive(endpoint, packets):
+    # Collect UDP packets as (dst_port, payload).
+    payload = b""
+    yield endpoint.ready.eq(1)
+    while True:
+        if (yield endpoint.valid):
+            data = (yield endpoint.data).to_bytes(4, "little")
+            if (yield endpoint.last):
+                last_be = (yield endpoint.last_be)
+                payload += data[:last_be.bit_length()]
+                packets.append(((yield endpoint.dst_port), payload))
+                payload = b""
+            else:
+                payload += data
+        yield
+
+@passive
+def _wishbone_ram_model(bus, mem):
+    # Simple Wishbone RAM model (byte-addressed dict, writes only).
+    while True:
+        if (yield bus.cyc) and (yield bus.stb) and not (yield bus.ack):
+            adr  = (yield bus.adr)
+            data = (yield bus.dat_w)
+            sel  = (yield bus.sel)
+            for n in range(4):
+                if sel & (1 << n):
+                    mem[4*adr + n] = (data >> (8*n)) & 0xff
+            yield bus.ack.eq(1)
+        else:
+            yield bus.ack.eq(0)
+        yield
+
+@passive
+def _axi_ram_model(axi, mem, bursts):
+    # Simple AXI RAM model (byte-addressed dict of data words, INCR bursts, one burst at a time),
+    # bursts are logged as (we, addr, len).
+    dw = len(axi.w.data)//8
+    yield axi.b.resp.eq(0)
+    yield axi.r.resp.eq(0)
+    while True:
+        if (yield axi.aw.valid):
+            addr, length = (yield axi.aw.addr), (yield axi.aw.len) + 1
+            bursts.append((1, addr, length))
+            yield axi.aw.ready.eq(1)
+            yield
+            yield axi.aw.ready.eq(0)
+            yield axi.w.ready.eq(1)
+            for n in range(length):
+                yield
+                while not (yield axi.w.valid):
+                    yield
+                mem[addr + n*dw] = (yield axi.w.data)
+            yield axi.w.ready.eq(0)
+            yield axi.b.valid.eq(1)
+            yield
+            while not (yield axi.b.ready):
+                yield
+            yield axi.b.valid.eq(0)
+        elif (yield axi.ar.valid):
+            addr, length = (yield axi.ar.addr), (yield axi.ar.len) + 1
+            bursts.append((0, addr, length))
+            yield axi.ar.ready.eq(1)
+            yield
+            yield axi.ar.ready.eq(0)
+            for n in range(length):
+                yield axi.r.valid.eq(1)
+                yield axi.r.data.eq(mem.get(addr + n*dw, 0))
+                yield axi.r.last.eq(n == (length - 1))
+                yield
+                while not (yield axi.r.ready):
+                    yield
+            yield axi.r.valid.eq(0)
+            yield axi.r.last.eq(0)
+        yield
+
+class _JESD204BPHY(Module):
+    # 8b10b Encoder -> Decoders with a lane delay (in words).
+    def __init__(self, delay):
+        self.sink     = sink   = stream.Endpoint([("data", 32), ("ctrl", 4)])
+        self.source   = source = stream.Endpoint([("data", 32), ("ctrl", 4)])
+        self.rx_align = Signal()
+        self.loopback = Signal(3)
+        self.submodules.encoder = encoder = Encoder(4, True)
+        self.decoders = [Decoder(True) for _ in range(4)]
+        self.submodules += self.decoders
+        line = Cat(*encoder.output)
+        for _ in range(delay):
+            line_d = Signal(40)
+            self.sync += line_d.eq(line)
+            line = line_d
+        for i in range(4):
+            self.comb += [
+                encoder.k[i].eq(sink.ctrl[i]),
+                encoder.d[i].eq(sink.data[8*i:8*(i + 1)]),
+                self.decoders[i].input.eq(line[10*i:10*(i + 1)]),
+                source.ctrl[i].eq(self.decoders[i].k),
+                source.data[8*i:8*(i + 1)].eq(self.decoders[i].d),
+            ]
+
+class _SimSDRTristate:
+    # SDRTristate input register on the SDRTristate's clock domain (LiteX's inferred implementation
+    # uses a derived clock domain, not clocked by the simulator).
+    @staticmethod
+    def lower(dr):
+        module = Module()
+        module.sync += dr.i.eq(dr.io)
+        return ClockDomainsRenamer(dr.clk.cd)(module)
+
+class _FT245PHYTimed(Module):
+    # FT245PHYSynchronousTimed with its usb clock domain and pads.
+    def __init__(self, **kwargs):
+        self.clock_domains.cd_sys = ClockDomain()
+        self.clock_domains.cd_usb = ClockDomain()
+        self.pads = Record([("data", 8), ("rxf_n", 1), ("txe_n", 1), ("rd_n", 1), ("wr_n", 1), ("oe_n", 1)])
+        self.submodules.phy = FT245PHYSynchronousTimed(self.pads, 100e6, **kwargs)
+        # Simulator clocks (CDCs use derived from/to clock domains).
+        self.clocks = {"sys": 10, "usb": 10}
+        for cdc in [self.phy.read_cdc, self.phy.write_cdc]:
+            self.clocks.update({f"from{cdc.duid}": 10, f"to{cdc.duid}": 10})
+
+@passive
+def _ft245_model(pads, data_w, written, strobes):
+    # Simple FT245 Synchronous FIFO model (always data to read/room to write, read data = counter),
+    # strobes are logged as R (read), W (write) or . (idle) per usb_clk cycle.
+    n = 0
+    while True:
+        rd = not (yield pads.rd_n) and not (yield pads.rxf_n)
+        wr = not (yield pads.wr_n) and not (yield pads.txe_n)
+        assert not (rd and wr)
+        if wr:
+            written.append((yield data_w))
+        strobes.append("R" if rd else "W" if wr else ".")
+        if rd:
+            n += 1
+        yield pads.data.eq(n & 0xff)
+        yield
+
+class TestLib(unittest.TestCase):
+    def test_eth_data_width(self):
+        # 8-bit datapath runs in PHY clock domains: always valid.
+        check_eth_data_width(_GigabitPHY(), 10e6, 8)
+        # 32-bit datapath runs in sys clock domain: needs sys_clk_freq*32 >= line rate.
+        check_eth_data_width(_GigabitPHY(),      31.25e6, 32)
+        check_eth_data_width(_FastEthernetPHY(), 10e6,    32)
+        with self.assertRaises(ValueError):
+            check_eth_data_width(_GigabitPHY(), 25e6, 32)
+        with self.assertRaises(ValueError):
+            check_eth_data_width(_GigabitPHY(), 100e6, 16)
+        # Line rate from the PHY class (RMII: 100Mbps, 2 bits at 50MHz).
+        self.assertEqual(get_eth_line_rate(_GigabitPHY()),      1e9)
+        self.assertEqual(get_eth_line_rate(_FastEthernetPHY()), 100e6)
+        check_eth_data_width(_FastEthernetPHY(), 3.125e6, 32)
+        with self.assertRaises(ValueError):
+            check_eth_data_width(_FastEthernetPHY(), 3e6, 32)
+        # Unknown PHY: only with the 8-bit datapath.
+        check_eth_data_width(_UnknownPHY(), 100e6, 8)
+        with self.assertRaises(ValueError):
+            check_eth_data_width(_UnknownPHY(), 100e6, 32)
+
+    def test_hub75_helpers(self):
+        self.assertEqual(parse_hub75_panel("64x32"), (64, 32))
+        self.assertEqual(parse_hub75_panel("128X64"), (128, 64))
+        with self.assertRaises(ValueError):
+            parse_hub75_panel("64x31")
+        lut = get_hub75_gamma_lut(gamma=2.2, bit_depth=10)
+        self.assertEqual(len(lut), 256)
+        self.assertEqual((lut[0], lut[255]), (0, 1023))
+        self.assertEqual(lut, sorted(lut))
+
+    def test_video_timings(self):
+        # 16-bit SDR SDRAM at 50MHz (ex ULX3S): 640x480@75Hz exceeds the DRAM budget.
+        sdr16 = get_dram_data_width(databits=16)
+        self.assertEqual(get_video_timings(None, "VideoHDMIPHY", 50e6, sdr16), "640x480@60Hz")
+        with self.assertRaises(ValueError):
+            get_video_timings("640x480@75Hz", "VideoHDMIPHY", 50e6, sdr16)
+        # 16-bit DDR3 at 100MHz (ex Artix7): largest timings within the HDMI PHY/PLL limits.
+        ddr3 = get_dram_data_width(databits=16, rate="1:4", memtype="DDR")
+        self.assertEqual(ddr3, 128)
+        self.assertEqual(get_video_timings(None, "VideoS7HDMIPHY", 100e6, ddr3,
+            pll=S7PLL, clkin_freq=100e6), "1920x1080@30Hz")
+        with self.assertRaises(ValueError):
+            get_video_timings("1920x1080@60Hz", "VideoS7HDMIPHY", 100e6, ddr3)
+        # rgb565 halves the bandwidth, PLL has to generate the shared clocks.
+        with self.assertRaises(ValueError):
+            get_video_timings("800x600@60Hz", "VideoHDMIPHY", 50e6, sdr16)
+        self.assertEqual(get_video_timings("800x600@60Hz", "VideoHDMIPHY", 50e6, sdr16, format="rgb565",
+            pll=ECP5PLL, clkin_freq=25e6, pll_shared_clk_freqs=[50e6]), "800x600@60Hz")
+        with self.assertRaises(ValueError):
+            get_video_timings("1234x567@60Hz", "VideoHDMIPHY", 50e6, sdr16)
+
+    def test_video_timings_2ppc(self):
+        ddr3_16 = get_dram_data_width(databits=16, rate="1:4", memtype="DDR")
+        # DeckLink Mini 4K like: 16-bit DDR3 at 148.5MHz (1:4) sustains 3840x2160@30Hz.
+        self.assertEqual(get_video_timings(None, "VideoS7GTPHDMIPHY2PPC", 148.5e6, ddr3_16), "3840x2160@30Hz")
+        # Too narrow/slow DRAM for 4K.
+        with self.assertRaises(ValueError):
+            get_video_timings("3840x2160@30Hz", "VideoS7GTPHDMIPHY2PPC", 100e6, 64)
+        self.assertEqual(get_video_timings(None, "VideoS7GTPHDMIPHY2PPC", 100e6, 64), "1920x1080@60Hz")
+        # 4K timings are only available on the 2 pixels/clock PHYs.
+        with self.assertRaises(ValueError):
+            get_video_timings("3840x2160@30Hz", "VideoS7GTPHDMIPHY", 148.5e6, ddr3_16)
+        t = get_video_timings_2ppc("3840x2160@30Hz")
+        self.assertEqual((t["h_active"], t["h_blanking"], t["pix_clk"]), (1920, 280, 148.5e6))
+
+    def test_tmds_encoder_2ppc(self):
+        # TMDSEncoder2PPC must generate the same symbols than TMDSEncoder on the serialized pixels.
+        prng  = random.Random(42)
+        pairs = [(prng.randrange(4) != 0, prng.randrange(256), prng.randrange(256), prng.randrange(4)) for _ in range(128)]
+        pairs += [(0, 0, 0, 0)]*4
+        def run(dut, inputs, get_out):
+            outs = []
+            def generator():
+                for inp in inputs:
+                    for sig, value in zip(get_out(dut)[1], inp):
+                        yield sig.eq(value)
+                    yield
+                    outs.append((yield get_out(dut)[0]))
+            run_simulation(dut, generator())
+            return outs[4:] # Encoders latency.
+        serial   = run(TMDSEncoder(),
+            [(de, d, c) for de, d0, d1, c in pairs for d in [d0, d1]],
+            lambda dut: (dut.out, [dut.de, dut.d, dut.c]))
+        parallel = run(TMDSEncoder2PPC(),
+            pairs,
+            lambda dut: (dut.out, [dut.de, dut.d[0], dut.d[1], dut.c]))
+        symbols = []
+        for out in parallel:
+            symbols += [out & 0x3ff, out >> 10]
+        self.assertEqual(symbols[:len(serial) - 8], serial[:len(serial) - 8])
+
+    def test_tmds_decoder(self):
+        class DUT(Module):
+            def __init__(self):
+                self.submodules.encoder = TMDSEncoder()
+                self.submodules.decoder = TMDSDecoder()
+                self.comb += self.decoder.input.eq(self.encoder.out)
+        dut    = DUT()
+        prng   = random.Random(42)
+        inputs = [(prng.randrange(4) != 0, prng.randrange(256), prng.randrange(4)) for _ in range(256)]
+        errors = []
+        def generator():
+            for i, (de, d, c) in enumerate(inputs + [(0, 0, 0)]*5):
+                yield dut.encoder.de.eq(de)
+                yield dut.encoder.d.eq(d)
+                yield dut.encoder.c.eq(c)
+                yield
+                # Encoder + Decoder latency (outputs sampled after the clock edge).
+                if i >= 5:
+                    de, d, c = inputs[i - 5]
+                    if (yield dut.decoder.de) != de:
+                        errors.append(i)
+                    elif de and (yield dut.decoder.d) != d:
+                        errors.append(i)
+                    elif not de and (yield dut.decoder.c) != c:
+                        errors.append(i)
+        run_simulation(dut, generator())
+        self.assertEqual(errors, [])
+
+    def test_jesd204b_link(self):
+        settings = JESD204BSettings(m=4, l=4, f=2, s=1, k=32)
+        class DUT(Module):
+            def __init__(self):
+                self.phys = [_JESD204BPHY(delay) for delay in [0, 3, 1, 5]] # Lanes skew.
+                self.submodules += self.phys
+                self.submodules.core = JESD204BCore(self.phys, settings, clock_domain="sys")
+                self.comb += self.core.tx_jsync.eq(self.core.rx_jsync)
+        dut  = DUT()
+        prng = random.Random(42)
+        sent, received, errors = [], [], []
+        def generator():
+            yield dut.core.control.storage.eq(1)
+            for cycle in range(600):
+                # SYSREF every 8 multiframes.
+                yield dut.core.sysref.eq((cycle % (8*settings.lmfc_words)) in [10, 11])
+                data = prng.getrandbits(settings.data_width)
+                yield dut.core.tx_data.eq(data)
+                yield
+                if (yield dut.core.tx_ready):
+                    sent.append(data)
+                if (yield dut.core.rx_ready):
+                    received.append((yield dut.core.rx_data))
+                for n in range(settings.l):
+                    link = getattr(dut.core, f"rx_link{n}")
+                    for error in ["error_invalid", "error_unexpected", "error_config"]:
+                        if (yield getattr(link, error)):
+                            errors.append((cycle, n, error))
+                if (yield dut.core.lmfc.error):
+                    errors.append((cycle, "sysref"))
+        run_simulation(dut, generator())
+        self.assertEqual(errors, [])
+        self.assertGreater(len(received), 300)
+        self.assertEqual(received, sent[:len(received)])
+
+    def test_csi2_capture(self):
+        nlanes, width, height, nframes = 2, 16, 4, 3
+        class DUT(Module):
+            def __init__(self):
+                self.submodules.receiver   = CSI2Receiver(nlanes=nlanes, clock_domain="sys")
+                self.submodules.sram       = wishbone.SRAM(4096)
+                self.bus = bus             = wishbone.Interface()
+                self.submodules.ringbuffer = WishboneFrameRingBuffer(bus, base=0, slot_size=4*width*height, burst_length=8)
+                self.comb += [
+                    self.receiver.source.connect(self.ringbuffer.sink),
+                    bus.connect(self.sram.bus),
+                ]
+        dut   = DUT()
+        prng  = random.Random(42)
+        lines = [[[prng.getrandbits(32) for _ in range(width)] for _ in range(height)] for _ in range(nframes)]
+
+        # Packets (one per HS burst, 4 bytes words, lane n sends bytes n, n + nlanes, ...).
+        def packet(words, skew):
+            data = b"".join(w.to_bytes(4, "little") for w in words)
+            return [[None]*skew[n] + [0xb8] + list(data[n::nlanes]) + [0x55]*(3 - skew[n]) for n in range(nlanes)]
+        bursts = []
+        for frame in range(nframes):
+            bursts.append(packet([csi2_packet_header(CSI2_DT_FRAME_START, frame)], [0, 1]))
+            for line in lines[frame]:
+                bursts.append(packet([csi2_packet_header(CSI2_DT_RAW10, 4*width)] + line + [0xffff], [1, 0]))
+            bursts.append(packet([csi2_packet_header(CSI2_DT_FRAME_END, frame)], [2, 0]))
+        bursts.insert(2, packet([csi2_packet_header(CSI2_DT_RAW10, 4*width) ^ (1 << 26)] + [0]*width, [0, 0])) # ECC error.
+
+        def generator():
+            for burst in bursts:
+                for i in range(max(len(lane) for lane in burst)):
+                    for n in range(nlanes):
+                        byte = burst[n][i] if i < len(burst[n]) else None
+                        yield dut.receiver.valid[n].eq(byte is not None)
+                        yield dut.receiver.data[n].eq(0 if byte is None else byte)
+                    yield
+                for n in range(nlanes):
+                    yield dut.receiver.valid[n].eq(0)
+                for _ in range(16):
+                    yield
+            for _ in range(64):
+                yield
+            self.assertEqual((yield dut.ringbuffer.frames.status), nframes)
+            self.assertEqual((yield dut.ringbuffer.drops.status), 0)
+            self.assertEqual((yield dut.ringbuffer.latest.fields.slot), (nframes - 1) % 3)
+            self.assertEqual((yield dut.receiver.depacketizer.h_active), width)
+            self.assertEqual((yield dut.receiver.depacketizer.v_active), height)
+            self.assertEqual((yield dut.receiver.ecc_errors.status), 1)
+            for frame in range(nframes):
+                words = []
+                for adr in range(width*height):
+                    words.append((yield dut.sram.mem[(frame % 3)*width*height + adr]))
+                self.assertEqual(words, sum(lines[frame], []))
+        run_simulation(dut, generator())
+
+    def test_video_blitter(self):
+        from litedram.common import LiteDRAMNativePort
+        read_port  = LiteDRAMNativePort("read",  address_width=16, data_width=32)
+        write_port = LiteDRAMNativePort("write", address_width=16, data_width=32)
+        dut = VideoBlitter(read_port, write_port)
+        mem = {0x40 + y*16 + x: (y << 8) | x for y in range(4) for x in range(8)}
+
+        def operation(mode, src, dst, width, height, src_stride, dst_stride, color=0):
+            for csr, value in [("src", src), ("dst", dst), ("width", width), ("height", height),
+                ("src_stride", src_stride), ("dst_stride", dst_stride), ("color", color)]:
+                yield getattr(dut, csr).storage.eq(value)
+            yield from dut.control.write((mode << 1) | 1)
+            yield
+            for _ in range(256):
+                if not (yield dut.status.fields.busy):
+                    break
+                yield
+            self.assertEqual((yield dut.status.fields.busy), 0)
+
+        def generator():
+            # Fill 3 words x 2 lines at word 0x200 (stride 8 words).
+            yield from operation(0, 0, 4*0x200, 12, 2, 0, 32, color=0x12345678)
+            for y in range(3):
+                for x in range(4):
+                    expected = 0x12345678 if (y < 2 and x < 3) else None
+                    self.assertEqual(mem.get(0x200 + 8*y + x), expected)
+            self.assertGreater((yield dut.cycles.status), 6)
+            # Copy 4 words x 3 lines from word 0x41 (stride 16 words) to word 0x300 (stride 4 words).
+            yield from operation(1, 4*0x41, 4*0x300, 16, 3, 64, 16)
+            for y in range(3):
+                for x in range(4):
+                    self.assertEqual(mem.get(0x300 + 4*y + x), (y << 8) | (x + 1))
+            self.assertIsNone(mem.get(0x300 + 12))
+
+        run_simulation(dut, [generator(),
+            _native_port_model(read_port,  mem),
+            _native_port_model(write_port, mem)])
+
+    def test_video_page_flip(self):
+        from litedram.common import LiteDRAMNativePort
+        dram_port = LiteDRAMNativePort("read", address_width=16, data_width=32)
+        dut       = VideoFrameBufferPageFlipper(dram_port, nbuffers=3, stride=256)
+        addresses = []
+
+        def frame():
+            for n in range(4):
+                yield dut.port.cmd.valid.eq(1)
+                yield dut.port.cmd.addr.eq(n)
+                yield dut.port.cmd.last.eq(n == 3)
+                yield
+                addresses.append((yield dram_port.cmd.addr))
+            yield dut.port.cmd.valid.eq(0)
+            yield dut.port.cmd.last.eq(0)
+            yield
+
+        def generator():
+            yield dram_port.cmd.ready.eq(1)
+            yield from frame()
+            # Flip requested between frames: current page kept until the end of the next frame.
+            yield from dut.flip.write(2)
+            yield
+            self.assertEqual((yield dut.status.fields.pending), 1)
+            self.assertEqual((yield dut.status.fields.page), 0)
+            yield from frame()
+            self.assertEqual((yield dut.status.fields.pending), 0)
+            self.assertEqual((yield dut.status.fields.page), 2)
+            yield from frame()
+            self.assertEqual(addresses, [0, 1, 2, 3]*2 + [128, 129, 130, 131])
+            self.assertEqual((yield dut.frames.status), 3)
+
+        run_simulation(dut, generator())
+
+    def test_xilinx_fast_config(self):
+        # Highest rate within the Flash max frequency with the +50% CCLK tolerance of 7-Series.
+        config = get_fast_config("xc7a100tcsg324-1", "s25fl128s", 4)
+        self.assertEqual((config["rate"], config["buswidth"]), (66, 4))
+        self.assertEqual(get_fast_config("xc7a35tcpg236-1", "s25fl032p", 4)["rate"], 50)
+        self.assertEqual(get_fast_config("xcku040-ffva1156-2-e", "mt25qu256", 4)["rate"], 85.0)
+        with self.assertRaises(ValueError):
+            get_fast_config("xc7z020clg400-1", "s25fl128s", 4)
+        with self.assertRaises(ValueError):
+            get_fast_config("xc7a35tcpg236-1", "unknown", 4)
+
+        from litex_boards.platforms import digilent_arty
+        platform = digilent_arty.Platform()
+        apply_fast_config(platform)
+        commands = platform.toolchain.bitstream_commands + [c for c, _ in platform.constraint_manager.platform_commands]
+        self.assertEqual(sum("SPI_BUSWIDTH" in c for c in commands), 1)
+        self.assertEqual(get_platform_config(platform), {"rate": 66.0, "buswidth": 4, "compress": True})
+
+    def test_spi_flash_xip_cache(self):
+        flash_bus = wishbone.Interface()
+        dut       = SPIFlashXIPCache(flash_bus, size=256, line_size=16)
+        accesses  = []
+
+        def generator():
+            base = 0x08000000 # Word address of the Flash region.
+            # Miss: Line filled with 4 sequential Flash reads, then hits on the same line.
+            for offset in [1, 0, 3, 2]:
+                self.assertEqual((yield from dut.bus.read(base + offset)), ~(base + offset) & 0xffffffff)
+            self.assertEqual(accesses, [base + n for n in range(4)])
+            # Next line.
+            self.assertEqual((yield from dut.bus.read(base + 5)), ~(base + 5) & 0xffffffff)
+            self.assertEqual(accesses[4:], [base + 4 + n for n in range(4)])
+            # Writes are discarded.
+            yield from dut.bus.write(base, 0)
+            self.assertEqual((yield from dut.bus.read(base)), ~base & 0xffffffff)
+            self.assertEqual(len(accesses), 8)
+            yield
+            self.assertEqual((yield dut.accesses.status), 6)
+            self.assertEqual((yield dut.misses.status), 2)
+            self.assertGreater((yield dut.wait_cycles.status), 2*4*4)
+            # Bypass: Direct Flash accesses.
+            yield from dut.control.write(0b11)
+            yield
+            self.assertEqual((yield dut.accesses.status), 0)
+            for n in range(2):
+                self.assertEqual((yield from dut.bus.read(base + 1)), ~(base + 1) & 0xffffffff)
+            self.assertEqual(accesses[8:], [base + 1, base + 1])
+            yield
+            self.assertEqual((yield dut.misses.status), 2)
+
+        run_simulation(dut, [generator(), _wishbone_flash_model(flash_bus, accesses)])
+
+    def test_sdcard_hs(self):
+        self.assertEqual(get_sdcard_clk_freq(100e6), 50e6)
+        self.assertEqual(get_sdcard_clk_freq(75e6),  37.5e6)
+        self.assertEqual(get_sdcard_clk_freq(125e6), 31.25e6)
+        self.assertEqual(get_sdcard_clk_freq(100e6, max_freq=25e6), 25e6)
+
+        read_endpoint  = stream.Endpoint([("data", 8)])
+        write_endpoint = stream.Endpoint([("data", 8)])
+        dut = SDCardDMAStats(read_endpoint, write_endpoint)
+
+        def generator():
+            yield read_endpoint.ready.eq(1)
+            # 2 blocks of 16 bytes, 1 byte every 2 cycles with a 10 cycles gap between blocks.
+            for block in range(2):
+                for n in range(16):
+                    yield read_endpoint.valid.eq(1)
+                    yield
+                    yield read_endpoint.valid.eq(0)
+                    yield
+                for n in range(10):
+                    yield
+            self.assertEqual((yield dut.read_bytes.status), 32)
+            self.assertEqual((yield dut.read_time.status), 2*31 + 10)
+            self.assertEqual((yield dut.write_bytes.status), 0)
+            yield from dut.control.write(1)
+            yield
+            self.assertEqual((yield dut.read_bytes.status), 0)
+
+        run_simulation(dut, generator())
+
+    def test_sdcard_hs_switch(self):
+        from types import SimpleNamespace
+        # SDCore/SDPHYClocker registers/streams seen by the switch (CSRs fields driven directly).
+        core = SimpleNamespace(
+            cmd_argument = SimpleNamespace(storage=Signal(32)),
+            cmd_command  = SimpleNamespace(fields=SimpleNamespace(cmd=Signal(6), data_type=Signal(2))),
+            cmd_send     = SimpleNamespace(re=Signal()),
+            data_event   = SimpleNamespace(fields=SimpleNamespace(done=Signal(reset=1), error=Signal(), timeout=Signal())),
+            source       = stream.Endpoint([("data", 8)]),
+        )
+        clocker = SimpleNamespace(divider=SimpleNamespace(storage=Signal(9, reset=4)))
+        dut     = SDCardHSSwitch(core, clocker, divider=2)
+
+        def command(cmd, arg=0, data_type=0):
+            yield core.cmd_argument.storage.eq(arg)
+            yield core.cmd_command.fields.cmd.eq(cmd)
+            yield core.cmd_command.fields.data_type.eq(data_type)
+            yield core.cmd_send.re.eq(1)
+            yield
+            yield core.cmd_send.re.eq(0)
+            yield core.data_event.fields.done.eq(0)
+            yield
+
+        def switch(selected, error=0):
+            yield from command(6, SD_SWITCH_SDR25_ARG, data_type=1)
+            status = [0]*64
+            status[16] = 0xf0 | selected
+            yield core.source.ready.eq(1)
+            for byte in status:
+                yield core.source.valid.eq(1)
+                yield core.source.data.eq(byte)
+                yield
+            yield core.source.valid.eq(0)
+            yield core.data_event.fields.error.eq(error)
+            yield core.data_event.fields.done.eq(1)
+            for _ in range(4):
+                yield
+
+        def generator():
+            # Switch failed (0xf) or data error: BIOS clock kept.
+            yield from switch(0xf)
+            self.assertEqual((yield dut.status.fields.hs), 0)
+            self.assertEqual((yield clocker.divider.storage), 4)
+            yield from switch(0x1, error=1)
+            self.assertEqual((yield clocker.divider.storage), 4)
+            yield core.data_event.fields.error.eq(0)
+            # ACMD6 (SET_BUS_WIDTH): Ignored.
+            yield from command(6, 2)
+            yield core.data_event.fields.done.eq(1)
+            yield
+            yield
+            self.assertEqual((yield clocker.divider.storage), 4)
+            # Switch successful: High-Speed divider.
+            yield from switch(0x1)
+            self.assertEqual((yield dut.status.fields.hs), 1)
+            self.assertEqual((yield clocker.divider.storage), 2)
+            # GO_IDLE: High-Speed cleared.
+            yield from command(0)
+            self.assertEqual((yield dut.status.fields.hs), 0)
+
+        run_simulation(dut, generator())
+
+    def test_tftp_receiver(self):
+        udp_port = _UDPPort()
+        bus      = wishbone.Interface()
+        dut      = TFTPReceiver(udp_port, bus, local_port=6969, clk_freq=1e6)
+        server   = 0xc0a80164
+        request  = tftp_request("boot.bin", blksize=8, windowsize=2)
+        packets  = []
+        mem      = {}
+
+        def data(block, payload):
+            return bytes([0, 3, block >> 8, block & 0xff]) + payload
+
+        def wait_packets(n):
+            for _ in range(1000):
+                if len(packets) >= n:
+                    break
+                yield
+
+        def generator():
+            for n in range(0, len(request), 4):
+                yield from dut.request_data.write(int.from_bytes(request[n:n + 4], "little"))
+            yield from dut.request_length.write(len(request))
+            yield from dut.server_ip.write(server)
+            yield from dut.base.write(0x100)
+            yield from dut.blksize.write(8)
+            yield from dut.windowsize.write(2)
+            yield from dut.timeout.write(500)
+            yield from dut.control.write(0b001)
+            # RRQ.
+            yield from wait_packets(1)
+            self.assertEqual(packets[0], (69, request))
+            # OACK (options checked, names case-insensitive, others ignored) -> ACK 0.
+            yield from _udp_send(udp_port.source, server, 5000, b"\x00\x06BlkSize\x008\x00tsize\x0019\x00windowsize\x002\x00")
+            yield from wait_packets(2)
+            self.assertEqual(packets[1], (5000, b"\x00\x04\x00\x00"))
+            # Window of 2 blocks -> ACK 2.
+            yield from _udp_send(udp_port.source, server, 5000, data(1, b"01234567"))
+            yield from _udp_send(udp_port.source, server, 5000, data(2, b"89abcdef"))
+            yield from wait_packets(3)
+            self.assertEqual(packets[2], (5000, b"\x00\x04\x00\x02"))
+            # Out-of-order block -> ACK 2 (once), packets from other ports dropped.
+            yield from _udp_send(udp_port.source, server, 5000, data(4, b"XXXXXXXX"))
+            yield from _udp_send(udp_port.source, server, 5000, data(4, b"XXXXXXXX"))
+            yield from _udp_send(udp_port.source, server, 5001, data(3, b"XXXXXXXX"))
+            yield from wait_packets(4)
+            self.assertEqual(packets[3], (5000, b"\x00\x04\x00\x02"))
+            # Last (short) block -> ACK 3, done.
+            yield from _udp_send(udp_port.source, server, 5000, data(3, b"ghi"))
+            yield from wait_packets(5)
+            self.assertEqual(packets[4], (5000, b"\x00\x04\x00\x03"))
+            for _ in range(16):
+                yield
+            self.assertEqual(len(packets), 5)
+            self.assertEqual((yield dut.status.fields.done), 1)
+            self.assertEqual((yield dut.bytes.status),  19)
+            self.assertEqual((yield dut.blocks.status), 3)
+            self.assertEqual((yield dut.acks.status),   4)
+            self.assertEqual(bytes(mem.get(0x100 + n, 0) for n in range(20)), b"0123456789abcdefghi\x00")
+            self.assertEqual(max(mem), 0x100 + 18)
+
+        run_simulation(dut, [generator(), _udp_receive(udp_port.sink, packets), _wishbone_ram_model(bus, mem)])
+
+    def test_tftp_receiver_errors(self):
+        server = 0xc0a80164
+
+        def data(block, payload):
+            return bytes([0, 3, block >> 8, block & 0xff]) + payload
+
+        def run(responses, windowsize=2, max_length=0):
+            udp_port = _UDPPort()
+            bus      = wishbone.Interface()
+            dut      = TFTPReceiver(udp_port, bus, local_port=6969, clk_freq=1e6)
+            packets  = []
+            result   = {}
+
+            def generator():
+                yield from dut.request_data.write(0x00000100)
+                yield from dut.request_length.write(2)
+                yield from dut.server_ip.write(server)
+                yield from dut.blksize.write(8)
+                yield from dut.windowsize.write(windowsize)
+                yield from dut.max_length.write(max_length)
+                yield from dut.timeout.write(1000)
+                yield from dut.control.write(0b001)
+                for response in responses:
+                    for _ in range(32):
+                        yield
+                    yield from _udp_send(udp_port.source, server, 5000, response)
+                for _ in range(32):
+                    yield
+                result["error"] = (yield dut.status.fields.error)
+                result["cause"] = (yield dut.status.fields.cause)
+                result["acks"]  = [packet for packet in packets if packet[1][:2] == b"\x00\x04"]
+
+            run_simulation(dut, [generator(), _udp_receive(udp_port.sink, packets), _wishbone_ram_model(bus, {})])
+            return result
+
+        oack = b"\x00\x06blksize\x008\x00windowsize\x002\x00"
+        # Server options not matching the configuration (or omitted): No ACK, error.
+        for response in [
+            b"\x00\x06blksize\x0016\x00windowsize\x002\x00",
+            b"\x00\x06blksize\x008\x00windowsize\x004\x00",
+            b"\x00\x06blksize\x008\x00",
+            b"\x00\x06blksize\x008x\x00windowsize\x002\x00"]:
+            r = run([response])
+            self.assertEqual((r["error"], r["cause"], r["acks"]), (1, 2, []))
+        # DATA without OACK (options ignored by the server).
+        r = run([data(1, b"01234567")])
+        self.assertEqual((r["error"], r["cause"], r["acks"]), (1, 2, []))
+        # Block larger than blksize.
+        r = run([oack, data(1, b"0123456789ab")])
+        self.assertEqual((r["error"], r["cause"], len(r["acks"])), (1, 3, 1))
+        # Transfer larger than max_length.
+        r = run([oack, data(1, b"01234567"), data(2, b"89abcdef"), data(3, b"ghi")], max_length=18)
+        self.assertEqual((r["error"], r["cause"], len(r["acks"])), (1, 4, 2))
+        r = run([oack, data(1, b"01234567"), data(2, b"89abcdef"), data(3, b"ghi")], max_length=19)
+        self.assertEqual((r["error"], len(r["acks"])), (0, 3))
+        # Default options (windowsize 1) accepted without OACK option.
+        r = run([b"\x00\x06blksize\x008\x00", data(1, b"0123")], windowsize=1)
+        self.assertEqual((r["error"], len(r["acks"])), (0, 2))
+
+    def test_tftp_receiver_timeout(self):
+        udp_port = _UDPPort()
+        bus      = wishbone.Interface()
+        dut      = TFTPReceiver(udp_port, bus, local_port=6969, clk_freq=1e6)
+        packets  = []
+
+        def generator():
+            yield from dut.request_data.write(0x00000100)
+            yield from dut.request_length.write(2)
+            yield from dut.timeout.write(50)
+            yield from dut.retries.write(2)
+            yield from dut.control.write(0b001)
+            for _ in range(400):
+                yield
+            # RRQ sent again on timeouts, then error.
+            self.assertEqual(packets, [(69, b"\x00\x01")]*3)
+            self.assertEqual((yield dut.timeouts.status), 3)
+            self.assertEqual((yield dut.status.fields.error), 1)
+            self.assertEqual((yield dut.status.fields.cause), 1)
+
+        run_simulation(dut, [generator(), _udp_receive(udp_port.sink, packets)])
+
+    def test_pll_cache(self):
+        import os
+        import tempfile
+        def ecp5_pll(cache, sys_clk_freq=60e6):
+            pll = use_pll_cache(ECP5PLL(), cache=cache)
+            pll.register_clkin(Signal(), 25e6)
+            pll.create_clkout(ClockDomain("sys"), sys_clk_freq)
+            pll.create_clkout(ClockDomain("sys2x"), 2*sys_clk_freq)
+            return pll
+
+        # Miss then Hit with the same configuration (and feedback output reserved).
+        cache = PLLConfigCache()
+        pll0  = ecp5_pll(cache)
+        pll1  = ecp5_pll(cache)
+        config0 = pll0.compute_config()
+        config1 = pll1.compute_config()
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+        self.assertEqual(config0, config1)
+        self.assertEqual(sorted(pll0.clkouts.keys()), sorted(pll1.clkouts.keys()))
+        self.assertIn(config0["clkfb"], pll1.clkouts)
+
+        # Different outputs/devices: Different keys.
+        self.assertNotEqual(get_pll_key(ecp5_pll(cache, 50e6)), get_pll_key(ecp5_pll(cache, 60e6)))
+        pll2 = S7PLL(speedgrade=-1)
+        pll3 = S7PLL(speedgrade=-3)
+        for pll in [pll2, pll3]:
+            pll.register_clkin(Signal(), 100e6)
+            pll.create_clkout(ClockDomain("sys"), 100e6)
+        self.assertNotEqual(get_pll_key(pll2), get_pll_key(pll3))
+
+        # Persistence.
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "pll_cache.json")
+            cache.save(filename)
+            cache = PLLConfigCache(filename)
+            self.assertEqual(ecp5_pll(cache).compute_config(), config0)
+            self.assertEqual((cache.misses, cache.hits), (0, 1))
+
+    def test_sys_clk_freq_results(self):
+        import os
+        import argparse
+        import tempfile
+        log = "\n".join([
+            "Info: Max frequency for clock '$glbnet$crg_clkout': 40.12 MHz (PASS at 24.00 MHz)",
+            "Info: Routing..",
+            "Info: Max frequency for clock '$glbnet$crg_clkout': 31.50 MHz (PASS at 24.00 MHz)",
+            "Info: Max frequency for clock 'eth_rx_clk': 118.20 MHz (FAIL at 125.00 MHz)",
+        ])
+        fmax = parse_nextpnr_fmax(log)
+        self.assertEqual(fmax["$glbnet$crg_clkout"], (31.5e6, 24e6, True))
+        self.assertEqual(fmax["eth_rx_clk"], (118.2e6, 125e6, False))
+        self.assertFalse(get_nextpnr_timing_pass(log))
+        self.assertTrue(get_nextpnr_timing_pass(log.rsplit("\n", 1)[0]))
+        self.assertFalse(get_nextpnr_timing_pass("ERROR: Failed to route"))
+
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "fmax.json")
+            db = FmaxDatabase(filename)
+            db.set("icebreaker", "default", {"sys_clk_freq": 30e6})
+            db.save()
+            db = FmaxDatabase(filename)
+            self.assertEqual(get_max_sys_clk_freq("icebreaker", db=db), 30e6)
+            self.assertIsNone(get_max_sys_clk_freq("icebreaker", "--cpu-type=serv", db=db))
+
+        sys_clk_freq_type = get_sys_clk_freq_type("unknown_target")
+        self.assertEqual(sys_clk_freq_type("48e6"), 48e6)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            sys_clk_freq_type("max")
+
+    def test_utilization(self):
+        log = "\n".join([
+            "   Number of cells:               3456",
+            "     SB_CARRY                      100",
+            "     SB_DFF                         50",
+            "     SB_DFFER                       20",
+            "     SB_LUT4                      2000",
+            "",
+            "Info: Device utilisation:",
+            "Info: \t         ICESTORM_LC:  3200/ 5280    60%",
+            "Info: \t        ICESTORM_RAM:    20/   30    66%",
+            "Info: \t               SB_IO:     8/   96     8%",
+            "Info: \t      ICESTORM_SPRAM:     4/    4   100%",
+            "Info: \t        ICESTORM_DSP:     0/    8     0%",
+            "",
+            "Info: Placed 8 cells",
+        ])
+        resources = get_nextpnr_resources(parse_nextpnr_utilization(log))
+        self.assertEqual(resources, {"lut": (3200, 5280), "bram": (24, 34), "dsp": (0, 8)})
+        self.assertEqual(get_yosys_ff_count(parse_yosys_cells(log)), 70)
+        self.assertEqual(parse_yosys_cells("     3456 cells\n      100   SB_CARRY\n       50   SB_DFF\n"),
+            {"SB_CARRY": 100, "SB_DFF": 50})
+
+        previous = {"resources": {"lut": [3000, 5280], "ff": [70, None]}, "fmax": {"sys": 30e6}}
+        current  = {"resources": {"lut": (3200, 5280), "ff": (70, None), "bram": (33, 34)}, "fmax": {"sys": 27e6}}
+        regressions, warnings = check_utilization(previous, current)
+        self.assertEqual(len(regressions), 2) # LUT increase + Fmax decrease.
+        self.assertEqual(len(warnings), 1)    # BRAM close to capacity.
+        regressions, warnings = check_utilization(None, current)
+        self.assertEqual(regressions, [])
+
+    def test_sim_soc(self):
+        from litex_boards.platforms import digilent_arty, xilinx_kc705
+        from litex_boards.targets import digilent_arty as arty_target, xilinx_kc705 as kc705_target
+        # DRAM module/data width from the target's BaseSoC/platform.
+        sdram_args = get_sim_sdram_args(arty_target.BaseSoC, digilent_arty.Platform())
+        self.assertEqual(sdram_args["sdram_data_width"], 16)
+        self.assertEqual(get_sim_sdram_args(kc705_target.BaseSoC, xilinx_kc705.Platform())["sdram_data_width"], 64)
+        soc = SimBaseSoC(100e6, ident="LiteX SoC on Arty A7",
+            cpu_type         = None,
+            uart_name        = "sim",
+            with_etherbone   = True,
+            **sdram_args,
+        )
+        soc.finalize()
+        # DRAM model with the target's module geometry/timings at the target's sys_clk_freq.
+        self.assertEqual(soc.sdrphy.settings.nphases, 4)
+        self.assertEqual(soc.bus.regions["main_ram"].size, 256*1024*1024)
+        self.assertIn("HW_PREAMBLE_CRC", soc.constants)
+        self.assertIn("(Simulation)", soc.constants["CONFIG_IDENTIFIER"])
+
+    def test_board_crg(self):
+        from litex.soc.cores.clock import S7IDELAYCTRL, USIDELAYCTRL, USMMCM, iCE40PLL
+        from litex_boards.platforms import digilent_arty, xilinx_kcu105, lattice_versa_ecp5
+        # 7-Series: sys/sys4x/sys4x_dqs/idelay from the PLL, reset-less DRAM IO clocks.
+        platform = digilent_arty.Platform()
+        crg = BoardCRG(platform, S7PLL(speedgrade=-1), platform.request("clk100"), 100e6)
+        crg.add_sys(100e6, with_dram=True)
+        crg.add_domain("eth", 25e6)
+        self.assertEqual(crg.family, "s7")
+        self.assertEqual([clkout[1] for clkout in crg.pll.clkouts.values()], [100e6, 400e6, 400e6, 200e6, 25e6])
+        self.assertIsInstance(crg.idelayctrl, S7IDELAYCTRL)
+        self.assertIsNone(crg.cd_sys4x.rst)
+        self.assertIsNotNone(crg.cd_sys.rst)
+        # Extra domains from add_sys: Just after sys (clkout order/PLL cache key kept).
+        platform = digilent_arty.Platform()
+        crg = BoardCRG(platform, S7PLL(speedgrade=-1), platform.request("clk100"), 100e6)
+        crg.add_sys(100e6, with_dram=True, domains={"eth": 25e6})
+        self.assertEqual([clkout[1] for clkout in crg.pll.clkouts.values()], [100e6, 25e6, 400e6, 400e6, 200e6])
+        # UltraScale: pll4x from the PLL, sys/sys4x from BUFGCE_DIV/BUFGCE.
+        platform = xilinx_kcu105.Platform()
+        crg = BoardCRG(platform, USMMCM(speedgrade=-2), platform.request("clk125"), 125e6)
+        crg.add_sys(125e6, with_dram=True, idelay_clk_freq=200e6)
+        self.assertEqual([clkout[1] for clkout in crg.pll.clkouts.values()], [500e6, 200e6])
+        self.assertIsInstance(crg.idelayctrl, USIDELAYCTRL)
+        # ECP5: sys2x_i/init from the PLL, with Power-On-Reset.
+        platform = lattice_versa_ecp5.Platform()
+        crg = BoardCRG(platform, ECP5PLL(), platform.request("clk100"), 100e6, with_por=True)
+        crg.add_sys(75e6, with_dram=True)
+        self.assertEqual([clkout[1] for clkout in crg.pll.clkouts.values()], [150e6, 25e6])
+        self.assertTrue(hasattr(crg, "cd_por") and hasattr(crg, "stop") and hasattr(crg, "reset"))
+        with self.assertRaises(ValueError):
+            get_crg_family(iCE40PLL())
+
+    def test_axi_ring_buffer(self):
+        # Writer: ring of 2 buffers of 2 bursts (4x64-bit), overrun once the ring and the FIFO are
+        # full, wrap-around to the base when the software releases the buffers.
+        mem, bursts = {}, []
+        bus = axi.AXIInterface(data_width=64, address_width=32)
+        dut = AXIRingBufferWriter(bus, fifo_depth=16, burst_length=4)
+        def writer_generator(dut):
+            yield dut.base.storage.eq(0x1000)
+            yield dut.size.storage.eq(64)
+            yield dut.buffers.storage.eq(2)
+            yield dut.control.fields.enable.eq(1)
+            for n in range(40):
+                yield dut.sink.valid.eq(1)
+                yield dut.sink.data.eq(n)
+                yield
+                yield dut.sink.valid.eq(0)
+                for _ in range(3):
+                    yield
+            for _ in range(64):
+                yield
+            self.assertEqual([mem[0x1000 + 8*n] for n in range(16)], list(range(16)))
+            self.assertEqual((yield dut.hw_count.status), 2)
+            self.assertEqual((yield dut.drops.status), 40 - 16 - (yield dut.fifo.level))
+            yield dut.sw_count.storage.eq(2)
+            for _ in range(128):
+                yield
+            self.assertEqual([mem[0x1000 + 8*n] for n in range(16)], list(range(16, 32)))
+            self.assertEqual((yield dut.hw_count.status), 4)
+            self.assertEqual([b[1] for b in bursts], 2*[0x1000, 0x1020, 0x1040, 0x1060])
+            self.assertTrue(all(b[0] == 1 and b[2] == 4 for b in bursts))
+        run_simulation(dut, [writer_generator(dut), _axi_ram_model(bus, mem, bursts)])
+
+        # Reader: no reads (underrun) while the ring is empty, wrap-around to the base.
+        mem    = {0x2000 + 8*n: n for n in range(16)}
+        bursts = []
+        data   = []
+        bus = axi.AXIInterface(data_width=64, address_width=32)
+        dut = AXIRingBufferReader(bus, fifo_depth=16, burst_length=4)
+        @passive
+        def reader_sink(dut):
+            yield dut.source.ready.eq(1)
+            while True:
+                if (yield dut.source.valid):
+                    data.append((yield dut.source.data))
+                yield
+        def reader_generator(dut):
+            yield dut.base.storage.eq(0x2000)
+            yield dut.size.storage.eq(64)
+            yield dut.buffers.storage.eq(2)
+            yield dut.control.fields.enable.eq(1)
+            for _ in range(64):
+                yield
+            self.assertEqual((bursts, data), ([], []))
+            yield dut.sw_count.storage.eq(1)
+            for _ in range(128):
+                yield
+            self.assertEqual(data, list(range(8)))
+            yield dut.sw_count.storage.eq(3)
+            for _ in range(256):
+                yield
+            self.assertEqual(data, list(range(8)) + list(range(8, 16)) + list(range(8)))
+            self.assertEqual((yield dut.hw_count.status), 3)
+            self.assertEqual([b[1] for b in bursts], [0x2000, 0x2020, 0x2040, 0x2060, 0x2000, 0x2020])
+        run_simulation(dut, [reader_generator(dut), reader_sink(dut), _axi_ram_model(bus, mem, bursts)])
+
+    def test_ps_dma(self):
+        # Bandwidth test pattern through a 64-bit AXI port: ring of 2 buffers of 256 bytes starting
+        # 64 bytes before a 4KB boundary (bursts split at the boundary and at the buffer ends).
+        mem, bursts = {}, []
+        bus = axi.AXIInterface(data_width=64, address_width=32)
+        dut = PSDMA(bus, fifo_depth=32, burst_length=16)
+        def generator(dut):
+            yield dut.test.fields.enable.eq(1)
+            for ring in [dut.writer, dut.reader]:
+                yield ring.base.storage.eq(0x0fc0)
+                yield ring.size.storage.eq(256)
+                yield ring.buffers.storage.eq(2)
+            # Write 2 buffers (then ring full).
+            yield dut.writer.control.fields.enable.eq(1)
+            irqs = 0
+            for _ in range(512):
+                irqs += (yield dut.writer.done)
+                yield
+            self.assertEqual(bursts, [(1, 0x0fc0, 8), (1, 0x1000, 16), (1, 0x1080, 8), (1, 0x10c0, 16), (1, 0x1140, 16)])
+            self.assertEqual([mem[0x0fc0 + 8*n] for n in range(64)], [(n << 32) | n for n in range(64)])
+            self.assertEqual((yield dut.writer.hw_count.status), 2)
+            self.assertEqual(irqs, 2)
+            self.assertEqual((yield dut.ev.writer.pending), 1)
+            # Read back the first buffer (pattern checked).
+            yield dut.reader.control.fields.enable.eq(1)
+            yield dut.reader.sw_count.storage.eq(1)
+            for _ in range(256):
+                yield
+            self.assertEqual(bursts[5:], [(0, 0x0fc0, 8), (0, 0x1000, 16), (0, 0x1080, 8)])
+            self.assertEqual((yield dut.reader.hw_count.status), 1)
+            self.assertEqual((yield dut.test_read_beats.status), 32)
+            self.assertEqual((yield dut.test_errors.status), 0)
+            self.assertEqual((yield dut.ev.reader.pending), 1)
+        run_simulation(dut, [generator(dut), _axi_ram_model(bus, mem, bursts)])
+
+    def test_timestamper(self):
+        # TimeCounter: 8.24 fixed point increment (3.33ns at 300MHz, truncated) and seconds rollover.
+        dut  = TimeCounter(300e6)
+        incr = int((1e9/300e6)*2**24)
+        def time_generator(dut):
+            yield dut.set_seconds.storage.eq(41)
+            yield dut.set_nanoseconds.storage.eq(999999990)
+            yield dut.control.fields.set.eq(1)
+            yield
+            yield dut.control.fields.set.eq(0)
+            yield
+            times = []
+            for _ in range(8):
+                times.append(((yield dut.seconds), (yield dut.nanoseconds)))
+                yield
+            expected = []
+            for n in range(8):
+                value = (999999990 << 24) + n*incr
+                expected.append((41 + value//(int(1e9) << 24), (value % (int(1e9) << 24)) >> 24))
+            self.assertEqual(times, expected)
+            self.assertEqual(times[3:5], [(41, 999999999), (42, 3)]) # 3*3.33ns truncated: 9.99999994ns.
+        run_simulation(dut, time_generator(dut))
+
+        # TimestamperCore: edge/sub-cycle encoding and latency compensation (125MHz: 8ns/cycle).
+        time    = TimeCounter(125e6)
+        samples = Signal(8)
+        enable  = Signal(2)
+        dut     = TimestamperCore(time, [(samples, 2), (Replicate(time.pps, 8), 1)], enable, fifo_depth=8)
+        dut.time = time # Simulated with the core.
+        events  = []
+        @passive
+        def events_generator(dut):
+            yield dut.source.ready.eq(1)
+            while True:
+                if (yield dut.source.valid):
+                    data = (yield dut.source.data)
+                    events.append((data >> 36, data & (2**30 - 1), (data >> 30) & 0b111, (data >> 33) & 0b111))
+                yield
+        def generator(dut):
+            yield time.set_seconds.storage.eq(5)
+            yield time.set_nanoseconds.storage.eq(1000)
+            yield time.control.fields.set.eq(1)
+            yield enable.eq(0b01)
+            yield
+            yield time.control.fields.set.eq(0)
+            for _ in range(4):
+                yield
+            # Input edge on the 5th sample (samples[0]: Oldest).
+            yield samples.eq(0b11110000)
+            yield
+            edge_ns = (yield time.nanoseconds)
+            yield samples.eq(0b11111111)
+            for _ in range(8):
+                yield
+            self.assertEqual(events, [(5, edge_ns - 2*8, 4, 0)])
+            # PPS Output edge (1 cycle after the second rollover).
+            yield time.set_seconds.storage.eq(6)
+            yield time.set_nanoseconds.storage.eq(999999976)
+            yield time.control.fields.set.eq(1)
+            yield
+            yield time.control.fields.set.eq(0)
+            yield enable.eq(0b11)
+            for _ in range(16):
+                yield
+            self.assertEqual(events[1:], [(7, 0, 0, 1)])
+        run_simulation(dut, [generator(dut), events_generator(dut)])
+
+    def test_hub75_scanner(self):
+        # Binary Coded Modulation: each row is displayed for oe_time << plane cycles on each bit-plane.
+        from litedram.common import LiteDRAMNativePort
+        port    = LiteDRAMNativePort("read", address_width=16, data_width=32)
+        control = Record([("clk", 1), ("stb", 1), ("oe", 1), ("bank", 2)])
+        chain   = Record([("r", 2), ("g", 2), ("b", 2)])
+        dut     = HUB75Scanner(control, [chain], port, sys_clk_freq=100e6, width=4, height=4, bit_depth=3, clk_freq=25e6)
+        mem     = {n: 0x00ffffff for n in range(16)}
+        pulses  = []
+        def generator(dut):
+            yield dut.oe_time.storage.eq(16)
+            while not (yield control.oe): # Skip OE reset value.
+                yield
+            length = 0
+            for _ in range(2000):
+                if not (yield control.oe):
+                    length += 1
+                elif length:
+                    pulses.append(((yield control.bank), length))
+                    length = 0
+                yield
+            # Rows (scan addresses) 0/1 alternated, 3 bit-planes per row.
+            self.assertGreaterEqual(len(pulses), 9)
+            for n, (bank, length) in enumerate(pulses[:9]):
+                self.assertEqual((bank, length), ((n//3) % 2, 16 << (n % 3)))
+            self.assertGreater((yield dut.frames.status), 0)
+        run_simulation(dut, [generator(dut), _native_port_model(port, mem)])
+
+    def test_hub75_udp_receiver(self):
+        # Packets: pixel offset + pixels written to base + offset, pixels out of the framebuffer dropped.
+        from litedram.common import LiteDRAMNativePort
+        udp_port = _UDPPort()
+        port     = LiteDRAMNativePort("write", address_width=16, data_width=32)
+        dut      = HUB75UDPReceiver(udp_port, port, base=0x100, size=16*4)
+        mem      = {}
+        def packet(offset, pixels):
+            return b"".join(v.to_bytes(4, "little") for v in [offset] + pixels)
+        def generator(dut):
+            yield from _udp_send(udp_port.source, 0xc0a80164, 7000, packet(2, [0x112233, 0x445566]))
+            yield from _udp_send(udp_port.source, 0xc0a80164, 7000, packet(14, [1, 2, 3, 4]))
+            yield from _udp_send(udp_port.source, 0xc0a80164, 7000, packet(0x40000000, [5]))
+            for _ in range(64):
+                yield
+            self.assertEqual(mem, {0x40 + 2: 0x112233, 0x40 + 3: 0x445566, 0x40 + 14: 1, 0x40 + 15: 2})
+            self.assertEqual((yield dut.pixels.status), 7)
+            self.assertEqual((yield dut.drops.status), 3)
+        run_simulation(dut, [generator(dut), _native_port_model(port, mem)])
+
+    def test_lms7002m_packetizer(self):
+        # RX: packets of 8 words (header, timestamp, 6 samples), sample n = n.
+        def run_packetizer(period, ready):
+            dut     = LMS7002MRXPacketizer(fifo_depth=16, packet_words=8, buffer_depth=4)
+            packets = []
+            def sink_generator(dut):
+                for n in range(256):
+                    yield dut.sink.valid.eq(1)
+                    yield dut.sink.data.eq(n)
+                    yield
+                    yield dut.sink.valid.eq(0)
+                    for _ in range(period - 1):
+                        yield
+                for _ in range(64):
+                    yield
+                self.assertEqual((yield dut.timestamp), 256)
+                packets.append(((yield dut.overruns), (yield dut.drops)))
+            @passive
+            def source_generator(dut):
+                packet = []
+                n = 0
+                while True:
+                    yield dut.source.ready.eq(ready(n))
+                    yield
+                    n += 1
+                    if (yield dut.source.valid) and (yield dut.source.ready):
+                        packet.append((yield dut.source.data))
+                        if (yield dut.source.last):
+                            packets.append(packet)
+                            packet = []
+            run_simulation(dut, [sink_generator(dut), source_generator(dut)])
+            return packets[:-1], packets[-1]
+
+        # No overruns/drops: consecutive packets.
+        packets, (overruns, drops) = run_packetizer(period=2, ready=lambda n: 1)
+        self.assertEqual((overruns, drops), (0, 0))
+        self.assertEqual(len(packets), 256//6)
+        for n, packet in enumerate(packets):
+            self.assertEqual(packet, [LMS7002M_SYNC << 32, 6*n] + list(range(6*n, 6*n + 6)))
+
+        # Source stalled: whole packets dropped (overruns in the header), timestamps still matching samples.
+        packets, (overruns, drops) = run_packetizer(period=2, ready=lambda n: (n//64) % 2)
+        self.assertGreater(overruns, 0)
+        self.assertEqual(drops, 0)
+        self.assertEqual(packets[-1][0] >> 32, LMS7002M_SYNC)
+        self.assertGreater(packets[-1][0] & 0xffffffff, 0)
+        for packet in packets:
+            self.assertEqual(packet[2:], list(range(packet[1], packet[1] + 6)))
+
+        # Samples faster than the packetizer (1 per cycle): dropped at the input and counted.
+        packets, (overruns, drops) = run_packetizer(period=1, ready=lambda n: 1)
+        self.assertGreater(drops, 0)
+
+    def test_lms7002m_depacketizer(self):
+        # TX: header/timestamp removed, samples released at the packet's timestamp (0: immediate).
+        dut     = LMS7002MTXDepacketizer(fifo_depth=32, packet_words=8)
+        samples = []
+        def generator(dut):
+            packets = [
+                [0x1234, 0] + [100 + n for n in range(6)],                # Invalid header: skipped.
+                [LMS7002M_SYNC << 32, 0]   + [n for n in range(6)],        # Immediate.
+                [LMS7002M_SYNC << 32, 200] + [10 + n for n in range(6)],   # At timestamp 200.
+            ]
+            for word in sum(packets, []):
+                yield dut.sink.valid.eq(1)
+                yield dut.sink.data.eq(word)
+                yield
+                while not (yield dut.sink.ready):
+                    yield
+            yield dut.sink.valid.eq(0)
+            for timestamp in range(100, 300):
+                yield dut.timestamp.eq(timestamp)
+                yield
+                if timestamp < 200:
+                    self.assertEqual(len(samples), 6)
+            self.assertEqual([sample for sample, _ in samples], list(range(6)) + [10 + n for n in range(6)])
+            self.assertEqual([n for n, (_, last) in enumerate(samples) if last], [5, 11])
+            self.assertGreaterEqual(timestamps[6], 200)
+        timestamps = []
+        @passive
+        def source_generator(dut):
+            yield dut.source.ready.eq(1)
+            while True:
+                if (yield dut.source.valid):
+                    samples.append(((yield dut.source.data), (yield dut.source.last)))
+                    timestamps.append((yield dut.timestamp))
+                yield
+        run_simulation(dut, [generator(dut), source_generator(dut)])
+
+    def test_ft245_phy_timed(self):
+        # Both directions busy: time slices of read_time/write_time (+1) usb_clk cycles, boosted
+        # (<< shift) for the urgent direction, unlimited with a 0 time, without data loss/duplication.
+        dut      = _FT245PHYTimed(read_time=8, write_time=4)
+        written  = []
+        received = []
+        strobes  = []
+        phases   = []
+        def generator(dut):
+            phases_settings = [
+                # read_urgent, write_urgent, write_valid, read_time
+                (0, 0, 1, 8),
+                (1, 0, 1, 8),
+                (0, 1, 1, 8),
+                (0, 0, 0, 8),
+                (0, 0, 1, 0),
+            ]
+            n = 0
+            yield dut.phy.source.ready.eq(1)
+            for read_urgent, write_urgent, write_valid, read_time in phases_settings:
+                yield dut.phy.read_urgent.eq(read_urgent)
+                yield dut.phy.write_urgent.eq(write_urgent)
+                yield dut.phy.timing.fields.read_time.eq(read_time)
+                start = len(strobes)
+                for _ in range(400):
+                    yield dut.phy.sink.valid.eq(write_valid)
+                    yield dut.phy.sink.data.eq(n & 0xff)
+                    yield
+                    if write_valid and (yield dut.phy.sink.ready):
+                        n += 1
+                    if (yield dut.phy.source.valid):
+                        received.append((yield dut.phy.source.data))
+                phases.append("".join(strobes[start:]))
+        run_simulation(dut, {"sys": [generator(dut)], "usb": [_ft245_model(dut.pads, dut.phy.data_w, written, strobes)]},
+            clocks            = dut.clocks,
+            special_overrides = {SDRTristate: _SimSDRTristate},
+        )
+
+        def slices(strobes):
+            # Read/Write slices lengths, skipping first/last ones (settings changes).
+            runs = [(k, len(list(g))) for k, g in itertools.groupby(strobes.replace(".", ""))]
+            return set(runs[1:-1])
+
+        self.assertEqual(slices(phases[0]), {("R", 8 + 1), ("W", 4 + 1)})
+        self.assertEqual(slices(phases[1]), {("R", (8 << 2) + 1), ("W", 4 + 1)})
+        self.assertEqual(slices(phases[2]), {("R", 8 + 1), ("W", (4 << 2) + 1)})
+        self.assertEqual(phases[3][-100:], "R"*100) # Write FIFOs drained.
+        self.assertEqual(phases[4][-100:], "R"*100) # Unlimited read time.
+
+        # Data in order, without loss/duplication.
+        self.assertGreater(len(written),  400)
+        self.assertGreater(len(received), 400)
+        self.assertEqual(written,  [n & 0xff for n in range(len(written))])
+        self.assertEqual(received, [n & 0xff for n in range(len(received))])
+
+    def test_eth_udp_relay(self):
+        # Packets (received with gaps) forwarded to the remote IP/relay port, without gaps (store-and-
+        # forward) and counted.
+        rx_port  = _UDPPort()
+        tx_port  = _UDPPort()
+        dut      = EthUDPRelay(rx_port, tx_port, udp_port=6000, remote_ip="192.168.2.100", depth=64)
+        payloads = [bytes(range(5)), bytes(range(64)), bytes(range(130)), b"\x55"*17]
+        packets  = []
+        def generator(dut):
+            for n, payload in enumerate(payloads):
+                if n == 3:
+                    yield from dut.remote_ip.write(0xc0a80265)
+                yield from _udp_send(rx_port.source, 0xc0a80164, 1234, payload, gap=n)
+            for _ in range(256):
+                yield
+            self.assertEqual((yield from dut.packets.read()), len(payloads))
+        @passive
+        def tx_generator(dut):
+            # Ready stalled 1/4 of the time, but data always valid from first to last word.
+            packet = None
+            n = 0
+            while True:
+                yield tx_port.sink.ready.eq(n % 4 != 0)
+                yield
+                n += 1
+                valid = (yield tx_port.sink.valid)
+                if packet is not None:
+                    self.assertTrue(valid)
+                if valid and (yield tx_port.sink.ready):
+                    if packet is None:
+                        packet = [(yield tx_port.sink.ip_address), (yield tx_port.sink.src_port),
+                                  (yield tx_port.sink.dst_port), (yield tx_port.sink.length), b""]
+                    last = (yield tx_port.sink.last)
+                    data = (yield tx_port.sink.data).to_bytes(4, "little")
+                    if last:
+                        data = data[:(yield tx_port.sink.last_be).bit_length()]
+                    packet[-1] += data
+                    if last:
+                        packets.append(tuple(packet))
+                        packet = None
+        run_simulation(dut, [generator(dut), tx_generator(dut)])
+        self.assertEqual(packets, [
+            (0xc0a80264 if n < 3 else 0xc0a80265, 6000, 6000, len(payload), payload)
+                for n, payload in enumerate(payloads)
+        ])